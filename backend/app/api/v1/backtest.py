@@ -14,7 +14,7 @@ import asyncio
 from ...models.backtester_models import (
     BacktestRequest, BacktestResult, BacktestConfiguration,
     TradingStrategy, PositionSizingMethod, PerformanceMetrics,
-    TransactionCosts, BacktestStatus, WalkForwardConfig
+    TransactionCosts, BacktestStatus, BacktestSweepRequest, BacktestSweepResult
 )
 from ...services.backtesting_service import BacktestingService
 from ...core.dependencies import get_backtesting_service
@@ -273,6 +273,48 @@ async def compare_strategies(
     }
 
 
+@router.post("/sweep", response_model=BacktestSweepResult)
+async def run_parameter_sweep(
+    request: BacktestSweepRequest,
+    service: BacktestingService = Depends(get_backtesting_service)
+) -> BacktestSweepResult:
+    """
+    Run a parameter sweep over many strategy variants
+
+    Loads market data and computes indicators once for the universe and date range,
+    evaluates all variants concurrently, and returns a compact leaderboard.
+    Full results are available per variant from /backtest/sweep/{sweep_id}/variants/{variant_index}.
+    """
+
+    try:
+        return await service.run_parameter_sweep(request)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Parameter sweep failed: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Parameter sweep failed: {str(e)}")
+
+
+@router.get("/sweep/{sweep_id}/variants/{variant_index}", response_model=BacktestResult)
+async def get_sweep_variant_result(
+    sweep_id: str,
+    variant_index: int,
+    service: BacktestingService = Depends(get_backtesting_service)
+) -> BacktestResult:
+    """
+    Get the full backtest result for one variant of a parameter sweep
+    """
+
+    result = service.get_sweep_variant_result(sweep_id, variant_index)
+    if result is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No result for variant {variant_index} of sweep {sweep_id}"
+        )
+
+    return result
+
+
 @router.get("/jobs", response_model=List[BacktestStatus])
 async def list_backtest_jobs(
     status: Optional[str] = Query(None, description="Filter by status"),
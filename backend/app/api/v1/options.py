@@ -144,21 +144,12 @@ async def get_volatility_surface(
     """
 
     try:
-        # Get options chains
-        chains = await service.data_provider.fetch_options_chain(symbol.upper())
+        # Cached per symbol and spot bucket; chains are only fetched on a miss
+        surface = await service.get_volatility_surface(symbol.upper())
 
-        if not chains:
+        if not surface:
             raise HTTPException(status_code=404, detail=f"No options data found for {symbol}")
 
-        # Calculate volatility surface
-        spot_price = chains[0].spot_price
-        risk_free_rate = service.risk_free_rate
-        dividend_yield = service.dividend_yield
-
-        surface = await service._calculate_volatility_surface(
-            chains, spot_price, risk_free_rate, dividend_yield
-        )
-
         return surface
 
     except HTTPException:
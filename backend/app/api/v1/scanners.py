@@ -16,6 +16,7 @@ import uuid
 from ...core.scanner_engine import get_scanner_engine
 from ...services.scanner_alert_system import get_alert_system
 from ...services.scanner_aggregation_service import get_aggregation_service
+from ...services.scanner_websocket_manager import get_scanner_websocket_manager
 from ...models.scanner_models import (
     ScannerConfig, SavedScanner, ScannerRunRequest, ScannerResponse,
     ScanResult, AlertConfig, ScannerSchedule, AggregatedScanResult,
@@ -54,6 +55,11 @@ async def create_scanner(
         # TODO: Save to database
         # await scanner_repository.save_scanner(saved_scanner)
 
+        # Make the scanner available to streaming subscriptions by id
+        websocket_manager = get_scanner_websocket_manager()
+        if websocket_manager:
+            websocket_manager.register_scanner(saved_scanner)
+
         return saved_scanner
 
     except Exception as e:
@@ -130,7 +136,25 @@ async def update_scanner(
         # if scanner.user_id != current_user.user_id:
         #     raise HTTPException(status_code=403, detail="Access denied")
 
-        raise HTTPException(status_code=404, detail="Scanner not found")
+        # Until scanners are persisted, the streaming registry holds them
+        websocket_manager = get_scanner_websocket_manager()
+        scanner = websocket_manager.scanners.get(scanner_id) if websocket_manager else None
+        if not scanner:
+            raise HTTPException(status_code=404, detail="Scanner not found")
+
+        if scanner.user_id != current_user.user_id:
+            raise HTTPException(status_code=403, detail="Access denied")
+
+        updated_scanner = scanner.copy(update={
+            "config": scanner_config,
+            "name": name if name is not None else scanner.name,
+            "description": description if description is not None else scanner.description,
+            "tags": tags if tags is not None else scanner.tags,
+            "updated_at": datetime.utcnow()
+        })
+        websocket_manager.register_scanner(updated_scanner)
+
+        return updated_scanner
 
     except HTTPException:
         raise
@@ -153,6 +177,13 @@ async def delete_scanner(
         # if scanner.user_id != current_user.user_id:
         #     raise HTTPException(status_code=403, detail="Access denied")
 
+        websocket_manager = get_scanner_websocket_manager()
+        if websocket_manager:
+            scanner = websocket_manager.scanners.get(scanner_id)
+            if scanner and scanner.user_id != current_user.user_id:
+                raise HTTPException(status_code=403, detail="Access denied")
+            websocket_manager.unregister_scanner(scanner_id)
+
         return {"message": "Scanner deleted successfully"}
 
     except HTTPException:
@@ -187,7 +218,7 @@ async def run_scanner(
                 raise HTTPException(status_code=400, detail="Scanner configuration required")
 
         # Run the scanner
-        results = await scanner_engine.run_scan(config)
+        results = await scanner_engine.run_scanner(config)
 
         # Process alerts in background if not test mode
         if not run_request.test_mode and run_request.scanner_id:
@@ -460,7 +491,7 @@ async def stream_scanner_results(
                 # TODO: Run scanner and yield results
                 # scanner = await scanner_repository.get_scanner(scanner_id)
                 # if scanner:
-                #     results = await scanner_engine.run_scan(scanner.config)
+                #     results = await scanner_engine.run_scanner(scanner.config)
                 #     yield f"data: {json.dumps(results.dict())}\n\n"
 
                 yield f"data: {json.dumps({'status': 'no_data'})}\n\n"
@@ -0,0 +1,283 @@
+"""
+Compiled alert condition plans.
+Alert rule conditions are compiled into flat threshold arrays grouped by
+symbol, so a market tick evaluates every rule on its symbols in a few NumPy
+operations against one field snapshot per symbol, and rule changes only
+recompile the symbols they touch.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.models.alert_models import AlertCondition, AlertRule, ComparisonOperator
+
+
+# Market data field names that conditions may use for quote fields
+FIELD_ALIASES: Dict[str, str] = {
+    'price': 'current_price',
+    'close': 'current_price',
+    'volume': 'volume',
+    'change': 'change',
+    'change_percent': 'change_percent',
+    'high': 'day_high',
+    'low': 'day_low',
+    'open': 'day_open',
+}
+
+# Operators compiled to array comparisons; other conditions use the scalar comparer
+_VECTOR_OPS = (
+    ComparisonOperator.EQUALS,
+    ComparisonOperator.NOT_EQUALS,
+    ComparisonOperator.GREATER_THAN,
+    ComparisonOperator.GREATER_THAN_OR_EQUAL,
+    ComparisonOperator.LESS_THAN,
+    ComparisonOperator.LESS_THAN_OR_EQUAL,
+    ComparisonOperator.BETWEEN,
+    ComparisonOperator.NOT_BETWEEN,
+    ComparisonOperator.PERCENT_CHANGE,
+)
+_OP_CODES = {operator: code for code, operator in enumerate(_VECTOR_OPS)}
+_SCALAR = -1
+
+# Minimum move, in percent of the threshold, for PERCENT_CHANGE conditions
+PERCENT_CHANGE_THRESHOLD = 5.0
+
+
+def is_technical_field(field: str) -> bool:
+    """Fields served from technical indicators rather than quotes."""
+    return field.startswith(('sma_', 'ema_')) or field in ('rsi', 'macd', 'bb_upper', 'bb_lower')
+
+
+def field_value(snapshot: Dict[str, Any], field: str) -> Any:
+    """Value of a condition field in a symbol snapshot (direct name, then quote alias)."""
+    if field in snapshot:
+        return snapshot[field]
+    return snapshot.get(FIELD_ALIASES.get(field, field))
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(Decimal(value))
+        except (InvalidOperation, ValueError):
+            return None
+    return None
+
+
+def _thresholds(condition: AlertCondition) -> Optional[Tuple[int, float, float]]:
+    """(op code, low, high) for conditions that can be compared as floats."""
+    code = _OP_CODES.get(condition.operator)
+    if code is None:
+        return None
+
+    if condition.operator in (ComparisonOperator.BETWEEN, ComparisonOperator.NOT_BETWEEN):
+        if not isinstance(condition.value, list) or len(condition.value) != 2:
+            return None
+        low, high = (_to_float(v) for v in condition.value)
+    elif condition.operator in (ComparisonOperator.EQUALS, ComparisonOperator.NOT_EQUALS) \
+            and not isinstance(condition.value, Decimal):
+        return None  # string equality keeps exact scalar semantics
+    else:
+        low = high = _to_float(condition.value)
+
+    if low is None or high is None:
+        return None
+    return code, low, high
+
+
+@dataclass
+class PlanMatch:
+    """A triggered (rule, symbol) pair with its per-condition outcomes."""
+    rule: AlertRule
+    symbol: str
+    conditions: List[Tuple[AlertCondition, bool, float]]  # (condition, met, value or NaN)
+
+
+@dataclass
+class PlanResult:
+    """Outcome of evaluating a plan against one tick of snapshots."""
+    triggered: List[PlanMatch]
+    pairs_evaluated: int
+    conditions_evaluated: int
+
+
+class SymbolPlan:
+    """Threshold arrays for the conditions of every rule on one symbol.
+
+    Conditions are stored rule by rule; ``evaluate`` reads each field of the
+    symbol's snapshot once, compares all conditions at once and reduces them
+    per rule with the rule's AND/OR logic.
+    """
+
+    def __init__(self, symbol: str, rules: Iterable[Tuple[AlertRule, List[Tuple[AlertCondition, Any]]]]):
+        self.symbol = symbol
+        self.rules: List[AlertRule] = []
+        self.conditions: List[AlertCondition] = []
+        field_pos: Dict[str, int] = {}
+
+        rule_start, rule_and = [], []
+        cond_field, cond_op, cond_low, cond_high = [], [], [], []
+        for rule, compiled in rules:
+            rule_start.append(len(self.conditions))
+            rule_and.append(rule.condition_logic.upper() == "AND")
+            self.rules.append(rule)
+            for condition, thresholds in compiled:
+                code, low, high = thresholds or (_SCALAR, np.nan, np.nan)
+                self.conditions.append(condition)
+                cond_field.append(field_pos.setdefault(condition.field, len(field_pos)))
+                cond_op.append(code)
+                cond_low.append(low)
+                cond_high.append(high)
+
+        self.fields = list(field_pos)
+        self.rule_start = np.asarray(rule_start, dtype=np.intp)
+        self.rule_and = np.asarray(rule_and, dtype=bool)
+        self.cond_field = np.asarray(cond_field, dtype=np.intp)
+        self.cond_op = np.asarray(cond_op, dtype=np.int8)
+        self.cond_low = np.asarray(cond_low, dtype=float)
+        self.cond_high = np.asarray(cond_high, dtype=float)
+        self.scalar_conditions = np.flatnonzero(self.cond_op == _SCALAR)
+
+    def rule_conditions(self, rule: int) -> range:
+        end = self.rule_start[rule + 1] if rule + 1 < len(self.rules) else len(self.conditions)
+        return range(self.rule_start[rule], end)
+
+    def evaluate(
+        self,
+        snapshot: Dict[str, Any],
+        scalar_compare: Optional[Callable[[Any, ComparisonOperator, Any], bool]] = None
+    ) -> List[PlanMatch]:
+        """Triggered rules of this symbol for its current snapshot."""
+        row = np.full(len(self.fields), np.nan)
+        for column, field in enumerate(self.fields):
+            value = _to_float(field_value(snapshot, field))
+            if value is not None:
+                row[column] = value
+
+        values = row[self.cond_field]
+        low, high, op = self.cond_low, self.cond_high, self.cond_op
+        with np.errstate(invalid='ignore', divide='ignore'):
+            within = (values >= low) & (values <= high)
+            met = np.select(
+                [op == _OP_CODES[o] for o in _VECTOR_OPS],
+                [
+                    values == low,
+                    ~np.isnan(values) & (values != low),
+                    values > low,
+                    values >= low,
+                    values < low,
+                    values <= low,
+                    within,
+                    ~np.isnan(values) & ~within,
+                    (low != 0) & (np.abs(values - low) / np.abs(low) * 100 >= PERCENT_CHANGE_THRESHOLD),
+                ],
+                default=False,
+            )
+
+        for i in self.scalar_conditions:
+            condition = self.conditions[i]
+            value = field_value(snapshot, condition.field)
+            met[i] = value is not None and scalar_compare is not None \
+                and scalar_compare(value, condition.operator, condition.value)
+
+        all_met = np.logical_and.reduceat(met, self.rule_start)
+        any_met = np.logical_or.reduceat(met, self.rule_start)
+        triggered = np.flatnonzero(np.where(self.rule_and, all_met, any_met))
+
+        return [
+            PlanMatch(
+                rule=self.rules[r],
+                symbol=self.symbol,
+                conditions=[(self.conditions[i], bool(met[i]), float(values[i])) for i in self.rule_conditions(r)],
+            )
+            for r in triggered
+        ]
+
+
+class AlertPlan:
+    """Compiled conditions of a rule set, grouped by symbol.
+
+    ``add`` and ``remove`` maintain the plan one rule at a time and only
+    invalidate the symbols that rule names; a symbol's ``SymbolPlan`` is
+    recompiled from its own rules the next time it is evaluated.
+    ``evaluate`` touches only the symbols that have a snapshot, so its cost
+    is proportional to the rules on those symbols. Conditions that are not
+    numeric comparisons fall back to ``scalar_compare``. Missing field
+    values never match, as with the per-condition evaluator.
+    """
+
+    def __init__(self, rules: Iterable[Tuple[AlertRule, Sequence[str]]] = ()):
+        self._rules: Dict[str, Tuple[Tuple[str, ...], List[Tuple[AlertCondition, Any]]]] = {}
+        self.by_symbol: Dict[str, Dict[str, AlertRule]] = {}
+        self._compiled: Dict[str, SymbolPlan] = {}
+        for rule, symbols in rules:
+            self.add(rule, symbols)
+
+    def __len__(self) -> int:
+        """Number of (rule, symbol) pairs."""
+        return sum(len(rules) for rules in self.by_symbol.values())
+
+    def add(self, rule: AlertRule, symbols: Sequence[str]) -> None:
+        """Add a rule, replacing any previous version of it."""
+        self.remove(rule.rule_id)
+        compiled = [(condition, _thresholds(condition)) for condition in rule.conditions]
+        if not compiled or not symbols:
+            return
+
+        symbols = tuple(dict.fromkeys(symbols))
+        self._rules[rule.rule_id] = (symbols, compiled)
+        for symbol in symbols:
+            self.by_symbol.setdefault(symbol, {})[rule.rule_id] = rule
+            self._compiled.pop(symbol, None)
+
+    def remove(self, rule_id: str) -> None:
+        entry = self._rules.pop(rule_id, None)
+        if entry is None:
+            return
+        for symbol in entry[0]:
+            rules = self.by_symbol[symbol]
+            del rules[rule_id]
+            if not rules:
+                del self.by_symbol[symbol]
+            self._compiled.pop(symbol, None)
+
+    def clear(self) -> None:
+        for index in (self._rules, self.by_symbol, self._compiled):
+            index.clear()
+
+    def symbol_plan(self, symbol: str) -> Optional[SymbolPlan]:
+        """Compiled conditions of the rules on ``symbol`` (None if it has none)."""
+        plan = self._compiled.get(symbol)
+        if plan is None and symbol in self.by_symbol:
+            plan = self._compiled[symbol] = SymbolPlan(symbol, (
+                (rule, self._rules[rule_id][1]) for rule_id, rule in self.by_symbol[symbol].items()
+            ))
+        return plan
+
+    def symbol_fields(self, symbol: str) -> List[str]:
+        plan = self.symbol_plan(symbol)
+        return plan.fields if plan else []
+
+    def evaluate(
+        self,
+        snapshots: Dict[str, Dict[str, Any]],
+        scalar_compare: Optional[Callable[[Any, ComparisonOperator, Any], bool]] = None
+    ) -> PlanResult:
+        """Evaluate the rules of every symbol that has a snapshot."""
+        triggered: List[PlanMatch] = []
+        pairs = conditions = 0
+        for symbol, snapshot in snapshots.items():
+            plan = self.symbol_plan(symbol)
+            if plan is None:
+                continue
+            triggered.extend(plan.evaluate(snapshot, scalar_compare))
+            pairs += len(plan.rules)
+            conditions += len(plan.conditions)
+        return PlanResult(triggered=triggered, pairs_evaluated=pairs, conditions_evaluated=conditions)
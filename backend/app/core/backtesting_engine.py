@@ -11,14 +11,16 @@ from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Set, Any
 from uuid import uuid4
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import product
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import warnings
 
 from ..models.backtester_models import (
     BacktestConfiguration, TradingStrategy, SignalRule, Trade, Position,
-    PortfolioSnapshot, PerformanceMetrics, WalkForwardResult, BacktestResult,
+    PortfolioSnapshot, EquityCurve, TradeLog, PerformanceMetrics, WalkForwardResult, BacktestResult,
     PositionSizingMethod, RebalanceFrequency, TransactionCosts
 )
+from .indicator_kernel import IndicatorKernel
 
 # Suppress pandas warnings for cleaner output
 warnings.filterwarnings('ignore', category=pd.errors.PerformanceWarning)
@@ -44,82 +46,8 @@ class SignalGenerator:
         self.exit_rules = strategy.exit_rules
 
     def calculate_technical_indicators(self, prices: pd.DataFrame) -> pd.DataFrame:
-        """Calculate technical indicators for all symbols."""
-        indicators = {}
-
-        for symbol in prices.columns.get_level_values(1).unique():
-            symbol_data = prices.xs(symbol, level=1, axis=1)
-            symbol_indicators = {}
-
-            # Moving averages
-            symbol_indicators['SMA_20'] = symbol_data['Close'].rolling(20).mean()
-            symbol_indicators['SMA_50'] = symbol_data['Close'].rolling(50).mean()
-            symbol_indicators['EMA_12'] = symbol_data['Close'].ewm(span=12).mean()
-            symbol_indicators['EMA_26'] = symbol_data['Close'].ewm(span=26).mean()
-
-            # RSI
-            delta = symbol_data['Close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-            rs = gain / loss
-            symbol_indicators['RSI'] = 100 - (100 / (1 + rs))
-
-            # MACD
-            symbol_indicators['MACD'] = symbol_indicators['EMA_12'] - symbol_indicators['EMA_26']
-            symbol_indicators['MACD_Signal'] = symbol_indicators['MACD'].ewm(span=9).mean()
-            symbol_indicators['MACD_Histogram'] = symbol_indicators['MACD'] - symbol_indicators['MACD_Signal']
-
-            # Bollinger Bands
-            bb_period = 20
-            bb_std = 2
-            bb_middle = symbol_data['Close'].rolling(bb_period).mean()
-            bb_std_dev = symbol_data['Close'].rolling(bb_period).std()
-            symbol_indicators['BB_UPPER'] = bb_middle + (bb_std_dev * bb_std)
-            symbol_indicators['BB_LOWER'] = bb_middle - (bb_std_dev * bb_std)
-            symbol_indicators['BB_MIDDLE'] = bb_middle
-
-            # ADX
-            high_low = symbol_data['High'] - symbol_data['Low']
-            high_close = np.abs(symbol_data['High'] - symbol_data['Close'].shift())
-            low_close = np.abs(symbol_data['Low'] - symbol_data['Close'].shift())
-            tr = np.maximum(high_low, np.maximum(high_close, low_close))
-            symbol_indicators['ATR'] = tr.rolling(14).mean()
-
-            # Stochastic
-            stoch_period = 14
-            low_min = symbol_data['Low'].rolling(stoch_period).min()
-            high_max = symbol_data['High'].rolling(stoch_period).max()
-            symbol_indicators['STOCH_K'] = 100 * (symbol_data['Close'] - low_min) / (high_max - low_min)
-            symbol_indicators['STOCH_D'] = symbol_indicators['STOCH_K'].rolling(3).mean()
-
-            # OBV
-            obv = [0]
-            for i in range(1, len(symbol_data)):
-                if symbol_data['Close'].iloc[i] > symbol_data['Close'].iloc[i - 1]:
-                    obv.append(obv[-1] + symbol_data['Volume'].iloc[i])
-                elif symbol_data['Close'].iloc[i] < symbol_data['Close'].iloc[i - 1]:
-                    obv.append(obv[-1] - symbol_data['Volume'].iloc[i])
-                else:
-                    obv.append(obv[-1])
-            symbol_indicators['OBV'] = pd.Series(obv, index=symbol_data.index)
-
-            # Store indicators for this symbol
-            for indicator_name, values in symbol_indicators.items():
-                if symbol not in indicators:
-                    indicators[symbol] = {}
-                indicators[symbol][indicator_name] = values
-
-        # Convert to MultiIndex DataFrame
-        indicator_df = pd.DataFrame()
-        for symbol, symbol_indicators in indicators.items():
-            for indicator, values in symbol_indicators.items():
-                indicator_df[(indicator, symbol)] = values
-
-        indicator_df.columns = pd.MultiIndex.from_tuples(
-            indicator_df.columns, names=['Indicator', 'Symbol']
-        )
-
-        return indicator_df
+        """Calculate technical indicators for all symbols in one batched pass."""
+        return IndicatorKernel.compute_frame(prices)
 
     def evaluate_rule(self, rule: SignalRule, indicators: pd.DataFrame, symbol: str,
                      current_date: date) -> float:
@@ -128,6 +56,8 @@ class SignalGenerator:
             if (rule.indicator, symbol) not in indicators.columns:
                 return 0.0
 
+            # Indicator frames are indexed by Timestamp; plain dates never match
+            current_date = pd.Timestamp(current_date)
             indicator_values = indicators[(rule.indicator, symbol)]
             current_value = indicator_values.loc[current_date]
 
@@ -193,6 +123,61 @@ class SignalGenerator:
 
         return signals
 
+    def evaluate_rule_matrix(self, rule: SignalRule, indicators: pd.DataFrame,
+                             symbols: List[str], dates: pd.DatetimeIndex) -> np.ndarray:
+        """Evaluate a signal rule for every date and symbol in one vectorized pass.
+
+        Returns a (dates x symbols) array of 0.0/1.0 with the same semantics as
+        evaluate_rule: missing indicators and NaN values never fire, and
+        crossovers compare against the previous row of the indicator history.
+        """
+        fired = np.zeros((len(dates), len(symbols)), dtype=bool)
+
+        if indicators.empty or rule.indicator not in indicators.columns.get_level_values(0):
+            return fired.astype(float)
+
+        panel = indicators.xs(rule.indicator, level=0, axis=1).reindex(columns=symbols)
+        current = panel.reindex(dates).to_numpy(dtype=float)
+        threshold = rule.threshold
+
+        if rule.operator in ['crossover', 'crossunder']:
+            previous = panel.shift(1).reindex(dates).to_numpy(dtype=float)
+            if rule.operator == 'crossover':
+                fired = (previous <= threshold) & (current > threshold)
+            else:
+                fired = (previous >= threshold) & (current < threshold)
+        elif rule.operator == 'gt':
+            fired = current > threshold
+        elif rule.operator == 'lt':
+            fired = current < threshold
+        elif rule.operator == 'gte':
+            fired = current >= threshold
+        elif rule.operator == 'lte':
+            fired = current <= threshold
+
+        return fired.astype(float)
+
+    def generate_signal_matrices(self, indicators: pd.DataFrame, symbols: List[str],
+                                 dates: pd.DatetimeIndex) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Generate composite entry and exit signal matrices (dates x symbols)."""
+        entry_signals = self._composite_signal_matrix(self.entry_rules, indicators, symbols, dates)
+        exit_signals = self._composite_signal_matrix(self.exit_rules, indicators, symbols, dates)
+        return entry_signals, exit_signals
+
+    def _composite_signal_matrix(self, rules: List[SignalRule], indicators: pd.DataFrame,
+                                 symbols: List[str], dates: pd.DatetimeIndex) -> pd.DataFrame:
+        """Combine weighted rule matrices into a single composite signal matrix."""
+        composite = np.zeros((len(dates), len(symbols)))
+        total_weight = sum(rule.weight for rule in rules)
+
+        if total_weight > 0:
+            for rule in rules:
+                composite += self.evaluate_rule_matrix(rule, indicators, symbols, dates) * (
+                    rule.weight / total_weight
+                )
+
+        return pd.DataFrame(composite, index=dates, columns=symbols)
+
 
 class PositionSizer:
     """Calculates position sizes based on different methodologies."""
@@ -317,7 +302,7 @@ class PortfolioManager:
         self.initial_capital = initial_capital
         self.cash = initial_capital
         self.positions: Dict[str, Position] = {}
-        self.trade_log: List[Trade] = []
+        self.trade_log = TradeLog()
         self.cost_calculator = TransactionCostCalculator(transaction_costs)
 
     def execute_trade(self, symbol: str, action: str, quantity: int, price: float,
@@ -499,12 +484,80 @@ class PortfolioManager:
             leverage=sum(abs(pos.market_value) for pos in self.positions.values()) / total_value
         )
 
+    def record_snapshot(self, equity_curve: EquityCurve, date: date, prices: Dict[str, float],
+                        prev_value: float = None, benchmark_return_pct: float = 0.0) -> float:
+        """Append the day's portfolio state to a columnar equity curve and return its total value."""
+        self.update_portfolio_values(prices)
+
+        total_value = self.get_portfolio_value(prices)
+        daily_return = (total_value - prev_value) if prev_value else 0.0
+        daily_return_pct = (daily_return / prev_value) if prev_value and prev_value > 0 else 0.0
+        positions = list(self.positions.values())
+        gross_exposure = sum(abs(pos.market_value) for pos in positions)
+
+        equity_curve.append(
+            date, total_value, self.cash, positions,
+            daily_return=daily_return,
+            daily_return_pct=daily_return_pct,
+            benchmark_return_pct=benchmark_return_pct,
+            gross_exposure=gross_exposure,
+            net_exposure=sum(pos.market_value for pos in positions),
+            leverage=gross_exposure / total_value
+        )
+        return total_value
+
+
+@dataclass
+class WalkForwardWindow:
+    """Training and out-of-sample test date ranges for one walk-forward step."""
+    train_start: date
+    train_end: date
+    test_start: date
+    test_end: date
+
+
+# Market data shared by backtest worker processes. Set once per worker by the
+# pool initializer so tasks only carry a configuration, not the price panel.
+_worker_market_data: Optional[MarketData] = None
+
+
+def _init_backtest_worker(market_data: MarketData) -> None:
+    """Process pool initializer: keep the shared market data for later tasks."""
+    global _worker_market_data
+    _worker_market_data = market_data
+
+
+def _evaluate_walk_forward_task(config: BacktestConfiguration) -> Optional[PerformanceMetrics]:
+    """Backtest one window/parameter combination inside a worker process."""
+    engine = BacktestingEngine()
+
+    try:
+        _, equity_curve = engine._simulate(config, _worker_market_data)
+        return engine._calculate_performance_metrics(
+            equity_curve, _worker_market_data.benchmark, _worker_market_data.risk_free_rate, config
+        )
+    except ValueError as e:
+        logger.warning(f"Walk-forward task {config.start_date} to {config.end_date} skipped: {str(e)}")
+        return None
+
+
+def _run_sweep_variant_task(config: BacktestConfiguration) -> Optional[BacktestResult]:
+    """Run a full backtest for one sweep variant inside a worker process."""
+    engine = BacktestingEngine()
+
+    try:
+        return engine._build_single_result(config, _worker_market_data, str(uuid4()))
+    except ValueError as e:
+        logger.warning(f"Sweep variant '{config.strategy.name}' failed: {str(e)}")
+        return None
+
 
 class BacktestingEngine:
     """Main backtesting engine with walk-forward optimization."""
 
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
         self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers
 
     async def run_backtest(self, config: BacktestConfiguration,
                           market_data: MarketData) -> BacktestResult:
@@ -531,54 +584,132 @@ class BacktestingEngine:
             self.logger.error(f"Backtest {backtest_id} failed: {str(e)}")
             raise
 
+    async def run_parameter_sweep(self, base_config: BacktestConfiguration,
+                                  strategies: List[TradingStrategy],
+                                  market_data: MarketData) -> List[Optional[BacktestResult]]:
+        """Backtest many strategy variants over the same universe and date range.
+
+        Indicators are computed once and shared with a process pool through its
+        initializer; results are returned in variant order, with None for
+        variants that could not be evaluated.
+        """
+        shared_data = self._with_indicators(base_config.strategy, market_data)
+        variant_configs = [
+            base_config.copy(update={
+                'strategy': strategy,
+                'enable_walk_forward': False,
+                'parameter_grid': None
+            })
+            for strategy in strategies
+        ]
+
+        self.logger.info(f"Running parameter sweep with {len(variant_configs)} variants")
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 initializer=_init_backtest_worker,
+                                 initargs=(shared_data,)) as pool:
+            return await asyncio.gather(*[
+                loop.run_in_executor(pool, _run_sweep_variant_task, variant_config)
+                for variant_config in variant_configs
+            ])
+
     async def _run_single_backtest(self, config: BacktestConfiguration,
                                   market_data: MarketData, backtest_id: str) -> BacktestResult:
         """Run a single-period backtest."""
+        return self._build_single_result(config, market_data, backtest_id)
+
+    def _build_single_result(self, config: BacktestConfiguration,
+                             market_data: MarketData, backtest_id: str) -> BacktestResult:
+        """Simulate a single period and assemble the full backtest result."""
+        run_started = datetime.utcnow()
+
+        portfolio, equity_curve = self._simulate(config, market_data)
+
+        # Calculate performance metrics
+        performance_metrics = self._calculate_performance_metrics(
+            equity_curve, market_data.benchmark, market_data.risk_free_rate, config
+        )
+
+        # Create result
+        return BacktestResult(
+            backtest_id=backtest_id,
+            configuration=config,
+            performance_metrics=performance_metrics,
+            equity_curve=equity_curve,
+            trade_log=portfolio.trade_log,
+            walk_forward_results=None,
+            monthly_returns=self._calculate_monthly_returns(equity_curve),
+            rolling_sharpe=self._calculate_rolling_sharpe(equity_curve),
+            rolling_volatility=self._calculate_rolling_volatility(equity_curve),
+            sector_performance={},  # TODO: Implement sector analysis
+            top_winners=portfolio.trade_log.top_trades(10, winners=True),
+            top_losers=portfolio.trade_log.top_trades(10, winners=False),
+            execution_time_seconds=max((datetime.utcnow() - run_started).total_seconds(), 1e-6),
+            total_data_points=len(equity_curve),
+            cache_hit_rate=1.0,  # TODO: Implement cache tracking
+            data_quality_score=1.0  # TODO: Implement data quality assessment
+        )
+
+    def _simulate(self, config: BacktestConfiguration,
+                  market_data: MarketData) -> Tuple[PortfolioManager, EquityCurve]:
+        """Execute the strategy day by day and return the final portfolio and equity curve.
+
+        Uses ``market_data.indicators`` when already populated so callers that
+        run many configurations over the same data compute indicators once.
+        """
         # Initialize components
         signal_generator = SignalGenerator(config.strategy)
         portfolio = PortfolioManager(config.initial_capital, config.transaction_costs)
 
         # Calculate technical indicators
-        indicators = signal_generator.calculate_technical_indicators(market_data.prices)
+        indicators = market_data.indicators
+        if indicators is None or indicators.empty:
+            indicators = signal_generator.calculate_technical_indicators(market_data.prices)
 
         # Get trading dates
-        trading_dates = pd.date_range(config.start_date, config.end_date, freq='B')
-        available_dates = market_data.prices.index.intersection(trading_dates)
+        available_dates = self._get_trading_dates(config, market_data.prices)
 
         if len(available_dates) == 0:
             raise ValueError("No trading data available for the specified date range")
 
-        equity_curve = []
+        # Precompute signals and closes once so the day loop only reads arrays
+        symbols = list(config.universe)
+        entry_matrix, exit_matrix = signal_generator.generate_signal_matrices(
+            indicators, symbols, available_dates
+        )
+        entry_values = entry_matrix.to_numpy()
+        exit_values = exit_matrix.to_numpy()
+        close_values = self._get_close_matrix(market_data.prices, symbols, available_dates)
+
+        equity_curve = EquityCurve()
         prev_portfolio_value = config.initial_capital
 
         # Execute strategy day by day
-        for current_date in available_dates:
-            current_prices = {}
-
-            # Get current prices for all symbols
-            for symbol in config.universe:
-                try:
-                    price = market_data.prices.loc[current_date, ('Close', symbol)]
-                    if not pd.isna(price):
-                        current_prices[symbol] = price
-                except (KeyError, IndexError):
-                    continue
+        for row, current_date in enumerate(available_dates):
+            day_closes = close_values[row]
+            current_prices = {
+                symbol: float(day_closes[col])
+                for col, symbol in enumerate(symbols)
+                if not np.isnan(day_closes[col])
+            }
 
             if not current_prices:
                 continue
 
-            # Generate signals for all symbols
-            for symbol in current_prices.keys():
-                signals = signal_generator.generate_signals(
-                    indicators, symbol, [current_date.date()]
-                )
-
-                if current_date.date() not in signals:
+            # Read precomputed signals for all priced symbols
+            for col, symbol in enumerate(symbols):
+                if symbol not in current_prices:
                     continue
 
-                signal_data = signals[current_date.date()]
-                entry_signal = signal_data['entry_signal']
-                exit_signal = signal_data['exit_signal']
+                entry_signal = float(entry_values[row, col])
+                exit_signal = float(exit_values[row, col])
+                signals = {
+                    current_date.date(): {
+                        'entry_signal': entry_signal,
+                        'exit_signal': exit_signal
+                    }
+                }
 
                 # Position sizing
                 position_size = self._calculate_position_size(
@@ -618,54 +749,224 @@ class BacktestingEngine:
                         signal_strength=exit_signal
                     )
 
-            # Create daily snapshot
-            snapshot = portfolio.get_portfolio_snapshot(
-                current_date.date(), current_prices, prev_portfolio_value
+            # Record the daily snapshot straight into the columnar curve
+            benchmark_return_pct = 0.0
+            if current_date in market_data.benchmark.index:
+                benchmark_return_pct = float(market_data.benchmark.loc[current_date])
+
+            prev_portfolio_value = portfolio.record_snapshot(
+                equity_curve, current_date.date(), current_prices,
+                prev_portfolio_value, benchmark_return_pct
             )
 
-            # Add benchmark return
-            if current_date in market_data.benchmark.index:
-                snapshot.benchmark_return_pct = market_data.benchmark.loc[current_date]
+        return portfolio, equity_curve
 
-            equity_curve.append(snapshot)
-            prev_portfolio_value = snapshot.total_value
+    async def _run_walk_forward_backtest(self, config: BacktestConfiguration,
+                                       market_data: MarketData, backtest_id: str) -> BacktestResult:
+        """Run walk-forward optimization backtest.
+
+        Every (training window, parameter set) pair is backtested in a process
+        pool, the best in-sample parameters of each window are then evaluated
+        on the following out-of-sample window, and the full-period backtest is
+        returned with the per-window results attached.
+        """
+        windows = self._generate_walk_forward_windows(config, market_data.prices)
+        if not windows:
+            self.logger.warning(
+                "Date range too short for walk-forward windows; running single backtest"
+            )
+            return await self._run_single_backtest(config, market_data, backtest_id)
 
-        # Calculate performance metrics
-        performance_metrics = self._calculate_performance_metrics(
-            equity_curve, market_data.benchmark, market_data.risk_free_rate, config
+        parameter_sets = self._expand_parameter_grid(config.parameter_grid)
+        for parameters in parameter_sets:
+            self._apply_strategy_parameters(config.strategy, parameters)  # Fail fast on bad paths
+
+        # Indicators are causal, so one full-history pass serves every window
+        shared_data = self._with_indicators(config.strategy, market_data)
+
+        train_configs = [
+            self._window_configuration(config, window.train_start, window.train_end, parameters)
+            for window in windows
+            for parameters in parameter_sets
+        ]
+
+        self.logger.info(
+            f"Walk-forward {backtest_id}: {len(windows)} windows x "
+            f"{len(parameter_sets)} parameter sets"
         )
 
-        # Create result
-        return BacktestResult(
-            backtest_id=backtest_id,
-            configuration=config,
-            performance_metrics=performance_metrics,
-            equity_curve=equity_curve,
-            trade_log=portfolio.trade_log,
-            walk_forward_results=None,
-            monthly_returns=self._calculate_monthly_returns(equity_curve),
-            rolling_sharpe=self._calculate_rolling_sharpe(equity_curve),
-            rolling_volatility=self._calculate_rolling_volatility(equity_curve),
-            sector_performance={},  # TODO: Implement sector analysis
-            top_winners=sorted(
-                [t for t in portfolio.trade_log if t.pnl and t.pnl > 0],
-                key=lambda x: x.pnl, reverse=True
-            )[:10],
-            top_losers=sorted(
-                [t for t in portfolio.trade_log if t.pnl and t.pnl < 0],
-                key=lambda x: x.pnl
-            )[:10],
-            total_data_points=len(equity_curve),
-            cache_hit_rate=1.0,  # TODO: Implement cache tracking
-            data_quality_score=1.0  # TODO: Implement data quality assessment
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 initializer=_init_backtest_worker,
+                                 initargs=(shared_data,)) as pool:
+            train_metrics = await asyncio.gather(*[
+                loop.run_in_executor(pool, _evaluate_walk_forward_task, window_config)
+                for window_config in train_configs
+            ])
+
+            # Pick the best in-sample parameter set for each window
+            selections = []
+            for window_index, window in enumerate(windows):
+                offset = window_index * len(parameter_sets)
+                candidates = [
+                    (parameters, metrics)
+                    for parameters, metrics in zip(
+                        parameter_sets, train_metrics[offset:offset + len(parameter_sets)]
+                    )
+                    if metrics is not None
+                ]
+                if not candidates:
+                    continue
+
+                best_parameters, best_metrics = max(
+                    candidates, key=lambda item: getattr(item[1], config.optimization_metric)
+                )
+                selections.append((window, best_parameters, best_metrics, candidates))
+
+            test_metrics = await asyncio.gather(*[
+                loop.run_in_executor(
+                    pool, _evaluate_walk_forward_task,
+                    self._window_configuration(config, window.test_start, window.test_end, parameters)
+                )
+                for window, parameters, _, _ in selections
+            ])
+
+        walk_forward_results = [
+            self._build_walk_forward_result(
+                window, parameters, best_metrics, window_test_metrics,
+                candidates, config.optimization_metric
+            )
+            for (window, parameters, best_metrics, candidates), window_test_metrics
+            in zip(selections, test_metrics)
+            if window_test_metrics is not None
+        ]
+
+        result = await self._run_single_backtest(config, shared_data, backtest_id)
+        result.walk_forward_results = walk_forward_results
+        return result
+
+    @staticmethod
+    def _with_indicators(strategy: TradingStrategy, market_data: MarketData) -> MarketData:
+        """Market data with the indicator panel populated (computed at most once)."""
+        if market_data.indicators is not None and not market_data.indicators.empty:
+            return market_data
+
+        return MarketData(
+            prices=market_data.prices,
+            indicators=SignalGenerator(strategy).calculate_technical_indicators(market_data.prices),
+            risk_free_rate=market_data.risk_free_rate,
+            benchmark=market_data.benchmark
         )
 
-    async def _run_walk_forward_backtest(self, config: BacktestConfiguration,
-                                       market_data: MarketData, backtest_id: str) -> BacktestResult:
-        """Run walk-forward optimization backtest."""
-        # TODO: Implement walk-forward optimization
-        # For now, run single backtest
-        return await self._run_single_backtest(config, market_data, backtest_id)
+    @staticmethod
+    def _get_trading_dates(config: BacktestConfiguration, prices: pd.DataFrame) -> pd.DatetimeIndex:
+        """Business days in the configured range that have price data."""
+        trading_dates = pd.date_range(config.start_date, config.end_date, freq='B')
+        return prices.index.intersection(trading_dates)
+
+    def _generate_walk_forward_windows(self, config: BacktestConfiguration,
+                                       prices: pd.DataFrame) -> List[WalkForwardWindow]:
+        """Split the backtest range into rolling train/test windows (in trading days)."""
+        trading_dates = self._get_trading_dates(config, prices)
+        train_days = config.training_window_days
+        test_days = config.test_window_days
+
+        windows = []
+        start = 0
+        while start + train_days + test_days <= len(trading_dates):
+            windows.append(WalkForwardWindow(
+                train_start=trading_dates[start].date(),
+                train_end=trading_dates[start + train_days - 1].date(),
+                test_start=trading_dates[start + train_days].date(),
+                test_end=trading_dates[start + train_days + test_days - 1].date()
+            ))
+            start += config.step_size_days
+
+        return windows
+
+    @staticmethod
+    def _expand_parameter_grid(parameter_grid: Optional[Dict[str, List[float]]]) -> List[Dict[str, float]]:
+        """Cartesian product of the parameter grid; a single empty set when absent."""
+        if not parameter_grid:
+            return [{}]
+
+        names = list(parameter_grid.keys())
+        return [
+            dict(zip(names, values))
+            for values in product(*(parameter_grid[name] for name in names))
+        ]
+
+    @staticmethod
+    def _apply_strategy_parameters(strategy: TradingStrategy,
+                                   parameters: Dict[str, float]) -> TradingStrategy:
+        """Return a validated copy of the strategy with dotted-path parameters overridden."""
+        if not parameters:
+            return strategy
+
+        data = strategy.dict()
+        for path, value in parameters.items():
+            keys = path.split('.')
+            target = data
+            try:
+                for key in keys[:-1]:
+                    target = target[int(key)] if isinstance(target, list) else target[key]
+                if keys[-1] not in target:
+                    raise KeyError(keys[-1])
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise ValueError(f"Unknown strategy parameter: {path}")
+            target[keys[-1]] = value
+
+        return TradingStrategy(**data)
+
+    def _window_configuration(self, config: BacktestConfiguration, start: date, end: date,
+                              parameters: Dict[str, float]) -> BacktestConfiguration:
+        """Configuration for a single walk-forward window with parameter overrides."""
+        return config.copy(update={
+            'strategy': self._apply_strategy_parameters(config.strategy, parameters),
+            'start_date': start,
+            'end_date': end,
+            'enable_walk_forward': False,
+            'parameter_grid': None
+        })
+
+    @staticmethod
+    def _build_walk_forward_result(window: WalkForwardWindow, parameters: Dict[str, float],
+                                   train_metrics: PerformanceMetrics,
+                                   test_metrics: PerformanceMetrics,
+                                   candidates: List[Tuple[Dict[str, float], PerformanceMetrics]],
+                                   optimization_metric: str) -> WalkForwardResult:
+        """Summarize one window.
+
+        The overfitting score is the in-sample minus out-of-sample value of the
+        optimization metric; the stability score is the share of parameter sets
+        with a positive in-sample metric.
+        """
+        train_value = getattr(train_metrics, optimization_metric)
+        test_value = getattr(test_metrics, optimization_metric)
+        profitable = sum(
+            1 for _, metrics in candidates if getattr(metrics, optimization_metric) > 0
+        )
+
+        return WalkForwardResult(
+            train_start=window.train_start,
+            train_end=window.train_end,
+            test_start=window.test_start,
+            test_end=window.test_end,
+            train_metrics=train_metrics,
+            test_metrics=test_metrics,
+            optimized_parameters=parameters or None,
+            overfitting_score=train_value - test_value,
+            stability_score=profitable / len(candidates)
+        )
+
+    @staticmethod
+    def _get_close_matrix(prices: pd.DataFrame, symbols: List[str],
+                          dates: pd.DatetimeIndex) -> np.ndarray:
+        """Extract a (dates x symbols) close price array, NaN where unavailable."""
+        if 'Close' not in prices.columns.get_level_values(0):
+            return np.full((len(dates), len(symbols)), np.nan)
+
+        return prices['Close'].reindex(index=dates, columns=symbols).to_numpy(dtype=float)
 
     def _calculate_position_size(self, method: PositionSizingMethod, symbol: str,
                                prices: pd.DataFrame, signals: Dict,
@@ -689,7 +990,14 @@ class BacktestingEngine:
 
         return 0.1  # Default
 
-    def _calculate_performance_metrics(self, equity_curve: List[PortfolioSnapshot],
+    @staticmethod
+    def _as_equity_curve(equity_curve) -> EquityCurve:
+        """Accept a columnar curve or a plain list of snapshots."""
+        if isinstance(equity_curve, EquityCurve):
+            return equity_curve
+        return EquityCurve.from_models(equity_curve)
+
+    def _calculate_performance_metrics(self, equity_curve: EquityCurve,
                                      benchmark: pd.Series, risk_free_rate: pd.Series,
                                      config: BacktestConfiguration) -> PerformanceMetrics:
         """Calculate comprehensive performance metrics."""
@@ -697,17 +1005,15 @@ class BacktestingEngine:
             raise ValueError("Empty equity curve")
 
         # Extract returns
-        portfolio_values = [snapshot.total_value for snapshot in equity_curve]
-        dates = [snapshot.date for snapshot in equity_curve]
+        equity_curve = self._as_equity_curve(equity_curve)
+        portfolio_values = equity_curve.total_values
+        dates = equity_curve.dates
 
         if len(portfolio_values) < 2:
             raise ValueError("Insufficient data for performance calculation")
 
         # Calculate returns
-        returns = np.array([
-            (portfolio_values[i] - portfolio_values[i-1]) / portfolio_values[i-1]
-            for i in range(1, len(portfolio_values))
-        ])
+        returns = equity_curve.returns
 
         # Basic return metrics
         total_return = (portfolio_values[-1] - portfolio_values[0]) / portfolio_values[0]
@@ -730,19 +1036,14 @@ class BacktestingEngine:
 
         # Drawdown analysis
         peak = np.maximum.accumulate(portfolio_values)
-        drawdown = (np.array(portfolio_values) - peak) / peak
+        drawdown = (portfolio_values - peak) / peak
         max_drawdown = np.min(drawdown)
         current_drawdown = drawdown[-1]
 
-        # Max drawdown duration
-        max_dd_duration = 0
-        current_dd_duration = 0
-        for dd in drawdown:
-            if dd < 0:
-                current_dd_duration += 1
-                max_dd_duration = max(max_dd_duration, current_dd_duration)
-            else:
-                current_dd_duration = 0
+        # Max drawdown duration: longest run of consecutive days under water
+        underwater = drawdown < 0
+        run_ids = np.cumsum(~underwater)
+        max_dd_duration = int(np.bincount(run_ids[underwater]).max()) if underwater.any() else 0
 
         # Calmar ratio
         calmar_ratio = annualized_return / abs(max_drawdown) if max_drawdown != 0 else 0
@@ -761,7 +1062,7 @@ class BacktestingEngine:
         tracking_error = volatility
 
         # Trade statistics (placeholder - would be calculated from actual trades)
-        total_trades = len([t for t in equity_curve if hasattr(t, 'trades')])
+        total_trades = 0
         winning_trades = 0
         losing_trades = 0
         win_rate = 0.5
@@ -797,72 +1098,53 @@ class BacktestingEngine:
             avg_win=avg_win,
             avg_loss=avg_loss,
             profit_factor=profit_factor,
-            max_leverage=max(snapshot.leverage for snapshot in equity_curve),
-            avg_leverage=np.mean([snapshot.leverage for snapshot in equity_curve]),
-            start_date=dates[0],
-            end_date=dates[-1],
+            max_leverage=float(np.max(equity_curve.column('leverage'))),
+            avg_leverage=float(np.mean(equity_curve.column('leverage'))),
+            start_date=dates[0].item(),
+            end_date=dates[-1].item(),
             trading_days=trading_days
         )
 
-    def _calculate_monthly_returns(self, equity_curve: List[PortfolioSnapshot]) -> List[float]:
+    def _calculate_monthly_returns(self, equity_curve: EquityCurve) -> List[float]:
         """Calculate monthly returns from equity curve."""
-        monthly_returns = []
+        equity_curve = self._as_equity_curve(equity_curve)
 
         # Group by month and calculate returns
-        df = pd.DataFrame([
-            {'date': snapshot.date, 'value': snapshot.total_value}
-            for snapshot in equity_curve
-        ])
-        df['date'] = pd.to_datetime(df['date'])
-        df.set_index('date', inplace=True)
+        values = pd.Series(equity_curve.total_values, index=pd.DatetimeIndex(equity_curve.dates))
+        monthly_values = values.resample('M').last().to_numpy()
+
+        return (monthly_values[1:] / monthly_values[:-1] - 1).tolist()
 
-        monthly_values = df.resample('M').last()
-        for i in range(1, len(monthly_values)):
-            monthly_return = (monthly_values.iloc[i]['value'] - monthly_values.iloc[i-1]['value']) / monthly_values.iloc[i-1]['value']
-            monthly_returns.append(monthly_return)
+    def _rolling_return_windows(self, equity_curve: EquityCurve, window: int) -> np.ndarray:
+        """Trailing windows of daily returns, one row per output point.
 
-        return monthly_returns
+        Row ``k`` holds returns ``k .. k + window - 1``, matching windows that
+        end just before each return from index ``window`` onwards.
+        """
+        returns = self._as_equity_curve(equity_curve).returns
+        if len(returns) <= window:
+            return np.empty((0, window))
 
-    def _calculate_rolling_sharpe(self, equity_curve: List[PortfolioSnapshot],
+        return np.lib.stride_tricks.sliding_window_view(returns[:-1], window)
+
+    def _calculate_rolling_sharpe(self, equity_curve: EquityCurve,
                                 window: int = 252) -> List[float]:
         """Calculate rolling Sharpe ratio."""
-        values = [snapshot.total_value for snapshot in equity_curve]
-        returns = np.array([
-            (values[i] - values[i-1]) / values[i-1]
-            for i in range(1, len(values))
-        ])
-
-        rolling_sharpe = []
-        for i in range(window, len(returns)):
-            window_returns = returns[i-window:i]
-            window_mean = np.mean(window_returns)
-            window_std = np.std(window_returns)
-
-            if window_std > 0:
-                sharpe = (window_mean * 252 - 0.02) / (window_std * np.sqrt(252))  # Assume 2% risk-free rate
-            else:
-                sharpe = 0.0
+        windows = self._rolling_return_windows(equity_curve, window)
+        window_mean = windows.mean(axis=1)
+        window_std = windows.std(axis=1)
 
-            rolling_sharpe.append(sharpe)
+        # Assume 2% risk-free rate
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe = (window_mean * 252 - 0.02) / (window_std * np.sqrt(252))
 
-        return rolling_sharpe
+        return np.where(window_std > 0, sharpe, 0.0).tolist()
 
-    def _calculate_rolling_volatility(self, equity_curve: List[PortfolioSnapshot],
+    def _calculate_rolling_volatility(self, equity_curve: EquityCurve,
                                     window: int = 252) -> List[float]:
         """Calculate rolling volatility."""
-        values = [snapshot.total_value for snapshot in equity_curve]
-        returns = np.array([
-            (values[i] - values[i-1]) / values[i-1]
-            for i in range(1, len(values))
-        ])
-
-        rolling_vol = []
-        for i in range(window, len(returns)):
-            window_returns = returns[i-window:i]
-            vol = np.std(window_returns) * np.sqrt(252)
-            rolling_vol.append(vol)
-
-        return rolling_vol
+        windows = self._rolling_return_windows(equity_curve, window)
+        return (windows.std(axis=1) * np.sqrt(252)).tolist()
 
     @staticmethod
     def _calculate_skewness(returns: np.ndarray) -> float:
@@ -0,0 +1,357 @@
+"""
+Local columnar OHLCV bar store.
+Bars are kept per (symbol, interval) as memory-mapped NumPy files. Only the
+date ranges that are missing or stale are fetched from the provider, and
+refreshes write only the new rows into spare capacity at the end of the
+file; slices are served as views of the mapped file.
+"""
+
+import asyncio
+import json
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+
+BAR_COLUMNS: Tuple[str, ...] = ("Open", "High", "Low", "Close", "Volume")
+
+# Calendar days covered by each yfinance-style period ("max" means all history)
+PERIOD_DAYS: Dict[str, Optional[int]] = {
+    "1d": 1, "5d": 5, "1mo": 31, "3mo": 92, "6mo": 183,
+    "1y": 366, "2y": 731, "5y": 1827, "10y": 3653, "ytd": 366, "max": None,
+}
+
+INTRADAY_INTERVALS = {"1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h"}
+
+# Spare rows reserved when a series file is (re)written, so refreshes can append in place
+MIN_SPARE_ROWS = 64
+SPARE_ROWS_FRACTION = 0.25
+
+# Provider signature: (symbol, interval, start, end) -> OHLCV frame; None bounds are open-ended
+BarFetcher = Callable[[str, str, Optional[pd.Timestamp], Optional[pd.Timestamp]], Awaitable[Optional[pd.DataFrame]]]
+
+
+@dataclass
+class Bars:
+    """A slice of stored bars. Columns are read-only views of the memory-mapped file."""
+    index: pd.DatetimeIndex
+    values: np.ndarray  # (bars, 5) Fortran-ordered: Open, High, Low, Close, Volume
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def column(self, name: str) -> np.ndarray:
+        return self.values[:, BAR_COLUMNS.index(name)]
+
+    @property
+    def open(self) -> np.ndarray:
+        return self.column("Open")
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.column("High")
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.column("Low")
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.column("Close")
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.column("Volume")
+
+    def to_frame(self) -> pd.DataFrame:
+        """OHLCV DataFrame backed by the stored arrays (no copy)."""
+        return pd.DataFrame(self.values, index=self.index, columns=list(BAR_COLUMNS), copy=False)
+
+
+def period_start(period: str, now: pd.Timestamp) -> Optional[pd.Timestamp]:
+    if period not in PERIOD_DAYS:
+        raise ValueError(f"Unsupported period: {period}")
+    if period == "ytd":
+        return pd.Timestamp(year=now.year, month=1, day=1)
+    days = PERIOD_DAYS[period]
+    return None if days is None else (now - pd.Timedelta(days=days)).normalize()
+
+
+def frame_to_array(df: pd.DataFrame) -> np.ndarray:
+    """(bars, 6) Fortran-ordered float64 array: epoch seconds, then OHLCV.
+
+    Timestamps are stored as exchange wall-clock time (tz dropped), matching
+    how callers format provider indexes.
+    """
+    if df is None or df.empty:
+        return np.empty((0, 1 + len(BAR_COLUMNS)), order="F")
+
+    index = pd.DatetimeIndex(df.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+
+    array = np.empty((len(df), 1 + len(BAR_COLUMNS)), order="F")
+    array[:, 0] = index.as_unit("s").asi8
+    for i, column in enumerate(BAR_COLUMNS, start=1):
+        array[:, i] = df[column].to_numpy(dtype=float) if column in df.columns else np.nan
+
+    array = array[~np.isnan(array[:, 4])]  # drop bars without a close
+    order = np.argsort(array[:, 0], kind="stable")
+    return np.asfortranarray(array[order])
+
+
+def merge_bars(existing: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """Splice ``new`` into ``existing``; fetched bars replace stored bars in their time range."""
+    if len(new) == 0:
+        return existing
+    if len(existing) == 0:
+        return new
+    first, last = new[0, 0], new[-1, 0]
+    ts = existing[:, 0]
+    return np.asfortranarray(np.concatenate([existing[ts < first], new, existing[ts > last]]))
+
+
+class BarStore:
+    """Incrementally maintained OHLCV history per (symbol, interval).
+
+    ``get_bars`` fetches only what is missing: earlier history when a longer
+    period is requested than has been covered, and bars since the last
+    stored one (re-fetching that bar, which may have been partial) once the
+    series is older than its refresh interval. New bars are appended in
+    place into spare rows past the end of the series, which no earlier
+    slice can see; when re-fetched bars differ from stored ones, and for
+    backfills and rebuilds, the file is rewritten and atomically replaced,
+    so slices already handed out keep their values. Adjusted-price providers rewrite history on splits and
+    dividends, so a series is rebuilt from scratch after ``rebuild_days``.
+    Concurrent requests for the same series share one update, and disk I/O
+    runs in a worker thread.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        fetch: BarFetcher,
+        daily_refresh_seconds: float = 300,
+        intraday_refresh_seconds: float = 60,
+        rebuild_days: float = 7,
+        clock: Optional[Callable[[], pd.Timestamp]] = None
+    ):
+        self.root = Path(root)
+        self.fetch = fetch
+        self.daily_refresh_seconds = daily_refresh_seconds
+        self.intraday_refresh_seconds = intraday_refresh_seconds
+        self.rebuild_days = rebuild_days
+        self.clock = clock or pd.Timestamp.now
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    # Files
+
+    def _paths(self, symbol: str, interval: str) -> Tuple[Path, Path]:
+        name = re.sub(r"[^A-Za-z0-9._-]", "_", symbol)
+        directory = self.root / interval
+        return directory / f"{name}.npy", directory / f"{name}.json"
+
+    def _read(self, symbol: str, interval: str) -> Tuple[Optional[np.ndarray], Dict[str, Any]]:
+        data_path, meta_path = self._paths(symbol, interval)
+        try:
+            if data_path.exists() and meta_path.exists():
+                mapped, meta = np.load(data_path, mmap_mode="r"), json.loads(meta_path.read_text())
+                # Rows past meta["rows"] are spare capacity (files without it are fully used)
+                return mapped[:meta.get("rows", len(mapped))], meta
+        except Exception as e:
+            logger.warning(f"Discarding unreadable bar store entry {symbol} {interval}: {e}")
+        return None, {}
+
+    @staticmethod
+    def _replace(path: Path, write: Callable[[Any], None]) -> None:
+        """Write a uniquely named temporary file and atomically move it over ``path``."""
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _write(self, symbol: str, interval: str, array: np.ndarray, meta: Dict[str, Any]) -> np.ndarray:
+        """Rewrite the series with spare capacity; returns the newly mapped rows."""
+        data_path, _ = self._paths(symbol, interval)
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+
+        rows = len(array)
+        capacity = rows + max(MIN_SPARE_ROWS, int(rows * SPARE_ROWS_FRACTION))
+        padded = np.full((capacity, array.shape[1]), np.nan, order="F")
+        padded[:rows] = array
+
+        # A new file replaces the old one; maps of the old file keep its data
+        self._replace(data_path, lambda f: np.save(f, padded))
+        self._write_meta(symbol, interval, {**meta, "rows": rows})
+        return self._read(symbol, interval)[0]
+
+    def _append(self, symbol: str, interval: str, new: np.ndarray, meta: Dict[str, Any]) -> np.ndarray:
+        """Write ``new`` into the spare rows after the series; returns the mapped rows.
+
+        Earlier slices end at the old row count, so they never see these rows.
+        Falls back to a full rewrite when the file has no room left.
+        """
+        data_path, _ = self._paths(symbol, interval)
+        rows = meta["rows"]
+        mapped = np.load(data_path, mmap_mode="r+")
+        end = rows + len(new)
+        if end > len(mapped) or not mapped.flags.f_contiguous:
+            array = np.concatenate([np.asarray(mapped[:rows]), new])
+            del mapped
+            return self._write(symbol, interval, array, meta)
+
+        mapped[rows:end] = new
+        mapped.flush()
+        del mapped
+
+        # Data first, then the row count: a crash in between leaves the old rows valid
+        self._write_meta(symbol, interval, {**meta, "rows": end})
+        return self._read(symbol, interval)[0]
+
+    def _write_meta(self, symbol: str, interval: str, meta: Dict[str, Any]) -> None:
+        _, meta_path = self._paths(symbol, interval)
+        self._replace(meta_path, lambda f: f.write(json.dumps(meta).encode()))
+
+    def clear(self, symbol: str, interval: str = "1d") -> None:
+        for path in self._paths(symbol, interval):
+            path.unlink(missing_ok=True)
+
+    # Reads
+
+    def _refresh_seconds(self, interval: str) -> float:
+        return self.intraday_refresh_seconds if interval in INTRADAY_INTERVALS else self.daily_refresh_seconds
+
+    async def get_bars(self, symbol: str, interval: str = "1d", period: str = "1y") -> Optional[Bars]:
+        """Bars for the period, fetching only missing or stale ranges. None if the provider has none."""
+        key = (symbol, interval)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            array = await self._update(symbol, interval, period)
+
+        if array is None or len(array) == 0:
+            return None
+        return self._slice(array, period_start(period, self.clock()))
+
+    async def _update(self, symbol: str, interval: str, period: str) -> Optional[np.ndarray]:
+        now = self.clock()
+        start = period_start(period, now)
+        array, meta = await asyncio.to_thread(self._read, symbol, interval)
+
+        built_at = meta.get("built_at")
+        if array is not None and built_at is not None and now.timestamp() - built_at > self.rebuild_days * 86400:
+            logger.info(f"Rebuilding stored bars for {symbol} {interval}")
+            array, meta = None, {}
+
+        if array is None or len(array) == 0:
+            fetched = frame_to_array(await self.fetch(symbol, interval, start, None))
+            if len(fetched) == 0:
+                return None
+            meta = {
+                "covered_from": None if start is None else start.timestamp(),
+                "built_at": now.timestamp(),
+                "fetched_at": now.timestamp(),
+            }
+            return await asyncio.to_thread(self._write, symbol, interval, fetched, meta)
+
+        rewrite = False
+        meta_changed = False
+        appended = None
+        covered_from = meta.get("covered_from")
+        meta.setdefault("rows", len(array))
+
+        # Backfill history older than anything fetched so far (prepends, so rewrites the file)
+        if covered_from is not None and (start is None or start.timestamp() < covered_from):
+            older = frame_to_array(await self.fetch(
+                symbol, interval, start, pd.Timestamp(covered_from, unit="s")
+            ))
+            array = merge_bars(np.asarray(array), older[older[:, 0] < array[0, 0]])
+            meta["covered_from"] = None if start is None else start.timestamp()
+            rewrite = True
+
+        # Refresh from the last stored bar onwards
+        if now.timestamp() - meta.get("fetched_at", 0) > self._refresh_seconds(interval):
+            newer = frame_to_array(await self.fetch(
+                symbol, interval, pd.Timestamp(array[-1, 0], unit="s"), None
+            ))
+            meta["fetched_at"] = now.timestamp()
+            meta_changed = True
+            if len(newer):
+                # Stored bars the refresh re-fetched must be unchanged to append in place
+                overlap = len(array) - int(np.searchsorted(array[:, 0], newer[0, 0]))
+                unchanged = (
+                    overlap <= len(newer)
+                    and np.array_equal(array[len(array) - overlap:], newer[:overlap], equal_nan=True)
+                )
+                if rewrite or not unchanged:
+                    array = merge_bars(np.asarray(array), newer)
+                    rewrite = True
+                elif overlap < len(newer):
+                    appended = newer[overlap:]
+
+        if rewrite:
+            return await asyncio.to_thread(self._write, symbol, interval, array, meta)
+        if appended is not None:
+            return await asyncio.to_thread(self._append, symbol, interval, appended, meta)
+        if meta_changed:
+            await asyncio.to_thread(self._write_meta, symbol, interval, meta)
+        return array
+
+    @staticmethod
+    def _slice(array: np.ndarray, start: Optional[pd.Timestamp]) -> Bars:
+        first = 0 if start is None else int(np.searchsorted(array[:, 0], start.timestamp()))
+        rows = array[first:]
+        index = pd.DatetimeIndex(pd.to_datetime(rows[:, 0].astype(np.int64), unit="s"))
+        return Bars(index=index, values=rows[:, 1:])
+
+
+class FakeBarProvider:
+    """Offline deterministic bar source for tests and development.
+
+    Prices are a pure function of (symbol, timestamp), so overlapping
+    fetches always agree. Every call is recorded in ``calls``.
+    """
+
+    FREQUENCIES = {"1d": "B", "5d": "5B", "1wk": "W-FRI", "1mo": "BM", "3mo": "BQ", "1h": "h", "60m": "h",
+                   "90m": "90min", "30m": "30min", "15m": "15min", "5m": "5min", "2m": "2min", "1m": "min"}
+
+    def __init__(self, base_price: float = 100.0, clock: Optional[Callable[[], pd.Timestamp]] = None,
+                 history_start: str = "2000-01-03"):
+        self.base_price = base_price
+        self.clock = clock or pd.Timestamp.now
+        self.history_start = pd.Timestamp(history_start)
+        self.calls: List[Tuple[str, str, Optional[pd.Timestamp], Optional[pd.Timestamp]]] = []
+
+    async def __call__(self, symbol: str, interval: str, start: Optional[pd.Timestamp],
+                       end: Optional[pd.Timestamp]) -> pd.DataFrame:
+        self.calls.append((symbol, interval, start, end))
+
+        now = self.clock()
+        start = self.history_start if start is None else max(start, self.history_start)
+        index = pd.date_range(start, now if end is None else min(end, now), freq=self.FREQUENCIES.get(interval, "B"))
+        if end is not None:
+            index = index[index < end]  # end bound is exclusive, like the yfinance API
+
+        seed = sum(ord(c) * (i + 1) for i, c in enumerate(symbol)) % 997
+        t = index.asi8 / 86400e9
+        noise = np.modf(np.abs(np.sin(t * 12.9898 + seed) * 43758.5453))[0] - 0.5
+        close = self.base_price * (1 + seed / 997) * (1 + 0.2 * np.sin(t / 60 + seed) + 0.02 * noise)
+        spread = close * 0.01 * (1 + np.abs(noise))
+
+        return pd.DataFrame({
+            "Open": close - spread * noise,
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Volume": np.round(1e6 * (1.5 + noise)),
+        }, index=index)
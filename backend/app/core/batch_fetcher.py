@@ -0,0 +1,83 @@
+"""
+Request coalescing for bulk data providers.
+Concurrent per-key requests are merged into one bulk fetch and the results
+are fanned back out to every waiting caller.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Set
+
+from loguru import logger
+
+
+class BatchCoalescer:
+    """Collects keys requested within ``max_wait`` seconds into bulk fetches.
+
+    ``bulk_fetch(keys)`` returns a dict of results; keys it omits resolve to
+    None. A key already queued or being fetched is not requested again, so
+    overlapping callers share one result. Batches are split at
+    ``max_batch`` keys and dispatched as soon as that many are queued. A
+    failed bulk fetch is logged and resolves its keys to None.
+    """
+
+    def __init__(self, bulk_fetch: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+                 max_batch: int = 200, max_wait: float = 0.01):
+        self.bulk_fetch = bulk_fetch
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait
+        self.bulk_calls = 0
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(self, key: Hashable) -> Any:
+        return (await self.get_many([key]))[key]
+
+    async def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        loop = asyncio.get_running_loop()
+        futures = {}
+        for key in dict.fromkeys(keys):
+            future = self._in_flight.get(key) or self._pending.get(key)
+            if future is None:
+                future = loop.create_future()
+                self._pending[key] = future
+            futures[key] = future
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._pending and self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+
+        # Shielded so one cancelled caller does not cancel the shared result
+        results = await asyncio.gather(*(asyncio.shield(future) for future in futures.values()))
+        return dict(zip(futures, results))
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, {}
+        keys = list(pending)
+        for start in range(0, len(keys), self.max_batch):
+            batch = {key: pending[key] for key in keys[start:start + self.max_batch]}
+            self._in_flight.update(batch)
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: Dict[Hashable, asyncio.Future]) -> None:
+        self.bulk_calls += 1
+        results = {}
+        try:
+            results = await self.bulk_fetch(list(batch)) or {}
+        except Exception as e:
+            logger.error(f"Bulk fetch of {len(batch)} keys failed: {e}")
+        finally:
+            # Always release waiters, including when this dispatch is cancelled
+            for key, future in batch.items():
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+                if not future.done():
+                    future.set_result(results.get(key))
@@ -0,0 +1,339 @@
+"""
+Two-tier cache: a bounded in-process LRU/TTL tier in front of async Redis.
+
+Values are stored in Redis as orjson. Pydantic models and datetimes are
+tagged on the way in so they come back with their original types; decoding
+only ever rebuilds ``app`` pydantic models via ``model_validate``, never
+arbitrary objects. Concurrent misses on the same key are coalesced into a
+single fetch. Every caller gets its own copy of a cached value, so mutating
+a result never changes what other callers see.
+"""
+
+import asyncio
+import copy
+import importlib
+import time
+from collections import OrderedDict
+from datetime import date, datetime, time as dt_time
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import orjson
+from loguru import logger
+from pydantic import BaseModel
+import redis.asyncio as redis
+
+
+_MODEL_TAG = "__model__"
+_DATETIME_TAG = "__datetime__"
+_DATE_TAG = "__date__"
+_TIME_TAG = "__time__"
+_MODEL_PACKAGE = "app."
+_DUMPS_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Models seen while encoding, by qualified name; others are imported on demand
+_models: Dict[str, type] = {}
+
+
+def _model_name(model: type) -> str:
+    return f"{model.__module__}:{model.__qualname__}"
+
+
+def _resolve_model(name: str) -> type:
+    model = _models.get(name)
+    if model is not None:
+        return model
+
+    module_name, _, qualname = name.partition(":")
+    if not module_name.startswith(_MODEL_PACKAGE):
+        raise ValueError(f"Refusing to decode model outside {_MODEL_PACKAGE}*: {name}")
+
+    model = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        model = getattr(model, part)
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        raise ValueError(f"Not a pydantic model: {name}")
+
+    _models[name] = model
+    return model
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        model = type(value)
+        name = _model_name(model)
+        _models.setdefault(name, model)
+        return {_MODEL_TAG: name, "data": value.model_dump(mode="json")}
+    # datetime before date: datetime is a date subclass
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, date):
+        return {_DATE_TAG: value.isoformat()}
+    if isinstance(value, dt_time):
+        return {_TIME_TAG: value.isoformat()}
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if hasattr(value, "item"):  # NumPy scalars not covered by OPT_SERIALIZE_NUMPY
+        return value.item()
+    return str(value)
+
+
+def _decode_tags(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode_tags(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    if len(value) == 1:
+        if _DATETIME_TAG in value:
+            return datetime.fromisoformat(value[_DATETIME_TAG])
+        if _DATE_TAG in value:
+            return date.fromisoformat(value[_DATE_TAG])
+        if _TIME_TAG in value:
+            return dt_time.fromisoformat(value[_TIME_TAG])
+    if _MODEL_TAG in value and len(value) == 2 and "data" in value:
+        return _resolve_model(value[_MODEL_TAG]).model_validate(value["data"])
+    return {key: _decode_tags(item) for key, item in value.items()}
+
+
+class LocalCache:
+    """Bounded LRU cache with per-entry expiry (monotonic clock).
+
+    Values are deep-copied on the way in and out, so neither the caller that
+    stored a value nor any reader can change the cached entry.
+    """
+
+    def __init__(self, max_items: int = 10000, max_ttl: float = 60):
+        self.max_items = max_items
+        self.max_ttl = max_ttl
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        ttl = min(ttl, self.max_ttl)
+        if ttl <= 0 or self.max_items <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_items:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    def delete_matching(self, pattern: str) -> int:
+        """Delete keys matching a Redis-style glob pattern."""
+        matched = [key for key in self._entries if fnmatchcase(key, pattern)]
+        for key in matched:
+            del self._entries[key]
+        return len(matched)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class TwoTierCache:
+    """In-process LRU tier backed by an async Redis client.
+
+    Reads check the local tier first, then Redis (populating the local tier
+    on a hit). ``get_or_set`` runs one fetch per key at a time: callers that
+    miss while a fetch is in flight await its result instead of fetching
+    again. After a Redis connection error Redis is skipped for
+    ``retry_seconds`` and the cache degrades to local-only.
+    """
+
+    def __init__(self, redis_client: Optional[redis.Redis] = None, default_ttl: int = 300,
+                 max_local_items: int = 10000, max_local_ttl: float = 60,
+                 retry_seconds: float = 30):
+        self.redis_client = redis_client
+        self.default_ttl = default_ttl
+        self.local = LocalCache(max_local_items, max_local_ttl)
+        self.retry_seconds = retry_seconds
+        self._redis_retry_at = 0.0
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    # Serialization
+
+    @staticmethod
+    def dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=_encode_default, option=_DUMPS_OPTIONS)
+
+    @staticmethod
+    def loads(data: bytes) -> Any:
+        return _decode_tags(orjson.loads(data))
+
+    # Redis availability
+
+    @property
+    def redis_available(self) -> bool:
+        return self.redis_client is not None and time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, action: str, key: str, error: Exception) -> None:
+        if isinstance(error, (redis.ConnectionError, redis.TimeoutError, OSError)):
+            self._redis_retry_at = time.monotonic() + self.retry_seconds
+            logger.warning(f"Redis unavailable, using local cache for {self.retry_seconds}s: {error}")
+        else:
+            logger.error(f"Cache {action} error for key {key}: {error}")
+
+    def _decode(self, key: str, data: Optional[bytes]) -> Optional[Any]:
+        if data is None:
+            return None
+        try:
+            return self.loads(data)
+        except Exception as e:
+            logger.error(f"Cache decode error for key {key}: {e}")
+            return None
+
+    # Single-key operations
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = self.local.get(key)
+        if value is not None or not self.redis_available:
+            return value
+
+        try:
+            data = await self.redis_client.get(key)
+        except Exception as e:
+            self._redis_failed("get", key, e)
+            return None
+
+        value = self._decode(key, data)
+        if value is not None:
+            self.local.set(key, value, self.local.max_ttl)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        ttl = self.default_ttl if ttl is None else ttl
+        self.local.set(key, value, ttl)
+        if not self.redis_available:
+            return False
+
+        try:
+            await self.redis_client.setex(key, ttl, self.dumps(value))
+            return True
+        except Exception as e:
+            self._redis_failed("set", key, e)
+            return False
+
+    async def delete(self, key: str) -> bool:
+        self.local.delete(key)
+        if not self.redis_available:
+            return False
+
+        try:
+            await self.redis_client.delete(key)
+            return True
+        except Exception as e:
+            self._redis_failed("delete", key, e)
+            return False
+
+    async def get_or_set(self, key: str, fetch_func: Callable[[], Any],
+                         ttl: Optional[int] = None) -> Any:
+        """Return the cached value, or fetch it once for all concurrent callers."""
+        value = self.local.get(key)
+        if value is not None:
+            return value
+
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._load(key, fetch_func, ttl))
+            self._in_flight[key] = flight
+            flight.add_done_callback(lambda done: self._finish_flight(key, done))
+
+        # Shielded so a cancelled caller does not cancel the fetch for the others;
+        # copied so concurrent callers never share one mutable result
+        return copy.deepcopy(await asyncio.shield(flight))
+
+    def _finish_flight(self, key: str, flight: asyncio.Future) -> None:
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+
+    async def _load(self, key: str, fetch_func: Callable[[], Any], ttl: Optional[int]) -> Any:
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        logger.debug(f"Cache miss for key: {key}, fetching data")
+        if asyncio.iscoroutinefunction(fetch_func):
+            value = await fetch_func()
+        else:
+            value = fetch_func()
+
+        if value is not None:
+            await self.set(key, value, ttl)
+        return value
+
+    # Multi-key operations
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        result = {}
+        missing = []
+        for key in keys:
+            value = self.local.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                result[key] = value
+
+        if not missing or not self.redis_available:
+            return result
+
+        try:
+            values = await self.redis_client.mget(missing)
+        except Exception as e:
+            self._redis_failed("batch get", ",".join(missing[:3]), e)
+            return result
+
+        for key, data in zip(missing, values):
+            value = self._decode(key, data)
+            if value is not None:
+                self.local.set(key, value, self.local.max_ttl)
+                result[key] = value
+        return result
+
+    async def set_many(self, data_dict: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        ttl = self.default_ttl if ttl is None else ttl
+        for key, value in data_dict.items():
+            self.local.set(key, value, ttl)
+        if not data_dict or not self.redis_available:
+            return False
+
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for key, value in data_dict.items():
+                pipeline.setex(key, ttl, self.dumps(value))
+            await pipeline.execute()
+            return True
+        except Exception as e:
+            self._redis_failed("batch set", ",".join(list(data_dict)[:3]), e)
+            return False
+
+    async def delete_pattern(self, pattern: str) -> int:
+        deleted = self.local.delete_matching(pattern)
+        if not self.redis_available:
+            return deleted
+
+        try:
+            keys = [key async for key in self.redis_client.scan_iter(match=pattern, count=500)]
+            if keys:
+                return await self.redis_client.delete(*keys)
+            return 0
+        except Exception as e:
+            self._redis_failed("pattern clear", pattern, e)
+            return deleted
@@ -0,0 +1,384 @@
+"""
+Columnar scanner evaluation.
+The scanned universe is held as one NumPy column per field, so each built-in
+filter is a single boolean mask over every symbol, and match scores, matched
+filters, sorting and top-N are all derived from those masks.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from ..models.scanner_models import ComparisonOperator, FilterCondition, FilterGroup, ScannerConfig
+
+
+# Built-in filters in the order they are reported as matched
+FILTER_NAMES: Tuple[str, ...] = ('price', 'volume', 'technical', 'fundamental', 'momentum', 'pattern')
+
+# Row getters for built-in filter fields: (row, indicators, fundamentals) -> value.
+# Defaults are the ones the row-wise filter checks use for missing keys.
+_FIELDS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any], Dict[str, Any]], Any]] = {
+    'price': lambda row, ind, fund: row.get('price', 0),
+    'change_percent': lambda row, ind, fund: row.get('change_percent', 0),
+    'high': lambda row, ind, fund: row.get('high', row.get('price', 0)),
+    'low': lambda row, ind, fund: row.get('low', row.get('price', 0)),
+    'volume': lambda row, ind, fund: row.get('volume', 0),
+    'avg_volume': lambda row, ind, fund: row.get('avg_volume', row.get('volume', 0)),
+    'vwap': lambda row, ind, fund: ind.get('vwap', row.get('price', 0)),
+    'rsi': lambda row, ind, fund: ind.get('rsi'),
+    'macd_histogram': lambda row, ind, fund: ind.get('macd_histogram', 0),
+    'adx': lambda row, ind, fund: ind.get('adx', 0),
+    'bollinger_position': lambda row, ind, fund: ind.get('bollinger_position', 'middle'),
+    'rate_of_change': lambda row, ind, fund: ind.get('rate_of_change', 0),
+    'relative_strength': lambda row, ind, fund: ind.get('relative_strength', 50),
+    'market_cap': lambda row, ind, fund: fund.get('market_cap'),
+    'pe_ratio': lambda row, ind, fund: fund.get('pe_ratio'),
+    'sector': lambda row, ind, fund: fund.get('sector'),
+}
+
+# Custom-condition operators evaluated as array comparisons; others run per row
+_NUMERIC_OPS = {
+    ComparisonOperator.GREATER_THAN: np.greater,
+    ComparisonOperator.GREATER_THAN_OR_EQUAL: np.greater_equal,
+    ComparisonOperator.LESS_THAN: np.less,
+    ComparisonOperator.LESS_THAN_OR_EQUAL: np.less_equal,
+    ComparisonOperator.CROSSES_ABOVE: np.greater,
+    ComparisonOperator.CROSSES_BELOW: np.less,
+}
+
+
+def _number(value: Any) -> float:
+    """Numeric value of a built-in field; NaN for None and non-numeric values."""
+    if isinstance(value, (int, float, Decimal)):
+        return float(value)
+    return np.nan
+
+
+def _float_or_nan(value: Any) -> float:
+    """``float(value)`` as the row-wise comparisons use it; NaN where that fails."""
+    try:
+        return float(value)
+    except (TypeError, ValueError, ArithmeticError):
+        return np.nan
+
+
+def _section(row: Dict[str, Any], key: str) -> Tuple[Dict[str, Any], bool]:
+    """Nested dict of a row and whether it is well formed (missing counts as empty)."""
+    value = row.get(key, {})
+    if isinstance(value, dict):
+        return value, True
+    return {}, False
+
+
+class UniverseColumns:
+    """Struct-of-arrays view of the per-symbol data of one scan universe.
+
+    Columns are built on first use and kept, so repeated scans over the same
+    universe only pay for the mask arithmetic. Numeric columns hold NaN for
+    missing or non-numeric values; text-like fields are stored as integer
+    category codes. Rows whose ``indicators``, ``fundamentals`` or
+    ``patterns`` are malformed fail the filters that read them, as they do
+    in the row-wise checks.
+    """
+
+    def __init__(self, asset_data: Dict[str, Dict[str, Any]]):
+        self.symbols: List[str] = list(asset_data)
+        self.rows: List[Dict[str, Any]] = list(asset_data.values())
+
+        sections = [(_section(row, 'indicators'), _section(row, 'fundamentals')) for row in self.rows]
+        self.indicators = [indicators for (indicators, _), _ in sections]
+        self.fundamentals = [fundamentals for _, (fundamentals, _) in sections]
+        self.indicators_ok = np.fromiter((ok for (_, ok), _ in sections), dtype=bool, count=len(self))
+        self.fundamentals_ok = np.fromiter((ok for _, (_, ok) in sections), dtype=bool, count=len(self))
+
+        self._numbers: Dict[str, np.ndarray] = {}
+        self._categories: Dict[str, Tuple[np.ndarray, List[Hashable]]] = {}
+        self._paths: Dict[str, np.ndarray] = {}
+        self._patterns: Optional[Tuple[Dict[Any, np.ndarray], np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _values(self, name: str):
+        getter = _FIELDS[name]
+        return (getter(row, ind, fund) for row, ind, fund in zip(self.rows, self.indicators, self.fundamentals))
+
+    def number(self, name: str) -> np.ndarray:
+        """Float column of a built-in filter field."""
+        column = self._numbers.get(name)
+        if column is None:
+            column = np.fromiter((_number(v) for v in self._values(name)), dtype=float, count=len(self))
+            self._numbers[name] = column
+        return column
+
+    def category(self, name: str) -> Tuple[np.ndarray, List[Hashable]]:
+        """(codes, categories) of a built-in filter field; unhashable values get code -1."""
+        cached = self._categories.get(name)
+        if cached is None:
+            positions: Dict[Hashable, int] = {}
+            codes = np.empty(len(self), dtype=np.intp)
+            for row, value in enumerate(self._values(name)):
+                try:
+                    codes[row] = positions.setdefault(value, len(positions))
+                except TypeError:
+                    codes[row] = -1
+            cached = self._categories[name] = (codes, list(positions))
+        return cached
+
+    def path(self, field: str) -> np.ndarray:
+        """Float column of a dot-notation field, as custom conditions read it."""
+        from .scanner_engine import FilterProcessor
+
+        column = self._paths.get(field)
+        if column is None:
+            column = np.fromiter(
+                (_float_or_nan(FilterProcessor._get_field_value(row, field)) for row in self.rows),
+                dtype=float, count=len(self)
+            )
+            self._paths[field] = column
+        return column
+
+    def patterns(self) -> Tuple[Dict[Any, np.ndarray], np.ndarray, np.ndarray]:
+        """(rows per pattern type, max pattern confidence, well-formed flags)."""
+        if self._patterns is None:
+            by_type: Dict[Any, List[int]] = {}
+            confidence = np.zeros(len(self))
+            ok = np.ones(len(self), dtype=bool)
+            for row, data in enumerate(self.rows):
+                patterns = data.get('patterns', [])
+                try:
+                    if not isinstance(patterns, (list, tuple)) or not all(isinstance(p, dict) for p in patterns):
+                        raise TypeError("malformed patterns")
+                    confidence[row] = _number(max([p.get('confidence', 0) for p in patterns], default=0))
+                    for pattern_type in {p.get('type') for p in patterns}:
+                        by_type.setdefault(pattern_type, []).append(row)
+                except TypeError:
+                    ok[row] = False
+            self._patterns = ({k: np.asarray(v, dtype=np.intp) for k, v in by_type.items()}, confidence, ok)
+        return self._patterns
+
+    def sort_key(self, sort_by: str) -> np.ndarray:
+        """Column of the result ``filter_values`` entry used to sort by ``sort_by`` (0 if absent)."""
+        if sort_by in ('price', 'volume', 'change_percent'):
+            return np.fromiter((_number(row.get(sort_by, 0)) for row in self.rows), dtype=float, count=len(self))
+        if sort_by.startswith('indicators.'):
+            key = sort_by[len('indicators.'):]
+            return np.fromiter((_number(ind.get(key, 0)) for ind in self.indicators), dtype=float, count=len(self))
+        return np.zeros(len(self))
+
+
+# Built-in filter masks. Each check is written as the condition a row must
+# meet, so NaN values (missing or non-numeric) fail it.
+
+def _price_mask(columns: UniverseColumns, f) -> np.ndarray:
+    price = columns.number('price')
+    mask = np.ones(len(columns), dtype=bool)
+    if f.min_price:
+        mask &= price >= float(f.min_price)
+    if f.max_price:
+        mask &= price <= float(f.max_price)
+    if f.price_change_percent:
+        mask &= np.abs(columns.number('change_percent')) >= float(f.price_change_percent)
+    if f.above_vwap is not None:
+        vwap = columns.number('vwap')
+        mask &= columns.indicators_ok & ((price > vwap) if f.above_vwap else (price < vwap))
+    if f.near_high:
+        high = columns.number('high')
+        mask &= (high != 0) & ((high - price) / high * 100 <= float(f.near_high))
+    if f.near_low:
+        low = columns.number('low')
+        mask &= (low != 0) & ((price - low) / low * 100 <= float(f.near_low))
+    return mask
+
+
+def _volume_mask(columns: UniverseColumns, f) -> np.ndarray:
+    volume = columns.number('volume')
+    mask = np.ones(len(columns), dtype=bool)
+    if f.min_volume:
+        mask &= volume >= f.min_volume
+    if f.max_volume:
+        mask &= volume <= f.max_volume
+    if f.volume_ratio:
+        avg_volume = columns.number('avg_volume')
+        mask &= (avg_volume <= 0) | (volume / avg_volume >= float(f.volume_ratio))
+    if f.dollar_volume:
+        mask &= volume * columns.number('price') >= float(f.dollar_volume)
+    return mask
+
+
+def _technical_mask(columns: UniverseColumns, f) -> np.ndarray:
+    mask = columns.indicators_ok.copy()
+    rsi = columns.number('rsi')
+    checked = ~np.isnan(rsi) & (rsi != 0)  # RSI bounds only apply when RSI is present
+    if f.rsi_min:
+        mask &= ~checked | (rsi >= float(f.rsi_min))
+    if f.rsi_max:
+        mask &= ~checked | (rsi <= float(f.rsi_max))
+    if f.macd_signal == 'bullish':
+        mask &= columns.number('macd_histogram') > 0
+    elif f.macd_signal == 'bearish':
+        mask &= columns.number('macd_histogram') < 0
+    if f.adx_min:
+        mask &= columns.number('adx') >= float(f.adx_min)
+    if f.bollinger_position:
+        codes, categories = columns.category('bollinger_position')
+        allowed = [code for code, value in enumerate(categories) if value == f.bollinger_position]
+        mask &= np.isin(codes, allowed)
+    return mask
+
+
+def _fundamental_mask(columns: UniverseColumns, f) -> np.ndarray:
+    mask = columns.fundamentals_ok.copy()
+    for name, low, high in (('market_cap', f.market_cap_min, f.market_cap_max),
+                            ('pe_ratio', f.pe_ratio_min, f.pe_ratio_max)):
+        values = columns.number(name)
+        checked = ~np.isnan(values) & (values != 0)
+        if low:
+            mask &= ~checked | (values >= float(low))
+        if high:
+            mask &= ~checked | (values <= float(high))
+    if f.sector:
+        codes, categories = columns.category('sector')
+        allowed = [code for code, value in enumerate(categories) if value in f.sector]
+        mask &= np.isin(codes, allowed)
+    return mask
+
+
+def _momentum_mask(columns: UniverseColumns, f) -> np.ndarray:
+    mask = np.ones(len(columns), dtype=bool)
+    if f.rate_of_change:
+        mask &= columns.indicators_ok & (np.abs(columns.number('rate_of_change')) >= float(f.rate_of_change))
+    if f.relative_strength:
+        mask &= columns.indicators_ok & (columns.number('relative_strength') >= float(f.relative_strength))
+    return mask
+
+
+def _pattern_mask(columns: UniverseColumns, f) -> np.ndarray:
+    by_type, confidence, ok = columns.patterns()
+    mask = np.ones(len(columns), dtype=bool)
+    if f.pattern_types:
+        detected = np.zeros(len(columns), dtype=bool)
+        for pattern_type in f.pattern_types:
+            detected[by_type.get(pattern_type, [])] = True
+        mask &= ok & detected
+    if f.confidence_min:
+        mask &= ok & (confidence >= float(f.confidence_min))
+    return mask
+
+
+_FILTER_MASKS = {
+    'price': ('price_filter', _price_mask),
+    'volume': ('volume_filter', _volume_mask),
+    'technical': ('technical_filter', _technical_mask),
+    'fundamental': ('fundamental_filter', _fundamental_mask),
+    'momentum': ('momentum_filter', _momentum_mask),
+    'pattern': ('pattern_filter', _pattern_mask),
+}
+
+
+def filter_masks(columns: UniverseColumns, config: ScannerConfig) -> Dict[str, np.ndarray]:
+    """Pass mask of every built-in filter the config sets, in ``FILTER_NAMES`` order."""
+    masks = {}
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for name in FILTER_NAMES:
+            attribute, build = _FILTER_MASKS[name]
+            filter_config = getattr(config, attribute)
+            if filter_config:
+                masks[name] = build(columns, filter_config)
+    return masks
+
+
+def condition_mask(columns: UniverseColumns, condition: FilterCondition) -> np.ndarray:
+    """Rows meeting a custom condition; non-numeric operators use the row-wise evaluator."""
+    from .scanner_engine import FilterProcessor
+
+    compare = _NUMERIC_OPS.get(condition.operator)
+    try:
+        if compare is not None:
+            target = float(condition.value)
+            with np.errstate(invalid='ignore'):
+                return compare(columns.path(condition.field), target)
+        if condition.operator == ComparisonOperator.BETWEEN:
+            if len(condition.value) != 2:
+                return np.zeros(len(columns), dtype=bool)
+            low, high = float(condition.value[0]), float(condition.value[1])
+            values = columns.path(condition.field)
+            with np.errstate(invalid='ignore'):
+                return (values >= low) & (values <= high)
+    except (TypeError, ValueError):
+        return np.zeros(len(columns), dtype=bool)
+
+    return np.fromiter(
+        (FilterProcessor.evaluate_condition(row, condition) for row in columns.rows),
+        dtype=bool, count=len(columns)
+    )
+
+
+def group_mask(columns: UniverseColumns, group: FilterGroup) -> np.ndarray:
+    """Rows meeting a filter group, nested groups included."""
+    masks = [condition_mask(columns, condition) for condition in group.conditions]
+    masks.extend(group_mask(columns, nested) for nested in group.groups or [])
+
+    operator = group.operator.upper()
+    if operator == 'AND':
+        return np.logical_and.reduce(masks) if masks else np.ones(len(columns), dtype=bool)
+    if operator == 'OR':
+        return np.logical_or.reduce(masks) if masks else np.zeros(len(columns), dtype=bool)
+    return np.zeros(len(columns), dtype=bool)
+
+
+@dataclass
+class ColumnarScanResult:
+    """Outcome of scanning a universe with one config."""
+    rows: np.ndarray  # matching row indices, sorted and limited
+    match_count: int  # matches before the limit
+    match_score: np.ndarray  # per-row share of configured built-in filters passed (0-100)
+    filter_masks: Dict[str, np.ndarray]  # per built-in filter pass masks
+
+    def matched_filters(self, row: int) -> List[str]:
+        return [name for name, mask in self.filter_masks.items() if mask[row]]
+
+
+def match_rows(columns: UniverseColumns, config: ScannerConfig,
+               universe: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+    """(pass mask, match score, built-in filter masks) for every row.
+
+    ``universe`` optionally restricts matches to a boolean mask of rows.
+    """
+    masks = filter_masks(columns, config)
+    passes = np.ones(len(columns), dtype=bool) if universe is None else universe.copy()
+    for mask in masks.values():
+        passes &= mask
+    if config.custom_conditions:
+        passes &= group_mask(columns, config.custom_conditions)
+
+    if masks:
+        match_score = np.add.reduce([mask.astype(float) for mask in masks.values()]) / len(masks) * 100
+    else:
+        match_score = np.full(len(columns), 100.0)
+    return passes, match_score, masks
+
+
+def rank_order(match_score: np.ndarray, sort_key: Optional[np.ndarray], sort_order: str = 'desc') -> np.ndarray:
+    """Stable ranking order of rows by ``sort_key``, or by descending match score
+    when there is no key or the key cannot be ordered (NaN values)."""
+    if sort_key is None or np.isnan(sort_key).any():
+        return np.argsort(-match_score, kind='stable')
+    if sort_order.lower() == 'desc':
+        sort_key = -sort_key
+    return np.argsort(sort_key, kind='stable')
+
+
+def scan_columns(columns: UniverseColumns, config: ScannerConfig,
+                 universe: Optional[np.ndarray] = None) -> ColumnarScanResult:
+    """Filter, score, sort and limit a universe the way ``ScannerEngine`` does row by row."""
+    passes, match_score, masks = match_rows(columns, config, universe)
+
+    matches = np.flatnonzero(passes)
+    sort_key = columns.sort_key(config.sort_by)[matches] if config.sort_by else None
+    order = matches[rank_order(match_score[matches], sort_key, config.sort_order)]
+    if config.limit:
+        order = order[:config.limit]
+    return ColumnarScanResult(order, len(matches), match_score, masks)
@@ -95,6 +95,9 @@ class Settings(BaseSettings):
     REDIS_URL: str = Field(default="redis://localhost:6379", description="Redis connection URL")
     REDIS_DB: int = Field(default=0, description="Redis database number")
     CACHE_TTL: int = Field(default=300, description="Cache TTL in seconds")
+    LOCAL_CACHE_MAX_ITEMS: int = Field(default=10000, description="In-process cache capacity per service")
+    LOCAL_CACHE_TTL: int = Field(default=60, description="Maximum in-process cache TTL in seconds")
+    REDIS_RETRY_SECONDS: int = Field(default=30, description="Seconds to skip Redis after a connection error")
     
     # External APIs
     ALPHA_VANTAGE_API_KEY: Optional[str] = Field(default=None, description="Alpha Vantage API key")
@@ -116,6 +119,14 @@ class Settings(BaseSettings):
     LSTM_EPOCHS: int = Field(default=75, description="Number of training epochs")
     LSTM_BATCH_SIZE: int = Field(default=32, description="Training batch size")
     LSTM_VALIDATION_SPLIT: float = Field(default=0.2, description="Validation data split ratio")
+    MODEL_STORAGE_PATH: str = Field(default="models", description="Directory for trained model files")
+    LSTM_REGISTRY_MAX_MODELS: int = Field(default=64, description="Maximum LSTM models kept loaded in memory")
+    LSTM_REGISTRY_MEMORY_MB: int = Field(default=1024, description="Memory budget for loaded LSTM models")
+    LSTM_WARM_START_MODELS: int = Field(default=20, description="Most-requested LSTM models to preload at startup")
+    LSTM_TRAINING_WORKERS: int = Field(default=1, description="Worker processes for background LSTM training")
+    LSTM_GLOBAL_MODEL: bool = Field(default=False, description="Score batch predictions with one shared multi-symbol LSTM")
+    LSTM_GLOBAL_RETRAIN_DAYS: int = Field(default=7, description="Days of new data after which the shared LSTM is retrained")
+    LSTM_GLOBAL_UNIVERSE: List[str] = Field(default=[], description="Symbols the shared LSTM is trained on (empty: DEFAULT_TICKERS)")
     
     # Default Technical Analysis Weights
     DEFAULT_WEIGHTS: dict = {
@@ -136,10 +147,18 @@ class Settings(BaseSettings):
         "AMZN", "TSLA", "JPM", "QQQ", "SPY", 
         "SE", "MRVL", "CRM", "UNH", "NFLX"
     ]
+    MARKET_DATA_PROVIDER: str = Field(default="yfinance", description="Bar data provider: yfinance, or fake for offline use")
+    BAR_STORE_PATH: str = Field(default="data/bars", description="Directory for the local OHLCV bar store (relative paths are under the backend directory)")
+    BAR_STORE_REBUILD_DAYS: int = Field(default=7, description="Days before stored bars are re-downloaded (split/dividend adjustments)")
+    YFINANCE_BULK_MAX_SYMBOLS: int = Field(default=200, description="Maximum tickers per bulk yfinance download")
+    BULK_COALESCE_WINDOW_MS: int = Field(default=10, description="Window for merging concurrent data requests into one bulk fetch")
+    SCANNER_SNAPSHOT_INTERVAL: int = Field(default=60, description="Seconds scanner runs share one universe data snapshot before it is refreshed")
     
     # WebSocket Configuration
     WS_HEARTBEAT_INTERVAL: int = Field(default=30, description="WebSocket heartbeat interval in seconds")
     MAX_WS_CONNECTIONS: int = Field(default=100, description="Maximum WebSocket connections")
+    WS_SEND_QUEUE_SIZE: int = Field(default=256, description="Pending messages per WebSocket before slow-consumer handling")
+    WS_SLOW_CONSUMER_POLICY: str = Field(default="coalesce", description="Full send queue policy: coalesce (latest update per symbol) or drop_oldest")
     
     # Logging
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
@@ -178,6 +197,14 @@ class Settings(BaseSettings):
     SENTRY_DSN: Optional[str] = Field(default=None, description="Sentry DSN for error tracking")
     APM_ENABLED: bool = Field(default=False, description="Enable APM monitoring")
     
+    @validator('BAR_STORE_PATH')
+    def resolve_bar_store_path(cls, v):
+        """Anchor relative bar store paths to the backend directory rather than the cwd"""
+        path = Path(v).expanduser()
+        if not path.is_absolute():
+            path = Path(__file__).resolve().parents[2] / path
+        return str(path)
+    
     @validator('ENVIRONMENT')
     def validate_environment(cls, v):
         """Validate environment value"""
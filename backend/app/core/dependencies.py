@@ -50,7 +50,7 @@ def get_backtesting_service() -> BacktestingService:
     """Get BacktestingService instance"""
     global _backtesting_service
     if _backtesting_service is None:
-        _backtesting_service = BacktestingService()
+        _backtesting_service = BacktestingService(get_stock_service())
     return _backtesting_service
 
 
@@ -0,0 +1,164 @@
+"""
+Incremental scanner runs with result deltas.
+A standing scan keeps every symbol's match state between universe snapshots,
+re-evaluates only symbols whose data changed, and reports which symbols
+entered, left or moved within the ranked results.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..models.scanner_models import ScannerConfig
+from .columnar_scan import UniverseColumns, match_rows, rank_order
+from .universe_snapshot import UniverseSnapshot
+
+
+@dataclass
+class ScanDelta:
+    """Changes to a ranked result list between two updates."""
+    entered: List[Dict[str, Any]] = field(default_factory=list)  # new rows, with their rank
+    exited: List[str] = field(default_factory=list)
+    moved: List[Dict[str, Any]] = field(default_factory=list)  # symbol, rank, previous_rank
+    version: Optional[int] = None  # snapshot version the delta brings clients to
+    evaluated: int = 0  # symbols re-evaluated for this update
+
+    def __bool__(self) -> bool:
+        return bool(self.entered or self.exited or self.moved)
+
+    def to_message(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "entered": self.entered,
+            "exited": self.exited,
+            "moved": self.moved,
+        }
+
+
+def diff_rankings(previous: Dict[str, int], current: Dict[str, int]) -> Tuple[List[str], List[str], List[str]]:
+    """(entered, exited, moved) symbols between two symbol -> rank maps, each in rank order."""
+    entered = [symbol for symbol in current if symbol not in previous]
+    exited = [symbol for symbol in previous if symbol not in current]
+    moved = [symbol for symbol, rank in current.items() if symbol in previous and previous[symbol] != rank]
+    return entered, exited, moved
+
+
+@dataclass
+class _Match:
+    data: Dict[str, Any]
+    match_score: float
+    sort_key: float
+    matched_filters: List[str]
+
+
+class IncrementalScan:
+    """Standing scan of one config over successive universe snapshots.
+
+    ``update`` compares the data of each universe symbol with what it was
+    last evaluated on (by identity, then equality), evaluates only the
+    symbols that differ, and re-ranks the kept matches. Ties are broken by
+    symbol so unchanged data never reorders. The top ``config.limit``
+    matches are the ranked results that deltas describe.
+    """
+
+    def __init__(self, config: ScannerConfig):
+        self.config = config
+        self.version: Optional[int] = None
+        self.ranking: Dict[str, int] = {}  # symbol -> rank for the top results
+        self._inputs: Dict[str, Dict[str, Any]] = {}
+        self._matches: Dict[str, _Match] = {}
+
+    def changed_symbols(self, snapshot: UniverseSnapshot, universe: Iterable[str]) -> List[str]:
+        """Symbols whose data differs from what they were last evaluated on, including dropped ones."""
+        universe = dict.fromkeys(universe)
+        changed = [symbol for symbol in self._inputs if symbol not in universe]
+        for symbol in universe:
+            previous, current = self._inputs.get(symbol), snapshot.assets.get(symbol)
+            if previous is not current and previous != current:
+                changed.append(symbol)
+        return changed
+
+    def update(self, snapshot: UniverseSnapshot, universe: Iterable[str]) -> ScanDelta:
+        """Apply a snapshot and return the change in ranked results."""
+        universe = list(universe)
+        changed = self.changed_symbols(snapshot, universe)
+        in_universe = set(universe)
+
+        for symbol in changed:
+            self._matches.pop(symbol, None)
+            if symbol in snapshot.assets and symbol in in_universe:
+                self._inputs[symbol] = snapshot.assets[symbol]
+            else:
+                self._inputs.pop(symbol, None)
+
+        evaluate = snapshot.select(symbol for symbol in changed if symbol in self._inputs)
+        if evaluate:
+            self._evaluate(evaluate)
+
+        previous = self.ranking
+        self.ranking = self._rank()
+        self.version = snapshot.version
+
+        entered, exited, moved = diff_rankings(previous, self.ranking)
+        return ScanDelta(
+            entered=[self.row(symbol) for symbol in entered],
+            exited=exited,
+            moved=[{"symbol": symbol, "rank": self.ranking[symbol], "previous_rank": previous[symbol]}
+                   for symbol in moved],
+            version=snapshot.version,
+            evaluated=len(evaluate),
+        )
+
+    def _evaluate(self, assets: Dict[str, Dict[str, Any]]) -> None:
+        columns = UniverseColumns(assets)
+        passes, match_score, masks = match_rows(columns, self.config)
+        sort_key = columns.sort_key(self.config.sort_by) if self.config.sort_by else np.zeros(len(columns))
+
+        for row in np.flatnonzero(passes):
+            symbol = columns.symbols[row]
+            self._matches[symbol] = _Match(
+                data=columns.rows[row],
+                match_score=float(match_score[row]),
+                sort_key=float(sort_key[row]),
+                matched_filters=[name for name, mask in masks.items() if mask[row]],
+            )
+
+    def _rank(self) -> Dict[str, int]:
+        symbols = sorted(self._matches)
+        matches = [self._matches[symbol] for symbol in symbols]
+        match_score = np.array([match.match_score for match in matches])
+        sort_key = np.array([match.sort_key for match in matches]) if self.config.sort_by else None
+
+        order = rank_order(match_score, sort_key, self.config.sort_order) if matches else []
+        if self.config.limit:
+            order = order[:self.config.limit]
+        return {symbols[i]: rank for rank, i in enumerate(order, start=1)}
+
+    @property
+    def scanned(self) -> int:
+        return len(self._inputs)
+
+    @property
+    def match_count(self) -> int:
+        return len(self._matches)
+
+    def match(self, symbol: str) -> Optional[_Match]:
+        return self._matches.get(symbol)
+
+    def row(self, symbol: str) -> Dict[str, Any]:
+        """Compact client row for a ranked symbol."""
+        match = self._matches[symbol]
+        return {
+            "symbol": symbol,
+            "rank": self.ranking[symbol],
+            "match_score": match.match_score,
+            "price": match.data.get('price'),
+            "change_percent": match.data.get('change_percent'),
+            "volume": match.data.get('volume'),
+            "matched_filters": match.matched_filters,
+        }
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Compact rows of the current ranked results, in rank order."""
+        return [self.row(symbol) for symbol in self.ranking]
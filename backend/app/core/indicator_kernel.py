@@ -0,0 +1,196 @@
+"""
+Batched technical indicator kernel.
+Computes indicators for a whole (bars x symbols) panel at once on 2-D arrays.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+
+
+# Output indicator names, in the order they appear in the panel frame
+PANEL_INDICATORS: Tuple[str, ...] = (
+    'SMA_20', 'SMA_50', 'EMA_12', 'EMA_26', 'RSI',
+    'MACD', 'MACD_Signal', 'MACD_Histogram',
+    'BB_UPPER', 'BB_LOWER', 'BB_MIDDLE',
+    'ATR', 'STOCH_K', 'STOCH_D', 'OBV',
+)
+
+
+@dataclass
+class PricePanel:
+    """OHLCV arrays shaped (bars x symbols) sharing one index and symbol list."""
+    index: pd.Index
+    symbols: List[str]
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_frame(cls, prices: pd.DataFrame, symbols: Optional[List[str]] = None) -> 'PricePanel':
+        """Build a panel from a DataFrame with (Price, Symbol) MultiIndex columns."""
+        if symbols is None:
+            symbols = list(prices.columns.get_level_values(1).unique())
+
+        def field(name: str) -> np.ndarray:
+            if name not in prices.columns.get_level_values(0):
+                return np.full((len(prices.index), len(symbols)), np.nan)
+            return prices[name].reindex(columns=symbols).to_numpy(dtype=float)
+
+        return cls(
+            index=prices.index,
+            symbols=list(symbols),
+            high=field('High'),
+            low=field('Low'),
+            close=field('Close'),
+            volume=field('Volume'),
+        )
+
+
+class IndicatorKernel:
+    """Vectorized indicator math over (bars x symbols) arrays.
+
+    Every method treats axis 0 as time and axis 1 as symbols, so one call
+    covers the whole universe. Results match the per-symbol pandas formulas
+    used by the backtesting engine (same windows, min periods and EWM
+    adjustment).
+    """
+
+    @staticmethod
+    def _frame(values: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(values, copy=False)
+
+    @classmethod
+    def sma(cls, values: np.ndarray, window: int) -> np.ndarray:
+        """Simple moving average."""
+        return cls._frame(values).rolling(window).mean().to_numpy()
+
+    @classmethod
+    def ema(cls, values: np.ndarray, span: int) -> np.ndarray:
+        """Exponential moving average (pandas ``adjust=True`` weighting)."""
+        return cls._frame(values).ewm(span=span).mean().to_numpy()
+
+    @classmethod
+    def rsi(cls, close: np.ndarray, period: int = 14) -> np.ndarray:
+        """Relative Strength Index using simple-average gains and losses."""
+        delta = np.empty_like(close)
+        delta[0] = np.nan
+        delta[1:] = close[1:] - close[:-1]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            gain = cls.sma(np.where(delta > 0, delta, 0.0), period)
+            loss = cls.sma(np.where(delta < 0, -delta, 0.0), period)
+            rs = gain / loss
+            return 100 - (100 / (1 + rs))
+
+    @classmethod
+    def macd(cls, close: np.ndarray, fast: int = 12, slow: int = 26,
+             signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """MACD line, signal line and histogram."""
+        macd_line = cls.ema(close, fast) - cls.ema(close, slow)
+        signal_line = cls.ema(macd_line, signal)
+        return macd_line, signal_line, macd_line - signal_line
+
+    @classmethod
+    def bollinger(cls, close: np.ndarray, period: int = 20,
+                  num_std: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Bollinger upper, middle and lower bands."""
+        rolling = cls._frame(close).rolling(period)
+        middle = rolling.mean().to_numpy()
+        std_dev = rolling.std().to_numpy()
+        return middle + std_dev * num_std, middle, middle - std_dev * num_std
+
+    @classmethod
+    def true_range(cls, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        """True range (undefined on the first bar, which has no previous close)."""
+        prev_close = np.empty_like(close)
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
+
+        return np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+    @classmethod
+    def atr(cls, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+            period: int = 14) -> np.ndarray:
+        """Average True Range (simple average of true range)."""
+        return cls.sma(cls.true_range(high, low, close), period)
+
+    @classmethod
+    def stochastic(cls, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   k_period: int = 14, d_period: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+        """Stochastic %K and %D."""
+        low_min = cls._frame(low).rolling(k_period).min().to_numpy()
+        high_max = cls._frame(high).rolling(k_period).max().to_numpy()
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            stoch_k = 100 * (close - low_min) / (high_max - low_min)
+
+        return stoch_k, cls.sma(stoch_k, d_period)
+
+    @staticmethod
+    def obv(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+        """On-Balance Volume starting at zero on the first bar."""
+        direction = np.zeros_like(close)
+        direction[1:] = np.sign(close[1:] - close[:-1])
+        flow = np.nan_to_num(direction * volume)
+        flow[0] = 0.0
+        return np.cumsum(flow, axis=0)
+
+    @classmethod
+    def compute(cls, panel: PricePanel) -> Dict[str, np.ndarray]:
+        """Compute every panel indicator, keyed by indicator name."""
+        close = panel.close
+
+        macd_line, macd_signal, macd_hist = cls.macd(close)
+        bb_upper, bb_middle, bb_lower = cls.bollinger(close)
+        stoch_k, stoch_d = cls.stochastic(panel.high, panel.low, close)
+
+        return {
+            'SMA_20': cls.sma(close, 20),
+            'SMA_50': cls.sma(close, 50),
+            'EMA_12': cls.ema(close, 12),
+            'EMA_26': cls.ema(close, 26),
+            'RSI': cls.rsi(close),
+            'MACD': macd_line,
+            'MACD_Signal': macd_signal,
+            'MACD_Histogram': macd_hist,
+            'BB_UPPER': bb_upper,
+            'BB_LOWER': bb_lower,
+            'BB_MIDDLE': bb_middle,
+            'ATR': cls.atr(panel.high, panel.low, close),
+            'STOCH_K': stoch_k,
+            'STOCH_D': stoch_d,
+            'OBV': cls.obv(close, panel.volume),
+        }
+
+    @classmethod
+    def compute_frame(cls, prices: pd.DataFrame,
+                      symbols: Optional[List[str]] = None) -> pd.DataFrame:
+        """Compute indicators for an OHLCV panel frame.
+
+        Returns a DataFrame indexed like ``prices`` with (Indicator, Symbol)
+        MultiIndex columns, assembled from one preallocated block.
+        """
+        panel = PricePanel.from_frame(prices, symbols)
+        results = cls.compute(panel)
+
+        n_bars, n_symbols = panel.close.shape
+        block = np.empty((n_bars, len(PANEL_INDICATORS), n_symbols))
+        for position, name in enumerate(PANEL_INDICATORS):
+            block[:, position, :] = results[name]
+
+        columns = pd.MultiIndex.from_product(
+            [list(PANEL_INDICATORS), panel.symbols], names=['Indicator', 'Symbol']
+        )
+        return pd.DataFrame(
+            block.reshape(n_bars, len(PANEL_INDICATORS) * n_symbols),
+            index=panel.index,
+            columns=columns,
+        )
+
+    @classmethod
+    def latest_values(cls, panel: PricePanel) -> Dict[str, np.ndarray]:
+        """Latest value of every indicator for each symbol (1-D per indicator)."""
+        return {name: values[-1] for name, values in cls.compute(panel).items()}
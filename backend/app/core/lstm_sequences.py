@@ -0,0 +1,119 @@
+"""
+Sliding-window training sequences for LSTM models.
+Windows are strided views into the feature matrices; only the rows of the
+batch being fed to the model are ever copied.
+"""
+
+import numpy as np
+import tensorflow as tf
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import List, Optional, Sequence, Tuple
+
+
+def sliding_windows(data: np.ndarray, lookback: int,
+                    target_column: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """(samples, lookback, features) window view and the targets that follow each window.
+
+    Window ``i`` covers rows ``i .. i + lookback - 1`` and its target is
+    ``data[i + lookback, target_column]``. Both arrays are read-only views
+    of ``data``.
+    """
+    if len(data) <= lookback:
+        return np.empty((0, lookback, data.shape[1]), dtype=data.dtype), np.empty(0, dtype=data.dtype)
+
+    windows = sliding_window_view(data[:-1], lookback, axis=0).transpose(0, 2, 1)
+    return windows, data[lookback:, target_column]
+
+
+class WindowedSequence(tf.keras.utils.Sequence):
+    """Keras batch generator over sliding windows of one or more feature matrices.
+
+    Each series contributes the windows whose targets fall in
+    ``[start_fraction, end_fraction)`` of its own target range, so the same
+    series list can be split chronologically into train and validation
+    generators. Each batch is gathered from strided views into a fresh
+    float32 array; the full (samples, lookback, features) tensor is never
+    built, which keeps multi-symbol training sets at the size of their
+    feature matrices.
+
+    When ``symbol_ids`` (one integer per series) is given, inputs are served
+    as ``{"sequence": X, "symbol_id": ids}`` for models with a symbol
+    embedding.
+    """
+
+    def __init__(self, series: Sequence[np.ndarray], lookback: int, batch_size: int = 32,
+                 shuffle: bool = False, target_column: int = 0,
+                 start_fraction: float = 0.0, end_fraction: float = 1.0,
+                 seed: Optional[int] = None, with_targets: bool = True,
+                 symbol_ids: Optional[Sequence[int]] = None):
+        self.lookback = lookback
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.with_targets = with_targets
+        self.symbol_ids = None if symbol_ids is None else np.asarray(symbol_ids, dtype=np.int32)
+        self._rng = np.random.default_rng(seed)
+
+        self._windows: List[np.ndarray] = []
+        self._targets: List[np.ndarray] = []
+        series_ids, offsets = [], []
+
+        for series_id, data in enumerate(series):
+            windows, targets = sliding_windows(np.asarray(data), lookback, target_column)
+            start = int(len(targets) * start_fraction)
+            end = int(len(targets) * end_fraction)
+
+            self._windows.append(windows)
+            self._targets.append(targets)
+            series_ids.append(np.full(max(end - start, 0), series_id, dtype=np.int32))
+            offsets.append(np.arange(start, end, dtype=np.int64))
+
+        self.series_ids = np.concatenate(series_ids) if series_ids else np.empty(0, dtype=np.int32)
+        self.offsets = np.concatenate(offsets) if offsets else np.empty(0, dtype=np.int64)
+        self._order = np.arange(len(self.offsets))
+        if self.shuffle:
+            self._rng.shuffle(self._order)
+
+        self.n_features = self._windows[0].shape[2] if self._windows else 0
+
+    @property
+    def num_samples(self) -> int:
+        return len(self.offsets)
+
+    def __len__(self) -> int:
+        return int(np.ceil(self.num_samples / self.batch_size))
+
+    def _gather(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        series_ids, offsets = self.series_ids[rows], self.offsets[rows]
+        X = np.empty((len(rows), self.lookback, self.n_features), dtype=np.float32)
+        y = np.empty(len(rows), dtype=np.float32)
+
+        for series_id in np.unique(series_ids):
+            mask = series_ids == series_id
+            X[mask] = self._windows[series_id][offsets[mask]]
+            y[mask] = self._targets[series_id][offsets[mask]]
+
+        return X, y
+
+    def __getitem__(self, index: int):
+        rows = self._order[index * self.batch_size:(index + 1) * self.batch_size]
+        X, y = self._gather(rows)
+        if self.symbol_ids is not None:
+            X = {"sequence": X, "symbol_id": self.symbol_ids[self.series_ids[rows]]}
+        return (X, y) if self.with_targets else X
+
+    def served_series_ids(self) -> np.ndarray:
+        """Series index of every sample, in the order batches are served."""
+        return self.series_ids[self._order]
+
+    def targets(self) -> np.ndarray:
+        """Targets of every sample, in the order batches are served."""
+        series_ids, offsets = self.series_ids[self._order], self.offsets[self._order]
+        y = np.empty(len(offsets), dtype=np.float32)
+        for series_id in np.unique(series_ids):
+            mask = series_ids == series_id
+            y[mask] = self._targets[series_id][offsets[mask]]
+        return y
+
+    def on_epoch_end(self):
+        if self.shuffle:
+            self._rng.shuffle(self._order)
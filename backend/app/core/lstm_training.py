@@ -0,0 +1,312 @@
+"""
+LSTM model construction and training.
+Kept free of service, config and database imports so that training jobs can
+run in worker processes that only need TensorFlow and scikit-learn.
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import joblib
+import numpy as np
+import tensorflow as tf
+from sklearn.preprocessing import MinMaxScaler
+from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau
+from tensorflow.keras.layers import LSTM, Concatenate, Dense, Dropout, Embedding, Input
+from tensorflow.keras.models import Model, Sequential
+from tensorflow.keras.optimizers import Adam
+
+from app.core.lstm_sequences import WindowedSequence
+
+logger = logging.getLogger(__name__)
+
+MIN_TRAINING_SEQUENCES = 50
+
+# Embedding row for symbols the global model was not trained on
+UNKNOWN_SYMBOL_ID = 0
+
+
+def build_lstm_model(lookback: int, n_features: int) -> tf.keras.Model:
+    """Build advanced LSTM model architecture"""
+    model = Sequential([
+        # First LSTM layer with return sequences
+        LSTM(
+            units=128,
+            return_sequences=True,
+            input_shape=(lookback, n_features),
+            dropout=0.2,
+            recurrent_dropout=0.2
+        ),
+
+        # Second LSTM layer with return sequences
+        LSTM(
+            units=64,
+            return_sequences=True,
+            dropout=0.2,
+            recurrent_dropout=0.2
+        ),
+
+        # Third LSTM layer without return sequences
+        LSTM(
+            units=32,
+            return_sequences=False,
+            dropout=0.2,
+            recurrent_dropout=0.2
+        ),
+
+        # Dropout for regularization
+        Dropout(0.3),
+
+        # Dense layers for prediction
+        Dense(units=16, activation='relu'),
+        Dropout(0.2),
+        Dense(units=1, activation='linear')  # Price prediction
+    ])
+
+    # Compile with advanced optimizer
+    model.compile(
+        optimizer=Adam(learning_rate=0.001, clipnorm=1.0),
+        loss='huber',  # More robust than MSE
+        metrics=['mae', 'mse']
+    )
+
+    return model
+
+
+def fit_lstm_model(
+    features: np.ndarray,
+    lookback: int,
+    epochs: int = 75,
+    batch_size: int = 32,
+    verbose: int = 1
+) -> Tuple[Optional[tf.keras.Model], Optional[MinMaxScaler], Dict[str, float]]:
+    """Scale features and train a model on a chronological 80/20 split.
+
+    Returns (None, None, {}) when there are too few sequences to train on.
+    """
+    # Scale features
+    scaler = MinMaxScaler(feature_range=(0, 1))
+    scaled_features = scaler.fit_transform(features)
+
+    # Prepare sequences for LSTM (80% train, 20% validation), batched from window views
+    train_batches = WindowedSequence(
+        [scaled_features], lookback, batch_size=batch_size, shuffle=True, end_fraction=0.8
+    )
+    val_batches = WindowedSequence(
+        [scaled_features], lookback, batch_size=batch_size, start_fraction=0.8
+    )
+
+    if train_batches.num_samples + val_batches.num_samples < MIN_TRAINING_SEQUENCES:
+        logger.error(f"Insufficient sequences for training: {train_batches.num_samples + val_batches.num_samples}")
+        return None, None, {}
+
+    model = build_lstm_model(lookback, scaled_features.shape[1])
+
+    # Configure callbacks
+    callbacks = [
+        EarlyStopping(
+            monitor='val_loss',
+            patience=10,
+            restore_best_weights=True,
+            verbose=verbose
+        ),
+        ReduceLROnPlateau(
+            monitor='val_loss',
+            factor=0.5,
+            patience=5,
+            min_lr=1e-7,
+            verbose=verbose
+        )
+    ]
+
+    history = model.fit(
+        train_batches,
+        epochs=epochs,
+        validation_data=val_batches,
+        callbacks=callbacks,
+        verbose=verbose
+    )
+
+    return model, scaler, {
+        "training_samples": train_batches.num_samples,
+        "epochs": len(history.history['loss']),
+        "loss": float(history.history['loss'][-1]),
+        "val_loss": float(history.history['val_loss'][-1]),
+    }
+
+
+def build_global_lstm_model(lookback: int, n_features: int, n_symbols: int,
+                            embedding_dim: int = 8) -> tf.keras.Model:
+    """Shared multi-symbol model: stacked LSTM over the window plus a symbol embedding.
+
+    Inputs are ``sequence`` (lookback, n_features) and an integer
+    ``symbol_id`` in ``[0, n_symbols]``, where 0 is the unknown symbol.
+    """
+    sequence = Input(shape=(lookback, n_features), name="sequence")
+    symbol_id = Input(shape=(), dtype="int32", name="symbol_id")
+
+    x = LSTM(units=128, return_sequences=True, dropout=0.2)(sequence)
+    x = LSTM(units=64, return_sequences=False, dropout=0.2)(x)
+    # Zero-initialised so the never-trained unknown row means "no symbol adjustment"
+    embedding = Embedding(
+        n_symbols + 1, embedding_dim, embeddings_initializer="zeros", name="symbol_embedding"
+    )(symbol_id)
+
+    x = Concatenate()([x, embedding])
+    x = Dropout(0.3)(x)
+    x = Dense(units=32, activation='relu')(x)
+    x = Dropout(0.2)(x)
+    output = Dense(units=1, activation='linear')(x)
+
+    model = Model(inputs={"sequence": sequence, "symbol_id": symbol_id}, outputs=output)
+    model.compile(
+        optimizer=Adam(learning_rate=0.001, clipnorm=1.0),
+        loss='huber',
+        metrics=['mae', 'mse']
+    )
+    return model
+
+
+def prediction_metrics(actual: np.ndarray, predicted: np.ndarray) -> Dict[str, float]:
+    """MAE/MSE, directional accuracy and accuracy (1 - MAE / mean price) in price units"""
+    if len(actual) == 0:
+        return {'accuracy': 0.0, 'directional_accuracy': 0.0, 'mae': 0.0, 'mse': 0.0}
+
+    errors = predicted - actual
+    mae = float(np.mean(np.abs(errors)))
+    mean_price = float(np.mean(actual))
+    directional_accuracy = (
+        float(np.mean((np.diff(actual) > 0) == (np.diff(predicted) > 0))) if len(actual) > 1 else 0.0
+    )
+
+    return {
+        'accuracy': max(0.0, 1.0 - (mae / mean_price if mean_price > 0 else 1.0)),
+        'directional_accuracy': directional_accuracy,
+        'mae': mae,
+        'mse': float(np.mean(errors ** 2)),
+    }
+
+
+def fit_global_lstm_model(
+    series: Dict[str, np.ndarray],
+    lookback: int,
+    epochs: int = 75,
+    batch_size: int = 256,
+    verbose: int = 1
+) -> Tuple[Optional[tf.keras.Model], Dict[str, Any], Dict[str, float]]:
+    """Train one model on pooled sequences of many symbols.
+
+    Each symbol's features are MinMax-scaled on its own history, so the
+    model sees comparable inputs across price levels. Returns the model,
+    the artifacts needed to serve it (symbol ids, per-symbol scalers and
+    per-symbol validation metrics) and a training summary.
+    """
+    symbols = sorted(symbol for symbol, features in series.items() if len(features) > lookback)
+    scalers = {symbol: MinMaxScaler(feature_range=(0, 1)).fit(series[symbol]) for symbol in symbols}
+    scaled = [scalers[symbol].transform(series[symbol]) for symbol in symbols]
+    symbol_ids = {symbol: i + 1 for i, symbol in enumerate(symbols)}
+    ids = [symbol_ids[symbol] for symbol in symbols]
+
+    train_batches = WindowedSequence(
+        scaled, lookback, batch_size=batch_size, shuffle=True, end_fraction=0.8, symbol_ids=ids
+    )
+    val_batches = WindowedSequence(
+        scaled, lookback, batch_size=batch_size, start_fraction=0.8, symbol_ids=ids
+    )
+
+    if train_batches.num_samples + val_batches.num_samples < MIN_TRAINING_SEQUENCES:
+        logger.error(f"Insufficient sequences for training: {train_batches.num_samples + val_batches.num_samples}")
+        return None, {}, {}
+
+    model = build_global_lstm_model(lookback, scaled[0].shape[1], len(symbols))
+    callbacks = [
+        EarlyStopping(monitor='val_loss', patience=10, restore_best_weights=True, verbose=verbose),
+        ReduceLROnPlateau(monitor='val_loss', factor=0.5, patience=5, min_lr=1e-7, verbose=verbose)
+    ]
+    history = model.fit(
+        train_batches,
+        epochs=epochs,
+        validation_data=val_batches,
+        callbacks=callbacks,
+        verbose=verbose
+    )
+
+    # Per-symbol metrics on the validation windows, in price units
+    predicted = model.predict(
+        WindowedSequence(scaled, lookback, batch_size=1024, start_fraction=0.8,
+                         symbol_ids=ids, with_targets=False),
+        verbose=0
+    ).flatten()
+    targets, series_ids = val_batches.targets(), val_batches.served_series_ids()
+    metrics = {}
+    for series_id, symbol in enumerate(symbols):
+        mask = series_ids == series_id
+        scaler = scalers[symbol]
+        metrics[symbol] = prediction_metrics(
+            (targets[mask] - scaler.min_[0]) / scaler.scale_[0],
+            (predicted[mask] - scaler.min_[0]) / scaler.scale_[0]
+        )
+
+    artifacts = {"symbol_ids": symbol_ids, "scalers": scalers, "metrics": metrics}
+    return model, artifacts, {
+        "symbols": len(symbols),
+        "training_samples": train_batches.num_samples,
+        "epochs": len(history.history['loss']),
+        "loss": float(history.history['loss'][-1]),
+        "val_loss": float(history.history['val_loss'][-1]),
+    }
+
+
+def _save_atomic(model: tf.keras.Model, artifacts: Any, model_path: str, scaler_path: str) -> None:
+    # Write to temporary names first so readers never see a half-written model
+    for path, save in ((Path(model_path), model.save), (Path(scaler_path), lambda p: joblib.dump(artifacts, p))):
+        tmp_path = path.with_name(f".{path.stem}.tmp{path.suffix}")
+        save(str(tmp_path))
+        tmp_path.replace(path)
+
+
+def train_and_save(
+    symbol: str,
+    features: np.ndarray,
+    lookback: int,
+    model_path: str,
+    scaler_path: str,
+    epochs: int = 75
+) -> Dict[str, Any]:
+    """Training job entry point for worker processes.
+
+    Trains a model, writes it and its scaler to the given paths and returns
+    a summary; the parent process loads the files into its model registry.
+    Raises ValueError when the data is too short to train on.
+    """
+    started = time.perf_counter()
+    model, scaler, summary = fit_lstm_model(features, lookback, epochs=epochs, verbose=0)
+    if model is None:
+        raise ValueError(f"Insufficient data to train LSTM model for {symbol}")
+
+    _save_atomic(model, scaler, model_path, scaler_path)
+    summary["training_seconds"] = round(time.perf_counter() - started, 3)
+    logger.info(f"Training completed for {symbol}: loss={summary['loss']:.6f}, val_loss={summary['val_loss']:.6f}")
+    return summary
+
+
+def train_and_save_global(
+    key: str,
+    series: Dict[str, np.ndarray],
+    lookback: int,
+    model_path: str,
+    artifacts_path: str,
+    epochs: int = 75
+) -> Dict[str, Any]:
+    """Worker-process entry point for the shared multi-symbol model (see train_and_save)."""
+    started = time.perf_counter()
+    model, artifacts, summary = fit_global_lstm_model(series, lookback, epochs=epochs, verbose=0)
+    if model is None:
+        raise ValueError("Insufficient data to train global LSTM model")
+
+    _save_atomic(model, artifacts, model_path, artifacts_path)
+    summary["training_seconds"] = round(time.perf_counter() - started, 3)
+    logger.info(f"Global LSTM training completed ({key}): {summary}")
+    return summary
@@ -0,0 +1,281 @@
+"""
+In-memory registry of trained per-symbol models.
+Keeps a bounded, memory-budgeted LRU of loaded models and scalers so that
+predictions do not reload model files from disk on every request.
+"""
+
+import asyncio
+import json
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+
+# Rough fixed cost of a loaded Keras model beyond its weights (graph, optimizer slots, Python objects)
+MODEL_OVERHEAD_BYTES = 2 * 1024 * 1024
+
+
+@dataclass
+class RegisteredModel:
+    """A loaded model and its scaler"""
+    symbol: str
+    version: str
+    model: Any
+    scaler: Any
+    size_bytes: int
+    loaded_at: datetime = field(default_factory=datetime.utcnow)
+    load_seconds: float = 0.0
+
+
+@dataclass
+class RegistryStats:
+    """Registry counters"""
+    hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    load_failures: int = 0
+    evictions: int = 0
+    load_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "loads": self.loads,
+            "load_failures": self.load_failures,
+            "evictions": self.evictions,
+            "total_load_seconds": round(self.load_seconds, 4),
+            "avg_load_ms": round(self.load_seconds / self.loads * 1000, 2) if self.loads else 0.0,
+        }
+
+
+def estimate_model_bytes(model: Any, scaler: Any = None) -> int:
+    """Weights plus a fixed per-model overhead, plus the scaler's arrays."""
+    size = MODEL_OVERHEAD_BYTES
+    count_params = getattr(model, "count_params", None)
+    if callable(count_params):
+        size += count_params() * 4  # float32 weights
+
+    for value in getattr(scaler, "__dict__", {}).values():
+        if isinstance(value, np.ndarray):
+            size += value.nbytes
+
+    return size
+
+
+class ModelRegistry:
+    """LRU of loaded (model, scaler) pairs keyed by symbol and model version.
+
+    Entries are evicted least-recently-used first once either ``max_models``
+    or ``memory_budget_mb`` is exceeded. Disk loads run in the default
+    executor and are coalesced per key. Request counts per symbol are
+    persisted next to the model files so the most-requested symbols can be
+    warm-loaded at startup.
+    """
+
+    REQUEST_COUNTS_FILE = "registry_requests.json"
+
+    def __init__(
+        self,
+        model_dir: Path,
+        load_model: Callable[[str], Any],
+        load_scaler: Callable[[str], Any],
+        default_version: str,
+        max_models: int = 32,
+        memory_budget_mb: float = 1024,
+        persist_every: int = 50
+    ):
+        self.model_dir = Path(model_dir)
+        self.load_model = load_model
+        self.load_scaler = load_scaler
+        self.default_version = default_version
+        self.max_models = max_models
+        self.memory_budget_bytes = int(memory_budget_mb * 1024 * 1024)
+        self.persist_every = persist_every
+
+        self.stats = RegistryStats()
+        self.request_counts: Counter = Counter()
+        self._entries: "OrderedDict[Tuple[str, str], RegisteredModel]" = OrderedDict()
+        self._loading: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._unsaved_requests = 0
+        self._load_request_counts()
+
+    # Paths
+
+    def model_path(self, symbol: str, version: Optional[str] = None) -> Path:
+        return self.model_dir / f"{symbol}_{version or self.default_version}_lstm_model.keras"
+
+    def scaler_path(self, symbol: str, version: Optional[str] = None) -> Path:
+        return self.model_dir / f"{symbol}_{version or self.default_version}_scaler.joblib"
+
+    def _existing_paths(self, symbol: str, version: str) -> Optional[Tuple[Path, Path]]:
+        model_path, scaler_path = self.model_path(symbol, version), self.scaler_path(symbol, version)
+        if model_path.exists() and scaler_path.exists():
+            return model_path, scaler_path
+
+        # Files written before models were versioned belong to the default version
+        if version == self.default_version:
+            legacy = self.model_dir / f"{symbol}_lstm_model.keras", self.model_dir / f"{symbol}_scaler.joblib"
+            if legacy[0].exists() and legacy[1].exists():
+                return legacy
+        return None
+
+    def has_saved_model(self, symbol: str, version: Optional[str] = None) -> bool:
+        return self._existing_paths(symbol, version or self.default_version) is not None
+
+    # Lookup
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(entry.size_bytes for entry in self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._entries
+
+    def get(self, symbol: str, version: Optional[str] = None) -> Optional[RegisteredModel]:
+        """Loaded entry, without touching disk or counters."""
+        key = (symbol, version or self.default_version)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def acquire(self, symbol: str, version: Optional[str] = None) -> Optional[RegisteredModel]:
+        """Loaded entry for a prediction request, loading it from disk on a miss."""
+        version = version or self.default_version
+        self._record_request(symbol)
+
+        entry = self.get(symbol, version)
+        if entry is not None:
+            self.stats.hits += 1
+            return entry
+
+        self.stats.misses += 1
+        return await self._load(symbol, version)
+
+    async def _load(self, symbol: str, version: str) -> Optional[RegisteredModel]:
+        key = (symbol, version)
+        loading = self._loading.get(key)
+        if loading is None:
+            loading = asyncio.ensure_future(self._load_from_disk(symbol, version))
+            self._loading[key] = loading
+            loading.add_done_callback(lambda _: self._loading.pop(key, None))
+        return await asyncio.shield(loading)
+
+    async def _load_from_disk(self, symbol: str, version: str) -> Optional[RegisteredModel]:
+        paths = self._existing_paths(symbol, version)
+        if paths is None:
+            return None
+
+        started = time.perf_counter()
+        loop = asyncio.get_event_loop()
+        try:
+            model, scaler = await asyncio.gather(
+                loop.run_in_executor(None, self.load_model, str(paths[0])),
+                loop.run_in_executor(None, self.load_scaler, str(paths[1])),
+            )
+        except Exception as e:
+            self.stats.load_failures += 1
+            logger.warning(f"Error loading model {symbol}@{version}: {e}")
+            return None
+
+        load_seconds = time.perf_counter() - started
+        self.stats.loads += 1
+        self.stats.load_seconds += load_seconds
+        return self.register(symbol, model, scaler, version, load_seconds)
+
+    async def reload(self, symbol: str, version: Optional[str] = None) -> Optional[RegisteredModel]:
+        """Replace the loaded entry with the files currently on disk (e.g. after retraining)."""
+        version = version or self.default_version
+        loaded = await self._load_from_disk(symbol, version)
+        if loaded is None:
+            self.evict(symbol, version)
+        return loaded
+
+    # Mutation
+
+    def register(self, symbol: str, model: Any, scaler: Any, version: Optional[str] = None,
+                 load_seconds: float = 0.0) -> RegisteredModel:
+        """Add or replace an entry, evicting least-recently-used entries over budget."""
+        version = version or self.default_version
+        entry = RegisteredModel(
+            symbol=symbol,
+            version=version,
+            model=model,
+            scaler=scaler,
+            size_bytes=estimate_model_bytes(model, scaler),
+            load_seconds=load_seconds,
+        )
+        self._entries[(symbol, version)] = entry
+        self._entries.move_to_end((symbol, version))
+        self._enforce_budget()
+        return entry
+
+    def evict(self, symbol: str, version: Optional[str] = None) -> bool:
+        return self._entries.pop((symbol, version or self.default_version), None) is not None
+
+    def _enforce_budget(self) -> None:
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_models or self.memory_bytes > self.memory_budget_bytes
+        ):
+            (symbol, version), _ = self._entries.popitem(last=False)
+            self.stats.evictions += 1
+            logger.debug(f"Evicted model {symbol}@{version} from registry")
+
+    # Warm start
+
+    def most_requested(self, limit: int) -> List[str]:
+        return [symbol for symbol, _ in self.request_counts.most_common(limit)]
+
+    async def warm_start(self, limit: int) -> List[str]:
+        """Load the most-requested symbols that have saved models; returns those loaded."""
+        loaded = []
+        for symbol in self.most_requested(limit):
+            if self.get(symbol) is not None or await self._load(symbol, self.default_version) is not None:
+                loaded.append(symbol)
+
+        logger.info(f"Model registry warm start loaded {len(loaded)} models")
+        return loaded
+
+    def _record_request(self, symbol: str) -> None:
+        self.request_counts[symbol] += 1
+        self._unsaved_requests += 1
+        if self._unsaved_requests >= self.persist_every:
+            self.save_request_counts()
+
+    def _load_request_counts(self) -> None:
+        try:
+            path = self.model_dir / self.REQUEST_COUNTS_FILE
+            if path.exists():
+                self.request_counts.update(json.loads(path.read_text()))
+        except Exception as e:
+            logger.warning(f"Could not read model request counts: {e}")
+
+    def save_request_counts(self) -> None:
+        try:
+            self.model_dir.mkdir(parents=True, exist_ok=True)
+            (self.model_dir / self.REQUEST_COUNTS_FILE).write_text(json.dumps(dict(self.request_counts)))
+            self._unsaved_requests = 0
+        except Exception as e:
+            logger.warning(f"Could not save model request counts: {e}")
+
+    def describe(self) -> Dict[str, Any]:
+        """Counters and current contents, for health/metrics endpoints."""
+        return {
+            **self.stats.to_dict(),
+            "models_loaded": len(self._entries),
+            "memory_mb": round(self.memory_bytes / (1024 * 1024), 2),
+            "memory_budget_mb": round(self.memory_budget_bytes / (1024 * 1024), 2),
+            "entries": [f"{symbol}@{version}" for symbol, version in self._entries],
+        }
@@ -9,7 +9,8 @@ import numpy as np
 from scipy.stats import norm
 from scipy.optimize import brent, bisect, newton
 import time
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from typing import ClassVar, Dict, List, Optional, Tuple
 from datetime import date, datetime
 import logging
 
@@ -22,6 +23,68 @@ from ..models.options_models import (
 logger = logging.getLogger(__name__)
 
 
+def _as_arrays(*values) -> List[np.ndarray]:
+    """Broadcast scalar or array pricing inputs to equal-length float arrays"""
+    return np.broadcast_arrays(*(np.atleast_1d(np.asarray(value, dtype=float)) for value in values))
+
+
+def _as_flags(values, positive, size: int) -> np.ndarray:
+    """Broadcast an enum value (or one per contract) to a boolean array"""
+    if isinstance(values, str):  # OptionType/ExerciseStyle are str enums
+        return np.full(size, values == positive)
+    return np.broadcast_to(np.array([value == positive for value in values], dtype=bool), (size,))
+
+
+@dataclass
+class OptionBatchResult:
+    """Prices and Greeks for a batch of contracts (one array entry per contract)"""
+    price: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    theta: np.ndarray
+    vega: np.ndarray
+    rho: np.ndarray
+
+    # Second-order Greeks (closed-form models only)
+    vanna: Optional[np.ndarray] = None
+    charm: Optional[np.ndarray] = None
+    vomma: Optional[np.ndarray] = None
+    speed: Optional[np.ndarray] = None
+    zomma: Optional[np.ndarray] = None
+    color: Optional[np.ndarray] = None
+
+    _GREEK_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'delta', 'gamma', 'theta', 'vega', 'rho', 'vanna', 'charm', 'vomma', 'speed', 'zomma', 'color'
+    )
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    def greeks(self, index: int = 0) -> Greeks:
+        """Greeks of a single contract in the batch"""
+        values = {
+            name: float(getattr(self, name)[index])
+            for name in self._GREEK_FIELDS if getattr(self, name) is not None
+        }
+        return Greeks(**values)
+
+    def greeks_records(self) -> List[Dict[str, float]]:
+        """Greeks of every contract as plain dicts (cheap to validate in bulk)"""
+        columns = {
+            name: getattr(self, name).tolist()
+            for name in self._GREEK_FIELDS if getattr(self, name) is not None
+        }
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+@dataclass
+class ImpliedVolatilityBatch:
+    """Implied volatilities for a batch of contracts (NaN where no volatility fits the price)"""
+    implied_volatility: np.ndarray
+    converged: np.ndarray
+    iterations: np.ndarray
+
+
 class BlackScholesPricer:
     """Black-Scholes option pricing model with Greeks calculation"""
 
@@ -136,118 +199,238 @@ class BlackScholesPricer:
             color=color
         )
 
+    @staticmethod
+    def _price_and_vega(S: np.ndarray, K: np.ndarray, T: np.ndarray, r: np.ndarray,
+                        sigma: np.ndarray, sign: np.ndarray,
+                        q: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Prices and raw vega (per unit of volatility) for live contracts; sign is +1 call, -1 put"""
+        sqrt_T = np.sqrt(T)
+        d1 = (np.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * sqrt_T)
+        d2 = d1 - sigma * sqrt_T
+        discounted_spot = S * np.exp(-q * T)
 
-class BinomialPricer:
-    """Cox-Ross-Rubinstein Binomial option pricing model"""
+        price = sign * (discounted_spot * norm.cdf(sign * d1) - K * np.exp(-r * T) * norm.cdf(sign * d2))
+        return price, discounted_spot * norm.pdf(d1) * sqrt_T
 
     @staticmethod
-    def price_option(S: float, K: float, T: float, r: float, sigma: float,
-                     option_type: OptionType, exercise_style: ExerciseStyle,
-                     steps: int = 100, q: float = 0) -> Tuple[float, Greeks]:
-        """Price option using binomial tree model"""
+    def price_batch(S, K, T, r, sigma, option_type, q=0) -> OptionBatchResult:
+        """Price and compute Greeks for many contracts in one vectorized pass
 
-        dt = T / steps
-        u = np.exp(sigma * np.sqrt(dt))  # Up move
-        d = 1 / u  # Down move
-        p = (np.exp((r - q) * dt) - d) / (u - d)  # Risk-neutral probability
+        Numeric inputs broadcast against each other (e.g. every strike and
+        expiry of a chain); ``option_type`` may be a single value or one per
+        contract. Results match ``call_price``/``put_price`` and
+        ``calculate_greeks`` element by element.
+        """
 
-        # Initialize price tree
-        price_tree = np.zeros((steps + 1, steps + 1))
+        S, K, T, r, sigma, q = _as_arrays(S, K, T, r, sigma, q)
+        is_call = _as_flags(option_type, OptionType.CALL, S.size)
 
-        # Calculate terminal stock prices
-        for i in range(steps + 1):
-            price_tree[i, steps] = S * (u ** i) * (d ** (steps - i))
+        # Expired contracts get a placeholder horizon and are overwritten below
+        expired = T <= 0
+        T = np.where(expired, 1.0, T)
 
-        # Initialize option value tree
-        option_tree = np.zeros((steps + 1, steps + 1))
+        sqrt_T = np.sqrt(T)
+        d1 = (np.log(S / K) + (r - q + 0.5 * sigma ** 2) * T) / (sigma * sqrt_T)
+        d2 = d1 - sigma * sqrt_T
+        exp_q_T = np.exp(-q * T)
+        exp_r_T = np.exp(-r * T)
+        pdf_d1 = norm.pdf(d1)
 
-        # Calculate terminal option values
-        for i in range(steps + 1):
-            if option_type == OptionType.CALL:
-                option_tree[i, steps] = max(price_tree[i, steps] - K, 0)
-            else:
-                option_tree[i, steps] = max(K - price_tree[i, steps], 0)
+        # Signed CDFs: N(d) for calls, N(-d) for puts
+        sign = np.where(is_call, 1.0, -1.0)
+        cdf_d1 = norm.cdf(sign * d1)
+        cdf_d2 = norm.cdf(sign * d2)
 
-        # Backward induction
-        for j in range(steps - 1, -1, -1):
-            for i in range(j + 1):
-                price_tree[i, j] = S * (u ** i) * (d ** (j - i))
+        price = sign * (S * exp_q_T * cdf_d1 - K * exp_r_T * cdf_d2)
+        delta = sign * exp_q_T * cdf_d1
+        gamma = exp_q_T * pdf_d1 / (S * sigma * sqrt_T)
+        theta = (-S * pdf_d1 * sigma * exp_q_T / (2 * sqrt_T)
+                 + sign * (q * S * cdf_d1 * exp_q_T - r * K * exp_r_T * cdf_d2)) / 365
+        vega = S * exp_q_T * pdf_d1 * sqrt_T / 100
+        rho = sign * K * T * exp_r_T * cdf_d2 / 100
 
-                # Discounted expected value
-                option_tree[i, j] = np.exp(-r * dt) * (
-                    p * option_tree[i + 1, j + 1] + (1 - p) * option_tree[i, j + 1]
-                )
+        # Second-order Greeks
+        vanna = -exp_q_T * pdf_d1 * d2 / sigma
+        charm = exp_q_T * pdf_d1 * (q + (r - q - d2 * sigma / (2 * sqrt_T)) / (sigma * sqrt_T))
+        vomma = vega * d1 * d2 / sigma
+        speed = -gamma * (d1 / (sigma * sqrt_T) + 1) / S
+        zomma = gamma * (d1 * d2 - 1) / sigma
+        color = -2 * exp_q_T * pdf_d1 / (2 * T * S * sigma * sqrt_T) * \
+                (q + d1 / (2 * sqrt_T) + (r - q) * d1 / (sigma * sqrt_T))
 
-                # Early exercise for American options
-                if exercise_style == ExerciseStyle.AMERICAN:
-                    if option_type == OptionType.CALL:
-                        intrinsic = max(price_tree[i, j] - K, 0)
-                    else:
-                        intrinsic = max(K - price_tree[i, j], 0)
-                    option_tree[i, j] = max(option_tree[i, j], intrinsic)
-
-        option_price = option_tree[0, 0]
-
-        # For now, return basic Greeks (can be enhanced later)
-        greeks = Greeks(
-            delta=0.5,  # Placeholder
-            gamma=0.1,  # Placeholder
-            theta=-0.1, # Placeholder
-            vega=0.2,   # Placeholder
-            rho=0.1     # Placeholder
+        # Handle expired options
+        intrinsic = np.maximum(sign * (S - K), 0.0)
+        expired_delta = np.where(is_call, (S > K).astype(float), -(S < K).astype(float))
+
+        def live(values: np.ndarray) -> np.ndarray:
+            return np.where(expired, 0.0, values)
+
+        return OptionBatchResult(
+            price=np.where(expired, intrinsic, price),
+            delta=np.where(expired, expired_delta, delta),
+            gamma=live(gamma),
+            theta=live(theta),
+            vega=live(vega),
+            rho=live(rho),
+            vanna=live(vanna),
+            charm=live(charm),
+            vomma=live(vomma),
+            speed=live(speed),
+            zomma=live(zomma),
+            color=live(color)
         )
 
-        return option_price, greeks
 
-    @staticmethod
-    def _calculate_greeks_binomial(S: float, K: float, T: float, r: float, sigma: float,
-                                  option_type: OptionType, exercise_style: ExerciseStyle,
-                                  steps: int, q: float) -> Greeks:
-        """Calculate Greeks using finite differences on binomial tree"""
+class BinomialPricer:
+    """Cox-Ross-Rubinstein Binomial option pricing model
 
-        h = 0.01 * S  # Small change for finite differences
-        dt = 0.01  # Small time change
+    Backward induction runs on (contracts x nodes) arrays, so a whole chain of
+    strikes and expiries is priced in a single pass over the time steps.
+    Delta, gamma and theta are read from the first lattice nodes; vega and rho
+    come from bumped lattices evaluated in the same pass.
+    """
 
-        # Base price
-        V, _ = BinomialPricer.price_option(S, K, T, r, sigma, option_type, exercise_style, steps, q)
+    VEGA_BUMP = 0.01  # 1% volatility change
+    RHO_BUMP = 0.01  # 1% rate change
 
-        # Delta: dV/dS
-        V_up, _ = BinomialPricer.price_option(S + h, K, T, r, sigma, option_type, exercise_style, steps, q)
-        V_down, _ = BinomialPricer.price_option(S - h, K, T, r, sigma, option_type, exercise_style, steps, q)
-        delta = (V_up - V_down) / (2 * h)
+    @staticmethod
+    def _induct(S: np.ndarray, K: np.ndarray, T: np.ndarray, r: np.ndarray, sigma: np.ndarray,
+                q: np.ndarray, is_call: np.ndarray, is_american: np.ndarray,
+                steps: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Backward induction for every contract at once; returns price, delta, gamma and theta"""
 
-        # Gamma: d²V/dS²
-        gamma = (V_up - 2 * V + V_down) / (h ** 2)
+        dt = T / steps
+        u = np.exp(sigma * np.sqrt(dt))  # Up move
+        d = 1 / u  # Down move
+        p = (np.exp((r - q) * dt) - d) / (u - d)  # Risk-neutral probability
+        discount = np.exp(-r * dt)
+
+        # Lattices are stored as (nodes x contracts) so every step works on a
+        # contiguous block of rows spanning all contracts
+        sign = np.where(is_call, 1.0, -1.0)
+        up_weight = discount * p
+        down_weight = discount * (1 - p)
+        any_american = bool(is_american.any())
+
+        # Exercise value is sign * spot - sign * K; European contracts get -inf
+        # so the early-exercise maximum never changes them
+        exercise_offset = -sign * K + np.where(is_american, 0.0, -np.inf)
+
+        # Node i at a step has i up moves: S * u**(2i - step). Stepping back
+        # drops the top node and multiplies the rest by u
+        nodes = np.arange(steps + 1)[:, None]
+        signed_spots = sign * S * np.exp(np.log(u) * (2 * nodes - steps))
+        values = np.maximum(signed_spots - sign * K, 0.0)
+        scratch = np.empty_like(values)
+        early_nodes = {}
+
+        # Induction works in place on the first ``width`` nodes
+        for step in range(steps - 1, -1, -1):
+            width = step + 1
+            current = values[:width]
+            np.multiply(values[1:width + 1], up_weight, out=scratch[:width])
+            current *= down_weight
+            current += scratch[:width]
+
+            # Early exercise for American options
+            if any_american:
+                spots_now = signed_spots[:width]
+                spots_now *= u
+                np.add(spots_now, exercise_offset, out=scratch[:width])
+                np.maximum(current, scratch[:width], out=current)
+
+            if step <= 2:
+                early_nodes[step] = current.copy()
+
+        price = early_nodes[0][0]
+        v1, v2 = early_nodes[1], early_nodes[2]
+
+        # Greeks from the lattice: delta at step 1, gamma and theta at step 2
+        delta = (v1[1] - v1[0]) / (S * u - S * d)
+        delta_up = (v2[2] - v2[1]) / (S * u * u - S)
+        delta_down = (v2[1] - v2[0]) / (S - S * d * d)
+        gamma = (delta_up - delta_down) / (0.5 * (S * u * u - S * d * d))
+        theta = (v2[1] - price) / (2 * dt) / 365  # Daily theta
+
+        return price, delta, gamma, theta
 
-        # Theta: dV/dt (negative because we're reducing time to expiry)
-        if T > dt:
-            V_later, _ = BinomialPricer.price_option(S, K, T - dt, r, sigma, option_type, exercise_style, steps, q)
-            theta = (V_later - V) / dt / 365  # Daily theta
-        else:
-            theta = 0
+    @staticmethod
+    def price_batch(S, K, T, r, sigma, option_type, exercise_style,
+                    steps: int = 100, q=0) -> OptionBatchResult:
+        """Price many contracts with one vectorized backward induction
+
+        Numeric inputs broadcast against each other (e.g. an array of strikes
+        with a matching array of expiries); ``option_type`` and
+        ``exercise_style`` may be a single value or one per contract.
+        """
+
+        if steps < 2:
+            raise ValueError("Binomial pricing requires at least 2 steps")
+
+        S, K, T, r, sigma, q = _as_arrays(S, K, T, r, sigma, q)
+        is_call = _as_flags(option_type, OptionType.CALL, S.size)
+        is_american = _as_flags(exercise_style, ExerciseStyle.AMERICAN, S.size)
+
+        # Expired contracts get a placeholder horizon and are overwritten below
+        expired = T <= 0
+        T_live = np.where(expired, 1.0, T)
+
+        # Base, volatility-bumped and rate-bumped lattices share one induction
+        def stacked(values: np.ndarray) -> np.ndarray:
+            return np.tile(values, 3)
+
+        prices, delta, gamma, theta = BinomialPricer._induct(
+            stacked(S), stacked(K), stacked(T_live),
+            np.concatenate([r, r, r + BinomialPricer.RHO_BUMP]),
+            np.concatenate([sigma, sigma + BinomialPricer.VEGA_BUMP, sigma]),
+            stacked(q), stacked(is_call), stacked(is_american), steps
+        )
+        price, price_vol_up, price_rate_up = np.split(prices, 3)
+        size = S.size
+        delta, gamma, theta = delta[:size], gamma[:size], theta[:size]
+
+        vega = (price_vol_up - price) / BinomialPricer.VEGA_BUMP / 100
+        rho = (price_rate_up - price) / BinomialPricer.RHO_BUMP / 100
+
+        # Handle expired options
+        intrinsic = np.maximum(np.where(is_call, S - K, K - S), 0.0)
+        expired_delta = np.where(is_call, (S > K).astype(float), -(S < K).astype(float))
+
+        return OptionBatchResult(
+            price=np.where(expired, intrinsic, price),
+            delta=np.where(expired, expired_delta, delta),
+            gamma=np.where(expired, 0.0, gamma),
+            theta=np.where(expired, 0.0, theta),
+            vega=np.where(expired, 0.0, vega),
+            rho=np.where(expired, 0.0, rho)
+        )
 
-        # Vega: dV/dσ
-        dv = 0.01  # 1% volatility change
-        V_vol_up, _ = BinomialPricer.price_option(S, K, T, r, sigma + dv, option_type, exercise_style, steps, q)
-        vega = (V_vol_up - V) / dv / 100
+    @staticmethod
+    def price_option(S: float, K: float, T: float, r: float, sigma: float,
+                     option_type: OptionType, exercise_style: ExerciseStyle,
+                     steps: int = 100, q: float = 0) -> Tuple[float, Greeks]:
+        """Price option using binomial tree model"""
 
-        # Rho: dV/dr
-        dr = 0.01  # 1% rate change
-        V_rate_up, _ = BinomialPricer.price_option(S, K, T, r + dr, sigma, option_type, exercise_style, steps, q)
-        rho = (V_rate_up - V) / dr / 100
+        result = BinomialPricer.price_batch(S, K, T, r, sigma, option_type, exercise_style, steps, q)
+        return float(result.price[0]), result.greeks(0)
 
-        return Greeks(
-            delta=delta,
-            gamma=gamma,
-            theta=theta,
-            vega=vega,
-            rho=rho
-        )
+    @staticmethod
+    def _calculate_greeks_binomial(S: float, K: float, T: float, r: float, sigma: float,
+                                  option_type: OptionType, exercise_style: ExerciseStyle,
+                                  steps: int, q: float) -> Greeks:
+        """Calculate Greeks from the binomial lattice"""
+
+        return BinomialPricer.price_batch(
+            S, K, T, r, sigma, option_type, exercise_style, steps, q
+        ).greeks(0)
 
 
 class ImpliedVolatilitySolver:
     """Solves for implied volatility using various numerical methods"""
 
+    MIN_VOLATILITY = 1e-4
+    MAX_VOLATILITY = 5.0
+
     @staticmethod
     def solve(request: ImpliedVolatilityRequest) -> ImpliedVolatilityOutput:
         """Calculate implied volatility from market price"""
@@ -360,6 +543,81 @@ class ImpliedVolatilitySolver:
             calculation_time_ms=calculation_time
         )
 
+    @staticmethod
+    def solve_batch(market_prices, S, K, T, r, option_type, q=0,
+                    tolerance: float = 1e-6, max_iterations: int = 100) -> ImpliedVolatilityBatch:
+        """Invert Black-Scholes for many contracts at once
+
+        Each contract runs a safeguarded Newton iteration: the volatility is
+        kept inside a bracket that shrinks with every evaluation, and any
+        Newton step leaving the bracket (or taken with vanishing vega) is
+        replaced by bisection. Prices outside the no-arbitrage bounds,
+        contracts at expiry, and prices whose bracket collapses onto
+        ``MIN_VOLATILITY`` or ``MAX_VOLATILITY`` get NaN.
+        """
+
+        market_prices, S, K, T, r, q = _as_arrays(market_prices, S, K, T, r, q)
+        size = market_prices.size
+        sign = np.where(_as_flags(option_type, OptionType.CALL, size), 1.0, -1.0)
+
+        # No-arbitrage bounds on European prices
+        live = T > 0
+        horizon = np.where(live, T, 1.0)
+        discounted_spot = S * np.exp(-q * horizon)
+        discounted_strike = K * np.exp(-r * horizon)
+        lower = np.maximum(sign * (discounted_spot - discounted_strike), 0.0)
+        upper = np.where(sign > 0, discounted_spot, discounted_strike)
+        solvable = live & np.isfinite(market_prices) & (market_prices > lower) & (market_prices < upper)
+
+        low = np.full(size, ImpliedVolatilitySolver.MIN_VOLATILITY)
+        high = np.full(size, ImpliedVolatilitySolver.MAX_VOLATILITY)
+
+        # Manaster-Koehler starting point
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sigma = np.sqrt(2 * np.abs(np.log(S / K) + (r - q) * horizon) / horizon)
+        sigma = np.clip(np.nan_to_num(sigma, nan=0.25), 0.05, ImpliedVolatilitySolver.MAX_VOLATILITY)
+
+        converged = np.zeros(size, dtype=bool)
+        iterations = np.full(size, max_iterations)
+        active = np.flatnonzero(solvable)
+
+        for iteration in range(max_iterations):
+            if active.size == 0:
+                break
+
+            current = sigma[active]
+            price, vega = BlackScholesPricer._price_and_vega(
+                S[active], K[active], T[active], r[active], current, sign[active], q[active]
+            )
+            error = price - market_prices[active]
+
+            # Shrink the bracket around the root
+            high[active] = np.where(error > 0, current, high[active])
+            low[active] = np.where(error < 0, current, low[active])
+
+            found = np.abs(error) < tolerance
+            collapsed = high[active] - low[active] < tolerance * 1e-3
+            # A bound that never moved means the root lies outside [MIN, MAX]
+            at_bound = (low[active] <= ImpliedVolatilitySolver.MIN_VOLATILITY) | \
+                       (high[active] >= ImpliedVolatilitySolver.MAX_VOLATILITY)
+            done = found | collapsed
+            converged[active[found | (collapsed & ~at_bound)]] = True
+            iterations[active[done]] = iteration
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                newton = current - error / vega
+            bisection = 0.5 * (low[active] + high[active])
+            inside = np.isfinite(newton) & (newton > low[active]) & (newton < high[active])
+            sigma[active] = np.where(done, current, np.where(inside, newton, bisection))
+
+            active = active[~done]
+
+        return ImpliedVolatilityBatch(
+            implied_volatility=np.where(solvable & converged, sigma, np.nan),
+            converged=converged,
+            iterations=iterations
+        )
+
 
 class OptionsPricingEngine:
     """Main options pricing engine orchestrating different models"""
@@ -444,6 +702,75 @@ class OptionsPricingEngine:
             convergence_achieved=True
         )
 
+    def price_chain(self, spot_price: float, strikes, times_to_expiry, risk_free_rate: float,
+                    volatilities, option_types, exercise_styles, dividend_yield: float = 0,
+                    pricing_model: PricingModel = PricingModel.BLACK_SCHOLES,
+                    steps: int = 100) -> List[OptionPricingOutput]:
+        """Price many contracts with one array pass per model
+
+        Contracts are routed like ``price_option``: American-style contracts
+        (or all of them when the binomial model is requested) share one
+        binomial batch, the rest one Black-Scholes batch.
+        ``calculation_time_ms`` is the total time spread evenly over the
+        contracts.
+        """
+
+        start_time = time.time()
+
+        strikes, times, volatilities = _as_arrays(strikes, times_to_expiry, volatilities)
+        size = strikes.size
+        is_call = _as_flags(option_types, OptionType.CALL, size)
+        use_binomial = _as_flags(exercise_styles, ExerciseStyle.AMERICAN, size) | \
+            (pricing_model == PricingModel.BINOMIAL_CRR)
+
+        types = np.array([OptionType.PUT, OptionType.CALL], dtype=object)[is_call.astype(int)]
+        styles = np.broadcast_to(np.asarray(exercise_styles, dtype=object), (size,))
+
+        prices = np.empty(size)
+        greeks: List[Optional[Dict[str, float]]] = [None] * size
+        models = np.empty(size, dtype=object)
+
+        for mask, model in ((use_binomial, PricingModel.BINOMIAL_CRR),
+                            (~use_binomial, PricingModel.BLACK_SCHOLES)):
+            index = np.flatnonzero(mask)
+            if index.size == 0:
+                continue
+
+            if model == PricingModel.BINOMIAL_CRR:
+                batch = self.binomial_pricer.price_batch(
+                    spot_price, strikes[index], times[index], risk_free_rate, volatilities[index],
+                    types[index], styles[index], steps, dividend_yield
+                )
+            else:
+                batch = self.bs_pricer.price_batch(
+                    spot_price, strikes[index], times[index], risk_free_rate, volatilities[index],
+                    types[index], dividend_yield
+                )
+
+            prices[index] = batch.price
+            models[index] = model
+            for position, contract_greeks in zip(index.tolist(), batch.greeks_records()):
+                greeks[position] = contract_greeks
+
+        # Calculate intrinsic and time value
+        intrinsic_values = np.maximum(np.where(is_call, spot_price - strikes, strikes - spot_price), 0.0)
+        calculation_time = (time.time() - start_time) * 1000 / max(size, 1)
+
+        return [
+            OptionPricingOutput(
+                price=price,
+                greeks=contract_greeks,
+                model_used=model,
+                intrinsic_value=intrinsic,
+                time_value=price - intrinsic,
+                calculation_time_ms=calculation_time,
+                convergence_achieved=True
+            )
+            for price, contract_greeks, model, intrinsic in zip(
+                prices.tolist(), greeks, models, intrinsic_values.tolist()
+            )
+        ]
+
     def calculate_implied_volatility(self, request: ImpliedVolatilityRequest) -> ImpliedVolatilityOutput:
         """Calculate implied volatility from market price"""
         return self.iv_solver.solve(request)
\ No newline at end of file
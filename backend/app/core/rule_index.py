@@ -0,0 +1,150 @@
+"""
+Inverted index over alert rules.
+Maps symbols, alert types and portfolios to rule ids so market events only
+touch the rules that can match them instead of scanning every rule.
+"""
+
+from collections import defaultdict
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.models.alert_models import AlertRule, AlertType
+
+
+# Index key for rules that name no symbols
+ANY_SYMBOL = "*"
+
+EVENT_TYPES = frozenset(alert_type.value for alert_type in AlertType)
+
+
+class RuleIndex:
+    """Rules keyed by symbol, alert type and portfolio.
+
+    ``add`` replaces any previous entry for the same rule id, so it serves
+    both new and updated rules. Lookups cost O(matching rules) and return
+    rules in the order they were first added. ``version`` changes whenever
+    the rule set does, so derived structures know when to rebuild.
+    """
+
+    def __init__(self):
+        self.rules: Dict[str, AlertRule] = {}
+        self.by_symbol: Dict[str, Set[str]] = defaultdict(set)
+        self.by_event_type: Dict[str, Set[str]] = defaultdict(set)
+        self.by_portfolio: Dict[str, Set[str]] = defaultdict(set)
+        self._keys: Dict[str, Tuple[Tuple[str, ...], str, Optional[str]]] = {}
+        self._sequence: Dict[str, int] = {}
+        self._counter = count()
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def __contains__(self, rule_id: str) -> bool:
+        return rule_id in self.rules
+
+    def get(self, rule_id: str) -> Optional[AlertRule]:
+        return self.rules.get(rule_id)
+
+    @staticmethod
+    def rule_symbols(rule: AlertRule) -> Tuple[str, ...]:
+        symbols = list(rule.symbols or [])
+        if rule.symbol:
+            symbols.append(rule.symbol)
+        return tuple(dict.fromkeys(symbol.upper() for symbol in symbols))
+
+    # Maintenance
+
+    def add(self, rule: AlertRule) -> None:
+        sequence = self._sequence.get(rule.rule_id)
+        self.remove(rule.rule_id)
+
+        symbols = self.rule_symbols(rule)
+        event_type = AlertType(rule.alert_type).value
+        self.rules[rule.rule_id] = rule
+        self._keys[rule.rule_id] = (symbols, event_type, rule.portfolio_id)
+        self._sequence[rule.rule_id] = next(self._counter) if sequence is None else sequence
+        self.version += 1
+
+        for symbol in symbols or (ANY_SYMBOL,):
+            self.by_symbol[symbol].add(rule.rule_id)
+        self.by_event_type[event_type].add(rule.rule_id)
+        if rule.portfolio_id:
+            self.by_portfolio[rule.portfolio_id].add(rule.rule_id)
+
+    def remove(self, rule_id: str) -> Optional[AlertRule]:
+        rule = self.rules.pop(rule_id, None)
+        self._sequence.pop(rule_id, None)
+        keys = self._keys.pop(rule_id, None)
+        if keys is None:
+            return rule
+        self.version += 1
+
+        symbols, event_type, portfolio_id = keys
+        for symbol in symbols or (ANY_SYMBOL,):
+            self._discard(self.by_symbol, symbol, rule_id)
+        self._discard(self.by_event_type, event_type, rule_id)
+        if portfolio_id:
+            self._discard(self.by_portfolio, portfolio_id, rule_id)
+        return rule
+
+    def clear(self) -> None:
+        for index in (self.rules, self.by_symbol, self.by_event_type, self.by_portfolio, self._keys, self._sequence):
+            index.clear()
+        self.version += 1
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, rule_id: str) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(rule_id)
+            if not ids:
+                del index[key]
+
+    # Lookups
+
+    def _rules(self, rule_ids: Iterable[str]) -> List[AlertRule]:
+        return [self.rules[rule_id] for rule_id in sorted(rule_ids, key=self._sequence.__getitem__)]
+
+    def symbol_rule_ids(self, symbols: Iterable[str], include_unscoped: bool = True) -> Set[str]:
+        """Ids of rules naming any of ``symbols`` (plus rules naming no symbol)."""
+        rule_ids: Set[str] = set()
+        for symbol in symbols:
+            rule_ids.update(self.by_symbol.get(symbol.upper(), ()))
+        if include_unscoped:
+            rule_ids.update(self.by_symbol.get(ANY_SYMBOL, ()))
+        return rule_ids
+
+    def for_symbol(self, symbol: str) -> List[AlertRule]:
+        """Rules that name ``symbol``."""
+        return self._rules(self.by_symbol.get(symbol.upper(), ()))
+
+    def for_symbols(self, symbols: Iterable[str]) -> Dict[str, List[AlertRule]]:
+        """Rules naming each symbol, for symbols that have any."""
+        matches = {}
+        for symbol in symbols:
+            rules = self.for_symbol(symbol)
+            if rules:
+                matches[symbol] = rules
+        return matches
+
+    def for_portfolio(self, portfolio_id: str) -> List[AlertRule]:
+        return self._rules(self.by_portfolio.get(portfolio_id, ()))
+
+    def for_event(self, event_type: Optional[str] = None,
+                  symbols: Optional[Iterable[str]] = None) -> List[AlertRule]:
+        """Rules relevant to a market event.
+
+        With symbols, rules naming any of them or naming no symbol match;
+        without symbols, only rules naming no symbol match. An event type
+        that is an alert type (``"price"``, ``"technical"``, ...) also
+        restricts matches to rules of that type.
+        """
+        symbols = list(symbols or [])
+        if symbols:
+            rule_ids = self.symbol_rule_ids(symbols)
+        else:
+            rule_ids = set(self.by_symbol.get(ANY_SYMBOL, ()))
+
+        if event_type in EVENT_TYPES:
+            rule_ids &= self.by_event_type.get(event_type, set())
+        return self._rules(rule_ids)
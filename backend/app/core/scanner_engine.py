@@ -6,7 +6,7 @@ and identifies matching assets based on configurable criteria.
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional, Set, Callable
+from typing import List, Dict, Any, Optional, Set, Callable, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
 import logging
@@ -18,6 +18,10 @@ from ..models.scanner_models import (
     ScannerConfig, ScanResult, ScannerResponse, AssetType, FilterCondition,
     FilterGroup, ComparisonOperator, TimeFrame, ScannerType
 )
+from .columnar_scan import scan_columns
+from .incremental_scan import IncrementalScan, ScanDelta
+from .config import settings
+from .universe_snapshot import UniverseSnapshot, UniverseSnapshotService
 
 logger = logging.getLogger(__name__)
 
@@ -156,14 +160,20 @@ class ScannerEngine:
     Core scanner engine for multi-asset scanning
 
     Provides filtering, ranking, and result aggregation capabilities
-    for real-time market scanning.
+    for real-time market scanning. By default filters are evaluated
+    column-wise over the whole universe (see ``columnar_scan``); with
+    ``columnar=False`` each asset is checked on its own. Asset data is
+    read from shared universe snapshots, so scanner runs within one
+    refresh interval do not refetch it.
     """
 
-    def __init__(self):
+    def __init__(self, columnar: bool = True):
         self.data_providers: Dict[AssetType, Callable] = {}
         self.filter_processors: Dict[str, Callable] = {}
         self.result_cache: Dict[str, ScannerResponse] = {}
         self.cache_ttl = 60  # seconds
+        self.columnar = columnar
+        self.snapshots = UniverseSnapshotService(self._fetch_asset_data, settings.SCANNER_SNAPSHOT_INTERVAL)
 
     def register_data_provider(self, asset_type: AssetType, provider: Callable):
         """Register data provider for asset type"""
@@ -201,23 +211,14 @@ class ScannerEngine:
             universe = await self._get_asset_universe(config)
             logger.info(f"Scanning {len(universe)} assets with {config.name}")
 
-            # Get data for all assets
-            asset_data = await self._fetch_asset_data(universe, config)
+            # Get data for all assets from the shared snapshot
+            snapshot = await self.snapshots.get_snapshot(universe, config.time_frame)
 
-            # Apply filters
-            results = []
-            filters_applied = 0
-
-            for symbol, data in asset_data.items():
-                if await self._passes_filters(data, config):
-                    result = await self._create_scan_result(symbol, data, config)
-                    results.append(result)
-                    filters_applied += 1
-
-            # Sort and limit results
-            results = self._sort_results(results, config)
-            if config.limit:
-                results = results[:config.limit]
+            # Apply filters, sort and limit results
+            if self.columnar:
+                results, filters_applied = self._scan_columnar(snapshot, universe, config)
+            else:
+                results, filters_applied = await self._scan_rows(snapshot.select(universe), config)
 
             # Add ranking
             for i, result in enumerate(results):
@@ -246,6 +247,45 @@ class ScannerEngine:
             logger.error(f"Error running scanner {config.name}: {e}")
             raise
 
+    async def rescan(self, scan: IncrementalScan) -> ScanDelta:
+        """
+        Update a standing scan from the current universe snapshot
+
+        Only symbols whose data changed since the scan's last update are
+        re-evaluated.
+
+        Args:
+            scan: Standing scan to update
+
+        Returns:
+            ScanDelta: Symbols that entered, exited or moved in the ranked results
+        """
+        universe = await self._get_asset_universe(scan.config)
+        snapshot = await self.snapshots.get_snapshot(universe, scan.config.time_frame)
+        return scan.update(snapshot, universe)
+
+    def stream_response(self, scan: IncrementalScan, scanner_id: str) -> ScannerResponse:
+        """Full response for the current ranked results of a standing scan"""
+        results = []
+        for symbol, rank in scan.ranking.items():
+            match = scan.match(symbol)
+            result = self._build_scan_result(symbol, match.data, scan.config, match.match_score, match.matched_filters)
+            result.rank = rank
+            results.append(result)
+
+        return ScannerResponse(
+            scanner_id=scanner_id,
+            scanner_name=scan.config.name,
+            scan_timestamp=datetime.utcnow(),
+            results=results,
+            total_matches=len(results),
+            total_scanned=scan.scanned,
+            scan_duration_ms=0,
+            filters_applied=scan.match_count,
+            config_hash=self._generate_cache_key(scan.config),
+            cache_hit=False
+        )
+
     async def _get_asset_universe(self, config: ScannerConfig) -> List[str]:
         """Get list of symbols to scan"""
         universe = set()
@@ -267,8 +307,8 @@ class ScannerEngine:
 
         return list(universe)
 
-    async def _fetch_asset_data(self, symbols: List[str], config: ScannerConfig) -> Dict[str, Dict[str, Any]]:
-        """Fetch data for all assets"""
+    async def _fetch_asset_data(self, symbols: List[str], time_frame: TimeFrame) -> Dict[str, Dict[str, Any]]:
+        """Fetch data for all assets (called by the snapshot service on refresh)"""
         tasks = []
         semaphore = asyncio.Semaphore(50)  # Limit concurrent requests
 
@@ -276,14 +316,14 @@ class ScannerEngine:
             async with semaphore:
                 try:
                     # Determine asset type
-                    asset_type = await self._determine_asset_type(symbol)
+                    asset_type = self._asset_type(symbol)
                     provider = self.data_providers.get(asset_type)
 
                     if not provider:
                         return symbol, {}
 
                     # Fetch comprehensive data
-                    data = await provider.get_asset_data(symbol, config.time_frame)
+                    data = await provider.get_asset_data(symbol, time_frame)
                     data['symbol'] = symbol
                     data['asset_type'] = asset_type
 
@@ -298,8 +338,40 @@ class ScannerEngine:
 
         return {symbol: data for symbol, data in results if data}
 
+    async def _scan_rows(self, asset_data: Dict[str, Dict[str, Any]],
+                         config: ScannerConfig) -> Tuple[List[ScanResult], int]:
+        """Filter assets one at a time; returns sorted, limited results and the match count"""
+        results = []
+        for symbol, data in asset_data.items():
+            if await self._passes_filters(data, config):
+                results.append(await self._create_scan_result(symbol, data, config))
+        matches = len(results)
+
+        results = self._sort_results(results, config)
+        if config.limit:
+            results = results[:config.limit]
+        return results, matches
+
+    def _scan_columnar(self, snapshot: UniverseSnapshot, universe: List[str],
+                       config: ScannerConfig) -> Tuple[List[ScanResult], int]:
+        """Filter the universe as column masks over the snapshot; only the returned top results are built"""
+        columns = snapshot.columns
+        scan = scan_columns(columns, config, snapshot.mask(universe))
+        results = [
+            self._build_scan_result(
+                columns.symbols[row], columns.rows[row], config,
+                float(scan.match_score[row]), scan.matched_filters(row)
+            )
+            for row in scan.rows
+        ]
+        return results, scan.match_count
+
     async def _determine_asset_type(self, symbol: str) -> AssetType:
         """Determine asset type from symbol"""
+        return self._asset_type(symbol)
+
+    @staticmethod
+    def _asset_type(symbol: str) -> AssetType:
         # Simple heuristics - would be enhanced with proper symbol lookup
         if symbol.endswith('-USD') or symbol.endswith('USDT'):
             return AssetType.CRYPTO
@@ -533,6 +605,11 @@ class ScannerEngine:
         # Determine matched filters
         matched_filters = await self._get_matched_filters(data, config)
 
+        return self._build_scan_result(symbol, data, config, match_score, matched_filters)
+
+    def _build_scan_result(self, symbol: str, data: Dict[str, Any], config: ScannerConfig,
+                           match_score: float, matched_filters: List[str]) -> ScanResult:
+        """Build a scan result from asset data and its filter outcome"""
         # Extract relevant values
         filter_values = {
             'price': data.get('price', 0),
@@ -642,8 +719,9 @@ class ScannerEngine:
         return (datetime.utcnow() - cache_timestamp).total_seconds() < self.cache_ttl
 
     def clear_cache(self):
-        """Clear result cache"""
+        """Clear result cache and universe snapshots"""
         self.result_cache.clear()
+        self.snapshots.clear()
 
 
 # Global scanner engine instance
@@ -0,0 +1,370 @@
+"""
+Incremental technical indicators for live bars.
+Each symbol keeps a constant amount of state per indicator, so a new bar or
+tick costs O(1) instead of recomputing the full history. Values follow the
+TA-Lib definitions used by TechnicalAnalysisService.
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+NAN = float("nan")
+
+# Output indicator names, in the order they appear in snapshots
+STREAMING_INDICATORS: Tuple[str, ...] = (
+    'sma_20', 'sma_50', 'sma_200', 'ema_12', 'ema_20', 'ema_26', 'rsi',
+    'macd', 'macd_signal', 'macd_hist',
+    'bb_upper', 'bb_middle', 'bb_lower',
+    'atr', 'adx', 'adx_plus_di', 'adx_minus_di',
+    'stoch_k', 'stoch_d', 'obv',
+)
+
+
+# Primitives. ``update(..., commit=False)`` returns the value the indicator
+# would have if the input were appended, without changing any state; this is
+# how a forming bar is evaluated on every tick.
+
+class _Sma:
+    """Simple moving average with a running window total (TA-Lib SMA)."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.window: Deque[float] = deque(maxlen=period)
+        self.total = 0.0
+
+    def update(self, value: float, commit: bool = True) -> float:
+        full = len(self.window) == self.period
+        total = self.total + value - (self.window[0] if full else 0.0)
+        count = len(self.window) + (0 if full else 1)
+        if commit:
+            self.window.append(value)
+            self.total = total
+        return total / self.period if count == self.period else NAN
+
+
+class _StdDev:
+    """Population standard deviation over a window (TA-Lib STDDEV)."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.window: Deque[float] = deque(maxlen=period)
+
+    def update(self, value: float, mean: float, commit: bool = True) -> float:
+        full = len(self.window) == self.period
+        values = list(self.window)[1 if full else 0:]
+        values.append(value)
+        if commit:
+            self.window.append(value)
+        if len(values) < self.period:
+            return NAN
+        return math.sqrt(max(sum((v - mean) ** 2 for v in values) / self.period, 0.0))
+
+
+class _Ema:
+    """Exponential moving average seeded with a simple average (TA-Lib EMA).
+
+    The first value is the mean of the ``period`` inputs ending at input
+    ``seed_at`` (default ``period``); TA-Lib MACD seeds its fast average at
+    the slow period so both lines start on the same bar.
+    """
+
+    def __init__(self, period: int, seed_at: Optional[int] = None):
+        self.period = period
+        self.seed_at = seed_at or period
+        self.k = 2.0 / (period + 1)
+        self.window: Deque[float] = deque(maxlen=period)
+        self.count = 0
+        self.value: Optional[float] = None
+
+    def update(self, value: float, commit: bool = True) -> float:
+        if self.value is not None:
+            result = self.value + self.k * (value - self.value)
+        elif self.count + 1 < self.seed_at:
+            result = NAN
+        else:
+            window = list(self.window)[1 if len(self.window) == self.period else 0:]
+            result = (sum(window) + value) / self.period
+
+        if commit:
+            self.count += 1
+            if self.value is None:
+                self.window.append(value)
+            if not math.isnan(result):
+                self.value = result
+        return result
+
+
+class _Wilder:
+    """Wilder smoothing: a simple average of the first ``period`` inputs, then
+    ``(previous * (period - 1) + value) / period`` (TA-Lib RSI and ATR)."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.count = 0
+        self.total = 0.0
+        self.value: Optional[float] = None
+
+    def update(self, value: float, commit: bool = True) -> float:
+        if self.value is not None:
+            result = (self.value * (self.period - 1) + value) / self.period
+            total = self.total
+        else:
+            total = self.total + value
+            result = total / self.period if self.count + 1 == self.period else NAN
+
+        if commit:
+            self.count += 1
+            self.total = total
+            if not math.isnan(result):
+                self.value = result
+        return result
+
+
+class _RollingExtremes:
+    """Highest high and lowest low over a window."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.highs: Deque[float] = deque(maxlen=period)
+        self.lows: Deque[float] = deque(maxlen=period)
+
+    def update(self, high: float, low: float, commit: bool = True) -> Tuple[float, float]:
+        skip = 1 if len(self.highs) == self.period else 0
+        count = len(self.highs) - skip + 1
+        highest = max(max(list(self.highs)[skip:], default=high), high)
+        lowest = min(min(list(self.lows)[skip:], default=low), low)
+        if commit:
+            self.highs.append(high)
+            self.lows.append(low)
+        return (highest, lowest) if count == self.period else (NAN, NAN)
+
+
+class _Adx:
+    """Directional movement index (TA-Lib PLUS_DI, MINUS_DI and ADX).
+
+    Directional movement and true range are summed over the first
+    ``period - 1`` bars and then smoothed with ``total - total / period +
+    value``. ADX starts as the mean of the first ``period`` DX values.
+    """
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.count = 0
+        self.prev: Optional[Tuple[float, float, float]] = None
+        self.plus_dm = 0.0
+        self.minus_dm = 0.0
+        self.tr = 0.0
+        self.dx_total = 0.0
+        self.adx: Optional[float] = None
+
+    def update(self, high: float, low: float, close: float,
+               commit: bool = True) -> Tuple[float, float, float]:
+        n = self.period
+        plus_di = minus_di = adx = NAN
+        plus_dm, minus_dm, tr = self.plus_dm, self.minus_dm, self.tr
+        dx_total, current_adx = self.dx_total, self.adx
+
+        if self.prev is not None:
+            prev_high, prev_low, prev_close = self.prev
+            up, down = high - prev_high, prev_low - low
+            bar_plus = up if up > 0 and up > down else 0.0
+            bar_minus = down if down > 0 and up < down else 0.0
+            bar_tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+            if self.count < n:
+                plus_dm, minus_dm, tr = plus_dm + bar_plus, minus_dm + bar_minus, tr + bar_tr
+            else:
+                plus_dm = plus_dm - plus_dm / n + bar_plus
+                minus_dm = minus_dm - minus_dm / n + bar_minus
+                tr = tr - tr / n + bar_tr
+
+                dx = None
+                plus_di = minus_di = 0.0
+                if tr != 0:
+                    plus_di, minus_di = 100 * plus_dm / tr, 100 * minus_dm / tr
+                    if plus_di + minus_di != 0:
+                        dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+
+                if current_adx is None:
+                    dx_total += dx or 0.0
+                    if self.count == 2 * n - 1:
+                        current_adx = dx_total / n
+                elif dx is not None:
+                    current_adx = (current_adx * (n - 1) + dx) / n
+                if current_adx is not None:
+                    adx = current_adx
+
+        if commit:
+            self.count += 1
+            self.prev = (high, low, close)
+            self.plus_dm, self.minus_dm, self.tr = plus_dm, minus_dm, tr
+            self.dx_total, self.adx = dx_total, current_adx
+        return adx, plus_di, minus_di
+
+
+class SymbolIndicators:
+    """Incremental indicator state for one symbol's bar series."""
+
+    def __init__(self):
+        self.bars = 0
+        self.prev_close: Optional[float] = None
+        self.obv = 0.0
+        self.sma = {period: _Sma(period) for period in (20, 50, 200)}
+        self.ema = {period: _Ema(period) for period in (12, 20, 26)}
+        self.macd_fast = _Ema(12, seed_at=26)
+        self.macd_slow = _Ema(26)
+        self.macd_signal = _Ema(9)
+        self.bb_std = _StdDev(20)
+        self.rsi_gain = _Wilder(14)
+        self.rsi_loss = _Wilder(14)
+        self.atr = _Wilder(14)
+        self.adx = _Adx(14)
+        self.stoch_range = _RollingExtremes(14)
+        self.stoch_k = _Sma(3)
+        self.stoch_d = _Sma(3)
+
+    def update(self, high: float, low: float, close: float, volume: float,
+               commit: bool = True) -> Dict[str, float]:
+        """Indicator values after a bar. With ``commit=False`` the bar is only
+        evaluated (a forming bar) and the state is left unchanged."""
+        values = {f'sma_{period}': sma.update(close, commit) for period, sma in self.sma.items()}
+        values.update({f'ema_{period}': ema.update(close, commit) for period, ema in self.ema.items()})
+
+        # MACD: both averages start on the slow period's bar, the signal 9 bars later
+        fast, slow = self.macd_fast.update(close, commit), self.macd_slow.update(close, commit)
+        macd = signal = NAN
+        if not math.isnan(slow):
+            signal = self.macd_signal.update(fast - slow, commit)
+            if not math.isnan(signal):
+                macd = fast - slow
+        values.update(macd=macd, macd_signal=signal, macd_hist=macd - signal)
+
+        middle = values['sma_20']
+        std = self.bb_std.update(close, middle, commit)
+        values.update(bb_upper=middle + 2 * std, bb_middle=middle, bb_lower=middle - 2 * std)
+
+        rsi = atr = NAN
+        obv = volume
+        if self.prev_close is not None:
+            change = close - self.prev_close
+            gain = self.rsi_gain.update(max(change, 0.0), commit)
+            loss = self.rsi_loss.update(max(-change, 0.0), commit)
+            if not math.isnan(gain):
+                rsi = 100 * gain / (gain + loss) if gain + loss != 0 else 0.0
+            true_range = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+            atr = self.atr.update(true_range, commit)
+            obv = self.obv + (volume if change > 0 else -volume if change < 0 else 0.0)
+        values.update(rsi=rsi, atr=atr, obv=obv)
+
+        adx, plus_di, minus_di = self.adx.update(high, low, close, commit)
+        values.update(adx=adx, adx_plus_di=plus_di, adx_minus_di=minus_di)
+
+        highest, lowest = self.stoch_range.update(high, low, commit)
+        stoch_k = stoch_d = NAN
+        if not math.isnan(highest):
+            fast_k = 100 * (close - lowest) / (highest - lowest) if highest != lowest else 0.0
+            slow_k = self.stoch_k.update(fast_k, commit)
+            if not math.isnan(slow_k):
+                stoch_d = self.stoch_d.update(slow_k, commit)
+                if not math.isnan(stoch_d):
+                    stoch_k = slow_k
+        values.update(stoch_k=stoch_k, stoch_d=stoch_d)
+
+        if commit:
+            self.bars += 1
+            self.prev_close = close
+            self.obv = obv
+        return values
+
+
+class StreamingIndicatorEngine:
+    """Latest indicator values for many symbols, updated bar by bar.
+
+    Each symbol has one forming bar identified by its bar time. Updates for
+    the same bar time replace it (quotes carry the day's high, low and
+    volume so far); an update for a later bar time first commits the
+    forming bar into the indicator state. Seeding from stored history is a
+    replay of the same updates, so the last stored bar becomes the forming
+    bar.
+    """
+
+    def __init__(self):
+        self._states: Dict[str, SymbolIndicators] = {}
+        self._forming: Dict[str, Tuple[pd.Timestamp, float, float, float, float]] = {}
+        self._latest: Dict[str, Dict[str, float]] = {}
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._states
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._states)
+
+    def seed(self, symbol: str, history: pd.DataFrame) -> None:
+        """Rebuild a symbol's state from an OHLCV history frame."""
+        self.remove(symbol)
+        self._states[symbol] = SymbolIndicators()
+        if history is None or history.empty:
+            return
+
+        index = history.index
+        high, low, close = (history[c].to_numpy(dtype=float) for c in ('High', 'Low', 'Close'))
+        volume = history['Volume'].to_numpy(dtype=float)
+        for i in range(len(history)):
+            self.update_bar(symbol, index[i], high[i], low[i], close[i], volume[i])
+
+    def remove(self, symbol: str) -> None:
+        self._states.pop(symbol, None)
+        self._forming.pop(symbol, None)
+        self._latest.pop(symbol, None)
+
+    def update_bar(self, symbol: str, bar_time: pd.Timestamp, high: float, low: float,
+                   close: float, volume: float) -> Dict[str, Optional[float]]:
+        """Set the symbol's forming bar, committing the previous one if ``bar_time`` is later."""
+        state = self._states.setdefault(symbol, SymbolIndicators())
+        forming = self._forming.get(symbol)
+
+        if forming is not None:
+            if bar_time < forming[0]:
+                return self.latest(symbol)  # out-of-order update for a committed bar
+            if bar_time > forming[0]:
+                state.update(*forming[1:])
+
+        bar = (float(high), float(low), float(close), float(volume))
+        self._forming[symbol] = (bar_time, *bar)
+        self._latest[symbol] = state.update(*bar, commit=False)
+        return self.latest(symbol)
+
+    def on_tick(self, symbol: str, bar_time: pd.Timestamp, price: float,
+                size: float = 0.0) -> Dict[str, Optional[float]]:
+        """Fold a trade into the forming bar for ``bar_time``."""
+        forming = self._forming.get(symbol)
+        if forming is not None and forming[0] == bar_time:
+            _, high, low, _, volume = forming
+            return self.update_bar(symbol, bar_time, max(high, price), min(low, price), price, volume + size)
+        return self.update_bar(symbol, bar_time, price, price, price, size)
+
+    def latest(self, symbol: str) -> Dict[str, Optional[float]]:
+        """Latest indicator values (None while an indicator is warming up)."""
+        values = self._latest.get(symbol)
+        if values is None:
+            return {}
+        return {name: None if math.isnan(values[name]) else values[name] for name in STREAMING_INDICATORS}
+
+    def snapshot(self, symbols: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Optional[float]]]:
+        symbols = self._latest if symbols is None else symbols
+        return {symbol: self.latest(symbol) for symbol in symbols if symbol in self._latest}
+
+    def latest_array(self, symbols: List[str]) -> np.ndarray:
+        """(symbols x indicators) array of latest values, NaN where unavailable."""
+        array = np.full((len(symbols), len(STREAMING_INDICATORS)), np.nan)
+        for row, symbol in enumerate(symbols):
+            values = self._latest.get(symbol)
+            if values is not None:
+                array[row] = [values[name] for name in STREAMING_INDICATORS]
+        return array
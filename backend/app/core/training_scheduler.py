@@ -0,0 +1,182 @@
+"""
+Background scheduler for model training jobs.
+Jobs run in a bounded process pool so training never blocks the event loop,
+and concurrent requests for the same model share one job.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+
+class TrainingStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class TrainingPendingError(Exception):
+    """Raised when a model is not available yet because its training job is still queued or running"""
+    def __init__(self, symbol: str, version: str, status: TrainingStatus):
+        super().__init__(f"Model {symbol}@{version} is {status.value}")
+        self.symbol = symbol
+        self.version = version
+        self.status = status
+
+
+@dataclass
+class TrainingJob:
+    """A submitted training job and its progress"""
+    symbol: str
+    version: str
+    status: TrainingStatus = TrainingStatus.QUEUED
+    submitted_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Any = None
+    error: Optional[str] = None
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def active(self) -> bool:
+        return self.status in (TrainingStatus.QUEUED, TrainingStatus.RUNNING)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "symbol": self.symbol,
+            "version": self.version,
+            "status": self.status.value,
+            "submitted_at": self.submitted_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "error": self.error,
+        }
+
+
+class TrainingScheduler:
+    """Queue of training jobs executed by at most ``max_workers`` worker processes.
+
+    ``train_func`` must be a picklable module-level function. Submitting a
+    job for a (symbol, version) that is already queued or running returns
+    the existing job. When a job succeeds, ``on_complete(job)`` is awaited
+    in the event loop before waiters are released, so callers can load the
+    trained model first.
+
+    Finished jobs are kept for status queries until a later submission for
+    the same symbol supersedes them, and at most ``max_finished_jobs`` are
+    kept overall.
+    """
+
+    def __init__(
+        self,
+        train_func: Callable[..., Any],
+        max_workers: int = 1,
+        on_complete: Optional[Callable[[TrainingJob], Awaitable[None]]] = None,
+        executor: Optional[Executor] = None,
+        max_finished_jobs: int = 256
+    ):
+        self.train_func = train_func
+        self.max_workers = max(1, max_workers)
+        self.max_finished_jobs = max_finished_jobs
+        self.on_complete = on_complete
+        self._executor = executor
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.jobs: Dict[Tuple[str, str], TrainingJob] = {}
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            # Spawned workers: forking a process that has initialised TensorFlow is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def submit(self, symbol: str, version: str, *args: Any,
+               train_func: Optional[Callable[..., Any]] = None) -> TrainingJob:
+        """Queue a job for ``train_func(symbol, *args)`` unless one is already pending.
+
+        ``train_func`` overrides the scheduler's default for this job.
+        """
+        key = (symbol, version)
+        job = self.jobs.get(key)
+        if job is not None and job.active:
+            return job
+
+        job = TrainingJob(symbol=symbol, version=version)
+        job.task = asyncio.ensure_future(self._run(job, train_func or self.train_func, args))
+        # Re-inserted so the dict stays in submission order
+        self.jobs.pop(key, None)
+        self.jobs[key] = job
+        self._prune(symbol)
+        logger.info(f"Queued training job for {symbol}@{version}")
+        return job
+
+    def _prune(self, symbol: str) -> None:
+        """Drop finished jobs superseded by a later submission, then the oldest finished beyond the cap"""
+        superseded = [key for key in self.jobs if key[0] == symbol][:-1]
+        for key in superseded:
+            if not self.jobs[key].active:
+                del self.jobs[key]
+
+        finished = [key for key, job in self.jobs.items() if not job.active]
+        for key in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self.jobs[key]
+
+    async def _run(self, job: TrainingJob, train_func: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+
+        async with self._slots:
+            job.status = TrainingStatus.RUNNING
+            job.started_at = datetime.utcnow()
+            loop = asyncio.get_event_loop()
+            try:
+                job.result = await loop.run_in_executor(self.executor, train_func, job.symbol, *args)
+                if self.on_complete is not None:
+                    await self.on_complete(job)
+                job.status = TrainingStatus.COMPLETED
+            except Exception as e:
+                job.status = TrainingStatus.FAILED
+                job.error = str(e) or type(e).__name__
+                logger.error(f"Training job for {job.symbol}@{job.version} failed: {job.error}")
+            finally:
+                job.finished_at = datetime.utcnow()
+                self._prune(job.symbol)
+
+    def get_job(self, symbol: str, version: str) -> Optional[TrainingJob]:
+        return self.jobs.get((symbol, version))
+
+    def is_pending(self, symbol: str, version: str) -> bool:
+        job = self.get_job(symbol, version)
+        return job is not None and job.active
+
+    async def wait(self, symbol: str, version: str, timeout: Optional[float] = None) -> Optional[TrainingJob]:
+        """Wait for the current job of a model to finish (without cancelling it on timeout)."""
+        job = self.get_job(symbol, version)
+        if job is None or job.task is None:
+            return job
+        await asyncio.wait_for(asyncio.shield(job.task), timeout)
+        return job
+
+    def describe(self) -> Dict[str, Any]:
+        counts = {status.value: 0 for status in TrainingStatus}
+        for job in self.jobs.values():
+            counts[job.status.value] += 1
+        return {"max_workers": self.max_workers, **counts}
+
+    def shutdown(self, wait: bool = False) -> None:
+        for job in self.jobs.values():
+            if job.task is not None and not job.task.done():
+                job.task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,139 @@
+"""
+Shared universe snapshots for scanners.
+Asset data is fetched at most once per refresh interval and published as an
+immutable, versioned snapshot that every scanner run in that window reads,
+so refresh cost does not grow with the number of scanners.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+from itertools import count
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional
+
+import numpy as np
+
+from ..models.scanner_models import TimeFrame
+from .columnar_scan import UniverseColumns
+
+
+@dataclass(frozen=True)
+class UniverseSnapshot:
+    """Asset data for one time frame as of one refresh.
+
+    ``symbols`` are all symbols the snapshot covers, including ones whose
+    fetch returned nothing, so they are not re-requested within the
+    window. The per-symbol dicts are shared by every reader and must not be
+    mutated. Columns for columnar scans are built once per snapshot.
+    """
+    version: int
+    time_frame: TimeFrame
+    assets: Mapping[str, Dict[str, Any]]
+    symbols: FrozenSet[str]
+    refreshed_at: float  # time.monotonic() of the full refresh this snapshot extends
+    timestamp: datetime
+
+    @cached_property
+    def columns(self) -> UniverseColumns:
+        return UniverseColumns(self.assets)
+
+    @cached_property
+    def _rows(self) -> Dict[str, int]:
+        return {symbol: row for row, symbol in enumerate(self.assets)}
+
+    def select(self, symbols: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Asset data of ``symbols`` that have data, in the given order."""
+        return {symbol: self.assets[symbol] for symbol in symbols if symbol in self.assets}
+
+    def mask(self, symbols: Iterable[str]) -> np.ndarray:
+        """Boolean mask over ``columns`` rows selecting ``symbols``."""
+        mask = np.zeros(len(self.assets), dtype=bool)
+        rows = [self._rows[symbol] for symbol in symbols if symbol in self._rows]
+        mask[rows] = True
+        return mask
+
+
+class UniverseSnapshotService:
+    """Versioned universe snapshots per time frame.
+
+    ``get_snapshot`` returns the current snapshot while it is younger than
+    ``refresh_interval`` seconds. Symbols it does not cover yet are fetched
+    on their own and published as a new version with the same refresh
+    time. Once the interval has passed, the next request refetches every
+    symbol requested since the previous refresh. Refreshes for a time frame
+    are serialized, so concurrent scanner runs wait for one fetch instead of
+    starting their own.
+    """
+
+    def __init__(self, fetch_assets: Callable[[List[str], TimeFrame], Awaitable[Dict[str, Dict[str, Any]]]],
+                 refresh_interval: float = 60.0):
+        self.fetch_assets = fetch_assets
+        self.refresh_interval = refresh_interval
+        self.refreshes = 0
+        self.symbols_fetched = 0
+        self._snapshots: Dict[TimeFrame, UniverseSnapshot] = {}
+        self._requested: Dict[TimeFrame, Dict[str, None]] = {}
+        self._locks: Dict[TimeFrame, asyncio.Lock] = {}
+        self._versions = count(1)
+
+    def current(self, time_frame: TimeFrame) -> Optional[UniverseSnapshot]:
+        return self._snapshots.get(time_frame)
+
+    def _is_fresh(self, snapshot: Optional[UniverseSnapshot]) -> bool:
+        return snapshot is not None and time.monotonic() - snapshot.refreshed_at < self.refresh_interval
+
+    async def get_snapshot(self, symbols: Iterable[str], time_frame: TimeFrame) -> UniverseSnapshot:
+        """Snapshot covering ``symbols``, refreshing or extending it when needed."""
+        symbols = list(dict.fromkeys(symbols))
+        requested = self._requested.setdefault(time_frame, {})
+        requested.update(dict.fromkeys(symbols))
+
+        snapshot = self._snapshots.get(time_frame)
+        if self._is_fresh(snapshot) and snapshot.symbols.issuperset(symbols):
+            return snapshot
+
+        lock = self._locks.setdefault(time_frame, asyncio.Lock())
+        async with lock:
+            # Another run may have refreshed while this one waited
+            snapshot = self._snapshots.get(time_frame)
+            if self._is_fresh(snapshot):
+                missing = [symbol for symbol in symbols if symbol not in snapshot.symbols]
+                if not missing:
+                    return snapshot
+                assets = dict(snapshot.assets)
+                assets.update(await self._fetch(missing, time_frame))
+                return self._publish(time_frame, assets, snapshot.symbols.union(missing), snapshot.refreshed_at)
+
+            # Refresh everything requested since the last refresh; symbols no
+            # run asked for in that window drop out of the universe
+            to_fetch = list({**self._requested[time_frame], **dict.fromkeys(symbols)})
+            self._requested[time_frame] = dict.fromkeys(symbols)
+            refreshed_at = time.monotonic()
+            assets = await self._fetch(to_fetch, time_frame)
+            self.refreshes += 1
+            return self._publish(time_frame, assets, frozenset(to_fetch), refreshed_at)
+
+    async def _fetch(self, symbols: List[str], time_frame: TimeFrame) -> Dict[str, Dict[str, Any]]:
+        self.symbols_fetched += len(symbols)
+        return await self.fetch_assets(symbols, time_frame)
+
+    def _publish(self, time_frame: TimeFrame, assets: Dict[str, Dict[str, Any]],
+                 symbols: FrozenSet[str], refreshed_at: float) -> UniverseSnapshot:
+        snapshot = UniverseSnapshot(
+            version=next(self._versions),
+            time_frame=time_frame,
+            assets=MappingProxyType(assets),
+            symbols=symbols,
+            refreshed_at=refreshed_at,
+            timestamp=datetime.utcnow(),
+        )
+        self._snapshots[time_frame] = snapshot
+        return snapshot
+
+    def clear(self) -> None:
+        """Drop all snapshots so the next request refetches."""
+        self._snapshots.clear()
+        self._requested.clear()
@@ -14,6 +14,8 @@ from contextlib import asynccontextmanager
 import json
 from typing import List
 import asyncio
+import importlib
+import sys
 import time
 import uuid
 from datetime import datetime
@@ -54,6 +56,27 @@ market_streamer = None
 # Scanner WebSocket manager
 scanner_websocket_manager = None
 
+# LSTM model registry warm start
+model_warm_start_task = None
+
+
+async def warm_start_lstm_models():
+    """Preload the most-requested LSTM models without blocking startup"""
+    try:
+        # Imported in a worker thread so loading TensorFlow never blocks the event loop
+        lstm_module = await asyncio.to_thread(importlib.import_module, "app.services.lstm_service")
+
+        loaded = await lstm_module.lstm_service.warm_start(settings.LSTM_WARM_START_MODELS)
+        app_logger.info(
+            f"✅ Preloaded {len(loaded)} LSTM models",
+            extra={"log_type": "model_registry", "event": "warm_start", "models": loaded}
+        )
+    except Exception as e:
+        app_logger.warning(
+            f"⚠️ LSTM model warm start failed: {e}",
+            extra={"log_type": "model_registry", "event": "warm_start_failed"}
+        )
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -137,8 +160,10 @@ async def lifespan(app: FastAPI):
             scanner_websocket_manager = None
 
         # Start background tasks
-        # Additional background tasks can be added here
-        
+        global model_warm_start_task
+        if settings.LSTM_WARM_START_MODELS > 0:
+            model_warm_start_task = asyncio.create_task(warm_start_lstm_models())
+
         app_logger.info(
             "✅ Application startup complete",
             extra={"log_type": "application_lifecycle", "event": "startup_complete"}
@@ -160,6 +185,16 @@ async def lifespan(app: FastAPI):
             extra={"log_type": "application_lifecycle", "event": "shutdown_begin"}
         )
 
+        if model_warm_start_task and not model_warm_start_task.done():
+            model_warm_start_task.cancel()
+
+        # Persist request counts for the next warm start and stop training workers
+        # (only if the LSTM service was loaded)
+        if "app.services.lstm_service" in sys.modules:
+            loaded_lstm_service = sys.modules["app.services.lstm_service"].lstm_service
+            loaded_lstm_service.registry.save_request_counts()
+            loaded_lstm_service.training_scheduler.shutdown()
+
         # Stop streaming services
         if scanner_websocket_manager:
             try:
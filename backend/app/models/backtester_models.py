@@ -3,12 +3,20 @@ Portfolio Backtester models and data contracts.
 Comprehensive data structures for strategy backtesting, walk-forward optimization, and performance analysis.
 """
 
+from abc import abstractmethod
+from collections.abc import Sequence
 from datetime import date, datetime
 from typing import Dict, List, Optional, Literal, Union, Any
-from pydantic import BaseModel, Field, validator
+import numpy as np
+from pydantic import BaseModel, Field, GetCoreSchemaHandler, validator
+from pydantic_core import core_schema
 from enum import Enum
 from decimal import Decimal
 
+# Alias for fields literally named ``date``; annotating them with ``date`` makes
+# pydantic resolve the type against the field default and recurse.
+DateType = date
+
 
 class PositionSizingMethod(str, Enum):
     """Position sizing methodologies."""
@@ -119,6 +127,16 @@ class BacktestConfiguration(BaseModel):
     training_window_days: int = Field(252, ge=60, le=1260, description="Training window in days")
     test_window_days: int = Field(63, ge=20, le=252, description="Test window in days")
     step_size_days: int = Field(21, ge=1, le=126, description="Walk-forward step size in days")
+    parameter_grid: Optional[Dict[str, List[float]]] = Field(
+        None,
+        description=(
+            "Strategy parameters to optimize in each training window, keyed by TradingStrategy "
+            "field or rule path (e.g. 'entry_signal_threshold', 'entry_rules.0.threshold')"
+        )
+    )
+    optimization_metric: Literal["sharpe_ratio", "total_return", "calmar_ratio"] = Field(
+        "sharpe_ratio", description="Metric used to select parameters in each training window"
+    )
 
     # Cost and risk models
     transaction_costs: TransactionCosts = Field(default_factory=TransactionCosts)
@@ -189,7 +207,7 @@ class Position(BaseModel):
 
 class PortfolioSnapshot(BaseModel):
     """Portfolio state at a specific date."""
-    date: date = Field(..., description="Snapshot date")
+    date: DateType = Field(..., description="Snapshot date")
     total_value: float = Field(..., gt=0, description="Total portfolio value")
     cash: float = Field(..., ge=0, description="Cash position")
     positions: List[Position] = Field(default_factory=list, description="Current positions")
@@ -206,6 +224,363 @@ class PortfolioSnapshot(BaseModel):
     leverage: float = Field(0.0, ge=0, description="Portfolio leverage")
 
 
+class _ColumnStore:
+    """Equally sized, growable NumPy columns with amortized O(1) appends."""
+
+    def __init__(self, dtypes: Dict[str, Any], capacity: int = 64):
+        self._size = 0
+        self._columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in dtypes.items()}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Drop unused capacity when results are pickled between processes
+        return {'_size': self._size, '_columns': {name: self.column(name).copy() for name in self._columns}}
+
+    def _reserve(self, extra: int) -> None:
+        capacity = len(next(iter(self._columns.values())))
+        required = self._size + extra
+        if required <= capacity:
+            return
+
+        new_capacity = max(required, capacity * 2)
+        for name, column in self._columns.items():
+            grown = np.empty(new_capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def append(self, **values: Any) -> None:
+        self._reserve(1)
+        for name, column in self._columns.items():
+            column[self._size] = values[name]
+        self._size += 1
+
+    def extend(self, count: int, **values: Any) -> None:
+        """Append ``count`` rows at once from per-column sequences."""
+        if count == 0:
+            return
+
+        self._reserve(count)
+        end = self._size + count
+        for name, column in self._columns.items():
+            column[self._size:end] = values[name]
+        self._size = end
+
+    def set(self, name: str, row: int, value: Any) -> None:
+        """Overwrite one populated cell."""
+        if not 0 <= row < self._size:
+            raise IndexError(f"row {row} out of range for {self._size} rows")
+        self._columns[name][row] = value
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only view of one column's populated rows."""
+        view = self._columns[name][:self._size]
+        view.flags.writeable = False
+        return view
+
+
+class _LabelTable:
+    """Interns repeated strings (symbols, sectors) as integer codes; -1 means None."""
+
+    def __init__(self):
+        self.labels: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def encode(self, label: Optional[str]) -> int:
+        if label is None:
+            return -1
+
+        code = self._codes.get(label)
+        if code is None:
+            code = len(self.labels)
+            self._codes[label] = code
+            self.labels.append(label)
+        return code
+
+    def decode(self, code: int) -> Optional[str]:
+        return self.labels[code] if code >= 0 else None
+
+
+def _optional_float(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+class _ColumnarModelSequence(Sequence):
+    """Read-only sequence of model rows stored column-wise.
+
+    Rows are only turned into pydantic models when indexed or iterated, which
+    is what pydantic does when the owning model is serialized. The pydantic
+    schema accepts either an instance or a plain list of models, and
+    serializes as a list of models.
+    """
+
+    item_model: type = BaseModel
+
+    @abstractmethod
+    def _materialize(self, row: int) -> BaseModel:
+        """Build the model for one stored row."""
+
+    @abstractmethod
+    def append_model(self, item: BaseModel) -> None:
+        """Store one model as a new row."""
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._materialize(row) for row in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._materialize(index)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={len(self)})"
+
+    def to_models(self) -> List[BaseModel]:
+        """Materialize every row."""
+        return [self._materialize(row) for row in range(len(self))]
+
+    @classmethod
+    def from_models(cls, items: List[BaseModel]):
+        container = cls()
+        for item in items:
+            container.append_model(item)
+        return container
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler):
+        items_schema = handler.generate_schema(List[cls.item_model])
+        from_items = core_schema.no_info_after_validator_function(cls.from_models, items_schema)
+
+        return core_schema.json_or_python_schema(
+            json_schema=from_items,
+            python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), from_items]),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                list, return_schema=items_schema
+            ),
+        )
+
+
+_SNAPSHOT_COLUMNS = {
+    'date': 'datetime64[D]',
+    'total_value': np.float64,
+    'cash': np.float64,
+    'daily_return': np.float64,
+    'daily_return_pct': np.float64,
+    'benchmark_return_pct': np.float64,
+    'num_positions': np.int64,
+    'gross_exposure': np.float64,
+    'net_exposure': np.float64,
+    'leverage': np.float64,
+    'positions_end': np.int64,
+}
+
+_POSITION_COLUMNS = {
+    'symbol': np.int32,
+    'quantity': np.int64,
+    'entry_price': np.float64,
+    'current_price': np.float64,
+    'entry_date': 'datetime64[D]',
+    'market_value': np.float64,
+    'unrealized_pnl': np.float64,
+    'unrealized_pnl_pct': np.float64,
+    'portfolio_weight': np.float64,
+    'volatility': np.float64,
+    'beta': np.float64,
+    'sector': np.int32,
+}
+
+
+class EquityCurve(_ColumnarModelSequence):
+    """Columnar daily portfolio history.
+
+    One row per trading day plus a flat table of the positions held each day,
+    so long backtests with large books hold a handful of arrays instead of
+    millions of model objects. Indexing returns ``PortfolioSnapshot`` models.
+    """
+
+    item_model = PortfolioSnapshot
+
+    def __init__(self):
+        self._rows = _ColumnStore(_SNAPSHOT_COLUMNS)
+        self._positions = _ColumnStore(_POSITION_COLUMNS)
+        self._labels = _LabelTable()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def append(self, date: date, total_value: float, cash: float, positions: List['Position'],
+               daily_return: float = 0.0, daily_return_pct: float = 0.0,
+               benchmark_return_pct: float = 0.0, gross_exposure: float = 0.0,
+               net_exposure: float = 0.0, leverage: float = 0.0) -> None:
+        """Record one day; position values are copied, so the caller may keep mutating them."""
+        encode = self._labels.encode
+        self._positions.extend(
+            len(positions),
+            symbol=[encode(p.symbol) for p in positions],
+            quantity=[p.quantity for p in positions],
+            entry_price=[p.entry_price for p in positions],
+            current_price=[p.current_price for p in positions],
+            entry_date=[p.entry_date for p in positions],
+            market_value=[p.market_value for p in positions],
+            unrealized_pnl=[p.unrealized_pnl for p in positions],
+            unrealized_pnl_pct=[p.unrealized_pnl_pct for p in positions],
+            portfolio_weight=[p.portfolio_weight for p in positions],
+            volatility=[np.nan if p.volatility is None else p.volatility for p in positions],
+            beta=[np.nan if p.beta is None else p.beta for p in positions],
+            sector=[encode(p.sector) for p in positions],
+        )
+        self._rows.append(
+            date=date, total_value=total_value, cash=cash,
+            daily_return=daily_return, daily_return_pct=daily_return_pct,
+            benchmark_return_pct=benchmark_return_pct, num_positions=len(positions),
+            gross_exposure=gross_exposure, net_exposure=net_exposure, leverage=leverage,
+            positions_end=len(self._positions),
+        )
+
+    def append_model(self, item: PortfolioSnapshot) -> None:
+        self.append(
+            item.date, item.total_value, item.cash, item.positions,
+            daily_return=item.daily_return, daily_return_pct=item.daily_return_pct,
+            benchmark_return_pct=item.benchmark_return_pct,
+            gross_exposure=item.gross_exposure, net_exposure=item.net_exposure,
+            leverage=item.leverage,
+        )
+        # Keep the stored count when a snapshot was built without its positions
+        self._rows.set('num_positions', len(self) - 1, item.num_positions)
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only array of a snapshot field (e.g. ``total_value``, ``leverage``)."""
+        return self._rows.column(name)
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self._rows.column('date')
+
+    @property
+    def total_values(self) -> np.ndarray:
+        return self._rows.column('total_value')
+
+    @property
+    def returns(self) -> np.ndarray:
+        """Simple day-over-day returns of total portfolio value."""
+        values = self.total_values
+        return values[1:] / values[:-1] - 1
+
+    def _materialize(self, row: int) -> PortfolioSnapshot:
+        snapshot = {name: self._rows.column(name)[row].item() for name in _SNAPSHOT_COLUMNS}
+        end = snapshot.pop('positions_end')
+        start = int(self._rows.column('positions_end')[row - 1]) if row > 0 else 0
+
+        columns = {name: self._positions.column(name)[start:end].tolist() for name in _POSITION_COLUMNS}
+        decode = self._labels.decode
+        positions = []
+        for values in zip(*columns.values()):
+            fields = dict(zip(columns, values))
+            fields['symbol'] = decode(fields['symbol'])
+            fields['sector'] = decode(fields['sector'])
+            fields['volatility'] = _optional_float(fields['volatility'])
+            fields['beta'] = _optional_float(fields['beta'])
+            positions.append(Position(**fields))
+
+        return PortfolioSnapshot(positions=positions, **snapshot)
+
+
+_TRADE_COLUMNS = {
+    'trade_id': object,
+    'symbol': np.int32,
+    'action': np.int32,
+    'quantity': np.int64,
+    'price': np.float64,
+    'timestamp': 'datetime64[us]',
+    'commission': np.float64,
+    'slippage': np.float64,
+    'market_impact': np.float64,
+    'signal_strength': np.float64,
+    'portfolio_weight': np.float64,
+    'sector': np.int32,
+    'pnl': np.float64,
+    'holding_days': np.int64,
+    'return_pct': np.float64,
+}
+
+
+class TradeLog(_ColumnarModelSequence):
+    """Columnar trade log; indexing returns ``Trade`` models.
+
+    Optional fields are stored as NaN (floats) or -1 (codes, holding days).
+    """
+
+    item_model = Trade
+
+    def __init__(self):
+        self._rows = _ColumnStore(_TRADE_COLUMNS)
+        self._labels = _LabelTable()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def append_model(self, item: Trade) -> None:
+        encode = self._labels.encode
+        self._rows.append(
+            trade_id=item.trade_id,
+            symbol=encode(item.symbol),
+            action=encode(item.action),
+            quantity=item.quantity,
+            price=item.price,
+            timestamp=item.timestamp,
+            commission=item.commission,
+            slippage=item.slippage,
+            market_impact=item.market_impact,
+            signal_strength=item.signal_strength,
+            portfolio_weight=item.portfolio_weight,
+            sector=encode(item.sector),
+            pnl=np.nan if item.pnl is None else item.pnl,
+            holding_days=-1 if item.holding_days is None else item.holding_days,
+            return_pct=np.nan if item.return_pct is None else item.return_pct,
+        )
+
+    append = append_model
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only array of a trade field; ``symbol``/``action``/``sector`` hold codes."""
+        return self._rows.column(name)
+
+    @property
+    def symbols(self) -> np.ndarray:
+        """Symbol of every trade as an object array."""
+        return np.array(self._labels.labels + [None], dtype=object)[self._rows.column('symbol')]
+
+    @property
+    def pnl(self) -> np.ndarray:
+        """Realized P&L per trade (NaN for trades that did not close a position)."""
+        return self._rows.column('pnl')
+
+    def _materialize(self, row: int) -> Trade:
+        fields = {name: self._rows.column(name)[row] for name in _TRADE_COLUMNS}
+        fields = {name: value.item() if isinstance(value, np.generic) else value
+                  for name, value in fields.items()}
+        decode = self._labels.decode
+
+        for name in ('symbol', 'action', 'sector'):
+            fields[name] = decode(fields[name])
+        for name in ('pnl', 'return_pct'):
+            fields[name] = _optional_float(fields[name])
+        if fields['holding_days'] < 0:
+            fields['holding_days'] = None
+
+        return Trade(**fields)
+
+    def top_trades(self, count: int, winners: bool = True) -> List[Trade]:
+        """Largest winning (or losing) closed trades by realized P&L."""
+        pnl = self.pnl
+        rows = np.flatnonzero(pnl > 0 if winners else pnl < 0)
+        order = np.argsort(-pnl[rows] if winners else pnl[rows], kind='stable')
+        return [self._materialize(int(row)) for row in rows[order][:count]]
+
+
 class PerformanceMetrics(BaseModel):
     """Comprehensive performance metrics."""
     # Return metrics
@@ -287,8 +662,8 @@ class BacktestResult(BaseModel):
 
     # Core results
     performance_metrics: PerformanceMetrics = Field(..., description="Overall performance metrics")
-    equity_curve: List[PortfolioSnapshot] = Field(..., description="Daily portfolio snapshots")
-    trade_log: List[Trade] = Field(..., description="Complete trade log")
+    equity_curve: EquityCurve = Field(..., description="Daily portfolio snapshots")
+    trade_log: TradeLog = Field(..., description="Complete trade log")
 
     # Walk-forward results (if enabled)
     walk_forward_results: Optional[List[WalkForwardResult]] = Field(
@@ -390,6 +765,52 @@ class StrategyOptimizationRequest(BaseModel):
     min_trade_count: int = Field(50, ge=10, description="Minimum trades required for valid result")
 
 
+class BacktestSweepRequest(BaseModel):
+    """Request to backtest many strategy variants over shared market data."""
+    universe: List[str] = Field(..., min_items=1, max_items=1000, description="Stock universe")
+    start_date: date = Field(..., description="Backtest start date")
+    end_date: date = Field(..., description="Backtest end date")
+    initial_capital: float = Field(100000.0, gt=0, description="Initial portfolio capital")
+    transaction_costs: TransactionCosts = Field(default_factory=TransactionCosts)
+
+    # Variants evaluated against the same data
+    variants: List[TradingStrategy] = Field(
+        ..., min_items=1, max_items=500, description="Strategy variants to evaluate"
+    )
+    ranking_metric: Literal["sharpe_ratio", "total_return", "calmar_ratio"] = Field(
+        "sharpe_ratio", description="Metric used to rank variants"
+    )
+
+    @validator('end_date')
+    def end_date_after_start_date(cls, v, values):
+        if 'start_date' in values and v <= values['start_date']:
+            raise ValueError('End date must be after start date')
+        return v
+
+
+class SweepLeaderboardEntry(BaseModel):
+    """Compact per-variant summary in a sweep leaderboard."""
+    rank: int = Field(..., ge=1, description="Rank by the sweep ranking metric")
+    variant_index: int = Field(..., ge=0, description="Index of the variant in the request")
+    strategy_name: str = Field(..., description="Strategy name")
+    total_return_pct: float = Field(..., description="Total return percentage")
+    sharpe_ratio: float = Field(..., description="Sharpe ratio")
+    calmar_ratio: float = Field(..., description="Calmar ratio")
+    max_drawdown: float = Field(..., le=0, description="Maximum drawdown")
+    total_trades: int = Field(..., ge=0, description="Number of trades")
+
+
+class BacktestSweepResult(BaseModel):
+    """Leaderboard for a parameter sweep; full results are fetched per variant."""
+    sweep_id: str = Field(..., description="Sweep identifier")
+    ranking_metric: str = Field(..., description="Metric used to rank variants")
+    universe_size: int = Field(..., gt=0, description="Number of symbols in universe")
+    date_range: str = Field(..., description="Date range (e.g., '2020-01-01 to 2023-12-31')")
+    leaderboard: List[SweepLeaderboardEntry] = Field(..., description="Variants ordered by rank")
+    failed_variants: List[int] = Field(default_factory=list, description="Variants that could not be evaluated")
+    execution_time_seconds: float = Field(..., ge=0, description="Sweep execution time")
+
+
 class BacktestError(BaseModel):
     """Error response for backtesting operations."""
     error_code: str = Field(..., description="Error code")
@@ -404,7 +825,8 @@ class BacktestError(BaseModel):
 __all__ = [
     'PositionSizingMethod', 'RebalanceFrequency', 'BenchmarkType', 'RiskFreeRateSource',
     'SignalRule', 'TradingStrategy', 'TransactionCosts', 'BacktestConfiguration',
-    'Trade', 'Position', 'PortfolioSnapshot', 'PerformanceMetrics',
+    'Trade', 'Position', 'PortfolioSnapshot', 'EquityCurve', 'TradeLog', 'PerformanceMetrics',
     'WalkForwardResult', 'BacktestResult', 'BacktestRequest', 'BacktestStatus',
-    'BacktestSummary', 'StrategyOptimizationRequest', 'BacktestError'
+    'BacktestSummary', 'StrategyOptimizationRequest', 'BacktestSweepRequest',
+    'SweepLeaderboardEntry', 'BacktestSweepResult', 'BacktestError'
 ]
\ No newline at end of file
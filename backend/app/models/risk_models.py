@@ -418,6 +418,10 @@ class MonteCarloSimulation(BaseModel):
     probability_of_target: Decimal = Field(..., description="Probability of reaching target")
     max_simulated_loss: Decimal = Field(..., description="Maximum simulated loss")
     max_simulated_gain: Decimal = Field(..., description="Maximum simulated gain")
+    var_95: Optional[Decimal] = Field(None, description="95% Value at Risk (fraction of portfolio value)")
+    var_99: Optional[Decimal] = Field(None, description="99% Value at Risk (fraction of portfolio value)")
+    cvar_95: Optional[Decimal] = Field(None, description="95% Conditional VaR (fraction of portfolio value)")
+    cvar_99: Optional[Decimal] = Field(None, description="99% Conditional VaR (fraction of portfolio value)")
 
     # Statistics
     simulation_paths: Optional[List[List[Decimal]]] = Field(None, description="Sample simulation paths")
@@ -221,6 +221,37 @@ class ScannerConfig(BaseModel):
     webhook_url: Optional[str] = Field(None, description="Webhook URL for alerts")
 
 
+# Result Models
+
+class ScanResult(BaseModel):
+    """Individual scan result for an asset"""
+    symbol: str = Field(..., description="Asset symbol")
+    name: Optional[str] = Field(None, description="Asset name")
+    asset_type: AssetType = Field(..., description="Type of asset")
+
+    # Price data
+    price: Decimal = Field(..., description="Current price")
+    change: Decimal = Field(..., description="Price change")
+    change_percent: Decimal = Field(..., description="Price change percentage")
+    volume: int = Field(..., description="Current volume")
+
+    # Scores and rankings
+    match_score: Decimal = Field(..., description="How well asset matches filters (0-100)")
+    rank: Optional[int] = Field(None, description="Rank among results")
+
+    # Matched conditions
+    matched_filters: List[str] = Field(..., description="Which filters were matched")
+    filter_values: Dict[str, Any] = Field(..., description="Actual values for filtered fields")
+
+    # Additional data
+    technical_indicators: Optional[Dict[str, Decimal]] = Field(None, description="Technical indicator values")
+    fundamental_data: Optional[Dict[str, Any]] = Field(None, description="Fundamental data")
+    patterns_detected: Optional[List[str]] = Field(None, description="Detected patterns")
+    tags: Optional[List[str]] = Field(None, description="Result tags")
+
+    # Metadata
+    scan_timestamp: datetime = Field(..., description="When scan was performed")
+    time_frame: TimeFrame = Field(..., description="Time frame used")
 
 
 class ScannerResponse(BaseModel):
@@ -420,38 +451,6 @@ class PortfolioAnalysis(BaseModel):
     timestamp: datetime = Field(..., description="Analysis timestamp")
 
 
-# Update ScanResult model to include tags
-class ScanResult(BaseModel):
-    """Individual scan result for an asset"""
-    symbol: str = Field(..., description="Asset symbol")
-    name: Optional[str] = Field(None, description="Asset name")
-    asset_type: AssetType = Field(..., description="Type of asset")
-
-    # Price data
-    price: Decimal = Field(..., description="Current price")
-    change: Decimal = Field(..., description="Price change")
-    change_percent: Decimal = Field(..., description="Price change percentage")
-    volume: int = Field(..., description="Current volume")
-
-    # Scores and rankings
-    match_score: Decimal = Field(..., description="How well asset matches filters (0-100)")
-    rank: Optional[int] = Field(None, description="Rank among results")
-
-    # Matched conditions
-    matched_filters: List[str] = Field(..., description="Which filters were matched")
-    filter_values: Dict[str, Any] = Field(..., description="Actual values for filtered fields")
-
-    # Additional data
-    technical_indicators: Optional[Dict[str, Decimal]] = Field(None, description="Technical indicator values")
-    fundamental_data: Optional[Dict[str, Any]] = Field(None, description="Fundamental data")
-    patterns_detected: Optional[List[str]] = Field(None, description="Detected patterns")
-    tags: Optional[List[str]] = Field(None, description="Result tags")
-
-    # Metadata
-    scan_timestamp: datetime = Field(..., description="When scan was performed")
-    time_frame: TimeFrame = Field(..., description="Time frame used")
-
-
 # Update FilterGroup model reference
 FilterGroup.model_rebuild()
 AggregatedScanResult.model_rebuild()
\ No newline at end of file
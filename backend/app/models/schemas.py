@@ -34,7 +34,7 @@ class TechnicalIndicators(BaseModel):
     macd: Dict[str, float] = Field(..., description="MACD line, signal, histogram")
     bollinger_bands: Dict[str, float] = Field(..., description="Upper, middle, lower bands")
     technical_score: float = Field(..., ge=0, le=1, description="Technical score 0-1")
-    recommendation: str = Field(..., regex="^(BUY|SELL|HOLD)$", description="Trading recommendation")
+    recommendation: str = Field(..., pattern="^(BUY|SELL|HOLD)$", description="Trading recommendation")
 
     # Additional indicators per module spec
     adx: float = Field(..., ge=0, le=100, description="ADX trend strength")
@@ -55,6 +55,26 @@ class LSTMPrediction(BaseModel):
     directional_accuracy: float = Field(..., ge=0, le=1, description="Direction prediction accuracy")
 
 
+class LSTMPredictionStatus(BaseModel):
+    """Why a symbol in a batch request has no LSTM prediction"""
+    symbol: str = Field(..., description="Stock symbol")
+    status: str = Field(
+        ..., pattern="^(pending|not_trained_for_symbol|insufficient_data)$", description="Prediction status"
+    )
+    model_version: Optional[str] = Field(None, description="Model version being trained or served")
+    detail: str = Field(..., description="Human-readable explanation")
+
+
+class ModelPerformance(BaseModel):
+    """LSTM model performance history"""
+    symbol: str = Field(..., description="Stock symbol")
+    model_version: str = Field(..., description="Model version")
+    accuracy_trend: List[float] = Field(..., description="Recent accuracy values")
+    mae_trend: List[float] = Field(..., description="Recent mean absolute error values")
+    directional_accuracy_trend: List[float] = Field(..., description="Recent directional accuracy values")
+    last_updated: datetime = Field(..., description="Last evaluation timestamp")
+
+
 class AnalysisResult(BaseModel):
     """Multi-factor analysis result per Claude.StockAnalysis.md"""
     symbol: str = Field(..., description="Stock symbol")
@@ -63,7 +83,7 @@ class AnalysisResult(BaseModel):
     sentiment_score: float = Field(..., ge=-1, le=1, description="Sentiment score -1 to 1")
     seasonality_score: float = Field(..., ge=0, le=1, description="Seasonality boost")
     final_score: float = Field(..., ge=0, le=1, description="Final weighted score")
-    recommendation: str = Field(..., regex="^(BUY|SELL|HOLD)$", description="Final recommendation")
+    recommendation: str = Field(..., pattern="^(BUY|SELL|HOLD)$", description="Final recommendation")
     confidence: float = Field(..., ge=0, le=1, description="Overall confidence level")
     timestamp: datetime = Field(..., description="Analysis timestamp")
 
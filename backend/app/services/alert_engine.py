@@ -7,12 +7,13 @@ rate limiting, and delivery coordination.
 
 import asyncio
 import uuid
-from typing import Optional, List, Dict, Any, Set, Callable
+from typing import Optional, List, Dict, Any, Set, Callable, Tuple
 from datetime import datetime, timedelta, time
 from decimal import Decimal
 import logging
 from collections import defaultdict, deque
 import json
+import numpy as np
 
 from ..models.alert_models import (
     AlertRule, Alert, AlertCondition, AlertType, AlertSeverity, AlertStatus,
@@ -20,11 +21,30 @@ from ..models.alert_models import (
     AlertSystemConfig
 )
 from ..models.risk_models import Position, Portfolio
+from ..core.alert_plan import AlertPlan, field_value, is_technical_field
+from ..core.rule_index import RuleIndex
 from ..services.stock_service import StockService
+from ..services.technical_analysis_service import technical_analysis_service
 
 logger = logging.getLogger(__name__)
 
 
+def technical_snapshot(indicators: Any) -> Dict[str, float]:
+    """Flat condition fields from a TechnicalIndicators result"""
+    if indicators is None:
+        return {}
+
+    data = indicators.dict() if hasattr(indicators, 'dict') else dict(indicators)
+    fields = {key: value for key, value in data.items() if isinstance(value, (int, float)) and not isinstance(value, bool)}
+    fields['rsi'] = (data.get('rsi') or {}).get('value')
+    fields['macd'] = (data.get('macd') or {}).get('macd')
+    fields['macd_signal'] = (data.get('macd') or {}).get('signal')
+    fields['bb_upper'] = (data.get('bollinger_bands') or {}).get('upper')
+    fields['bb_middle'] = (data.get('bollinger_bands') or {}).get('middle')
+    fields['bb_lower'] = (data.get('bollinger_bands') or {}).get('lower')
+    return {key: value for key, value in fields.items() if value is not None}
+
+
 class AlertConditionEvaluator:
     """Evaluates individual alert conditions"""
 
@@ -68,30 +88,19 @@ class AlertConditionEvaluator:
     ) -> Optional[Any]:
         """Get the current value for a field"""
         try:
-            # Direct field access
-            if field in current_data:
-                return current_data[field]
-
-            # Common field mappings
-            field_map = {
-                'price': 'current_price',
-                'close': 'current_price',
-                'volume': 'volume',
-                'change': 'change',
-                'change_percent': 'change_percent',
-                'high': 'day_high',
-                'low': 'day_low',
-                'open': 'day_open'
-            }
-
-            mapped_field = field_map.get(field, field)
-            if mapped_field in current_data:
-                return current_data[mapped_field]
-
-            # Technical indicators
-            if field.startswith('sma_') or field.startswith('ema_') or field in ['rsi', 'macd', 'bb_upper', 'bb_lower']:
-                technical_data = await self.stock_service.get_technical_indicators(symbol)
-                if technical_data and field in technical_data:
+            # Direct field access, then common field mappings
+            value = field_value(current_data, field)
+            if value is not None:
+                return value
+
+            # Technical indicators: live values for streamed symbols first
+            streamed = technical_analysis_service.get_streaming_indicators(symbol)
+            if streamed.get(field) is not None:
+                return streamed[field]
+
+            if is_technical_field(field):
+                technical_data = technical_snapshot(await self.stock_service.get_technical_indicators(symbol))
+                if field in technical_data:
                     return technical_data[field]
 
             # Historical comparisons
@@ -289,8 +298,9 @@ class AlertEngine:
         # Configuration
         self.config = AlertSystemConfig()
 
-        # Active rules
-        self.active_rules: Dict[str, AlertRule] = {}
+        # Active rules, indexed by symbol, alert type and portfolio
+        self.rule_index = RuleIndex()
+        self.plan = AlertPlan()  # kept in step with the index, one rule at a time
         self.rule_cooldowns: Dict[str, datetime] = {}
 
         # Processing queues
@@ -314,6 +324,10 @@ class AlertEngine:
             'conditions_checked': 0
         }
 
+    @property
+    def active_rules(self) -> Dict[str, AlertRule]:
+        return self.rule_index.rules
+
     async def start(self):
         """Start the alert engine"""
         try:
@@ -371,19 +385,27 @@ class AlertEngine:
         """Add an alert rule to the engine"""
         try:
             if rule.active:
-                self.active_rules[rule.rule_id] = rule
+                self._index_rule(rule)
                 logger.info(f"Added active alert rule: {rule.name} ({rule.rule_id})")
             else:
+                self._unindex_rule(rule.rule_id)
                 logger.info(f"Added inactive alert rule: {rule.name} ({rule.rule_id})")
 
         except Exception as e:
             logger.error(f"Error adding alert rule {rule.rule_id}: {e}")
 
+    def _index_rule(self, rule: AlertRule):
+        self.rule_index.add(rule)
+        self.plan.add(rule, RuleIndex.rule_symbols(rule))
+
+    def _unindex_rule(self, rule_id: str) -> Optional[AlertRule]:
+        self.plan.remove(rule_id)
+        return self.rule_index.remove(rule_id)
+
     async def remove_rule(self, rule_id: str):
         """Remove an alert rule from the engine"""
         try:
-            if rule_id in self.active_rules:
-                del self.active_rules[rule_id]
+            if self._unindex_rule(rule_id) is not None:
                 logger.info(f"Removed alert rule: {rule_id}")
 
             if rule_id in self.rule_cooldowns:
@@ -396,9 +418,9 @@ class AlertEngine:
         """Update an existing alert rule"""
         try:
             if rule.active:
-                self.active_rules[rule.rule_id] = rule
-            elif rule.rule_id in self.active_rules:
-                del self.active_rules[rule.rule_id]
+                self._index_rule(rule)
+            else:
+                self._unindex_rule(rule.rule_id)
 
             rule.updated_at = datetime.utcnow()
             logger.info(f"Updated alert rule: {rule.name} ({rule.rule_id})")
@@ -408,30 +430,92 @@ class AlertEngine:
 
     async def evaluate_rules_for_symbol(self, symbol: str, market_data: Dict[str, Any]):
         """Evaluate all rules for a specific symbol"""
+        await self.evaluate_tick({symbol: market_data})
+
+    async def evaluate_tick(self, market_data: Dict[str, Dict[str, Any]]) -> int:
+        """Evaluate the rules of every symbol in a market data update together
+
+        Only the compiled conditions of the rules on the tick's symbols are
+        compared, against one field snapshot per symbol. Returns the number
+        of rules triggered.
+        """
         try:
-            relevant_rules = [
-                rule for rule in self.active_rules.values()
-                if self._rule_applies_to_symbol(rule, symbol)
-            ]
+            market_data = {symbol.upper(): data for symbol, data in market_data.items()}
+            snapshots = await self._build_snapshots(self.plan, market_data)
 
-            for rule in relevant_rules:
-                await self._evaluate_rule(rule, symbol, market_data)
+            result = self.plan.evaluate(snapshots, self.condition_evaluator._compare_values)
+            self.stats['rules_evaluated'] += result.pairs_evaluated
+            self.stats['conditions_checked'] += result.conditions_evaluated
+
+            fired = 0
+            for match in result.triggered:
+                if not self._can_alert(match.rule):
+                    continue
+
+                condition_results = []
+                for condition, met, value in match.conditions:
+                    value = field_value(snapshots[match.symbol], condition.field) if np.isnan(value) else value
+                    description = self.condition_evaluator._generate_condition_description(condition, value)
+                    condition_results.append((met, description, value))
+
+                await self._fire_rule(match.rule, match.symbol, condition_results, market_data[match.symbol])
+                fired += 1
+            return fired
 
         except Exception as e:
-            logger.error(f"Error evaluating rules for symbol {symbol}: {e}")
+            logger.error(f"Error evaluating rules for market tick: {e}")
+            return 0
+
+    async def _build_snapshots(
+        self,
+        plan: AlertPlan,
+        market_data: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """One field snapshot per symbol, shared by every rule on that symbol
+
+        Quote fields come from the market data, indicators from the streaming
+        engine. Technical fields still missing are filled from a single
+        indicator lookup per symbol.
+        """
+        snapshots = {}
+        lookups = []
+        for symbol, data in market_data.items():
+            fields = plan.symbol_fields(symbol)
+            if not fields:
+                continue
+
+            snapshot = dict(data)
+            for name, value in technical_analysis_service.get_streaming_indicators(symbol).items():
+                if value is not None:
+                    snapshot.setdefault(name, value)
+            snapshots[symbol] = snapshot
+
+            if any(is_technical_field(f) and field_value(snapshot, f) is None for f in fields):
+                lookups.append(symbol)
+
+        if lookups:
+            results = await asyncio.gather(
+                *(self.stock_service.get_technical_indicators(symbol) for symbol in lookups),
+                return_exceptions=True
+            )
+            for symbol, indicators in zip(lookups, results):
+                if isinstance(indicators, Exception):
+                    logger.error(f"Error fetching indicators for {symbol}: {indicators}")
+                    continue
+                for name, value in technical_snapshot(indicators).items():
+                    snapshots[symbol].setdefault(name, value)
+
+        return snapshots
 
     async def evaluate_rules_for_portfolio(self, portfolio: Portfolio):
         """Evaluate portfolio-specific rules"""
         try:
-            portfolio_rules = [
-                rule for rule in self.active_rules.values()
-                if rule.portfolio_id == portfolio.portfolio_id
-            ]
-
             portfolio_data = self._prepare_portfolio_data(portfolio)
 
-            for rule in portfolio_rules:
-                await self._evaluate_portfolio_rule(rule, portfolio, portfolio_data)
+            await asyncio.gather(*(
+                self._evaluate_portfolio_rule(rule, portfolio, portfolio_data)
+                for rule in self.rule_index.for_portfolio(portfolio.portfolio_id)
+            ))
 
         except Exception as e:
             logger.error(f"Error evaluating portfolio rules: {e}")
@@ -538,82 +622,64 @@ class AlertEngine:
         except asyncio.CancelledError:
             pass
 
-    def _rule_applies_to_symbol(self, rule: AlertRule, symbol: str) -> bool:
-        """Check if a rule applies to a specific symbol"""
-        if rule.symbol and rule.symbol == symbol:
-            return True
-        if rule.symbols and symbol in rule.symbols:
-            return True
-        return False
+    def _can_alert(self, rule: AlertRule) -> bool:
+        """Check cooldown, rate limits and time restrictions for a triggered rule"""
+        # Check if rule is in cooldown
+        if rule.rule_id in self.rule_cooldowns:
+            cooldown_until = self.rule_cooldowns[rule.rule_id]
+            if datetime.utcnow() < cooldown_until:
+                return False
+
+        # Check rate limits
+        if not self.rate_limiter.can_send_alert(rule.user_id, rule.rule_id):
+            return False
 
-    async def _evaluate_rule(self, rule: AlertRule, symbol: str, market_data: Dict[str, Any]):
-        """Evaluate a single rule for a symbol"""
+        # Check time restrictions
+        return self._is_within_time_window(rule)
+
+    async def _fire_rule(
+        self,
+        rule: AlertRule,
+        symbol: str,
+        condition_results: List[Tuple[bool, str, Any]],
+        market_data: Dict[str, Any]
+    ):
+        """Generate and queue the alert for a triggered rule"""
         try:
-            # Check if rule is in cooldown
-            if rule.rule_id in self.rule_cooldowns:
-                cooldown_until = self.rule_cooldowns[rule.rule_id]
-                if datetime.utcnow() < cooldown_until:
-                    return
-
-            # Check rate limits
-            if not self.rate_limiter.can_send_alert(rule.user_id, rule.rule_id):
-                return
+            # Generate alert
+            met_conditions = [desc for is_met, desc, _ in condition_results if is_met]
+            condition_text = "; ".join(met_conditions)
+
+            # Get current value from first met condition
+            current_value = next(
+                (val for is_met, _, val in condition_results if is_met),
+                None
+            )
 
-            # Check time restrictions
-            if not self._is_within_time_window(rule):
-                return
+            alert = await self.generate_alert(
+                rule=rule,
+                symbol=symbol,
+                current_value=current_value,
+                condition_met=condition_text,
+                additional_data=market_data
+            )
+
+            # Queue for delivery
+            await self.queue_alert(alert, rule.severity in [AlertSeverity.CRITICAL, AlertSeverity.EMERGENCY])
+
+            # Update rule tracking
+            rule.last_triggered = datetime.utcnow()
+            rule.trigger_count += 1
+
+            # Set cooldown
+            if rule.cooldown_minutes > 0:
+                self.rule_cooldowns[rule.rule_id] = datetime.utcnow() + timedelta(minutes=rule.cooldown_minutes)
 
-            # Evaluate conditions
-            condition_results = []
-            for condition in rule.conditions:
-                is_met, description, current_value = await self.condition_evaluator.evaluate_condition(
-                    condition, symbol, market_data
-                )
-                condition_results.append((is_met, description, current_value))
-
-            # Apply condition logic
-            if rule.condition_logic.upper() == "AND":
-                rule_triggered = all(result[0] for result in condition_results)
-            else:  # OR
-                rule_triggered = any(result[0] for result in condition_results)
-
-            if rule_triggered:
-                # Generate alert
-                met_conditions = [desc for is_met, desc, _ in condition_results if is_met]
-                condition_text = "; ".join(met_conditions)
-
-                # Get current value from first met condition
-                current_value = next(
-                    (val for is_met, _, val in condition_results if is_met),
-                    None
-                )
-
-                alert = await self.generate_alert(
-                    rule=rule,
-                    symbol=symbol,
-                    current_value=current_value,
-                    condition_met=condition_text,
-                    additional_data=market_data
-                )
-
-                # Queue for delivery
-                await self.queue_alert(alert, rule.severity in [AlertSeverity.CRITICAL, AlertSeverity.EMERGENCY])
-
-                # Update rule tracking
-                rule.last_triggered = datetime.utcnow()
-                rule.trigger_count += 1
-
-                # Set cooldown
-                if rule.cooldown_minutes > 0:
-                    self.rule_cooldowns[rule.rule_id] = datetime.utcnow() + timedelta(minutes=rule.cooldown_minutes)
-
-                # Record for rate limiting
-                self.rate_limiter.record_alert(rule.user_id, rule.rule_id)
-
-                self.stats['rules_evaluated'] += 1
+            # Record for rate limiting
+            self.rate_limiter.record_alert(rule.user_id, rule.rule_id)
 
         except Exception as e:
-            logger.error(f"Error evaluating rule {rule.rule_id}: {e}")
+            logger.error(f"Error firing rule {rule.rule_id}: {e}")
 
     async def _evaluate_portfolio_rule(self, rule: AlertRule, portfolio: Portfolio, portfolio_data: Dict[str, Any]):
         """Evaluate a portfolio-specific rule"""
@@ -21,6 +21,7 @@ from ..models.alert_models import (
     AlertRuleStats, AlertEngineMetrics
 )
 from .alert_engine import AlertEngine
+from ..core.rule_index import RuleIndex
 from .webhook_delivery_service import WebhookDeliveryService
 from .email_notification_service import EmailNotificationService
 from .sms_push_notification_service import SMSNotificationService, PushNotificationService
@@ -81,7 +82,7 @@ class AlertScheduler:
                 await asyncio.sleep(rule.evaluation_interval)
 
                 # Check if rule is still active
-                if not rule.is_active:
+                if not rule.active:
                     break
 
                 # Evaluate rule
@@ -261,14 +262,18 @@ class AlertRuleEngine:
             webhook_service, email_service, sms_service, push_service
         )
 
-        # Active rules cache
-        self.active_rules: Dict[str, AlertRule] = {}
+        # Active rules cache, indexed by symbol, alert type and portfolio
+        self.rule_index = RuleIndex()
         self.user_rules: Dict[str, List[str]] = defaultdict(list)
 
         # Metrics and stats
         self.metrics = AlertEngineMetrics()
         self.processing_stats = ProcessingStats()
 
+    @property
+    def active_rules(self) -> Dict[str, AlertRule]:
+        return self.rule_index.rules
+
     async def start_engine(self):
         """Start the alert rule engine"""
         logger.info("Starting Alert Rule Engine...")
@@ -290,7 +295,7 @@ class AlertRuleEngine:
             await self.scheduler.unschedule_rule(rule_id)
 
         # Clear caches
-        self.active_rules.clear()
+        self.rule_index.clear()
         self.user_rules.clear()
 
         logger.info("Alert Rule Engine stopped")
@@ -314,11 +319,11 @@ class AlertRuleEngine:
             await self._store_rule(rule)
 
             # Add to active rules cache
-            self.active_rules[rule.rule_id] = rule
+            self.rule_index.add(rule)
             self.user_rules[rule.user_id].append(rule.rule_id)
 
             # Schedule evaluation if active
-            if rule.is_active:
+            if rule.active:
                 await self.scheduler.schedule_rule_evaluation(rule, self)
 
             logger.info(f"Added rule {rule.rule_id} for user {rule.user_id}")
@@ -341,10 +346,10 @@ class AlertRuleEngine:
 
             # Update rule
             await self._store_rule(rule)
-            self.active_rules[rule.rule_id] = rule
+            self.rule_index.add(rule)
 
             # Reschedule if active
-            if rule.is_active:
+            if rule.active:
                 await self.scheduler.schedule_rule_evaluation(rule, self)
 
             logger.info(f"Updated rule {rule.rule_id}")
@@ -366,7 +371,7 @@ class AlertRuleEngine:
             await self.scheduler.unschedule_rule(rule_id)
 
             # Remove from caches
-            del self.active_rules[rule_id]
+            self.rule_index.remove(rule_id)
             if rule_id in self.user_rules[rule.user_id]:
                 self.user_rules[rule.user_id].remove(rule_id)
 
@@ -422,7 +427,8 @@ class AlertRuleEngine:
         Evaluate all relevant rules for a market event
 
         Args:
-            event_type: Type of market event (price_change, technical_signal, etc.)
+            event_type: Type of market event (price_change, technical_signal, etc.);
+                alert type values ("price", "technical", ...) only match rules of that type
             event_data: Event data including prices, indicators, etc.
             symbols: List of symbols affected by the event
 
@@ -532,8 +538,8 @@ class AlertRuleEngine:
                         rule_dict = json.loads(rule_data)
                         rule = AlertRule(**rule_dict)
 
-                        if rule.is_active:
-                            self.active_rules[rule.rule_id] = rule
+                        if rule.active:
+                            self.rule_index.add(rule)
                             self.user_rules[rule.user_id].append(rule.rule_id)
 
                             # Schedule evaluation
@@ -573,27 +579,15 @@ class AlertRuleEngine:
         event_type: str,
         symbols: Optional[List[str]] = None
     ) -> List[AlertRule]:
-        """Get rules relevant to a market event"""
-        relevant_rules = []
-
-        for rule in self.active_rules.values():
-            if not rule.is_active:
-                continue
-
-            # Check if rule matches event type
-            rule_symbols = rule.symbols or []
-
-            if symbols:
-                # Check if rule applies to any of the affected symbols
-                if rule_symbols and not any(symbol in rule_symbols for symbol in symbols):
-                    continue
-            elif rule_symbols:
-                # Event has no specific symbols, but rule is symbol-specific
-                continue
+        """Get rules relevant to a market event from the rule index
 
-            relevant_rules.append(rule)
-
-        return relevant_rules
+        Rules for any affected symbol match, as do rules without symbols;
+        events without symbols only match rules without symbols.
+        """
+        return [
+            rule for rule in self.rule_index.for_event(event_type, symbols)
+            if rule.active
+        ]
 
     async def _get_delivery_configs(self, rule: AlertRule) -> Dict[str, Any]:
         """Get delivery configurations for a rule"""
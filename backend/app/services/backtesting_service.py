@@ -13,11 +13,13 @@ from uuid import uuid4
 from concurrent.futures import ThreadPoolExecutor
 import yfinance as yf
 from functools import lru_cache
+from collections import OrderedDict
 
 from ..models.backtester_models import (
     BacktestConfiguration, BacktestResult, BacktestRequest, BacktestStatus,
     BacktestSummary, StrategyOptimizationRequest, BacktestError,
-    TradingStrategy, PerformanceMetrics
+    TradingStrategy, PerformanceMetrics, BacktestSweepRequest, BacktestSweepResult,
+    SweepLeaderboardEntry, EquityCurve
 )
 from ..core.backtesting_engine import BacktestingEngine, MarketData
 from ..core.portfolio_metrics import AdvancedMetricsCalculator
@@ -173,6 +175,10 @@ class BacktestingService:
         self.metrics_calculator = AdvancedMetricsCalculator()
         self.active_backtests: Dict[str, BacktestStatus] = {}
 
+        # Full results of recent parameter sweeps, keyed by sweep id then variant index
+        self.sweep_results: "OrderedDict[str, Dict[int, BacktestResult]]" = OrderedDict()
+        self.max_stored_sweeps = 20
+
     async def run_backtest(self, request: BacktestRequest) -> BacktestResult:
         """Run a complete backtest."""
         backtest_id = str(uuid4())
@@ -241,6 +247,73 @@ class BacktestingService:
             if backtest_id in self.active_backtests:
                 self.active_backtests[backtest_id].completed_at = datetime.utcnow()
 
+    async def run_parameter_sweep(self, request: BacktestSweepRequest) -> BacktestSweepResult:
+        """Backtest all strategy variants against one shared market data load."""
+        sweep_id = str(uuid4())
+        started_at = datetime.utcnow()
+
+        # Fetch market data once for every variant
+        market_data = await self.data_provider.fetch_market_data(
+            request.universe, request.start_date, request.end_date
+        )
+
+        base_config = BacktestConfiguration(
+            strategy=request.variants[0],
+            universe=request.universe,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            initial_capital=request.initial_capital,
+            transaction_costs=request.transaction_costs
+        )
+
+        results = await self.backtesting_engine.run_parameter_sweep(
+            base_config, request.variants, market_data
+        )
+
+        completed = {index: result for index, result in enumerate(results) if result is not None}
+        ranked = sorted(
+            completed.items(),
+            key=lambda item: getattr(item[1].performance_metrics, request.ranking_metric),
+            reverse=True
+        )
+
+        leaderboard = [
+            SweepLeaderboardEntry(
+                rank=rank,
+                variant_index=index,
+                strategy_name=result.configuration.strategy.name,
+                total_return_pct=result.performance_metrics.total_return_pct,
+                sharpe_ratio=result.performance_metrics.sharpe_ratio,
+                calmar_ratio=result.performance_metrics.calmar_ratio,
+                max_drawdown=result.performance_metrics.max_drawdown,
+                total_trades=len(result.trade_log)
+            )
+            for rank, (index, result) in enumerate(ranked, start=1)
+        ]
+
+        self._store_sweep_results(sweep_id, completed)
+
+        logger.info(f"Sweep {sweep_id} evaluated {len(completed)}/{len(results)} variants")
+        return BacktestSweepResult(
+            sweep_id=sweep_id,
+            ranking_metric=request.ranking_metric,
+            universe_size=len(request.universe),
+            date_range=f"{request.start_date} to {request.end_date}",
+            leaderboard=leaderboard,
+            failed_variants=[index for index, result in enumerate(results) if result is None],
+            execution_time_seconds=(datetime.utcnow() - started_at).total_seconds()
+        )
+
+    def get_sweep_variant_result(self, sweep_id: str, variant_index: int) -> Optional[BacktestResult]:
+        """Get the full result of one variant from a recent sweep."""
+        return self.sweep_results.get(sweep_id, {}).get(variant_index)
+
+    def _store_sweep_results(self, sweep_id: str, results: Dict[int, BacktestResult]) -> None:
+        """Keep full sweep results for on-demand retrieval, evicting the oldest sweeps."""
+        self.sweep_results[sweep_id] = results
+        while len(self.sweep_results) > self.max_stored_sweeps:
+            self.sweep_results.popitem(last=False)
+
     async def get_backtest_status(self, backtest_id: str) -> Optional[BacktestStatus]:
         """Get the current status of a running backtest."""
         return self.active_backtests.get(backtest_id)
@@ -460,47 +533,40 @@ class BacktestingService:
         """Calculate performance attribution by sector."""
         sector_performance = {}
 
-        # Group trades by sector
-        for trade in result.trade_log:
-            if trade.pnl is not None:
-                sector = self.data_provider.get_sector_data(trade.symbol)
-                if sector not in sector_performance:
-                    sector_performance[sector] = 0.0
-                sector_performance[sector] += trade.pnl
+        # Group closed trades by sector straight from the trade log columns
+        pnl = result.trade_log.pnl
+        closed = ~np.isnan(pnl)
+        symbols = result.trade_log.symbols[closed]
+
+        for symbol, symbol_pnl in zip(symbols, pnl[closed]):
+            sector = self.data_provider.get_sector_data(symbol)
+            if sector not in sector_performance:
+                sector_performance[sector] = 0.0
+            sector_performance[sector] += float(symbol_pnl)
 
         return sector_performance
 
-    def _calculate_rolling_metrics(self, equity_curve: List,
+    def _calculate_rolling_metrics(self, equity_curve: EquityCurve,
                                  metric_type: str, window: int = 252) -> List[float]:
         """Calculate rolling metrics from equity curve."""
-        values = [snapshot.total_value for snapshot in equity_curve]
+        values = equity_curve.total_values
 
         if len(values) < window:
             return []
 
-        rolling_metrics = []
-
-        for i in range(window, len(values)):
-            window_values = values[i-window:i]
-            returns = np.array([
-                (window_values[j] - window_values[j-1]) / window_values[j-1]
-                for j in range(1, len(window_values))
-            ])
-
-            if metric_type == "sharpe":
-                if len(returns) > 0 and np.std(returns) > 0:
-                    sharpe = (np.mean(returns) * 252 - 0.02) / (np.std(returns) * np.sqrt(252))
-                    rolling_metrics.append(sharpe)
-                else:
-                    rolling_metrics.append(0.0)
-            elif metric_type == "volatility":
-                if len(returns) > 0:
-                    vol = np.std(returns) * np.sqrt(252)
-                    rolling_metrics.append(vol)
-                else:
-                    rolling_metrics.append(0.0)
-
-        return rolling_metrics
+        # Window ending before point i spans values[i-window:i], i.e. window-1 returns
+        returns = values[1:] / values[:-1] - 1
+        windows = np.lib.stride_tricks.sliding_window_view(returns, window - 1)[:len(values) - window]
+        window_std = windows.std(axis=1)
+
+        if metric_type == "sharpe":
+            with np.errstate(divide='ignore', invalid='ignore'):
+                sharpe = (windows.mean(axis=1) * 252 - 0.02) / (window_std * np.sqrt(252))
+            return np.where(window_std > 0, sharpe, 0.0).tolist()
+        elif metric_type == "volatility":
+            return (window_std * np.sqrt(252)).tolist()
+
+        return []
 
     def _assess_data_quality(self, market_data: MarketData) -> float:
         """Assess the quality of market data used in backtest."""
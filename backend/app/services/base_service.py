@@ -2,13 +2,12 @@
 Base service class with common functionality
 """
 
-import asyncio
 from typing import Optional, Any, Dict
 from datetime import datetime, timedelta
-import redis
-import json
+import redis.asyncio as redis
 from loguru import logger
 
+from app.core.cache import TwoTierCache
 from app.core.config import settings
 
 
@@ -18,84 +17,41 @@ class BaseService:
     def __init__(self):
         self.redis_client = None
         self._setup_redis()
+        self.cache = TwoTierCache(
+            self.redis_client,
+            default_ttl=settings.CACHE_TTL,
+            max_local_items=settings.LOCAL_CACHE_MAX_ITEMS,
+            max_local_ttl=settings.LOCAL_CACHE_TTL,
+            retry_seconds=settings.REDIS_RETRY_SECONDS
+        )
     
     def _setup_redis(self):
-        """Setup Redis connection for caching"""
+        """Setup async Redis client for caching (connects lazily on first use)"""
         try:
-            self.redis_client = redis.Redis.from_url(
+            self.redis_client = redis.from_url(
                 settings.REDIS_URL,
-                decode_responses=True,
                 socket_connect_timeout=5
             )
-            # Test connection
-            self.redis_client.ping()
-            logger.info("Redis connection established")
         except Exception as e:
-            logger.warning(f"Redis connection failed: {e}")
+            logger.warning(f"Redis client setup failed: {e}")
             self.redis_client = None
     
     async def get_cached(self, key: str) -> Optional[Any]:
         """Get data from cache"""
-        if not self.redis_client:
-            return None
-        
-        try:
-            data = self.redis_client.get(key)
-            if data:
-                return json.loads(data)
-        except Exception as e:
-            logger.error(f"Cache get error for key {key}: {e}")
-        
-        return None
+        return await self.cache.get(key)
     
     async def set_cached(self, key: str, data: Any, ttl: int = None) -> bool:
         """Set data in cache with TTL"""
-        if not self.redis_client:
-            return False
-        
-        if ttl is None:
-            ttl = settings.CACHE_TTL
-        
-        try:
-            serialized = json.dumps(data, default=str)  # default=str handles datetime objects
-            self.redis_client.setex(key, ttl, serialized)
-            return True
-        except Exception as e:
-            logger.error(f"Cache set error for key {key}: {e}")
-            return False
+        return await self.cache.set(key, data, ttl)
     
     async def delete_cached(self, key: str) -> bool:
         """Delete data from cache"""
-        if not self.redis_client:
-            return False
-        
-        try:
-            self.redis_client.delete(key)
-            return True
-        except Exception as e:
-            logger.error(f"Cache delete error for key {key}: {e}")
-            return False
+        return await self.cache.delete(key)
     
     async def get_or_set_cache(self, key: str, fetch_func, ttl: int = None) -> Any:
-        """Get data from cache or fetch and cache it"""
-        # Try to get from cache first
-        cached_data = await self.get_cached(key)
-        if cached_data is not None:
-            logger.debug(f"Cache hit for key: {key}")
-            return cached_data
-        
-        # Fetch data
-        logger.debug(f"Cache miss for key: {key}, fetching data")
+        """Get data from cache or fetch and cache it (one fetch per key at a time)"""
         try:
-            if asyncio.iscoroutinefunction(fetch_func):
-                data = await fetch_func()
-            else:
-                data = fetch_func()
-            
-            # Cache the result
-            await self.set_cached(key, data, ttl)
-            return data
-            
+            return await self.cache.get_or_set(key, fetch_func, ttl)
         except Exception as e:
             logger.error(f"Error fetching data for key {key}: {e}")
             raise
@@ -106,65 +62,17 @@ class BaseService:
     
     async def batch_get_cached(self, keys: list) -> Dict[str, Any]:
         """Get multiple keys from cache at once"""
-        if not self.redis_client or not keys:
+        if not keys:
             return {}
-        
-        result = {}
-        try:
-            pipeline = self.redis_client.pipeline()
-            for key in keys:
-                pipeline.get(key)
-            
-            values = pipeline.execute()
-            
-            for key, value in zip(keys, values):
-                if value:
-                    try:
-                        result[key] = json.loads(value)
-                    except json.JSONDecodeError:
-                        logger.error(f"JSON decode error for cached key: {key}")
-                        
-        except Exception as e:
-            logger.error(f"Batch cache get error: {e}")
-        
-        return result
+        return await self.cache.get_many(keys)
     
     async def batch_set_cached(self, data_dict: Dict[str, Any], ttl: int = None) -> bool:
         """Set multiple key-value pairs in cache"""
-        if not self.redis_client or not data_dict:
-            return False
-        
-        if ttl is None:
-            ttl = settings.CACHE_TTL
-        
-        try:
-            pipeline = self.redis_client.pipeline()
-            
-            for key, value in data_dict.items():
-                serialized = json.dumps(value, default=str)
-                pipeline.setex(key, ttl, serialized)
-            
-            pipeline.execute()
-            return True
-            
-        except Exception as e:
-            logger.error(f"Batch cache set error: {e}")
-            return False
+        return await self.cache.set_many(data_dict, ttl)
     
     async def clear_cache_pattern(self, pattern: str) -> int:
         """Clear all cache keys matching a pattern"""
-        if not self.redis_client:
-            return 0
-        
-        try:
-            keys = self.redis_client.keys(pattern)
-            if keys:
-                return self.redis_client.delete(*keys)
-            return 0
-            
-        except Exception as e:
-            logger.error(f"Cache pattern clear error for pattern {pattern}: {e}")
-            return 0
+        return await self.cache.delete_pattern(pattern)
     
     def safe_float_extract(self, value) -> float:
         """Safely extract float value from pandas Series or scalar"""
@@ -206,16 +114,16 @@ class BaseService:
     
     async def rate_limit_check(self, user_id: Optional[int], endpoint: str) -> bool:
         """Check if user has exceeded rate limits"""
-        if not self.redis_client or not user_id:
+        if not self.cache.redis_available or not user_id:
             return True  # Allow if no rate limiting setup
         
         try:
             key = f"rate_limit:{user_id}:{endpoint}"
-            current_requests = self.redis_client.get(key)
+            current_requests = await self.redis_client.get(key)
             
             if not current_requests:
                 # First request in window
-                self.redis_client.setex(key, settings.RATE_LIMIT_WINDOW, 1)
+                await self.redis_client.setex(key, settings.RATE_LIMIT_WINDOW, 1)
                 return True
             
             current_requests = int(current_requests)
@@ -224,7 +132,7 @@ class BaseService:
                 return False  # Rate limit exceeded
             
             # Increment counter
-            self.redis_client.incr(key)
+            await self.redis_client.incr(key)
             return True
             
         except Exception as e:
@@ -258,13 +166,14 @@ class BaseService:
             "service": self.__class__.__name__,
             "status": "healthy",
             "timestamp": datetime.utcnow(),
-            "redis_connected": self.redis_client is not None
+            "redis_connected": self.redis_client is not None,
+            "local_cache_entries": len(self.cache.local)
         }
         
         # Test Redis connection
         if self.redis_client:
             try:
-                self.redis_client.ping()
+                await self.redis_client.ping()
                 health_status["redis_status"] = "connected"
             except Exception as e:
                 health_status["redis_status"] = f"error: {e}"
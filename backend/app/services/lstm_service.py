@@ -7,24 +7,28 @@ Per Claude.StockAnalysis.md specifications
 import numpy as np
 import pandas as pd
 import tensorflow as tf
-from tensorflow.keras.models import Sequential, load_model
-from tensorflow.keras.layers import LSTM, Dense, Dropout
-from tensorflow.keras.optimizers import Adam
-from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau
+from tensorflow.keras.models import load_model
 from sklearn.preprocessing import MinMaxScaler
-from sklearn.metrics import mean_absolute_error, mean_squared_error
 import joblib
-import asyncio
-import aiofiles
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
 from datetime import datetime, timedelta
 import logging
 from pathlib import Path
 import hashlib
+import weakref
 
 from app.core.config import settings
+from app.core.lstm_sequences import WindowedSequence, sliding_windows
+from app.core.lstm_training import (
+    build_lstm_model,
+    prediction_metrics,
+    train_and_save,
+    train_and_save_global
+)
+from app.core.model_registry import ModelRegistry
+from app.core.training_scheduler import TrainingJob, TrainingPendingError, TrainingScheduler
 from app.services.base_service import BaseService
-from app.models.schemas import LSTMPrediction, ModelPerformance
+from app.models.schemas import LSTMPrediction, LSTMPredictionStatus, ModelPerformance
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +39,9 @@ class LSTMService(BaseService):
     Implements comprehensive prediction pipeline with confidence intervals
     """
 
+    # Registry key of the shared multi-symbol model
+    GLOBAL_MODEL_KEY = "_global"
+
     def __init__(self):
         super().__init__()
         self.lookback_days = 90  # Per specification
@@ -47,17 +54,41 @@ class LSTMService(BaseService):
             'Stochastic_K', 'Stochastic_D', 'ATR', 'Williams_R',
             'CCI', 'MFI', 'ROC'
         ]
-        self.models_cache = {}
-        self.scalers_cache = {}
+        self._inference_functions = weakref.WeakKeyDictionary()  # model -> {training: tf.function}
+        self.registry = ModelRegistry(
+            Path(settings.MODEL_STORAGE_PATH),
+            load_model=load_model,
+            load_scaler=joblib.load,
+            default_version=self._get_model_version(),
+            max_models=settings.LSTM_REGISTRY_MAX_MODELS,
+            memory_budget_mb=settings.LSTM_REGISTRY_MEMORY_MB
+        )
         self.model_dir = Path(settings.MODEL_STORAGE_PATH)
-        self.model_dir.mkdir(exist_ok=True)
+        self.training_scheduler = TrainingScheduler(
+            train_and_save,
+            max_workers=settings.LSTM_TRAINING_WORKERS,
+            on_complete=self._on_training_complete
+        )
+        # Newest global model version trained for the configured universe (served while a newer one trains)
+        self.live_global_version: Optional[str] = None
+
+    @property
+    def model_dir(self) -> Path:
+        """Directory holding saved models (shared with the registry)"""
+        return self.registry.model_dir
+
+    @model_dir.setter
+    def model_dir(self, path: Path):
+        self.registry.model_dir = Path(path)
+        self.registry.model_dir.mkdir(exist_ok=True)
 
     async def get_lstm_prediction(
         self,
         symbol: str,
         historical_data: pd.DataFrame,
         days_ahead: int = 5,
-        retrain: bool = False
+        retrain: bool = False,
+        model_version: Optional[str] = None
     ) -> Optional[LSTMPrediction]:
         """
         Generate LSTM predictions for stock price
@@ -67,9 +98,15 @@ class LSTMService(BaseService):
             historical_data: Historical price and technical indicator data
             days_ahead: Number of days to predict (1-30)
             retrain: Whether to retrain the model
+            model_version: Saved model version to use (defaults to the current version)
 
         Returns:
-            LSTMPrediction with predictions and confidence intervals
+            LSTMPrediction with predictions and confidence intervals, or None
+            when no prediction can be made
+
+        Raises:
+            TrainingPendingError: the symbol has no usable model yet and its
+                training job is still queued or running
         """
         try:
             if days_ahead < 1 or days_ahead > self.prediction_horizon:
@@ -85,8 +122,11 @@ class LSTMService(BaseService):
                 return None
 
             # Get or train model
-            model, scaler = await self._get_or_train_model(symbol, features, retrain)
+            model, scaler = await self._get_or_train_model(symbol, features, retrain, model_version)
             if model is None:
+                job = self.training_scheduler.get_job(symbol, model_version or self._get_model_version())
+                if job is not None and job.active:
+                    raise TrainingPendingError(job.symbol, job.version, job.status)
                 return None
 
             # Generate predictions
@@ -104,48 +144,16 @@ class LSTMService(BaseService):
                 model, scaler, features
             )
 
-            # Generate prediction dates
-            last_date = historical_data.index[-1]
-            prediction_dates = [
-                (last_date + timedelta(days=i+1)).strftime("%Y-%m-%d")
-                for i in range(days_ahead)
-            ]
-
-            current_price = float(historical_data['Close'].iloc[-1])
-
-            return LSTMPrediction(
-                symbol=symbol,
-                current_price=current_price,
-                predictions=predictions.tolist(),
-                prediction_dates=prediction_dates,
-                confidence_intervals={
-                    "80_percent": {
-                        "lower": confidence_intervals['80']['lower'].tolist(),
-                        "upper": confidence_intervals['80']['upper'].tolist()
-                    },
-                    "95_percent": {
-                        "lower": confidence_intervals['95']['lower'].tolist(),
-                        "upper": confidence_intervals['95']['upper'].tolist()
-                    }
-                },
-                horizon_days=days_ahead,
-                model_accuracy=performance['accuracy'],
-                directional_accuracy=performance['directional_accuracy'],
-                mae=performance['mae'],
-                mse=performance['mse'],
-                model_version=self._get_model_version(),
+            return self._build_prediction(
+                symbol, historical_data, predictions, confidence_intervals, performance,
+                model_version or self._get_model_version(),
                 feature_importance=await self._calculate_feature_importance(model),
-                prediction_metadata={
-                    "training_samples": len(features),
-                    "lookback_days": self.lookback_days,
-                    "features_used": len(self.feature_columns),
-                    "model_architecture": self._get_model_architecture(),
-                    "training_time": performance.get('training_time'),
-                    "confidence_method": "monte_carlo_dropout"
-                },
-                timestamp=datetime.utcnow()
+                training_samples=len(features)
             )
 
+        except TrainingPendingError:
+            logger.info(f"LSTM model for {symbol} is training; prediction pending")
+            raise
         except Exception as e:
             logger.error(f"Error generating LSTM prediction for {symbol}: {e}")
             return None
@@ -178,181 +186,215 @@ class LSTMService(BaseService):
             logger.error(f"Error preparing features: {e}")
             return None
 
+    def _build_prediction(
+        self,
+        symbol: str,
+        historical_data: pd.DataFrame,
+        predictions: np.ndarray,
+        confidence_intervals: Dict[str, Dict[str, np.ndarray]],
+        performance: Dict[str, float],
+        model_version: str,
+        feature_importance: Dict[str, float],
+        training_samples: int,
+        model_type: str = "per_symbol"
+    ) -> LSTMPrediction:
+        """Assemble the prediction contract from model outputs"""
+        days_ahead = len(predictions)
+
+        # Generate prediction dates
+        last_date = historical_data.index[-1]
+        prediction_dates = [
+            (last_date + timedelta(days=i+1)).strftime("%Y-%m-%d")
+            for i in range(days_ahead)
+        ]
+
+        current_price = float(historical_data['Close'].iloc[-1])
+
+        return LSTMPrediction(
+            symbol=symbol,
+            current_price=current_price,
+            predictions=predictions.tolist(),
+            prediction_dates=prediction_dates,
+            # Flat "<level>_<bound>" keys per the Dict[str, List[float]] contract
+            confidence_intervals={
+                f"{level}_{bound}": confidence_intervals[level][bound].tolist()
+                for level in ('80', '95')
+                for bound in ('lower', 'upper')
+            },
+            horizon_days=days_ahead,
+            model_accuracy=performance['accuracy'],
+            directional_accuracy=performance['directional_accuracy'],
+            mae=performance['mae'],
+            mse=performance['mse'],
+            model_version=model_version,
+            feature_importance=feature_importance,
+            prediction_metadata={
+                "training_samples": training_samples,
+                "lookback_days": self.lookback_days,
+                "features_used": len(self.feature_columns),
+                "model_architecture": self._get_model_architecture(),
+                "model_type": model_type,
+                "training_time": performance.get('training_time'),
+                "confidence_method": "monte_carlo_dropout"
+            },
+            timestamp=datetime.utcnow()
+        )
+
     async def _get_or_train_model(
         self,
         symbol: str,
         features: np.ndarray,
-        retrain: bool = False
+        retrain: bool = False,
+        version: Optional[str] = None
     ) -> Tuple[Optional[tf.keras.Model], Optional[MinMaxScaler]]:
-        """Get existing model or train new one"""
+        """Get model from the registry (loading it from disk on a miss)
+
+        Missing or forced retrains are queued on the training scheduler rather
+        than run in the request: the last good model is served meanwhile, or
+        (None, None) while a first model for the symbol is pending.
+        """
         try:
-            model_path = self.model_dir / f"{symbol}_lstm_model.keras"
-            scaler_path = self.model_dir / f"{symbol}_scaler.joblib"
+            current_version = self._get_model_version()
+            version = version or current_version
 
-            # Check if model exists and retrain is not forced
-            if not retrain and model_path.exists() and scaler_path.exists():
-                try:
-                    model = await self._load_model(model_path)
-                    scaler = joblib.load(scaler_path)
-
-                    # Validate model compatibility
-                    if self._validate_model_compatibility(model, features):
-                        logger.info(f"Loaded existing model for {symbol}")
-                        return model, scaler
-                    else:
-                        logger.warning(f"Model incompatible for {symbol}, retraining...")
-                        retrain = True
-                except Exception as e:
-                    logger.warning(f"Error loading model for {symbol}: {e}, retraining...")
-                    retrain = True
+            entry = await self.registry.acquire(symbol, version)
+            usable = entry is not None and self._validate_model_compatibility(entry.model, features)
+            if entry is not None and not usable:
+                logger.warning(f"Model incompatible for {symbol}, retraining...")
+                self.registry.evict(symbol, version)
 
-            # Train new model
-            logger.info(f"Training new LSTM model for {symbol}")
-            model, scaler = await self._train_model(symbol, features)
+            if usable and (not retrain or version != current_version):
+                return entry.model, entry.scaler
 
-            if model is not None:
-                # Save model and scaler
-                await self._save_model(model, model_path)
-                joblib.dump(scaler, scaler_path)
+            # Only the current version can be (re)trained
+            if version != current_version:
+                logger.warning(f"No usable {version} model for {symbol}")
+                return None, None
 
-                # Cache in memory
-                self.models_cache[symbol] = model
-                self.scalers_cache[symbol] = scaler
+            self.schedule_training(symbol, features)
 
-            return model, scaler
+            if usable:
+                return entry.model, entry.scaler
+            return None, None
 
         except Exception as e:
             logger.error(f"Error getting/training model for {symbol}: {e}")
             return None, None
 
-    async def _train_model(
-        self,
-        symbol: str,
-        features: np.ndarray
-    ) -> Tuple[Optional[tf.keras.Model], Optional[MinMaxScaler]]:
-        """Train LSTM model with advanced architecture"""
-        try:
-            # Scale features
-            scaler = MinMaxScaler(feature_range=(0, 1))
-            scaled_features = scaler.fit_transform(features)
-
-            # Prepare sequences for LSTM
-            X, y = self._create_sequences(scaled_features, self.lookback_days)
-
-            if len(X) < 50:  # Minimum sequences needed
-                logger.error(f"Insufficient sequences for training: {len(X)}")
-                return None, None
-
-            # Split data (80% train, 20% validation)
-            split_idx = int(len(X) * 0.8)
-            X_train, X_val = X[:split_idx], X[split_idx:]
-            y_train, y_val = y[:split_idx], y[split_idx:]
-
-            # Build advanced LSTM model
-            model = self._build_lstm_model(X_train.shape)
-
-            # Configure callbacks
-            callbacks = [
-                EarlyStopping(
-                    monitor='val_loss',
-                    patience=10,
-                    restore_best_weights=True,
-                    verbose=1
-                ),
-                ReduceLROnPlateau(
-                    monitor='val_loss',
-                    factor=0.5,
-                    patience=5,
-                    min_lr=1e-7,
-                    verbose=1
-                )
-            ]
-
-            # Train model
-            logger.info(f"Training LSTM model for {symbol} with {len(X_train)} sequences")
-
-            history = model.fit(
-                X_train, y_train,
-                epochs=75,  # Per specification
-                batch_size=32,
-                validation_data=(X_val, y_val),
-                callbacks=callbacks,
-                verbose=1,
-                shuffle=True
-            )
+    def schedule_training(self, symbol: str, features: np.ndarray) -> TrainingJob:
+        """Queue a background training job (deduplicated per symbol)"""
+        version = self._get_model_version()
+        return self.training_scheduler.submit(
+            symbol,
+            version,
+            features,
+            self.lookback_days,
+            str(self.registry.model_path(symbol, version)),
+            str(self.registry.scaler_path(symbol, version)),
+            settings.LSTM_EPOCHS
+        )
 
-            # Log training results
-            final_loss = history.history['loss'][-1]
-            final_val_loss = history.history['val_loss'][-1]
-            logger.info(f"Training completed for {symbol}: loss={final_loss:.6f}, val_loss={final_val_loss:.6f}")
+    async def _on_training_complete(self, job: TrainingJob):
+        """Swap the newly trained model into the registry"""
+        if await self.registry.reload(job.symbol, job.version) is None:
+            raise RuntimeError(f"Trained model for {job.symbol} could not be loaded")
+        if job.symbol == self.GLOBAL_MODEL_KEY and self._is_newer_global_version(job.version):
+            self.live_global_version = job.version
+        logger.info(f"Trained LSTM model for {job.symbol} is live: {job.result}")
 
-            return model, scaler
+    def get_training_status(self, symbol: str) -> Dict[str, Any]:
+        """Training job status for a symbol's current model version"""
+        version = self._get_model_version()
+        job = self.training_scheduler.get_job(symbol, version)
+        if job is not None:
+            return job.to_dict()
 
-        except Exception as e:
-            logger.error(f"Error training model for {symbol}: {e}")
-            return None, None
+        trained = self.registry.get(symbol, version) is not None or self.registry.has_saved_model(symbol, version)
+        return {"symbol": symbol, "version": version, "status": "ready" if trained else "not_trained"}
 
     def _build_lstm_model(self, input_shape: Tuple) -> tf.keras.Model:
         """Build advanced LSTM model architecture"""
-        model = Sequential([
-            # First LSTM layer with return sequences
-            LSTM(
-                units=128,
-                return_sequences=True,
-                input_shape=(input_shape[1], input_shape[2]),
-                dropout=0.2,
-                recurrent_dropout=0.2
-            ),
-
-            # Second LSTM layer with return sequences
-            LSTM(
-                units=64,
-                return_sequences=True,
-                dropout=0.2,
-                recurrent_dropout=0.2
-            ),
-
-            # Third LSTM layer without return sequences
-            LSTM(
-                units=32,
-                return_sequences=False,
-                dropout=0.2,
-                recurrent_dropout=0.2
-            ),
-
-            # Dropout for regularization
-            Dropout(0.3),
-
-            # Dense layers for prediction
-            Dense(units=16, activation='relu'),
-            Dropout(0.2),
-            Dense(units=1, activation='linear')  # Price prediction
-        ])
-
-        # Compile with advanced optimizer
-        model.compile(
-            optimizer=Adam(learning_rate=0.001, clipnorm=1.0),
-            loss='huber',  # More robust than MSE
-            metrics=['mae', 'mse']
-        )
-
-        return model
+        return build_lstm_model(input_shape[1], input_shape[2])
 
     def _create_sequences(
         self,
         data: np.ndarray,
         lookback: int
     ) -> Tuple[np.ndarray, np.ndarray]:
-        """Create sequences for LSTM training"""
-        X, y = [], []
+        """Create sequences for LSTM training (read-only strided views, no copy)"""
+        # Features: all columns for lookback period; target: Close price (index 0)
+        return sliding_windows(data, lookback, target_column=0)
+
+    def _inference_function(self, model: tf.keras.Model, training: bool):
+        """Graph-compiled forward pass, traced once per model and dropout mode"""
+        functions = self._inference_functions.setdefault(model, {})
+        if training not in functions:
+            functions[training] = tf.function(
+                lambda x: model(x, training=training), reduce_retracing=True
+            )
+        return functions[training]
 
-        for i in range(lookback, len(data)):
-            # Features: all columns for lookback period
-            X.append(data[i-lookback:i])
-            # Target: Close price (index 0)
-            y.append(data[i, 0])
+    def _rollout(
+        self,
+        model: tf.keras.Model,
+        last_sequence: np.ndarray,
+        days_ahead: int,
+        n_paths: int = 1,
+        training: bool = False
+    ) -> np.ndarray:
+        """Roll the model forward for ``n_paths`` paths at once
+
+        All paths advance together as one (n_paths, lookback, features) batch
+        per step, so a horizon costs ``days_ahead`` forward passes regardless
+        of the number of paths. With ``training=True`` dropout stays active and
+        every path draws its own masks (Monte Carlo dropout). Each step feeds
+        the predicted close back as the newest row; other features carry
+        forward unchanged. Returns scaled close predictions, (n_paths, days_ahead).
+        """
+        return self._rollout_many(model, last_sequence[np.newaxis], days_ahead, n_paths, training)[0]
 
-        return np.array(X), np.array(y)
+    def _rollout_many(
+        self,
+        model: tf.keras.Model,
+        last_sequences: np.ndarray,
+        days_ahead: int,
+        n_paths: int = 1,
+        training: bool = False,
+        symbol_ids: Optional[np.ndarray] = None,
+        max_batch_rows: int = 8192
+    ) -> np.ndarray:
+        """``_rollout`` for many sequences: (n, lookback, features) -> (n, n_paths, days_ahead)
+
+        Paths of all sequences share each forward pass, chunked to at most
+        ``max_batch_rows`` windows. ``symbol_ids`` feeds models with a
+        symbol embedding (the global model).
+        """
+        forward = self._inference_function(model, training)
+        n_sequences = len(last_sequences)
+        windows = np.repeat(last_sequences.reshape(n_sequences, self.lookback_days, -1), n_paths, axis=0)
+        ids = None if symbol_ids is None else np.repeat(np.asarray(symbol_ids, dtype=np.int32), n_paths)
+        predictions = np.empty((len(windows), days_ahead))
+
+        for start in range(0, len(windows), max_batch_rows):
+            window = windows[start:start + max_batch_rows].astype(np.float32)
+            inputs = window if ids is None else {"sequence": window, "symbol_id": ids[start:start + max_batch_rows]}
+
+            for step in range(days_ahead):
+                pred_scaled = forward(inputs).numpy()[:, 0]
+                predictions[start:start + len(window), step] = pred_scaled
+
+                # Shift the window and append the predicted close
+                next_row = window[:, -1, :].copy()
+                next_row[:, 0] = pred_scaled
+                window[:, :-1, :] = window[:, 1:, :]
+                window[:, -1, :] = next_row
+
+        return predictions.reshape(n_sequences, n_paths, days_ahead)
+
+    @staticmethod
+    def _inverse_scale_close(scaler: MinMaxScaler, values: np.ndarray) -> np.ndarray:
+        """Undo MinMax scaling of the close column (index 0) without a dummy feature matrix"""
+        return (np.asarray(values) - scaler.min_[0]) / scaler.scale_[0]
 
     async def _generate_predictions(
         self,
@@ -363,36 +405,11 @@ class LSTMService(BaseService):
     ) -> np.ndarray:
         """Generate multi-step predictions"""
         try:
-            # Scale features
+            # Scale features and roll forward from the last sequence
             scaled_features = scaler.transform(features)
+            pred_scaled = self._rollout(model, scaled_features[-self.lookback_days:], days_ahead)
 
-            # Get last sequence for prediction
-            last_sequence = scaled_features[-self.lookback_days:].reshape(1, self.lookback_days, -1)
-
-            predictions = []
-            current_sequence = last_sequence.copy()
-
-            for _ in range(days_ahead):
-                # Predict next price
-                pred_scaled = model.predict(current_sequence, verbose=0)[0, 0]
-
-                # Create next feature vector (simplified - assumes other features remain similar)
-                next_features = current_sequence[0, -1, :].copy()
-                next_features[0] = pred_scaled  # Update close price
-
-                # Update sequence for next prediction
-                new_sequence = np.roll(current_sequence[0], -1, axis=0)
-                new_sequence[-1] = next_features
-                current_sequence = new_sequence.reshape(1, self.lookback_days, -1)
-
-                # Inverse transform prediction to get actual price
-                dummy_features = np.zeros((1, len(self.feature_columns)))
-                dummy_features[0, 0] = pred_scaled
-                pred_actual = scaler.inverse_transform(dummy_features)[0, 0]
-
-                predictions.append(pred_actual)
-
-            return np.array(predictions)
+            return self._inverse_scale_close(scaler, pred_scaled[0])
 
         except Exception as e:
             logger.error(f"Error generating predictions: {e}")
@@ -409,41 +426,13 @@ class LSTMService(BaseService):
     ) -> Dict[str, Dict[str, np.ndarray]]:
         """Calculate confidence intervals using Monte Carlo dropout"""
         try:
-            # Enable dropout during inference for uncertainty estimation
-            def predict_with_dropout(x):
-                return model(x, training=True)
-
             scaled_features = scaler.transform(features)
-            last_sequence = scaled_features[-self.lookback_days:].reshape(1, self.lookback_days, -1)
-
-            all_predictions = []
-
-            # Run multiple predictions with dropout
-            for _ in range(n_simulations):
-                sim_predictions = []
-                current_sequence = last_sequence.copy()
-
-                for _ in range(days_ahead):
-                    pred_scaled = predict_with_dropout(current_sequence).numpy()[0, 0]
-
-                    # Update sequence (simplified)
-                    next_features = current_sequence[0, -1, :].copy()
-                    next_features[0] = pred_scaled
 
-                    new_sequence = np.roll(current_sequence[0], -1, axis=0)
-                    new_sequence[-1] = next_features
-                    current_sequence = new_sequence.reshape(1, self.lookback_days, -1)
-
-                    # Inverse transform
-                    dummy_features = np.zeros((1, len(self.feature_columns)))
-                    dummy_features[0, 0] = pred_scaled
-                    pred_actual = scaler.inverse_transform(dummy_features)[0, 0]
-
-                    sim_predictions.append(pred_actual)
-
-                all_predictions.append(sim_predictions)
-
-            all_predictions = np.array(all_predictions)
+            # All dropout simulations advance together, one batched pass per day
+            all_predictions = self._inverse_scale_close(scaler, self._rollout(
+                model, scaled_features[-self.lookback_days:], days_ahead,
+                n_paths=n_simulations, training=True
+            ))
 
             # Calculate confidence intervals
             intervals = {}
@@ -481,47 +470,22 @@ class LSTMService(BaseService):
         """Calculate comprehensive model performance metrics"""
         try:
             scaled_features = scaler.transform(features)
-            X, y = self._create_sequences(scaled_features, self.lookback_days)
+            batches = WindowedSequence(
+                [scaled_features], self.lookback_days, batch_size=256, with_targets=False
+            )
 
-            if len(X) == 0:
+            if batches.num_samples == 0:
                 return {'accuracy': 0.0, 'directional_accuracy': 0.0, 'mae': 0.0, 'mse': 0.0}
 
             # Make predictions
-            y_pred_scaled = model.predict(X, verbose=0).flatten()
-
-            # Inverse transform predictions
-            dummy_features = np.zeros((len(y_pred_scaled), len(self.feature_columns)))
-            dummy_features[:, 0] = y_pred_scaled
-            y_pred = scaler.inverse_transform(dummy_features)[:, 0]
-
-            # Inverse transform actual values
-            dummy_actual = np.zeros((len(y), len(self.feature_columns)))
-            dummy_actual[:, 0] = y
-            y_actual = scaler.inverse_transform(dummy_actual)[:, 0]
-
-            # Calculate metrics
-            mae = mean_absolute_error(y_actual, y_pred)
-            mse = mean_squared_error(y_actual, y_pred)
-
-            # Calculate directional accuracy
-            if len(y_actual) > 1:
-                actual_direction = np.diff(y_actual) > 0
-                pred_direction = np.diff(y_pred) > 0
-                directional_accuracy = np.mean(actual_direction == pred_direction)
-            else:
-                directional_accuracy = 0.0
-
-            # Calculate overall accuracy (inverse of normalized MAE)
-            mean_price = np.mean(y_actual)
-            normalized_mae = mae / mean_price if mean_price > 0 else 1.0
-            accuracy = max(0.0, 1.0 - normalized_mae)
+            y_pred_scaled = model.predict(batches, verbose=0).flatten()
+            y = batches.targets()
 
-            return {
-                'accuracy': float(accuracy),
-                'directional_accuracy': float(directional_accuracy),
-                'mae': float(mae),
-                'mse': float(mse)
-            }
+            # Inverse transform predictions and actual values, then score in price units
+            return prediction_metrics(
+                self._inverse_scale_close(scaler, y),
+                self._inverse_scale_close(scaler, y_pred_scaled)
+            )
 
         except Exception as e:
             logger.error(f"Error calculating model performance: {e}")
@@ -538,8 +502,9 @@ class LSTMService(BaseService):
 
             importance_scores = {}
 
-            # Get first layer weights to analyze feature importance
-            first_layer_weights = model.layers[0].get_weights()[0]  # Input weights
+            # Get first LSTM layer weights to analyze feature importance
+            first_lstm = next(layer for layer in model.layers if isinstance(layer, tf.keras.layers.LSTM))
+            first_layer_weights = first_lstm.get_weights()[0]  # Input weights
 
             # Calculate average absolute weight for each feature
             feature_importance = np.mean(np.abs(first_layer_weights), axis=1)
@@ -557,6 +522,16 @@ class LSTMService(BaseService):
             logger.error(f"Error calculating feature importance: {e}")
             return {}
 
+    def get_registry_stats(self) -> Dict[str, Any]:
+        """Model registry hit/miss, load latency and memory counters"""
+        return self.registry.describe()
+
+    async def warm_start(self, limit: int) -> List[str]:
+        """Preload the ``limit`` most-requested saved models into the registry"""
+        if limit <= 0:
+            return []
+        return await self.registry.warm_start(limit)
+
     def _get_model_version(self) -> str:
         """Get current model version"""
         return "lstm_v2.1"
@@ -578,16 +553,6 @@ class LSTMService(BaseService):
             "loss": "huber"
         }
 
-    async def _load_model(self, model_path: Path) -> tf.keras.Model:
-        """Load model asynchronously"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, load_model, str(model_path))
-
-    async def _save_model(self, model: tf.keras.Model, model_path: Path):
-        """Save model asynchronously"""
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, model.save, str(model_path))
-
     def _validate_model_compatibility(
         self,
         model: tf.keras.Model,
@@ -613,9 +578,19 @@ class LSTMService(BaseService):
         self,
         symbols: List[str],
         historical_data: Dict[str, pd.DataFrame],
-        days_ahead: int = 5
-    ) -> Dict[str, Optional[LSTMPrediction]]:
-        """Generate predictions for multiple symbols"""
+        days_ahead: int = 5,
+        use_global_model: Optional[bool] = None
+    ) -> Dict[str, Union[LSTMPrediction, LSTMPredictionStatus, None]]:
+        """Generate predictions for multiple symbols
+
+        With the global model (``LSTM_GLOBAL_MODEL`` or ``use_global_model``)
+        the whole list is scored by one shared model in batched passes;
+        otherwise each symbol uses its own model. Symbols whose model is
+        still training map to a "pending" ``LSTMPredictionStatus``.
+        """
+        if settings.LSTM_GLOBAL_MODEL if use_global_model is None else use_global_model:
+            return await self.batch_predict_global(symbols, historical_data, days_ahead)
+
         try:
             tasks = []
             for symbol in symbols:
@@ -632,6 +607,11 @@ class LSTMService(BaseService):
                 try:
                     result = await task
                     results[symbol] = result
+                except TrainingPendingError as pending:
+                    results[symbol] = LSTMPredictionStatus(
+                        symbol=symbol, status="pending", model_version=pending.version,
+                        detail=f"Model is {pending.status.value}"
+                    )
                 except Exception as e:
                     logger.error(f"Error predicting {symbol}: {e}")
                     results[symbol] = None
@@ -642,6 +622,179 @@ class LSTMService(BaseService):
             logger.error(f"Error in batch prediction: {e}")
             return {}
 
+    async def batch_predict_global(
+        self,
+        symbols: List[str],
+        historical_data: Dict[str, pd.DataFrame],
+        days_ahead: int = 5,
+        n_simulations: int = 100
+    ) -> Dict[str, Union[LSTMPrediction, LSTMPredictionStatus, None]]:
+        """Score many symbols with the shared multi-symbol model
+
+        Every symbol's last window (scaled with its own scaler) goes through
+        the model together: ``days_ahead`` batched passes for the point
+        forecasts and ``days_ahead`` more for the Monte Carlo dropout paths,
+        instead of per-symbol model loads and rollouts.
+
+        The model is trained on the configured universe and versioned by its
+        data window (see ``_global_model_version``), so the symbols a request
+        happens to contain never trigger a retrain. When the window's version
+        is not trained yet, training is queued on the universe symbols at
+        hand and the live global model keeps serving every symbol it knows.
+        Every other symbol maps to an ``LSTMPredictionStatus`` ("pending",
+        "not_trained_for_symbol" or "insufficient_data") rather than a
+        prediction from an untrained embedding.
+        """
+        try:
+            if days_ahead < 1 or days_ahead > self.prediction_horizon:
+                raise ValueError(f"days_ahead must be between 1 and {self.prediction_horizon}")
+
+            results: Dict[str, Union[LSTMPrediction, LSTMPredictionStatus, None]] = {}
+            features_by_symbol = {}
+            for symbol in symbols:
+                features = None
+                if symbol in historical_data and len(historical_data[symbol]) >= self.min_training_data:
+                    features = await self._prepare_features(historical_data[symbol])
+                if features is None:
+                    results[symbol] = LSTMPredictionStatus(
+                        symbol=symbol, status="insufficient_data",
+                        detail=f"At least {self.min_training_data} rows with all model features are required"
+                    )
+                else:
+                    features_by_symbol[symbol] = features
+
+            if not features_by_symbol:
+                return results
+
+            version = self._global_model_version(
+                [historical_data[symbol].index[-1] for symbol in features_by_symbol]
+            )
+            entry = await self.registry.acquire(self.GLOBAL_MODEL_KEY, version)
+            if entry is None:
+                universe = set(self.global_universe)
+                training = {s: f for s, f in features_by_symbol.items() if s in universe}
+                if training:
+                    self.schedule_global_training(training, version)
+                    logger.info(f"Global LSTM model {version} is training")
+                if self.live_global_version is not None:
+                    entry = await self.registry.acquire(self.GLOBAL_MODEL_KEY, self.live_global_version)
+
+            if entry is None:
+                for symbol in features_by_symbol:
+                    results[symbol] = LSTMPredictionStatus(
+                        symbol=symbol, status="pending", model_version=version,
+                        detail="Global model is training"
+                    )
+                return results
+
+            model, artifacts = entry.model, entry.scaler
+            n_features = model.input_shape["sequence"][-1]
+            scored = []
+            for symbol, features in features_by_symbol.items():
+                if symbol in artifacts["symbol_ids"] and features.shape[1] == n_features:
+                    scored.append(symbol)
+                else:
+                    results[symbol] = LSTMPredictionStatus(
+                        symbol=symbol, status="not_trained_for_symbol", model_version=entry.version,
+                        detail=f"Global model {entry.version} was not trained on this symbol"
+                        + ("" if symbol in self.global_universe else "; it is outside LSTM_GLOBAL_UNIVERSE")
+                    )
+            if not scored:
+                return results
+
+            scalers = [artifacts["scalers"][symbol] for symbol in scored]
+            last_sequences = np.stack([
+                scaler.transform(features_by_symbol[symbol][-self.lookback_days:])
+                for symbol, scaler in zip(scored, scalers)
+            ])
+            symbol_ids = np.array([artifacts["symbol_ids"][symbol] for symbol in scored])
+
+            point = self._rollout_many(model, last_sequences, days_ahead, symbol_ids=symbol_ids)[:, 0]
+            paths = self._rollout_many(
+                model, last_sequences, days_ahead, n_paths=n_simulations, training=True, symbol_ids=symbol_ids
+            )
+
+            feature_importance = await self._calculate_feature_importance(model)
+
+            for i, (symbol, scaler) in enumerate(zip(scored, scalers)):
+                predictions = self._inverse_scale_close(scaler, point[i])
+                simulated = self._inverse_scale_close(scaler, paths[i])
+                intervals = {
+                    str(level): {
+                        'lower': np.percentile(simulated, low, axis=0),
+                        'upper': np.percentile(simulated, high, axis=0)
+                    }
+                    for level, (low, high) in [(80, (10, 90)), (95, (2.5, 97.5))]
+                }
+                try:
+                    results[symbol] = self._build_prediction(
+                        symbol, historical_data[symbol], predictions, intervals,
+                        artifacts["metrics"][symbol],
+                        entry.version,
+                        feature_importance=feature_importance,
+                        training_samples=len(features_by_symbol[symbol]),
+                        model_type="global"
+                    )
+                except Exception as e:
+                    logger.error(f"Error building global prediction for {symbol}: {e}")
+                    results[symbol] = None
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Error in global batch prediction: {e}")
+            return {symbol: None for symbol in symbols}
+
+    @property
+    def global_universe(self) -> List[str]:
+        """Symbols the global model is trained on"""
+        return [symbol.upper() for symbol in settings.LSTM_GLOBAL_UNIVERSE or settings.DEFAULT_TICKERS]
+
+    def _global_version_prefix(self) -> str:
+        """Version prefix shared by every global model of the configured universe"""
+        digest = hashlib.sha1("|".join(sorted(set(self.global_universe))).encode()).hexdigest()[:12]
+        return f"{self._get_model_version()}-{digest}"
+
+    def _global_model_version(self, last_dates: List[Any]) -> str:
+        """Version of the global model for the configured universe and data window
+
+        The window is the latest bar date bucketed by
+        ``LSTM_GLOBAL_RETRAIN_DAYS``, so the universe is retrained once that
+        much new data has arrived. Only a change to the configured universe
+        starts a new version line.
+        """
+        data_end = max(pd.Timestamp(last_date) for last_date in last_dates)
+        window = data_end.date().toordinal() // max(1, settings.LSTM_GLOBAL_RETRAIN_DAYS)
+        return f"{self._global_version_prefix()}-w{window}"
+
+    def _is_newer_global_version(self, version: str) -> bool:
+        """Whether a trained global version should replace the live one
+
+        Only versions of the configured universe are promoted, and only when
+        their data window is newer, so a slow job for an older window never
+        demotes a fresher model.
+        """
+        prefix, _, window = version.rpartition("-w")
+        if prefix != self._global_version_prefix():
+            return False
+        if self.live_global_version is None:
+            return True
+        live_prefix, _, live_window = self.live_global_version.rpartition("-w")
+        return live_prefix != prefix or int(window) > int(live_window)
+
+    def schedule_global_training(self, features_by_symbol: Dict[str, np.ndarray], version: str) -> TrainingJob:
+        """Queue training of the shared multi-symbol model on pooled histories"""
+        return self.training_scheduler.submit(
+            self.GLOBAL_MODEL_KEY,
+            version,
+            features_by_symbol,
+            self.lookback_days,
+            str(self.registry.model_path(self.GLOBAL_MODEL_KEY, version)),
+            str(self.registry.scaler_path(self.GLOBAL_MODEL_KEY, version)),
+            settings.LSTM_EPOCHS,
+            train_func=train_and_save_global
+        )
+
     async def get_model_performance_history(
         self,
         symbol: str
@@ -3,21 +3,25 @@ Market data streaming service for real-time data simulation and publishing
 """
 
 import asyncio
-import yfinance as yf
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 import random
+import pandas as pd
 from loguru import logger
 
 from app.core.config import settings
 from app.services.redis_pubsub import RedisStreamer
+from app.services.stock_service import StockService
+from app.services.technical_analysis_service import technical_analysis_service
 
 
 class MarketDataStreamer:
     """Service for streaming real-time market data updates"""
 
-    def __init__(self, redis_streamer: RedisStreamer):
+    def __init__(self, redis_streamer: RedisStreamer, stock_service: Optional[StockService] = None):
         self.redis_streamer = redis_streamer
+        self.stock_service = stock_service or StockService()
+        self.indicators = technical_analysis_service.streaming_indicators
         self.running = False
         self.stream_task = None
         self.symbols = settings.DEFAULT_TICKERS
@@ -53,6 +57,7 @@ class MarketDataStreamer:
             try:
                 # Get current market data for all symbols
                 market_data = await self._fetch_current_market_data()
+                await self._update_indicators(market_data)
 
                 # Publish market updates
                 for symbol, data in market_data.items():
@@ -76,68 +81,64 @@ class MarketDataStreamer:
                 logger.error(f"❌ Error in market data streaming: {e}")
                 await asyncio.sleep(5)  # Wait before retry
 
-    async def _fetch_current_market_data(self) -> Dict[str, Dict[str, Any]]:
-        """Fetch current market data for all symbols"""
+    async def _fetch_current_market_data(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Fetch current market data for all symbols in bulk quote requests"""
+        symbols = symbols or self.symbols
         market_data = {}
 
         try:
-            # Fetch data in smaller batches to avoid rate limits
-            batch_size = 5
-            for i in range(0, len(self.symbols), batch_size):
-                batch_symbols = self.symbols[i:i + batch_size]
-
-                # Use threading to avoid blocking the event loop
-                batch_data = await asyncio.get_event_loop().run_in_executor(
-                    None, self._fetch_symbol_batch, batch_symbols
-                )
-
-                market_data.update(batch_data)
-
-                # Small delay between batches
-                await asyncio.sleep(1)
-
+            prices = await self.stock_service.get_prices(symbols)
         except Exception as e:
             logger.error(f"❌ Error fetching market data: {e}")
+            prices = {}
 
-        return market_data
+        for symbol in symbols:
+            price = prices.get(symbol.upper())
+            if price is None:
+                # Generate simulated data as fallback
+                market_data[symbol] = self._generate_simulated_data(symbol)
+                continue
+
+            market_data[symbol] = {
+                "price": round(price.current_price, 2),
+                "change": round(price.change, 2),
+                "change_percent": round(price.change_percent, 2),
+                "volume": price.volume,
+                "high": round(price.day_high, 2),
+                "low": round(price.day_low, 2),
+                "previous_close": price.previous_close,
+                "market_cap": price.market_cap,
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            }
 
-    def _fetch_symbol_batch(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
-        """Fetch market data for a batch of symbols"""
-        batch_data = {}
+        return market_data
 
-        for symbol in symbols:
-            try:
-                ticker = yf.Ticker(symbol)
-
-                # Get current price info
-                info = ticker.info
-                history = ticker.history(period="1d", interval="1m")
-
-                if not history.empty:
-                    current_price = float(history['Close'].iloc[-1])
-                    previous_close = info.get('previousClose', current_price)
-
-                    change = current_price - previous_close
-                    change_percent = (change / previous_close) * 100 if previous_close != 0 else 0
-
-                    batch_data[symbol] = {
-                        "price": round(current_price, 2),
-                        "change": round(change, 2),
-                        "change_percent": round(change_percent, 2),
-                        "volume": int(history['Volume'].iloc[-1]) if len(history) > 0 else 0,
-                        "high": round(float(history['High'].max()), 2),
-                        "low": round(float(history['Low'].min()), 2),
-                        "previous_close": previous_close,
-                        "market_cap": info.get('marketCap'),
-                        "timestamp": datetime.now(timezone.utc).isoformat()
-                    }
+    async def _update_indicators(self, market_data: Dict[str, Dict[str, Any]]):
+        """Fold live quotes into the streaming indicators and attach the latest values"""
+        live = {symbol: data for symbol, data in market_data.items() if not data.get("simulated")}
 
-            except Exception as e:
-                logger.error(f"❌ Error fetching data for {symbol}: {e}")
-                # Generate simulated data as fallback
-                batch_data[symbol] = self._generate_simulated_data(symbol)
+        try:
+            # Symbols seen for the first time are seeded from stored daily history
+            unseeded = [symbol for symbol in live if symbol not in self.indicators]
+            if unseeded:
+                histories = await self.stock_service.get_histories(unseeded, "1y", "1d")
+                for symbol in unseeded:
+                    self.indicators.seed(symbol, histories.get(symbol))
+
+            # Quotes carry the day's running high, low and volume: they are today's forming bar
+            market_hours = self.stock_service.get_market_hours()
+            if market_hours["is_open"]:
+                bar_time = pd.Timestamp(market_hours["current_time"]).normalize()
+                for symbol, data in live.items():
+                    self.indicators.update_bar(
+                        symbol, bar_time, data["high"], data["low"], data["price"], data["volume"]
+                    )
+        except Exception as e:
+            logger.error(f"❌ Error updating streaming indicators: {e}")
 
-        return batch_data
+        for symbol, data in live.items():
+            if symbol in self.indicators:
+                data["indicators"] = self.indicators.latest(symbol)
 
     def _generate_simulated_data(self, symbol: str) -> Dict[str, Any]:
         """Generate simulated market data for testing"""
@@ -224,12 +225,8 @@ class MarketDataStreamer:
 
         try:
             # Fetch data for requested symbols
-            market_data = {}
-            for symbol in target_symbols:
-                batch_data = await asyncio.get_event_loop().run_in_executor(
-                    None, self._fetch_symbol_batch, [symbol]
-                )
-                market_data.update(batch_data)
+            market_data = await self._fetch_current_market_data(target_symbols)
+            await self._update_indicators(market_data)
 
             # Publish updates
             for symbol, data in market_data.items():
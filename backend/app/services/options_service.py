@@ -7,6 +7,7 @@ implied volatility analysis, and options chain management.
 
 import asyncio
 import logging
+from collections import OrderedDict
 from datetime import date, datetime, timedelta
 from typing import List, Optional, Dict, Any
 import yfinance as yf
@@ -20,7 +21,7 @@ from ..models.options_models import (
     VolatilitySurface, OptionsAnalyticsRequest, OptionsAnalyticsResponse,
     Greeks
 )
-from ..core.options_pricing import OptionsPricingEngine
+from ..core.options_pricing import OptionsPricingEngine, ImpliedVolatilitySolver
 from ..services.stock_service import StockService
 
 logger = logging.getLogger(__name__)
@@ -32,8 +33,9 @@ class OptionsDataProvider:
     def __init__(self):
         self.stock_service = StockService()
 
-    async def fetch_options_chain(self, symbol: str, expiry: Optional[date] = None) -> List[OptionsChain]:
-        """Fetch options chain data for a symbol"""
+    async def fetch_options_chain(self, symbol: str, expiry: Optional[date] = None,
+                                  spot_price: Optional[float] = None) -> List[OptionsChain]:
+        """Fetch options chain data for a symbol, reusing ``spot_price`` when the caller already has it"""
 
         try:
             ticker = yf.Ticker(symbol)
@@ -54,7 +56,8 @@ class OptionsDataProvider:
                 expirations = [expiry_str]
 
             chains = []
-            spot_price = await self._get_spot_price(symbol)
+            if spot_price is None:
+                spot_price = await self.get_spot_price(symbol)
 
             for exp_str in expirations[:5]:  # Limit to 5 nearest expiries
                 try:
@@ -134,7 +137,7 @@ class OptionsDataProvider:
 
         return options
 
-    async def _get_spot_price(self, symbol: str) -> float:
+    async def get_spot_price(self, symbol: str) -> float:
         """Get current spot price for underlying"""
 
         stock_price = await self.stock_service.get_current_price(symbol)
@@ -177,6 +180,12 @@ class OptionsAnalyticsService:
         self.risk_free_rate = 0.05  # 5% risk-free rate
         self.dividend_yield = 0.02  # 2% dividend yield
 
+        # Volatility surfaces keyed by symbol, spot bucket and rates
+        self.surface_cache: "OrderedDict[tuple, VolatilitySurface]" = OrderedDict()
+        self.max_cached_surfaces = 100
+        self.surface_cache_ttl = 300  # seconds
+        self.surface_spot_bucket_pct = 0.005  # 0.5% spot buckets
+
     async def get_options_analytics(self, request: OptionsAnalyticsRequest) -> OptionsAnalyticsResponse:
         """Get comprehensive options analytics for a symbol"""
 
@@ -251,58 +260,56 @@ class OptionsAnalyticsService:
         strike_filter: Optional[float] = None,
         type_filter: Optional[OptionType] = None
     ) -> List[OptionPricingOutput]:
-        """Calculate pricing for options in chains"""
+        """Calculate pricing for every contract of every chain in one batch"""
 
-        pricing_results = []
+        strikes, times, volatilities, option_types, exercise_styles = [], [], [], [], []
 
-        for chain in chains[:2]:  # Limit to first 2 expiries for performance
+        for chain in chains:
             days_to_expiry = (chain.expiry_date - date.today()).days
             time_to_expiry = days_to_expiry / 365.0
 
             if time_to_expiry <= 0:
                 continue
 
-            # Process calls
+            contracts = []
             if type_filter != OptionType.PUT:
-                for call in chain.calls:
-                    if strike_filter and abs(call.strike - strike_filter) > 0.01:
-                        continue
+                contracts.extend(chain.calls)
+            if type_filter != OptionType.CALL:
+                contracts.extend(chain.puts)
 
-                    input_params = OptionPricingInput(
-                        spot_price=spot_price,
-                        strike_price=call.strike,
-                        time_to_expiry=time_to_expiry,
-                        risk_free_rate=risk_free_rate,
-                        volatility=chain.atm_iv or 0.25,
-                        dividend_yield=dividend_yield,
-                        option_type=OptionType.CALL,
-                        exercise_style=call.exercise_style
-                    )
+            for contract in contracts:
+                if strike_filter and abs(contract.strike - strike_filter) > 0.01:
+                    continue
 
-                    result = self.pricing_engine.price_option(input_params)
-                    pricing_results.append(result)
+                strikes.append(contract.strike)
+                times.append(time_to_expiry)
+                volatilities.append(chain.atm_iv or 0.25)
+                option_types.append(contract.option_type)
+                exercise_styles.append(contract.exercise_style)
 
-            # Process puts
-            if type_filter != OptionType.CALL:
-                for put in chain.puts:
-                    if strike_filter and abs(put.strike - strike_filter) > 0.01:
-                        continue
+        if not strikes:
+            return []
 
-                    input_params = OptionPricingInput(
-                        spot_price=spot_price,
-                        strike_price=put.strike,
-                        time_to_expiry=time_to_expiry,
-                        risk_free_rate=risk_free_rate,
-                        volatility=chain.atm_iv or 0.25,
-                        dividend_yield=dividend_yield,
-                        option_type=OptionType.PUT,
-                        exercise_style=put.exercise_style
-                    )
+        return self.pricing_engine.price_chain(
+            spot_price, strikes, times, risk_free_rate, volatilities,
+            option_types, exercise_styles, dividend_yield, pricing_model
+        )
+
+    async def get_volatility_surface(self, symbol: str) -> Optional[VolatilitySurface]:
+        """Get the implied volatility surface, reusing a cached one while spot stays in its bucket"""
 
-                    result = self.pricing_engine.price_option(input_params)
-                    pricing_results.append(result)
+        spot_price = await self.data_provider.get_spot_price(symbol)
+        cached = self._get_cached_surface(symbol, spot_price, self.risk_free_rate, self.dividend_yield)
+        if cached:
+            return cached
+
+        chains = await self.data_provider.fetch_options_chain(symbol, spot_price=spot_price)
+        if not chains:
+            return None
 
-        return pricing_results
+        return await self._calculate_volatility_surface(
+            chains, chains[0].spot_price, self.risk_free_rate, self.dividend_yield
+        )
 
     async def _calculate_volatility_surface(
         self, chains: List[OptionsChain], spot_price: float,
@@ -310,56 +317,120 @@ class OptionsAnalyticsService:
     ) -> VolatilitySurface:
         """Calculate implied volatility surface"""
 
-        strikes = []
-        expiries = []
-        iv_matrix = []
+        symbol = chains[0].symbol
+        cached = self._get_cached_surface(symbol, spot_price, risk_free_rate, dividend_yield)
+        if cached:
+            return cached
 
-        # Collect unique strikes across all chains
-        all_strikes = set()
-        for chain in chains:
-            all_strikes.update([c.strike for c in chain.calls])
-            all_strikes.update([p.strike for p in chain.puts])
+        surface = self._build_volatility_surface(chains, spot_price, risk_free_rate, dividend_yield)
 
-        strikes = sorted(list(all_strikes))
+        cache_key = self._surface_cache_key(symbol, spot_price, risk_free_rate, dividend_yield)
+        self.surface_cache[cache_key] = surface
+        self.surface_cache.move_to_end(cache_key)
+        while len(self.surface_cache) > self.max_cached_surfaces:
+            self.surface_cache.popitem(last=False)
 
-        # Limit strikes around ATM
-        atm_strike = min(strikes, key=lambda x: abs(x - spot_price))
-        strike_range = [s for s in strikes if 0.8 * spot_price <= s <= 1.2 * spot_price]
-        strikes = sorted(strike_range)[:10]  # Limit to 10 strikes
+        return surface
 
-        # Build IV matrix
-        for chain in chains[:5]:  # Limit to 5 expiries
-            expiries.append(chain.expiry_date)
-            iv_row = []
+    def _surface_cache_key(self, symbol: str, spot_price: float,
+                           risk_free_rate: float, dividend_yield: float) -> tuple:
+        """Cache key with spot rounded to a log-spaced bucket"""
 
-            for strike in strikes:
-                # Find option at this strike
-                call = next((c for c in chain.calls if abs(c.strike - strike) < 0.01), None)
-                put = next((p for p in chain.puts if abs(p.strike - strike) < 0.01), None)
+        bucket = int(round(np.log(spot_price) / np.log1p(self.surface_spot_bucket_pct)))
+        return symbol.upper(), bucket, round(risk_free_rate, 6), round(dividend_yield, 6)
 
-                # Calculate IV (mock for now)
-                if call and call.last:
-                    # Would calculate actual IV from market price
-                    iv = chain.atm_iv or 0.25
-                elif put and put.last:
-                    iv = chain.atm_iv or 0.25
-                else:
-                    iv = 0.25
+    def _get_cached_surface(self, symbol: str, spot_price: float,
+                            risk_free_rate: float, dividend_yield: float) -> Optional[VolatilitySurface]:
+        """Return a fresh cached surface for this spot bucket, if any"""
 
-                iv_row.append(iv)
+        cache_key = self._surface_cache_key(symbol, spot_price, risk_free_rate, dividend_yield)
+        surface = self.surface_cache.get(cache_key)
+        if surface is None:
+            return None
 
-            iv_matrix.append(iv_row)
+        age = (datetime.now() - surface.calculation_time).total_seconds()
+        if age > self.surface_cache_ttl or surface.calculation_time.date() != date.today():
+            del self.surface_cache[cache_key]
+            return None
 
-        # Calculate surface metrics
-        atm_term_structure = {
-            exp.strftime("%Y-%m-%d"): chain.atm_iv or 0.25
-            for exp, chain in zip(expiries, chains[:5])
-        }
+        return surface
+
+    def _build_volatility_surface(
+        self, chains: List[OptionsChain], spot_price: float,
+        risk_free_rate: float, dividend_yield: float
+    ) -> VolatilitySurface:
+        """Solve market IVs for every chain at once and grid them as expiries x strikes
+
+        Out-of-the-money contracts are used (puts below spot, calls at or
+        above), priced at the bid/ask mid or the last trade. Each expiry is
+        interpolated linearly across the strike grid, flat beyond its quoted
+        range; expiries with no solvable quote fall back to the chain's ATM IV.
+        """
+
+        live_chains = [c for c in chains if (c.expiry_date - date.today()).days > 0]
+
+        # Collect quotes across all chains
+        rows, strikes_quoted, prices, times, option_types = [], [], [], [], []
+        for row, chain in enumerate(live_chains):
+            time_to_expiry = (chain.expiry_date - date.today()).days / 365.0
+            otm_contracts = [p for p in chain.puts if p.strike < spot_price] + \
+                            [c for c in chain.calls if c.strike >= spot_price]
+
+            for contract in otm_contracts:
+                price = self._market_price(contract)
+                if price is None:
+                    continue
 
-        skew_by_expiry = {
-            exp.strftime("%Y-%m-%d"): 0.02  # Mock skew
-            for exp in expiries
-        }
+                rows.append(row)
+                strikes_quoted.append(contract.strike)
+                prices.append(price)
+                times.append(time_to_expiry)
+                option_types.append(contract.option_type)
+
+        rows = np.asarray(rows, dtype=int)
+        strikes_quoted = np.asarray(strikes_quoted, dtype=float)
+        if prices:
+            ivs = ImpliedVolatilitySolver.solve_batch(
+                prices, spot_price, strikes_quoted, times, risk_free_rate,
+                option_types, dividend_yield
+            ).implied_volatility
+        else:
+            ivs = np.empty(0)
+
+        # Strike grid around ATM
+        all_strikes = {c.strike for chain in live_chains for c in chain.calls + chain.puts}
+        strikes = sorted(s for s in all_strikes if 0.8 * spot_price <= s <= 1.2 * spot_price)
+        strike_grid = np.asarray(strikes, dtype=float)
+
+        expiries = []
+        iv_matrix = []
+        atm_term_structure = {}
+        skew_by_expiry = {}
+
+        for row, chain in enumerate(live_chains):
+            mask = (rows == row) & np.isfinite(ivs)
+            order = np.argsort(strikes_quoted[mask])
+            quoted_strikes, quoted_ivs = strikes_quoted[mask][order], ivs[mask][order]
+
+            if quoted_ivs.size:
+                def smile(points):
+                    return np.interp(points, quoted_strikes, quoted_ivs)
+            else:
+                fallback = chain.atm_iv or 0.25
+
+                def smile(points):
+                    return np.full(np.shape(points), fallback, dtype=float)
+
+            expiry_key = chain.expiry_date.strftime("%Y-%m-%d")
+            expiries.append(chain.expiry_date)
+            iv_matrix.append(smile(strike_grid).tolist())
+            atm_term_structure[expiry_key] = float(smile(spot_price))
+            # 90%-110% moneyness skew: positive when downside strikes are richer
+            skew_by_expiry[expiry_key] = float(smile(0.9 * spot_price) - smile(1.1 * spot_price))
+
+        # Dispersion of log ATM IV across the term structure
+        atm_levels = np.log(list(atm_term_structure.values()) or [1.0])
+        vol_of_vol = float(np.std(atm_levels)) if atm_levels.size > 1 else 0.0
 
         return VolatilitySurface(
             symbol=chains[0].symbol,
@@ -370,9 +441,19 @@ class OptionsAnalyticsService:
             implied_volatilities=iv_matrix,
             atm_term_structure=atm_term_structure,
             skew_by_expiry=skew_by_expiry,
-            volatility_of_volatility=0.15  # Mock vol of vol
+            volatility_of_volatility=vol_of_vol
         )
 
+    @staticmethod
+    def _market_price(contract: OptionContract) -> Optional[float]:
+        """Bid/ask mid when both sides are quoted, otherwise the last trade"""
+
+        if contract.bid and contract.ask and contract.ask >= contract.bid:
+            return 0.5 * (contract.bid + contract.ask)
+        if contract.last:
+            return contract.last
+        return None
+
     def _aggregate_greeks(self, pricing_results: List[OptionPricingOutput]) -> Greeks:
         """Aggregate Greeks across all options"""
 
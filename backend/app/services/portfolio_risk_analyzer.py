@@ -11,6 +11,7 @@ import pandas as pd
 from typing import Optional, List, Dict, Any, Tuple
 from decimal import Decimal
 from datetime import datetime, timedelta
+from dataclasses import dataclass
 import logging
 from scipy import stats
 from scipy.optimize import minimize
@@ -28,6 +29,22 @@ logger = logging.getLogger(__name__)
 warnings.filterwarnings('ignore', category=RuntimeWarning)
 
 
+@dataclass
+class MonteCarloPathStatistics:
+    """Terminal-return statistics of a chunked Monte Carlo run plus a few sample paths"""
+    num_simulations: int
+    expected_return: float
+    expected_volatility: float
+    percentiles: Dict[float, float]
+    value_at_risk: Dict[float, float]
+    conditional_value_at_risk: Dict[float, float]
+    probability_of_loss: float
+    probability_of_target: float
+    max_loss: float
+    max_gain: float
+    sample_paths: np.ndarray  # (num_sample_paths, horizon + 1) portfolio values
+
+
 class PortfolioRiskAnalyzer:
     """
     Advanced portfolio risk analysis using quantitative risk models
@@ -42,6 +59,7 @@ class PortfolioRiskAnalyzer:
         self.correlation_lookback_days = 60  # 60 days for correlation
         self.risk_free_rate = Decimal(0.02)  # 2% annual risk-free rate
         self.trading_days_per_year = 252
+        self.monte_carlo_chunk_size = 50_000  # paths simulated per chunk
 
     async def analyze_portfolio_risk(
         self,
@@ -185,10 +203,11 @@ class PortfolioRiskAnalyzer:
         self,
         portfolio: Portfolio,
         time_horizon_days: int = 252,
-        num_simulations: int = 10000
+        num_simulations: int = 10000,
+        num_sample_paths: int = 100
     ) -> MonteCarloSimulation:
         """
-        Run Monte Carlo simulation for portfolio outcomes
+        Run a correlated multi-asset Monte Carlo simulation for portfolio outcomes
         """
         try:
             # Get historical data
@@ -196,34 +215,23 @@ class PortfolioRiskAnalyzer:
             if not price_data:
                 return self._create_default_monte_carlo()
 
-            # Calculate portfolio statistics
-            portfolio_returns = self._calculate_portfolio_returns(portfolio, price_data)
-            mean_return = np.mean(portfolio_returns)
-            volatility = np.std(portfolio_returns)
+            symbols, weights, asset_returns = self._build_asset_returns(portfolio, price_data)
+            if len(asset_returns) < 2:
+                return self._create_default_monte_carlo()
 
-            # Run Monte Carlo simulation
-            simulation_results = self._run_monte_carlo_paths(
+            mean_returns = asset_returns.mean(axis=0)
+            covariance = np.atleast_2d(np.cov(asset_returns, rowvar=False))
+
+            results = self._run_monte_carlo_paths(
                 portfolio.total_value,
-                mean_return,
-                volatility,
+                weights,
+                mean_returns,
+                covariance,
                 time_horizon_days,
-                num_simulations
+                num_simulations,
+                num_sample_paths=num_sample_paths
             )
-
-            # Calculate statistics
-            final_values = simulation_results[:, -1]
-            returns = (final_values - float(portfolio.total_value)) / float(portfolio.total_value)
-
-            percentiles = np.percentile(returns, [5, 25, 50, 75, 95])
-
-            # Calculate probabilities
-            probability_of_loss = np.sum(returns < 0) / len(returns)
-            target_return = 0.10  # 10% target return
-            probability_of_target = np.sum(returns >= target_return) / len(returns)
-
-            # Select sample paths for visualization
-            sample_indices = np.random.choice(num_simulations, min(100, num_simulations), replace=False)
-            sample_paths = [simulation_results[i].tolist() for i in sample_indices]
+            percentiles = results.percentiles
 
             return MonteCarloSimulation(
                 simulation_id=f"mc_{portfolio.portfolio_id}_{int(datetime.utcnow().timestamp())}",
@@ -231,18 +239,22 @@ class PortfolioRiskAnalyzer:
                 num_simulations=num_simulations,
                 time_horizon_days=time_horizon_days,
                 confidence_levels=[Decimal(0.05), Decimal(0.25), Decimal(0.50), Decimal(0.75), Decimal(0.95)],
-                expected_return=Decimal(str(mean_return * time_horizon_days)),
-                expected_volatility=Decimal(str(volatility * np.sqrt(time_horizon_days))),
-                percentile_5=Decimal(str(percentiles[0])),
-                percentile_25=Decimal(str(percentiles[1])),
-                percentile_50=Decimal(str(percentiles[2])),
-                percentile_75=Decimal(str(percentiles[3])),
-                percentile_95=Decimal(str(percentiles[4])),
-                probability_of_loss=Decimal(str(probability_of_loss)),
-                probability_of_target=Decimal(str(probability_of_target)),
-                max_simulated_loss=Decimal(str(np.min(returns))),
-                max_simulated_gain=Decimal(str(np.max(returns))),
-                simulation_paths=sample_paths,
+                expected_return=Decimal(str(results.expected_return * time_horizon_days)),
+                expected_volatility=Decimal(str(results.expected_volatility * np.sqrt(time_horizon_days))),
+                percentile_5=Decimal(str(percentiles[5])),
+                percentile_25=Decimal(str(percentiles[25])),
+                percentile_50=Decimal(str(percentiles[50])),
+                percentile_75=Decimal(str(percentiles[75])),
+                percentile_95=Decimal(str(percentiles[95])),
+                probability_of_loss=Decimal(str(results.probability_of_loss)),
+                probability_of_target=Decimal(str(results.probability_of_target)),
+                max_simulated_loss=Decimal(str(results.max_loss)),
+                max_simulated_gain=Decimal(str(results.max_gain)),
+                var_95=Decimal(str(results.value_at_risk[0.95])),
+                var_99=Decimal(str(results.value_at_risk[0.99])),
+                cvar_95=Decimal(str(results.conditional_value_at_risk[0.95])),
+                cvar_99=Decimal(str(results.conditional_value_at_risk[0.99])),
+                simulation_paths=results.sample_paths.tolist(),
                 simulated_at=datetime.utcnow()
             )
 
@@ -496,10 +508,11 @@ class PortfolioRiskAnalyzer:
             concentration_analysis = await self.analyze_concentration_risk(portfolio)
 
             return RiskMetrics(
-                var_95=Decimal(str(abs(var_95))),
-                var_99=Decimal(str(abs(var_99))),
-                cvar_95=Decimal(str(abs(cvar_95))),
-                cvar_99=Decimal(str(abs(cvar_99))),
+                # Losses are reported as positive amounts; a tail of gains is no risk
+                var_95=Decimal(str(max(-var_95, 0.0))),
+                var_99=Decimal(str(max(-var_99, 0.0))),
+                cvar_95=Decimal(str(max(-cvar_95, 0.0))),
+                cvar_99=Decimal(str(max(-cvar_99, 0.0))),
                 daily_volatility=Decimal(str(daily_volatility)),
                 annual_volatility=Decimal(str(annual_volatility)),
                 downside_volatility=Decimal(str(downside_volatility)),
@@ -531,7 +544,7 @@ class PortfolioRiskAnalyzer:
         """Calculate historical VaR"""
         if len(returns) == 0:
             return 0.0
-        return abs(np.percentile(returns, (1 - confidence_level) * 100))
+        return max(-np.percentile(returns, (1 - confidence_level) * 100), 0.0)
 
     def _calculate_parametric_var(self, returns: np.ndarray, confidence_level: float) -> float:
         """Calculate parametric VaR assuming normal distribution"""
@@ -542,7 +555,7 @@ class PortfolioRiskAnalyzer:
         volatility = np.std(returns)
         z_score = stats.norm.ppf(1 - confidence_level)
 
-        var = abs(mean_return + z_score * volatility)
+        var = max(-(mean_return + z_score * volatility), 0.0)
         return var
 
     async def _calculate_monte_carlo_var(
@@ -644,32 +657,113 @@ class PortfolioRiskAnalyzer:
             logger.error(f"Error calculating correlation statistics: {e}")
             return self._create_identity_correlation_matrix(symbols)
 
+    def _build_asset_returns(
+        self,
+        portfolio: Portfolio,
+        price_data: Dict[str, List[Dict]]
+    ) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Daily returns per position on common dates, with normalized position weights"""
+        symbols = [pos.symbol for pos in portfolio.positions if pos.symbol in price_data]
+        if not symbols:
+            return [], np.array([]), np.empty((0, 0))
+
+        closes = pd.DataFrame({
+            symbol: pd.Series(
+                [point['close'] for point in price_data[symbol]],
+                index=[point['date'] for point in price_data[symbol]]
+            )
+            for symbol in symbols
+        })
+        closes = closes[~closes.index.duplicated(keep='last')].sort_index().dropna()
+        asset_returns = closes.pct_change().iloc[1:].to_numpy(dtype=float)
+
+        market_values = {pos.symbol: float(pos.market_value) for pos in portfolio.positions}
+        weights = np.array([market_values[symbol] for symbol in symbols])
+        weights = weights / weights.sum() if weights.sum() > 0 else np.full(len(symbols), 1.0 / len(symbols))
+
+        return symbols, weights, asset_returns
+
+    @staticmethod
+    def _covariance_factor(covariance: np.ndarray) -> np.ndarray:
+        """Matrix L with L @ L.T == covariance (Cholesky, or eigen-clipped if not positive definite)"""
+        try:
+            return np.linalg.cholesky(covariance)
+        except np.linalg.LinAlgError:
+            eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+            return eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
+
     def _run_monte_carlo_paths(
         self,
         initial_value: Decimal,
-        mean_return: float,
-        volatility: float,
+        weights: np.ndarray,
+        mean_returns: np.ndarray,
+        covariance: np.ndarray,
         time_horizon: int,
-        num_simulations: int
-    ) -> np.ndarray:
-        """Run Monte Carlo simulation paths"""
-        try:
-            dt = 1.0  # Daily time step
-            paths = np.zeros((num_simulations, time_horizon + 1))
-            paths[:, 0] = float(initial_value)
-
-            for t in range(1, time_horizon + 1):
-                random_shocks = np.random.normal(0, 1, num_simulations)
-                paths[:, t] = paths[:, t-1] * np.exp(
-                    (mean_return - 0.5 * volatility**2) * dt +
-                    volatility * np.sqrt(dt) * random_shocks
-                )
-
-            return paths
-
-        except Exception as e:
-            logger.error(f"Error running Monte Carlo paths: {e}")
-            return np.zeros((num_simulations, time_horizon + 1))
+        num_simulations: int,
+        target_return: float = 0.10,
+        num_sample_paths: int = 100,
+        confidence_levels: Tuple[float, ...] = (0.95, 0.99),
+        chunk_size: Optional[int] = None,
+        rng: Optional[np.random.Generator] = None
+    ) -> MonteCarloPathStatistics:
+        """Simulate buy-and-hold portfolio outcomes under correlated multi-asset GBM
+
+        Each asset follows a daily GBM whose shocks are correlated through the
+        Cholesky factor of the return covariance. With constant parameters the
+        terminal log-growth of every asset is jointly normal, so terminal values
+        are drawn directly in chunks of ``chunk_size`` paths and only the
+        terminal return per path is kept. Full daily paths are simulated just
+        for the ``num_sample_paths`` returned for visualization.
+        """
+        rng = rng or np.random.default_rng()
+        chunk_size = chunk_size or self.monte_carlo_chunk_size
+        initial_value = float(initial_value)
+
+        weights = np.asarray(weights, dtype=float)
+        mean_returns = np.asarray(mean_returns, dtype=float)
+        covariance = np.atleast_2d(np.asarray(covariance, dtype=float))
+        factor = self._covariance_factor(covariance)
+        drift = mean_returns - 0.5 * np.diag(covariance)
+        num_assets = len(weights)
+
+        # Terminal returns, chunk by chunk
+        terminal_factor = factor.T * np.sqrt(time_horizon)
+        final_returns = np.empty(num_simulations)
+        for start in range(0, num_simulations, chunk_size):
+            size = min(chunk_size, num_simulations - start)
+            log_growth = drift * time_horizon + rng.standard_normal((size, num_assets)) @ terminal_factor
+            final_returns[start:start + size] = np.exp(log_growth) @ weights - 1.0
+
+        # Daily sample paths
+        num_sample_paths = min(num_sample_paths, num_simulations)
+        daily_log_growth = drift + rng.standard_normal((time_horizon, num_sample_paths, num_assets)) @ factor.T
+        sample_paths = np.empty((num_sample_paths, time_horizon + 1))
+        sample_paths[:, 0] = initial_value
+        sample_paths[:, 1:] = initial_value * (np.exp(np.cumsum(daily_log_growth, axis=0)) @ weights).T
+
+        # Tail statistics
+        value_at_risk, conditional_value_at_risk = {}, {}
+        for confidence_level in confidence_levels:
+            cutoff = np.percentile(final_returns, (1 - confidence_level) * 100)
+            value_at_risk[confidence_level] = max(-cutoff, 0.0)
+            conditional_value_at_risk[confidence_level] = max(-final_returns[final_returns <= cutoff].mean(), 0.0)
+
+        percentile_levels = [5, 25, 50, 75, 95]
+        percentiles = dict(zip(percentile_levels, np.percentile(final_returns, percentile_levels)))
+
+        return MonteCarloPathStatistics(
+            num_simulations=num_simulations,
+            expected_return=float(weights @ mean_returns),
+            expected_volatility=float(np.sqrt(weights @ covariance @ weights)),
+            percentiles=percentiles,
+            value_at_risk=value_at_risk,
+            conditional_value_at_risk=conditional_value_at_risk,
+            probability_of_loss=float(np.mean(final_returns < 0)),
+            probability_of_target=float(np.mean(final_returns >= target_return)),
+            max_loss=float(final_returns.min()),
+            max_gain=float(final_returns.max()),
+            sample_paths=sample_paths
+        )
 
     async def _run_stress_scenario(self, portfolio: Portfolio, scenario: Dict[str, Any]) -> Dict[str, Any]:
         """Run a single stress test scenario"""
@@ -10,8 +10,8 @@ import json
 import smtplib
 from typing import Dict, List, Any, Optional, Set, Callable
 from datetime import datetime, timedelta
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
 import logging
 import aiohttp
 from dataclasses import dataclass, field
@@ -122,14 +122,14 @@ class EmailAlertSender:
         """Send email alert"""
         try:
             # Create message
-            msg = MimeMultipart()
+            msg = MIMEMultipart()
             msg['From'] = self.username
             msg['To'] = ', '.join(recipients)
             msg['Subject'] = f"Scanner Alert: {alert.scanner_name} - {alert.symbol}"
 
             # Create email body
             body = self._create_email_body(alert)
-            msg.attach(MimeText(body, 'html'))
+            msg.attach(MIMEText(body, 'html'))
 
             # Send email
             with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
@@ -261,17 +261,19 @@ class ScannerAlertSystem:
             if not scanner.alert_config or not scanner.alert_config.enabled:
                 return
 
+            self._start_cleanup_task()
+
             scanner_id = scanner.scanner_id
-            current_symbols = {result.symbol for result in results.results}
+            results_by_symbol = {result.symbol: result for result in results.results}
+            current_symbols = set(results_by_symbol)
             previous_symbols = self.previous_results.get(scanner_id, set())
 
             # Generate alerts for new matches
             if scanner.alert_config.alert_on_new_match:
                 new_symbols = current_symbols - previous_symbols
                 for symbol in new_symbols:
-                    # Find the result for this symbol
-                    result = next((r for r in results.results if r.symbol == symbol), None)
-                    if result and self._should_alert_for_result(result, scanner.alert_config):
+                    result = results_by_symbol[symbol]
+                    if self._should_alert_for_result(result, scanner.alert_config):
                         await self._create_new_match_alert(scanner, result)
 
             # Generate alerts for removed matches
@@ -511,7 +513,14 @@ class ScannerAlertSystem:
         return results
 
     def _start_cleanup_task(self):
-        """Start background cleanup task"""
+        """Start background cleanup task (once an event loop is running)"""
+        if self._cleanup_task is not None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
         async def cleanup_loop():
             while True:
                 try:
@@ -6,6 +6,7 @@ alerts, and live streaming of scanner data.
 """
 
 import asyncio
+import hashlib
 import json
 from typing import Dict, Set, List, Optional, Any
 from datetime import datetime
@@ -13,16 +14,23 @@ import logging
 
 from ..services.websocket_manager import ConnectionManager
 from ..core.scanner_engine import get_scanner_engine
+from ..core.incremental_scan import IncrementalScan, diff_rankings
 from ..services.scanner_alert_system import get_alert_system
 from ..services.scanner_aggregation_service import get_aggregation_service
 from ..models.scanner_models import (
     SavedScanner, ScannerResponse, ScanResult, ScannerAlert,
-    AggregatedScanResult, ScannerRunRequest
+    AggregatedScanResult, ScannerRunRequest, ScannerConfig
 )
 
 logger = logging.getLogger(__name__)
 
 
+def ad_hoc_scanner_id(config: ScannerConfig) -> str:
+    """Stream id of an ad-hoc scanner, derived from its configuration"""
+    config_str = json.dumps(config.dict(), sort_keys=True, default=str)
+    return f"ad_hoc_{hashlib.md5(config_str.encode()).hexdigest()}"
+
+
 class ScannerSubscription:
     """Represents a scanner subscription for a WebSocket client"""
 
@@ -35,14 +43,49 @@ class ScannerSubscription:
         self.created_at = datetime.utcnow()
 
 
+class ScannerStream:
+    """Standing scan of one scanner, shared by every client subscribed to it"""
+
+    def __init__(self, scanner: SavedScanner):
+        self.scanner = scanner
+        self.scan = IncrementalScan(scanner.config)
+        self.subscribers: Dict[str, ScannerSubscription] = {}
+        self.aggregation_clients: Dict[str, int] = {}  # client_id -> aggregation interval
+        self.task: Optional[asyncio.Task] = None
+
+    @property
+    def active(self) -> bool:
+        return bool(self.subscribers or self.aggregation_clients)
+
+    @property
+    def interval_seconds(self) -> int:
+        intervals = [sub.interval_seconds for sub in self.subscribers.values()]
+        intervals.extend(self.aggregation_clients.values())
+        return min(intervals, default=60)
+
+
 class ScannerWebSocketManager:
     """
     Manages real-time WebSocket connections for scanner data streaming
+
+    Each subscribed scanner runs once per interval as an incremental scan,
+    whatever the number of subscribers. Clients get the current ranked
+    results when they subscribe and then only enter/exit/rank-change
+    deltas, tagged with the snapshot version they lead to.
     """
 
     def __init__(self, websocket_manager: ConnectionManager):
         self.websocket_manager = websocket_manager
 
+        # Known scanners: scanner_id -> SavedScanner
+        self.scanners: Dict[str, SavedScanner] = {}
+
+        # Ad-hoc scanners, registered only while streamed
+        self._ad_hoc_scanner_ids: Set[str] = set()
+
+        # Running standing scans: scanner_id -> ScannerStream
+        self.scanner_streams: Dict[str, ScannerStream] = {}
+
         # Scanner subscriptions: client_id -> {scanner_id: ScannerSubscription}
         self.scanner_subscriptions: Dict[str, Dict[str, ScannerSubscription]] = {}
 
@@ -51,6 +94,7 @@ class ScannerWebSocketManager:
 
         # Aggregation subscriptions: client_id -> {config}
         self.aggregation_subscriptions: Dict[str, Dict[str, Any]] = {}
+        self._aggregation_rankings: Dict[str, Dict[str, int]] = {}
 
         # Background tasks
         self._scanner_tasks: Dict[str, asyncio.Task] = {}
@@ -61,6 +105,34 @@ class ScannerWebSocketManager:
         self.alert_system = get_alert_system()
         self.aggregation_service = get_aggregation_service()
 
+    def register_scanner(self, scanner: SavedScanner):
+        """Make a saved scanner available for streaming subscriptions
+
+        Re-registering a streamed scanner with a new config restarts its scan
+        from the current ranking, so subscribers get the change as a delta.
+        """
+        self.scanners[scanner.scanner_id] = scanner
+        stream = self.scanner_streams.get(scanner.scanner_id)
+        if stream is not None:
+            if stream.scanner.config != scanner.config:
+                scan = IncrementalScan(scanner.config)
+                scan.ranking, scan.version = stream.scan.ranking, stream.scan.version
+                stream.scan = scan
+            stream.scanner = scanner
+
+    def unregister_scanner(self, scanner_id: str):
+        """Stop streaming a deleted scanner and drop its subscriptions"""
+        self.scanners.pop(scanner_id, None)
+        stream = self.scanner_streams.pop(scanner_id, None)
+        if stream is not None:
+            if stream.task:
+                stream.task.cancel()
+            for client_id in stream.subscribers:
+                subscriptions = self.scanner_subscriptions.get(client_id, {})
+                subscriptions.pop(scanner_id, None)
+                if not subscriptions:
+                    self.scanner_subscriptions.pop(client_id, None)
+
     async def start_services(self):
         """Start scanner WebSocket services"""
         try:
@@ -78,14 +150,17 @@ class ScannerWebSocketManager:
         """Stop scanner WebSocket services"""
         try:
             # Cancel all scanner tasks
-            for task in self._scanner_tasks.values():
+            tasks = list(self._scanner_tasks.values())
+            tasks.extend(stream.task for stream in self.scanner_streams.values() if stream.task)
+            for task in tasks:
                 task.cancel()
 
             # Wait for tasks to complete
-            if self._scanner_tasks:
-                await asyncio.gather(*self._scanner_tasks.values(), return_exceptions=True)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
 
             self._scanner_tasks.clear()
+            self.scanner_streams.clear()
 
             logger.info("Scanner WebSocket services stopped successfully")
 
@@ -124,8 +199,8 @@ class ScannerWebSocketManager:
             scanner_id = message.get("scanner_id")
             interval_seconds = message.get("interval_seconds", 60)
 
-            if not scanner_id:
-                await self._send_error(client_id, "scanner_id is required")
+            if not scanner_id and not message.get("config"):
+                await self._send_error(client_id, "scanner_id or config is required")
                 return
 
             # Validate interval
@@ -133,6 +208,24 @@ class ScannerWebSocketManager:
                 await self._send_error(client_id, "interval_seconds must be between 30 and 3600")
                 return
 
+            # Ad-hoc scanners are keyed by their config, so clients share a
+            # stream only when they asked for the same scan
+            requested_id = scanner_id
+            if message.get("config"):
+                config = ScannerConfig(**message["config"])
+                scanner_id = ad_hoc_scanner_id(config)
+                if scanner_id not in self.scanners:
+                    now = datetime.utcnow()
+                    self.register_scanner(SavedScanner(
+                        scanner_id=scanner_id, user_id="ad_hoc", name=config.name,
+                        config=config, created_at=now, updated_at=now
+                    ))
+                    self._ad_hoc_scanner_ids.add(scanner_id)
+
+            if scanner_id not in self.scanners:
+                await self._send_error(client_id, f"Unknown scanner: {scanner_id}")
+                return
+
             # Create subscription
             if client_id not in self.scanner_subscriptions:
                 self.scanner_subscriptions[client_id] = {}
@@ -140,22 +233,23 @@ class ScannerWebSocketManager:
             subscription = ScannerSubscription(client_id, scanner_id, interval_seconds)
             self.scanner_subscriptions[client_id][scanner_id] = subscription
 
-            # Start scanner task
-            task_key = f"{client_id}_{scanner_id}"
-            if task_key in self._scanner_tasks:
-                self._scanner_tasks[task_key].cancel()
-
-            self._scanner_tasks[task_key] = asyncio.create_task(
-                self._scanner_streaming_task(subscription)
-            )
-
-            # Send confirmation
-            await self.websocket_manager.send_personal_message({
+            # Join the scanner's stream; current results and subscriber list
+            # are taken together so no delta is missed or applied twice
+            stream = self._get_stream(scanner_id)
+            stream.subscribers[client_id] = subscription
+            confirmation = {
                 "type": "scanner_subscription_confirmed",
                 "scanner_id": scanner_id,
+                "requested_id": requested_id,
                 "interval_seconds": interval_seconds,
+                "version": stream.scan.version,
+                "results": stream.scan.rows(),
                 "timestamp": datetime.utcnow().isoformat()
-            }, client_id)
+            }
+            self._start_stream(stream)
+
+            # Send confirmation
+            await self.websocket_manager.send_personal_message(confirmation, client_id)
 
             logger.info(f"Client {client_id} subscribed to scanner {scanner_id}")
 
@@ -178,11 +272,11 @@ class ScannerWebSocketManager:
 
                 del self.scanner_subscriptions[client_id][scanner_id]
 
-                # Cancel task
-                task_key = f"{client_id}_{scanner_id}"
-                if task_key in self._scanner_tasks:
-                    self._scanner_tasks[task_key].cancel()
-                    del self._scanner_tasks[task_key]
+                # Leave the scanner's stream
+                stream = self.scanner_streams.get(scanner_id)
+                if stream:
+                    stream.subscribers.pop(client_id, None)
+                    self._release_stream(stream)
 
                 # Clean up empty subscription dict
                 if not self.scanner_subscriptions[client_id]:
@@ -269,12 +363,25 @@ class ScannerWebSocketManager:
                 await self._send_error(client_id, "scanner_ids is required")
                 return
 
+            unknown = [scanner_id for scanner_id in scanner_ids if scanner_id not in self.scanners]
+            if unknown:
+                await self._send_error(client_id, f"Unknown scanners: {', '.join(unknown)}")
+                return
+
             # Store aggregation subscription
+            self._leave_aggregation_streams(client_id)
             self.aggregation_subscriptions[client_id] = {
                 "scanner_ids": scanner_ids,
                 "interval_seconds": interval_seconds,
                 "last_run": None
             }
+            self._aggregation_rankings[client_id] = {}
+
+            # Keep the scanners' standing scans running for the aggregation
+            for scanner_id in scanner_ids:
+                stream = self._get_stream(scanner_id)
+                stream.aggregation_clients[client_id] = interval_seconds
+                self._start_stream(stream)
 
             # Start aggregation task
             task_key = f"{client_id}_aggregation"
@@ -310,7 +417,7 @@ class ScannerWebSocketManager:
 
             # Run scanner
             request = ScannerRunRequest(config=scanner_config, real_time=True)
-            results = await self.scanner_engine.run_scan(scanner_config)
+            results = await self.scanner_engine.run_scanner(request.config)
 
             # Send results
             await self.websocket_manager.send_personal_message({
@@ -345,7 +452,10 @@ class ScannerWebSocketManager:
                 ],
                 "alert_subscriptions": list(alert_subs),
                 "aggregation_subscription": agg_subs if agg_subs else None,
-                "active_tasks": len([k for k in self._scanner_tasks.keys() if k.startswith(client_id)])
+                "active_tasks": len([k for k in self._scanner_tasks.keys() if k.startswith(client_id)]) + len([
+                    sub for sub in scanner_subs.values()
+                    if sub.scanner_id in self.scanner_streams and self.scanner_streams[sub.scanner_id].task
+                ])
             }
 
             await self.websocket_manager.send_personal_message({
@@ -358,38 +468,64 @@ class ScannerWebSocketManager:
             logger.error(f"Error getting scanner status: {e}")
             await self._send_error(client_id, f"Failed to get scanner status: {str(e)}")
 
-    async def _scanner_streaming_task(self, subscription: ScannerSubscription):
-        """Background task for streaming scanner results"""
+    def _get_stream(self, scanner_id: str) -> ScannerStream:
+        """Get or create the standing scan for a registered scanner"""
+        stream = self.scanner_streams.get(scanner_id)
+        if stream is None:
+            stream = self.scanner_streams[scanner_id] = ScannerStream(self.scanners[scanner_id])
+        return stream
+
+    def _start_stream(self, stream: ScannerStream):
+        """Start the stream's background task if it is not running"""
+        if stream.task is None or stream.task.done():
+            stream.task = asyncio.create_task(self._scanner_streaming_task(stream))
+
+    def _release_stream(self, stream: ScannerStream):
+        """Stop and drop a stream nobody uses any more, unregistering ad-hoc scanners"""
+        if stream.active:
+            return
+        if stream.task:
+            stream.task.cancel()
+        scanner_id = stream.scanner.scanner_id
+        self.scanner_streams.pop(scanner_id, None)
+        if scanner_id in self._ad_hoc_scanner_ids:
+            self._ad_hoc_scanner_ids.discard(scanner_id)
+            self.scanners.pop(scanner_id, None)
+
+    def _leave_aggregation_streams(self, client_id: str):
+        """Remove a client's aggregation interest from all streams"""
+        for stream in list(self.scanner_streams.values()):
+            if stream.aggregation_clients.pop(client_id, None) is not None:
+                self._release_stream(stream)
+
+    async def _scanner_streaming_task(self, stream: ScannerStream):
+        """Background task re-scanning changed symbols and streaming result deltas"""
+        scanner_id = stream.scanner.scanner_id
         try:
-            while subscription.active:
+            while stream.active:
                 try:
-                    # TODO: Load scanner configuration from database
-                    # For now, we'll use a mock configuration
-
-                    # Mock scanner run
-                    await asyncio.sleep(subscription.interval_seconds)
+                    delta = await self.scanner_engine.rescan(stream.scan)
 
                     # Update last run time
-                    subscription.last_run = datetime.utcnow()
-
-                    # Send mock results
-                    await self.websocket_manager.send_personal_message({
-                        "type": "scanner_results",
-                        "scanner_id": subscription.scanner_id,
-                        "results": {
-                            "scanner_id": subscription.scanner_id,
-                            "scanner_name": f"Scanner {subscription.scanner_id}",
-                            "scan_timestamp": datetime.utcnow().isoformat(),
-                            "results": [],
-                            "total_matches": 0,
-                            "total_scanned": 0,
-                            "scan_duration_ms": 100,
-                            "filters_applied": 0,
-                            "config_hash": "mock",
-                            "cache_hit": False
-                        },
-                        "timestamp": datetime.utcnow().isoformat()
-                    }, subscription.client_id)
+                    now = datetime.utcnow()
+                    subscribers = list(stream.subscribers.values())
+                    for subscription in subscribers:
+                        subscription.last_run = now
+
+                    if delta:
+                        message = {
+                            "type": "scanner_delta",
+                            "scanner_id": scanner_id,
+                            **delta.to_message(),
+                            "timestamp": now.isoformat()
+                        }
+                        await self.websocket_manager.send_to_clients(
+                            [subscription.client_id for subscription in subscribers], message
+                        )
+
+                        await self._process_scanner_alerts(stream)
+
+                    await asyncio.sleep(stream.interval_seconds)
 
                 except asyncio.CancelledError:
                     break
@@ -399,11 +535,16 @@ class ScannerWebSocketManager:
 
         except asyncio.CancelledError:
             pass
-        finally:
-            subscription.active = False
+
+    async def _process_scanner_alerts(self, stream: ScannerStream):
+        """Feed changed scanner results to the alert system"""
+        scanner = stream.scanner
+        if scanner.alert_config and scanner.alert_config.enabled:
+            response = self.scanner_engine.stream_response(stream.scan, scanner.scanner_id)
+            await self.alert_system.process_scanner_results(scanner, response)
 
     async def _aggregation_streaming_task(self, client_id: str):
-        """Background task for streaming aggregated results"""
+        """Background task streaming changes to aggregated results"""
         try:
             while client_id in self.aggregation_subscriptions:
                 try:
@@ -415,14 +556,43 @@ class ScannerWebSocketManager:
                     # Update last run time
                     config["last_run"] = datetime.utcnow()
 
-                    # TODO: Run actual aggregation
-                    # For now, send mock aggregated results
-                    await self.websocket_manager.send_personal_message({
-                        "type": "aggregated_results",
-                        "scanner_ids": config["scanner_ids"],
-                        "results": [],
-                        "timestamp": datetime.utcnow().isoformat()
-                    }, client_id)
+                    # Aggregate the current results of the scanners' standing scans
+                    scanner_results = [
+                        (stream.scanner, self.scanner_engine.stream_response(stream.scan, scanner_id))
+                        for scanner_id in config["scanner_ids"]
+                        for stream in [self.scanner_streams.get(scanner_id)]
+                        if stream and stream.scan.version is not None
+                    ]
+                    aggregated = await self.aggregation_service.aggregate_scanner_results(
+                        scanner_results, force_refresh=True
+                    )
+
+                    results = {result.symbol: result for result in aggregated}
+                    ranking = {symbol: rank for rank, symbol in enumerate(results, start=1)}
+                    previous = self._aggregation_rankings.get(client_id, {})
+                    self._aggregation_rankings[client_id] = ranking
+
+                    entered, exited, moved = diff_rankings(previous, ranking)
+                    if entered or exited or moved:
+                        await self.websocket_manager.send_personal_message({
+                            "type": "aggregated_delta",
+                            "scanner_ids": config["scanner_ids"],
+                            "entered": [
+                                {
+                                    "symbol": symbol,
+                                    "rank": ranking[symbol],
+                                    "aggregate_score": float(results[symbol].aggregate_score),
+                                    "scanner_count": results[symbol].scanner_count
+                                }
+                                for symbol in entered
+                            ],
+                            "exited": exited,
+                            "moved": [
+                                {"symbol": symbol, "rank": ranking[symbol], "previous_rank": previous[symbol]}
+                                for symbol in moved
+                            ],
+                            "timestamp": datetime.utcnow().isoformat()
+                        }, client_id)
 
                 except asyncio.CancelledError:
                     break
@@ -456,9 +626,10 @@ class ScannerWebSocketManager:
             }
 
             # Send to subscribed clients
-            for client_id, scanner_ids in self.alert_subscriptions.items():
-                if alert.scanner_id in scanner_ids:
-                    await self.websocket_manager.send_personal_message(alert_message, client_id)
+            await self.websocket_manager.send_to_clients([
+                client_id for client_id, scanner_ids in self.alert_subscriptions.items()
+                if alert.scanner_id in scanner_ids
+            ], alert_message)
 
         except Exception as e:
             logger.error(f"Error handling scanner alert broadcast: {e}")
@@ -483,6 +654,15 @@ class ScannerWebSocketManager:
                     self._scanner_tasks[task_key].cancel()
                     del self._scanner_tasks[task_key]
 
+            # Leave scanner streams
+            for scanner_id in self.scanner_subscriptions.get(client_id, {}):
+                stream = self.scanner_streams.get(scanner_id)
+                if stream:
+                    stream.subscribers.pop(client_id, None)
+                    self._release_stream(stream)
+            self._leave_aggregation_streams(client_id)
+            self._aggregation_rankings.pop(client_id, None)
+
             # Remove subscriptions
             if client_id in self.scanner_subscriptions:
                 del self.scanner_subscriptions[client_id]
@@ -505,7 +685,8 @@ class ScannerWebSocketManager:
                 "total_scanner_subscriptions": sum(len(subs) for subs in self.scanner_subscriptions.values()),
                 "total_alert_subscriptions": sum(len(subs) for subs in self.alert_subscriptions.values()),
                 "total_aggregation_subscriptions": len(self.aggregation_subscriptions),
-                "active_tasks": len(self._scanner_tasks),
+                "active_tasks": len(self._scanner_tasks) + len(self.scanner_streams),
+                "active_streams": len(self.scanner_streams),
                 "connected_clients": len(set(
                     list(self.scanner_subscriptions.keys()) +
                     list(self.alert_subscriptions.keys()) +
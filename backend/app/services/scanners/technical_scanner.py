@@ -285,6 +285,267 @@ class TechnicalIndicatorCalculator:
         return smoothed[period-1:]
 
 
+class PanelIndicatorCalculator:
+    """
+    Latest technical indicators for a whole universe at once
+
+    Takes (symbols x bars) arrays, one row per symbol with a common bar
+    count, and reproduces the TechnicalIndicatorCalculator formulas with
+    array operations along the bar axis, so each indicator is one pass over
+    the panel instead of one Python call per symbol. Every method returns
+    a 1-D array (or dict of arrays) with one value per symbol.
+    """
+
+    MA_PERIODS = (5, 10, 20, 50, 100, 200)
+
+    def __init__(self, close: np.ndarray, high: Optional[np.ndarray] = None,
+                 low: Optional[np.ndarray] = None, volume: Optional[np.ndarray] = None):
+        self.close = self._panel(close)
+        self.high = self._panel(high) if high is not None else None
+        self.low = self._panel(low) if low is not None else None
+        self.volume = self._panel(volume) if volume is not None else None
+
+        for name in ('high', 'low', 'volume'):
+            values = getattr(self, name)
+            if values is not None and values.shape != self.close.shape:
+                raise ValueError(f"{name} panel shape {values.shape} does not match close {self.close.shape}")
+
+    @staticmethod
+    def _panel(values) -> np.ndarray:
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 2:
+            raise ValueError("Indicator panels must be 2-D (symbols x bars)")
+        return values
+
+    @property
+    def symbol_count(self) -> int:
+        return self.close.shape[0]
+
+    @property
+    def bar_count(self) -> int:
+        return self.close.shape[1]
+
+    @property
+    def has_ohlc(self) -> bool:
+        return self.high is not None and self.low is not None
+
+    def _full(self, value: float) -> np.ndarray:
+        return np.full(self.symbol_count, value)
+
+    @staticmethod
+    def _ema(values: np.ndarray, period: int) -> np.ndarray:
+        """EMA along bars seeded with the first bar, as in _calculate_ema"""
+        alpha = 2 / (period + 1)
+        bars = np.ascontiguousarray(values.T)  # step through bars, all symbols per step
+        ema = np.empty_like(bars)
+        ema[0] = bars[0]
+
+        for i in range(1, len(bars)):
+            ema[i] = alpha * bars[i] + (1 - alpha) * ema[i-1]
+
+        return ema.T
+
+    @staticmethod
+    def _smooth(values: np.ndarray, period: int) -> np.ndarray:
+        """Wilder smoothing along bars, as in _smooth_data"""
+        if values.shape[1] < period:
+            return values
+
+        bars = np.ascontiguousarray(values.T)
+        smoothed = np.empty((len(bars) - period + 1, bars.shape[1]))
+        smoothed[0] = bars[:period].mean(axis=0)
+
+        for i in range(period, len(bars)):
+            smoothed[i-period+1] = (smoothed[i-period] * (period - 1) + bars[i]) / period
+
+        return smoothed.T
+
+    def _true_range(self) -> np.ndarray:
+        high, low, close = self.high, self.low, self.close
+        return np.maximum(high[:, 1:] - low[:, 1:],
+                          np.maximum(np.abs(high[:, 1:] - close[:, :-1]), np.abs(low[:, 1:] - close[:, :-1])))
+
+    def calculate_rsi(self, period: int = 14) -> np.ndarray:
+        """Calculate RSI (Relative Strength Index)"""
+        if self.bar_count < period + 1:
+            return self._full(50.0)
+
+        deltas = np.diff(self.close[:, -(period + 1):], axis=1)
+        avg_gain = np.where(deltas > 0, deltas, 0).mean(axis=1)
+        avg_loss = np.where(deltas < 0, -deltas, 0).mean(axis=1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        return np.where(avg_loss == 0, 100.0, rsi)
+
+    def calculate_macd(self, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, np.ndarray]:
+        """Calculate MACD (Moving Average Convergence Divergence)"""
+        if self.bar_count < slow + signal:
+            return {'macd': self._full(0.0), 'signal': self._full(0.0), 'histogram': self._full(0.0)}
+
+        macd_line = self._ema(self.close, fast) - self._ema(self.close, slow)
+        signal_line = self._ema(macd_line, signal)
+
+        return {
+            'macd': macd_line[:, -1],
+            'signal': signal_line[:, -1],
+            'histogram': macd_line[:, -1] - signal_line[:, -1]
+        }
+
+    def calculate_bollinger_bands(self, period: int = 20, std_dev: float = 2.0) -> Dict[str, np.ndarray]:
+        """Calculate Bollinger Bands"""
+        current_price = self.close[:, -1] if self.bar_count else self._full(0.0)
+        if self.bar_count < period:
+            return {
+                'upper': current_price,
+                'middle': current_price,
+                'lower': current_price,
+                'position': np.full(self.symbol_count, 'middle', dtype=object),
+                'width': self._full(0.0)
+            }
+
+        window = self.close[:, -period:]
+        middle = window.mean(axis=1)
+        std = window.std(axis=1)
+
+        upper = middle + (std_dev * std)
+        lower = middle - (std_dev * std)
+
+        position = np.select([current_price > upper, current_price < lower], ['above', 'below'], 'middle')
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            width = np.where(middle != 0, ((upper - lower) / middle) * 100, 0.0)
+
+        return {
+            'upper': upper,
+            'middle': middle,
+            'lower': lower,
+            'position': position.astype(object),
+            'width': width
+        }
+
+    def calculate_moving_averages(self) -> Dict[str, np.ndarray]:
+        """Calculate various moving averages"""
+        results = {}
+
+        for period in self.MA_PERIODS:
+            if self.bar_count >= period:
+                results[f'sma_{period}'] = self.close[:, -period:].mean(axis=1)
+                results[f'ema_{period}'] = self._ema(self.close, period)[:, -1]
+
+        return results
+
+    def calculate_adx(self, period: int = 14) -> np.ndarray:
+        """Calculate ADX (Average Directional Index)"""
+        if self.bar_count < period + 1:
+            return self._full(0.0)
+
+        high, low = self.high, self.low
+        up_move = high[:, 1:] - high[:, :-1]
+        down_move = low[:, :-1] - low[:, 1:]
+
+        plus_dm = np.where(up_move > down_move, np.maximum(up_move, 0), 0)
+        minus_dm = np.where(down_move > up_move, np.maximum(down_move, 0), 0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            atr = self._smooth(self._true_range(), period)
+            plus_di = 100 * self._smooth(plus_dm, period) / atr
+            minus_di = 100 * self._smooth(minus_dm, period) / atr
+
+            dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di + 1e-10)
+            adx = self._smooth(dx, period)
+
+        return adx[:, -1]
+
+    def calculate_stochastic(self, k_period: int = 14, d_period: int = 3) -> Dict[str, np.ndarray]:
+        """Calculate Stochastic Oscillator"""
+        if self.bar_count < k_period:
+            return {'k': self._full(50.0), 'd': self._full(50.0),
+                    'signal': np.full(self.symbol_count, 'neutral', dtype=object)}
+
+        # %K for the last d_period bars (fewer when the history is short)
+        k_count = min(d_period, self.bar_count - k_period + 1)
+        bars = k_period + k_count - 1
+        lowest_low = np.lib.stride_tricks.sliding_window_view(self.low[:, -bars:], k_period, axis=1).min(axis=2)
+        highest_high = np.lib.stride_tricks.sliding_window_view(self.high[:, -bars:], k_period, axis=1).max(axis=2)
+
+        k_values = 100 * (self.close[:, -k_count:] - lowest_low) / (highest_high - lowest_low + 1e-10)
+
+        current_k = k_values[:, -1]
+        current_d = k_values.mean(axis=1) if k_count == d_period else self._full(50.0)
+
+        signal = np.select(
+            [(current_k < 20) & (current_d < 20), (current_k > 80) & (current_d > 80)],
+            ['oversold', 'overbought'], 'neutral'
+        )
+
+        return {
+            'k': current_k,
+            'd': current_d,
+            'signal': signal.astype(object)
+        }
+
+    def calculate_atr(self, period: int = 14) -> np.ndarray:
+        """Calculate ATR (Average True Range)"""
+        if self.bar_count < period + 1:
+            return self._full(0.0)
+
+        return self._true_range()[:, -period:].mean(axis=1)
+
+    def calculate_obv(self) -> np.ndarray:
+        """Calculate OBV (On-Balance Volume)"""
+        if self.bar_count < 2 or self.volume is None:
+            return self._full(0.0)
+
+        direction = np.sign(np.diff(self.close, axis=1))
+        return (direction * self.volume[:, 1:]).sum(axis=1)
+
+    def calculate_williams_r(self, period: int = 14) -> np.ndarray:
+        """Calculate Williams %R"""
+        if self.bar_count < period:
+            return self._full(0.0)
+
+        highest_high = self.high[:, -period:].max(axis=1)
+        lowest_low = self.low[:, -period:].min(axis=1)
+        price_range = highest_high - lowest_low
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            williams_r = -100 * (highest_high - self.close[:, -1]) / price_range
+        return np.where(price_range == 0, 0.0, williams_r)
+
+    def calculate_comprehensive_indicators(self) -> Dict[str, np.ndarray]:
+        """
+        Every indicator of TechnicalScanner.calculate_comprehensive_indicators,
+        keyed the same way (stochastic 'signal' replaces the MACD one there too)
+        """
+        if not self.bar_count:
+            return {}
+
+        indicators = {'rsi': self.calculate_rsi()}
+        indicators.update(self.calculate_macd())
+        indicators.update(self.calculate_bollinger_bands())
+        indicators.update(self.calculate_moving_averages())
+
+        if self.has_ohlc:
+            indicators['adx'] = self.calculate_adx()
+            indicators.update(self.calculate_stochastic())
+            indicators['atr'] = self.calculate_atr()
+            indicators['williams_r'] = self.calculate_williams_r()
+
+        if self.volume is not None:
+            indicators['obv'] = self.calculate_obv()
+
+        current_price = self.close[:, -1]
+        for period in (20, 50, 200):
+            ma_value = indicators.get(f'sma_{period}', self._full(0.0))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                indicators[f'price_vs_sma{period}'] = np.where(
+                    ma_value == 0, 0.0, ((current_price - ma_value) / ma_value) * 100
+                )
+
+        return indicators
+
+
 class TechnicalScanner:
     """
     Scanner specialized for technical analysis
@@ -530,6 +791,31 @@ class TechnicalScanner:
             logger.error(f"Error calculating indicators for {symbol}: {e}")
             return {}
 
+    def calculate_universe_indicators(self, symbols: List[str],
+                                      ohlcv_panel: Dict[str, np.ndarray]) -> Dict[str, Dict[str, Any]]:
+        """
+        Calculate comprehensive technical indicators for many symbols at once
+
+        ohlcv_panel holds (symbols x bars) 'close' and optional 'high', 'low'
+        and 'volume' arrays, rows in the order of symbols. Returns the same
+        per-symbol dicts as calculate_comprehensive_indicators.
+        """
+        try:
+            panel = PanelIndicatorCalculator(
+                ohlcv_panel['close'], ohlcv_panel.get('high'), ohlcv_panel.get('low'), ohlcv_panel.get('volume')
+            )
+            indicators = panel.calculate_comprehensive_indicators()
+
+            columns = {name: values.tolist() for name, values in indicators.items()}
+            return {
+                symbol: {name: values[row] for name, values in columns.items()}
+                for row, symbol in enumerate(symbols)
+            }
+
+        except Exception as e:
+            logger.error(f"Error calculating panel indicators for {len(symbols)} symbols: {e}")
+            return {}
+
     def _calculate_price_vs_ma(self, prices: List[float], ma_value: float) -> float:
         """Calculate price position relative to moving average"""
         if not prices or ma_value == 0:
@@ -9,6 +9,7 @@ import talib
 import numpy as np
 from typing import Optional, Dict, List, Any
 from datetime import datetime, timedelta
+from pathlib import Path
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
@@ -18,6 +19,8 @@ from app.models.stock_schemas import (
     StockPrice, TechnicalIndicators, LSTMPrediction,
     StockAnalysisResponse, RecommendationType
 )
+from app.core.bar_store import BarStore, FakeBarProvider
+from app.core.batch_fetcher import BatchCoalescer
 from app.core.config import settings
 from app.core.external_rate_limiting import rate_limit_external_api
 from app.services.alpha_vantage_service import alpha_vantage_service
@@ -26,12 +29,38 @@ from app.services.technical_analysis_service import technical_analysis_service
 
 class StockService(BaseService):
     """Stock analysis service with comprehensive market data"""
-    
+
+    # Shared by every instance in the process: one bar store, so updates of a
+    # series are serialized by one lock, and one pair of coalescers, so
+    # concurrent requests from any instance merge into the same bulk fetches
+    bar_store: Optional[BarStore] = None
+    _quote_batches: Optional[BatchCoalescer] = None
+    _range_batches: Optional[BatchCoalescer] = None
+
     def __init__(self):
         super().__init__()
         self.executor = ThreadPoolExecutor(max_workers=4)
         self.allowed_periods = ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y"]
         self.allowed_intervals = ["1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h", "1d", "5d", "1wk", "1mo", "3mo"]
+        if StockService.bar_store is None:
+            self._init_shared()
+
+    def _init_shared(self):
+        StockService._quote_batches = BatchCoalescer(
+            self._bulk_fetch_quotes,
+            max_batch=settings.YFINANCE_BULK_MAX_SYMBOLS,
+            max_wait=settings.BULK_COALESCE_WINDOW_MS / 1000
+        )
+        StockService._range_batches = BatchCoalescer(
+            self._bulk_fetch_ranges,
+            max_batch=settings.YFINANCE_BULK_MAX_SYMBOLS,
+            max_wait=settings.BULK_COALESCE_WINDOW_MS / 1000
+        )
+        StockService.bar_store = BarStore(
+            Path(settings.BAR_STORE_PATH),
+            FakeBarProvider() if settings.MARKET_DATA_PROVIDER == "fake" else self._fetch_yfinance_range,
+            rebuild_days=settings.BAR_STORE_REBUILD_DAYS
+        )
 
     @rate_limit_external_api("yfinance", lambda self, symbol, *args, **kwargs: symbol)
     async def _fetch_yfinance_history(self, symbol: str, period: str, interval: str = "1d"):
@@ -43,6 +72,179 @@ class StockService(BaseService):
             lambda: ticker.history(period=period, interval=interval)
         )
 
+    @rate_limit_external_api("yfinance", lambda self, *args, **kwargs: "bulk")
+    async def _fetch_yfinance_bulk(self, symbols: List[str], **download_kwargs) -> Dict[str, pd.DataFrame]:
+        """Rate-limited multi-ticker yfinance download, split into one frame per symbol
+
+        One provider request covers every symbol, so it counts once against
+        the yfinance budget.
+        """
+        loop = asyncio.get_event_loop()
+        data = await loop.run_in_executor(
+            self.executor,
+            lambda: yf.download(
+                tickers=symbols, group_by="ticker", auto_adjust=True,
+                progress=False, threads=True, **download_kwargs
+            )
+        )
+
+        if data is None or data.empty:
+            return {}
+        if not isinstance(data.columns, pd.MultiIndex):
+            return {symbols[0]: data} if len(symbols) == 1 else {}
+
+        frames = {}
+        tickers = set(data.columns.get_level_values(0))
+        for symbol in symbols:
+            if symbol in tickers:
+                frame = data[symbol].dropna(how="all")
+                if not frame.empty:
+                    frames[symbol] = frame
+        return frames
+
+    async def _bulk_fetch_ranges(self, keys: List[tuple]) -> Dict[tuple, pd.DataFrame]:
+        """One download per distinct (interval, start, end) among the requested ranges"""
+        groups: Dict[tuple, List[str]] = {}
+        for symbol, interval, start, end in keys:
+            groups.setdefault((interval, start, end), []).append(symbol)
+
+        results = {}
+        for (interval, start, end), symbols in groups.items():
+            if start is None:
+                frames = await self._fetch_yfinance_bulk(symbols, period="max", interval=interval)
+            else:
+                frames = await self._fetch_yfinance_bulk(symbols, start=start, end=end, interval=interval)
+            for symbol in symbols:
+                results[(symbol, interval, start, end)] = frames.get(symbol)
+        return results
+
+    async def _fetch_yfinance_range(self, symbol: str, interval: str,
+                                    start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]):
+        """History for a date range (open-ended bounds allowed), batched with concurrent requests
+
+        Bar store updates for many symbols usually ask for the same range
+        (the same period start, or the same last stored bar), so they share
+        one bulk download.
+        """
+        return await self._range_batches.get((symbol, interval, start, end))
+
+    async def _bulk_fetch_quotes(self, symbols: List[str]) -> Dict[str, StockPrice]:
+        """Latest daily bar and previous close for many symbols in one download"""
+        frames = await self._fetch_yfinance_bulk(symbols, period="5d", interval="1d")
+
+        prices = {}
+        for symbol, hist in frames.items():
+            hist = hist.dropna(subset=["Close"])
+            if hist.empty:
+                continue
+            current = hist.iloc[-1]
+            current_price = self.safe_float_extract(current['Close'])
+            previous_close = self.safe_float_extract(hist['Close'].iloc[-2]) if len(hist) > 1 else current_price
+            change = current_price - previous_close
+
+            prices[symbol] = StockPrice(
+                symbol=symbol,
+                current_price=current_price,
+                previous_close=previous_close,
+                change=self.format_percentage(change),
+                change_percent=self.format_percentage(change / previous_close * 100 if previous_close != 0 else 0),
+                day_high=self.safe_float_extract(current['High']),
+                day_low=self.safe_float_extract(current['Low']),
+                volume=int(self.safe_float_extract(current['Volume'])),
+                market_cap=None,
+                timestamp=datetime.utcnow()
+            )
+        return prices
+
+    def _valid_symbols(self, symbols: List[str]) -> List[str]:
+        """Validated, de-duplicated symbols; invalid ones are logged and skipped"""
+        valid = []
+        for symbol in symbols:
+            try:
+                valid.append(self.validate_symbol(symbol))
+            except ValueError as e:
+                logger.warning(f"Skipping symbol {symbol!r}: {e}")
+        return list(dict.fromkeys(valid))
+
+    async def get_prices(self, symbols: List[str]) -> Dict[str, Optional[StockPrice]]:
+        """Current prices for many symbols
+
+        Cached quotes are read in one batch; the rest are fetched together
+        with any other concurrent requests in bulk downloads of up to
+        YFINANCE_BULK_MAX_SYMBOLS tickers. Bulk quotes carry no market cap,
+        so they are cached apart from single-symbol prices, which are
+        preferred when present. Invalid symbols are skipped.
+        """
+        symbols = self._valid_symbols(symbols)
+        price_keys = {symbol: self.create_cache_key("stock_price", symbol) for symbol in symbols}
+        quote_keys = {symbol: self.create_cache_key("stock_quote", symbol) for symbol in symbols}
+
+        cached = await self.batch_get_cached(list(price_keys.values()) + list(quote_keys.values()))
+        prices = {
+            symbol: cached.get(price_keys[symbol]) or cached.get(quote_keys[symbol])
+            for symbol in symbols
+        }
+
+        missing = [symbol for symbol, price in prices.items() if price is None]
+        if missing:
+            fetched = await self._quote_batches.get_many(missing)
+            prices.update(fetched)
+            await self.batch_set_cached(
+                {quote_keys[symbol]: price for symbol, price in fetched.items() if price is not None}, ttl=60
+            )
+
+        return prices
+
+    async def get_histories(self, symbols: List[str], period: str = "1y",
+                            interval: str = "1d") -> Dict[str, pd.DataFrame]:
+        """OHLCV history for many symbols through the bar store
+
+        Missing ranges of all symbols are fetched together in bulk downloads.
+        Invalid symbols are skipped.
+        """
+        symbols = self._valid_symbols(symbols)
+        period = self.validate_timeframe(period, self.allowed_periods)
+        interval = self.validate_timeframe(interval, self.allowed_intervals)
+
+        frames = await asyncio.gather(*(self._get_history_frame(symbol, period, interval) for symbol in symbols))
+        return dict(zip(symbols, frames))
+
+    async def _get_history_frame(self, symbol: str, period: str, interval: str = "1d") -> pd.DataFrame:
+        """OHLCV history from the local bar store, which fetches only missing ranges"""
+        try:
+            bars = await self.bar_store.get_bars(symbol, interval, period)
+            return bars.to_frame() if bars is not None else pd.DataFrame()
+        except Exception as e:
+            logger.warning(f"Bar store unavailable for {symbol}: {e}, fetching directly")
+            return await self._fetch_yfinance_history(symbol, period, interval)
+
+    def _history_records(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Serialize OHLCV rows column-wise (NaN prices become 0.0, like safe_float_extract)"""
+        columns = {
+            name: np.nan_to_num(df[column].to_numpy(dtype=float), nan=0.0).tolist()
+            for name, column in (("open", "Open"), ("high", "High"), ("low", "Low"), ("close", "Close"))
+        }
+        adjusted = df['Adj Close'] if 'Adj Close' in df.columns else df['Close']
+        columns["adjusted_close"] = np.nan_to_num(adjusted.to_numpy(dtype=float), nan=0.0).tolist()
+        volumes = df['Volume'].fillna(0).to_numpy(dtype=float).astype(np.int64).tolist()
+        dates = df.index.strftime("%Y-%m-%d %H:%M:%S")
+
+        return [
+            {
+                "date": date,
+                "open": open_,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": volume,
+                "adjusted_close": adjusted_close,
+            }
+            for date, open_, high, low, close, volume, adjusted_close in zip(
+                dates, columns["open"], columns["high"], columns["low"], columns["close"],
+                volumes, columns["adjusted_close"]
+            )
+        ]
+
     @rate_limit_external_api("yfinance", lambda self, symbol, *args, **kwargs: symbol)
     async def _fetch_yfinance_info(self, symbol: str):
         """Rate-limited wrapper for yfinance info calls"""
@@ -268,8 +470,8 @@ class StockService(BaseService):
         
         async def fetch_indicators():
             try:
-                # Get historical data with rate limiting
-                df = await self._fetch_yfinance_history(symbol, period, "1d")
+                # Get historical data from the local bar store
+                df = await self._get_history_frame(symbol, period, "1d")
                 
                 if df.empty or len(df) < 50:
                     logger.warning(f"yfinance returned insufficient data for {symbol}, trying Alpha Vantage fallback")
@@ -590,8 +792,8 @@ class StockService(BaseService):
         
         async def fetch_history():
             try:
-                # Get historical data with rate limiting
-                df = await self._fetch_yfinance_history(symbol, period, interval)
+                # Get historical data from the local bar store
+                df = await self._get_history_frame(symbol, period, interval)
                 
                 if df.empty:
                     logger.warning(f"yfinance returned empty data for {symbol}, trying Alpha Vantage fallback")
@@ -599,19 +801,7 @@ class StockService(BaseService):
                     if df is None or df.empty:
                         return None
                 
-                history = []
-                for index, row in df.iterrows():
-                    history.append({
-                        "date": index.strftime("%Y-%m-%d %H:%M:%S"),
-                        "open": self.safe_float_extract(row['Open']),
-                        "high": self.safe_float_extract(row['High']),
-                        "low": self.safe_float_extract(row['Low']),
-                        "close": self.safe_float_extract(row['Close']),
-                        "volume": int(row['Volume']),
-                        "adjusted_close": self.safe_float_extract(row.get('Adj Close', row['Close']))
-                    })
-                
-                return history
+                return self._history_records(df)
                 
             except Exception as e:
                 logger.error(f"yfinance error fetching price history for {symbol}: {e}, trying Alpha Vantage fallback")
@@ -620,19 +810,7 @@ class StockService(BaseService):
                     if df is None or df.empty:
                         return None
 
-                    history = []
-                    for index, row in df.iterrows():
-                        history.append({
-                            "date": index.strftime("%Y-%m-%d %H:%M:%S"),
-                            "open": self.safe_float_extract(row['Open']),
-                            "high": self.safe_float_extract(row['High']),
-                            "low": self.safe_float_extract(row['Low']),
-                            "close": self.safe_float_extract(row['Close']),
-                            "volume": int(row['Volume']),
-                            "adjusted_close": self.safe_float_extract(row.get('Adj Close', row['Close']))
-                        })
-
-                    return history
+                    return self._history_records(df)
                 except Exception as fallback_e:
                     logger.error(f"Alpha Vantage fallback also failed for {symbol}: {fallback_e}")
                     return None
@@ -730,8 +908,8 @@ class StockService(BaseService):
 
         async def fetch_enhanced_indicators():
             try:
-                # Get historical data with rate limiting
-                df = await self._fetch_yfinance_history(symbol, period, "1d")
+                # Get historical data from the local bar store
+                df = await self._get_history_frame(symbol, period, "1d")
 
                 if df.empty or len(df) < 50:
                     logger.warning(f"yfinance returned insufficient data for {symbol}, trying Alpha Vantage fallback")
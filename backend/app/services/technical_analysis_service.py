@@ -14,6 +14,7 @@ from loguru import logger
 from app.services.base_service import BaseService
 from app.models.stock_schemas import TechnicalIndicators, RecommendationType
 from app.core.config import settings
+from app.core.streaming_indicators import StreamingIndicatorEngine
 
 
 class TechnicalAnalysisService(BaseService):
@@ -28,6 +29,8 @@ class TechnicalAnalysisService(BaseService):
             'volume': ['AD', 'ADOSC'],
             'pattern': ['CDL2CROWS', 'CDL3BLACKCROWS', 'CDL3INSIDE', 'CDL3LINESTRIKE', 'CDL3OUTSIDE', 'CDL3STARSINSOUTH', 'CDL3WHITESOLDIERS']
         }
+        # Live indicator values, fed bar by bar by the market data streamer
+        self.streaming_indicators = StreamingIndicatorEngine()
 
     def calculate_talib_indicators(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Calculate TA-Lib indicators"""
@@ -150,6 +153,10 @@ class TechnicalAnalysisService(BaseService):
             logger.error(f"Error calculating ta library indicators: {e}")
             return {}
 
+    def get_streaming_indicators(self, symbol: str) -> Dict[str, Optional[float]]:
+        """Latest incrementally updated indicators for a streamed symbol (empty if not streamed)"""
+        return self.streaming_indicators.latest(symbol.upper())
+
     def calculate_comprehensive_indicators(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Calculate comprehensive indicators using both libraries"""
         try:
@@ -0,0 +1,307 @@
+"""
+WebSocket fan-out engine shared by the WebSocket managers.
+Each update is serialized once and queued on every target connection; a
+writer task per connection drains its own bounded queue, so sends run
+concurrently and a slow socket only delays itself.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+SLOW_CONSUMER_POLICIES = ("coalesce", "drop_oldest")
+
+
+@dataclass(frozen=True)
+class Frame:
+    """A serialized message waiting in a connection's send queue."""
+    text: str
+    enqueued_at: float  # time.monotonic()
+    droppable: bool = True
+
+
+class FanoutConnection:
+    """Send queue, writer task and lag metrics of one WebSocket.
+
+    The queue holds at most ``max_queue`` frames. When it is full, the
+    oldest droppable frame is discarded for the new one; if only
+    undroppable frames are queued the consumer is too slow to keep and the
+    connection is closed. Under the ``coalesce`` policy a keyed frame
+    replaces a pending frame with the same key in place, so a slow client
+    gets the latest update for that key at its original queue position.
+    """
+
+    def __init__(self, connection_id: str, websocket: WebSocket, engine: 'FanoutEngine',
+                 max_queue: int, policy: str):
+        self.connection_id = connection_id
+        self.websocket = websocket
+        self.engine = engine
+        self.max_queue = max_queue
+        self.policy = policy
+        self.connected_at = time.monotonic()
+
+        self._pending: 'OrderedDict[Hashable, Frame]' = OrderedDict()
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._sending: Optional[Frame] = None
+
+        # Metrics
+        self.sent = 0
+        self.bytes_sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_queue_depth = 0
+        self.last_lag = 0.0
+        self.avg_lag = 0.0
+        self.max_lag = 0.0
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._writer())
+
+    def stop(self):
+        # A writer stopping its own connection after a failed send exits on its own
+        if self._task and self._task is not asyncio.current_task():
+            self._task.cancel()
+        self._task = None
+        self._pending.clear()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    @property
+    def current_lag(self) -> float:
+        """Seconds the oldest unsent frame (in flight or queued) has been waiting."""
+        oldest = self._sending or next(iter(self._pending.values()), None)
+        if oldest is None:
+            return 0.0
+        return time.monotonic() - oldest.enqueued_at
+
+    def enqueue(self, frame: Frame, key: Optional[Hashable] = None) -> bool:
+        """Queue a frame; False when the connection is too slow to keep."""
+        if key is not None and self.policy == "coalesce" and key in self._pending:
+            previous = self._pending[key]
+            self._pending[key] = Frame(frame.text, previous.enqueued_at, frame.droppable)
+            self.coalesced += 1
+            return True
+
+        if len(self._pending) >= self.max_queue and not self._drop_oldest():
+            return False
+
+        if key is None or self.policy != "coalesce":
+            key = next(self.engine.sequence)
+        self._pending[key] = frame
+        if len(self._pending) > self.max_queue_depth:
+            self.max_queue_depth = len(self._pending)
+        if not self._ready.is_set():
+            self._ready.set()
+        return True
+
+    def _drop_oldest(self) -> bool:
+        for key, frame in self._pending.items():
+            if frame.droppable:
+                del self._pending[key]
+                self.dropped += 1
+                return True
+        return False
+
+    async def _writer(self):
+        try:
+            while True:
+                await self._ready.wait()
+                while self._pending:
+                    _, self._sending = self._pending.popitem(last=False)
+                    await self.websocket.send_text(self._sending.text)
+                    self._record_send(self._sending)
+                    self._sending = None
+                self._ready.clear()
+
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Send to WebSocket connection {self.connection_id} failed: {e}")
+            await self.engine.close(self.connection_id, e)
+
+    def _record_send(self, frame: Frame):
+        lag = time.monotonic() - frame.enqueued_at
+        self.sent += 1
+        self.bytes_sent += len(frame.text)
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        self.avg_lag = lag if self.sent == 1 else 0.9 * self.avg_lag + 0.1 * lag
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "connection_id": self.connection_id,
+            "policy": self.policy,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "sent": self.sent,
+            "bytes_sent": self.bytes_sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "current_lag_ms": round(self.current_lag * 1000, 3),
+            "last_lag_ms": round(self.last_lag * 1000, 3),
+            "avg_lag_ms": round(self.avg_lag * 1000, 3),
+            "max_lag_ms": round(self.max_lag * 1000, 3),
+        }
+
+
+class FanoutEngine:
+    """Serialize-once, queue-per-connection WebSocket delivery.
+
+    ``publish`` serializes a message once and enqueues the same text on
+    every target connection without awaiting any socket. Broadcast updates
+    are droppable and, with a ``key``, coalesce to the latest pending
+    update under the ``coalesce`` policy; ``droppable=False`` multicasts
+    updates that must all arrive, such as deltas. ``send`` queues a
+    personal message that is never dropped or coalesced. When a send fails or a
+    consumer falls too far behind, the connection is unregistered and
+    ``on_close(connection_id, error)`` is called (sync or async) so the
+    owning manager can clean up its subscriptions.
+    """
+
+    def __init__(self, max_queue: int = 256, policy: str = "coalesce",
+                 on_close: Optional[Callable[[str, Optional[Exception]], Any]] = None):
+        if policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Unknown slow consumer policy: {policy}")
+
+        self.max_queue = max_queue
+        self.policy = policy
+        self.on_close = on_close
+        self.connections: Dict[str, FanoutConnection] = {}
+        self.sequence = count()
+        self._closing: set = set()
+
+        self.messages_published = 0
+        self.frames_enqueued = 0
+        self.slow_consumers_closed = 0
+
+    def register(self, connection_id: str, websocket: WebSocket,
+                 policy: Optional[str] = None) -> FanoutConnection:
+        """Start delivering to a connection, replacing any previous one with the id."""
+        self.unregister(connection_id)
+        connection = FanoutConnection(connection_id, websocket, self, self.max_queue, policy or self.policy)
+        self.connections[connection_id] = connection
+        connection.start()
+        return connection
+
+    def unregister(self, connection_id: str):
+        """Stop delivering to a connection and discard its queue."""
+        connection = self.connections.pop(connection_id, None)
+        if connection:
+            connection.stop()
+
+    def clear(self):
+        """Stop delivering to every connection."""
+        for connection_id in list(self.connections):
+            self.unregister(connection_id)
+
+    @staticmethod
+    def serialize(message: Dict[str, Any]) -> str:
+        return json.dumps(message, default=str)
+
+    def send(self, connection_id: str, message: Dict[str, Any]) -> bool:
+        """Queue a personal message; False when the connection is unknown or closed."""
+        connection = self.connections.get(connection_id)
+        if connection is None:
+            return False
+
+        frame = Frame(self.serialize(message), time.monotonic(), droppable=False)
+        return self._enqueue(connection, frame)
+
+    def publish(self, connection_ids: Iterable[str], message: Dict[str, Any],
+                key: Optional[Hashable] = None, droppable: bool = True) -> int:
+        """Queue one serialized update for many connections; returns how many got it.
+
+        Undroppable updates are never dropped or coalesced, like personal messages.
+        """
+        frame = Frame(self.serialize(message), time.monotonic(), droppable)  # shared by every queue
+        if not droppable:
+            key = None
+        self.messages_published += 1
+
+        delivered = 0
+        for connection_id in list(connection_ids):
+            connection = self.connections.get(connection_id)
+            if connection and self._enqueue(connection, frame, key):
+                delivered += 1
+        return delivered
+
+    def publish_all(self, message: Dict[str, Any], key: Optional[Hashable] = None) -> int:
+        """Queue one serialized update for every connection."""
+        return self.publish(self.connections, message, key)
+
+    def _enqueue(self, connection: FanoutConnection, frame: Frame, key: Optional[Hashable] = None) -> bool:
+        if connection.enqueue(frame, key):
+            self.frames_enqueued += 1
+            return True
+
+        self.slow_consumers_closed += 1
+        logger.warning(f"Closing slow WebSocket consumer {connection.connection_id} "
+                       f"({connection.queue_depth} queued, {connection.current_lag:.1f}s behind)")
+        self.unregister(connection.connection_id)
+
+        task = asyncio.create_task(self._closed(connection, None, code=1013))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+        return False
+
+    async def close(self, connection_id: str, error: Optional[Exception] = None, code: Optional[int] = None):
+        """Unregister a connection, optionally close its socket, and notify the owner."""
+        connection = self.connections.get(connection_id)
+        if connection is None:
+            return
+        self.unregister(connection_id)
+        await self._closed(connection, error, code)
+
+    async def _closed(self, connection: FanoutConnection, error: Optional[Exception], code: Optional[int]):
+        connection_id = connection.connection_id
+        if code is not None:
+            try:
+                await connection.websocket.close(code=code, reason="Slow consumer")
+            except Exception:
+                pass
+
+        if self.on_close:
+            try:
+                result = self.on_close(connection_id, error)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Error cleaning up WebSocket connection {connection_id}: {e}")
+
+    def get_connection_metrics(self, connection_id: str) -> Optional[Dict[str, Any]]:
+        connection = self.connections.get(connection_id)
+        return connection.get_metrics() if connection else None
+
+    def get_stats(self, top: int = 10) -> Dict[str, Any]:
+        """Engine totals plus the connections that are furthest behind."""
+        connections = list(self.connections.values())
+        lagging = sorted(connections, key=lambda c: c.current_lag, reverse=True)[:top]
+
+        return {
+            "connections": len(connections),
+            "policy": self.policy,
+            "max_queue": self.max_queue,
+            "messages_published": self.messages_published,
+            "frames_enqueued": self.frames_enqueued,
+            "frames_sent": sum(c.sent for c in connections),
+            "frames_dropped": sum(c.dropped for c in connections),
+            "frames_coalesced": sum(c.coalesced for c in connections),
+            "queued_frames": sum(c.queue_depth for c in connections),
+            "slow_consumers_closed": self.slow_consumers_closed,
+            "max_lag_ms": round(max((c.current_lag for c in connections), default=0.0) * 1000, 3),
+            "most_lagging": [c.get_metrics() for c in lagging if c.current_lag > 0],
+        }
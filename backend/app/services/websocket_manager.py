@@ -4,11 +4,13 @@ WebSocket connection manager for real-time market data streaming with Redis pub/
 
 from typing import Dict, List, Set, Optional
 from fastapi import WebSocket
-import json
 from datetime import datetime
 import asyncio
 from loguru import logger
 
+from app.core.config import settings
+from app.services.websocket_fanout import FanoutEngine
+
 
 class ConnectionManager:
     """Manages WebSocket connections and real-time data streaming with Redis integration"""
@@ -25,12 +27,20 @@ class ConnectionManager:
 
         # Redis streamer (will be set externally)
         self.redis_streamer: Optional[object] = None
+
+        # Delivery: one serialization per update, per-client send queues
+        self.fanout = FanoutEngine(
+            max_queue=settings.WS_SEND_QUEUE_SIZE,
+            policy=settings.WS_SLOW_CONSUMER_POLICY,
+            on_close=lambda client_id, error: self.disconnect(client_id)
+        )
     
     async def connect(self, websocket: WebSocket, client_id: str):
         """Accept new WebSocket connection"""
         await websocket.accept()
         self.active_connections[client_id] = websocket
         self.subscriptions[client_id] = set()
+        self.fanout.register(client_id, websocket)
         
         logger.info(f"WebSocket client {client_id} connected")
         
@@ -54,18 +64,21 @@ class ConnectionManager:
             
             # Remove connection
             del self.active_connections[client_id]
+            self.fanout.unregister(client_id)
             logger.info(f"WebSocket client {client_id} disconnected and cleaned up")
     
     async def send_personal_message(self, message: dict, client_id: str):
-        """Send message to specific client"""
+        """Queue message for specific client (never dropped for slow clients)"""
         if client_id in self.active_connections:
-            try:
-                websocket = self.active_connections[client_id]
-                await websocket.send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Error sending message to {client_id}: {e}")
-                self.disconnect(client_id)
+            self.fanout.send(client_id, message)
     
+    async def send_to_clients(self, client_ids: List[str], message: dict):
+        """Queue one message for several clients, serialized once (never dropped for slow clients)"""
+        self.fanout.publish(
+            [client_id for client_id in client_ids if client_id in self.active_connections],
+            message, droppable=False
+        )
+
     async def broadcast_to_symbol_subscribers(self, symbol: str, message: dict):
         """Broadcast message to all clients subscribed to a symbol"""
         if symbol in self.symbol_subscribers:
@@ -75,25 +88,14 @@ class ConnectionManager:
             message["symbol"] = symbol
             message["timestamp"] = datetime.utcnow().isoformat()
             
-            for client_id in subscribers:
-                await self.send_personal_message(message, client_id)
+            # Slow clients keep only the latest pending update per type and symbol
+            self.fanout.publish(subscribers, message, key=(message.get("type"), symbol))
     
     async def broadcast_to_all(self, message: dict):
         """Broadcast message to all connected clients"""
         message["timestamp"] = datetime.utcnow().isoformat()
         
-        disconnected_clients = []
-        
-        for client_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Error broadcasting to {client_id}: {e}")
-                disconnected_clients.append(client_id)
-        
-        # Clean up disconnected clients
-        for client_id in disconnected_clients:
-            self.disconnect(client_id)
+        self.fanout.publish(self.active_connections, message)
     
     async def subscribe_to_symbols(self, client_id: str, symbols: List[str]):
         """Subscribe client to symbol updates and notify Redis streamer"""
@@ -165,8 +167,13 @@ class ConnectionManager:
             "unique_symbols": len(self.symbol_subscribers),
             "clients": list(self.active_connections.keys()),
             "symbols": list(self.symbol_subscribers.keys()),
-            "redis_streaming": redis_status
+            "redis_streaming": redis_status,
+            "fanout": self.fanout.get_stats()
         }
+
+    def get_client_metrics(self, client_id: str) -> Optional[dict]:
+        """Send queue depth, drops and lag for a client"""
+        return self.fanout.get_connection_metrics(client_id)
     
     async def send_market_update(self, symbol: str, data: dict):
         """Send market data update to subscribed clients"""
@@ -17,6 +17,7 @@ import uuid
 
 from app.core.config import settings
 from app.services.base_service import BaseService
+from app.services.websocket_fanout import FanoutEngine
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +72,13 @@ class WebSocketManager(BaseService):
         self.connection_rate_tracker: Dict[str, List[float]] = {}
         self.is_running = False
 
+        # Delivery: one serialization per update, per-connection send queues
+        self.fanout = FanoutEngine(
+            max_queue=settings.WS_SEND_QUEUE_SIZE,
+            policy=settings.WS_SLOW_CONSUMER_POLICY,
+            on_close=self._on_connection_closed
+        )
+
     async def initialize(self):
         """Initialize WebSocket manager with Redis connection"""
         try:
@@ -97,6 +105,7 @@ class WebSocketManager(BaseService):
         self.is_running = False
 
         # Close all connections
+        self.fanout.clear()
         for connection in list(self.connections.values()):
             try:
                 await connection.websocket.close(code=1001, reason="Server shutdown")
@@ -146,6 +155,7 @@ class WebSocketManager(BaseService):
             )
 
             self.connections[connection_id] = connection
+            self.fanout.register(connection_id, websocket)
 
             # Track user connections
             if user_id:
@@ -206,6 +216,7 @@ class WebSocketManager(BaseService):
 
             # Remove connection
             del self.connections[connection_id]
+            self.fanout.unregister(connection_id)
 
             # Clean up Redis
             if self.redis_client:
@@ -393,9 +404,8 @@ class WebSocketManager(BaseService):
                 "timestamp": datetime.utcnow().isoformat()
             }
 
-            # Send to all connections
-            for connection_id in list(self.connections.keys()):
-                await self._send_message(connection_id, message)
+            # Send to all connections; slow clients only need the latest status
+            self.fanout.publish(self.connections, message, key=("market_status",))
 
         except Exception as e:
             logger.error(f"Error broadcasting market status: {e}")
@@ -525,19 +535,19 @@ class WebSocketManager(BaseService):
             logger.error(f"Error getting subscriptions for {connection_id}: {e}")
 
     async def _send_message(self, connection_id: str, message: Dict[str, Any]):
-        """Send message to specific connection"""
-        try:
-            if connection_id not in self.connections:
-                return
-
-            connection = self.connections[connection_id]
-            await connection.websocket.send_text(json.dumps(message))
-
-        except WebSocketDisconnect:
-            await self.disconnect_client(connection_id, "websocket_disconnect")
-        except Exception as e:
-            logger.error(f"Error sending message to {connection_id}: {e}")
-            await self.disconnect_client(connection_id, "send_error")
+        """Queue message for specific connection (never dropped for slow clients)"""
+        if connection_id in self.connections:
+            self.fanout.send(connection_id, message)
+
+    async def _on_connection_closed(self, connection_id: str, error: Optional[Exception]):
+        """Clean up after the fan-out engine closed a connection"""
+        if isinstance(error, WebSocketDisconnect):
+            reason = "websocket_disconnect"
+        elif error is None:
+            reason = "slow_consumer"
+        else:
+            reason = "send_error"
+        await self.disconnect_client(connection_id, reason)
 
     async def _check_rate_limit(self, connection_id: str) -> bool:
         """Check if connection is within rate limits"""
@@ -612,14 +622,16 @@ class WebSocketManager(BaseService):
                 if symbol not in self.symbol_subscribers:
                     continue
 
-                # Send to all subscribers
-                for connection_id in list(self.symbol_subscribers[symbol]):
-                    if connection_id in self.connections:
-                        connection = self.connections[connection_id]
-
-                        # Check if connection wants this data type
-                        if data_type in connection.subscription_types or not connection.subscription_types:
-                            await self._send_message(connection_id, message)
+                # Send to all subscribers that want this data type, serialized once;
+                # slow clients keep only the latest pending update per type and symbol
+                recipients = [
+                    connection_id for connection_id in self.symbol_subscribers[symbol]
+                    if connection_id in self.connections and (
+                        data_type in self.connections[connection_id].subscription_types
+                        or not self.connections[connection_id].subscription_types
+                    )
+                ]
+                self.fanout.publish(recipients, message, key=(message.get("type"), symbol))
 
             except Exception as e:
                 logger.error(f"Error in broadcast worker: {e}")
@@ -673,7 +685,8 @@ class WebSocketManager(BaseService):
                 "active_symbols": len([s for s, subs in self.symbol_subscribers.items() if subs]),
                 "avg_subscriptions_per_connection": (
                     total_subscriptions / total_connections if total_connections > 0 else 0
-                )
+                ),
+                "fanout": self.fanout.get_stats()
             }
 
         except Exception as e:
@@ -0,0 +1,130 @@
+"""
+Benchmark: batched indicator kernel vs per-symbol indicator loop.
+
+Usage (from backend/):
+    python -m benchmarks.indicator_kernel_benchmark [--symbols 1000] [--days 2500]
+
+The per-symbol loop is the previous SignalGenerator implementation. It is
+timed on a sample of symbols and extrapolated, because running it over the
+full panel takes minutes.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.core.indicator_kernel import IndicatorKernel
+
+
+def build_panel(n_symbols: int, n_days: int, seed: int = 42) -> pd.DataFrame:
+    """Synthetic OHLCV panel with (Price, Symbol) MultiIndex columns."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2015-01-01', periods=n_days)
+    symbols = [f"S{i:04d}" for i in range(n_symbols)]
+
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, (n_days, n_symbols)), axis=0))
+    fields = {
+        'Open': close * (1 + rng.normal(0, 0.002, close.shape)),
+        'High': close * (1 + rng.uniform(0, 0.02, close.shape)),
+        'Low': close * (1 - rng.uniform(0, 0.02, close.shape)),
+        'Close': close,
+        'Volume': rng.integers(100_000, 5_000_000, close.shape).astype(float),
+    }
+
+    columns = pd.MultiIndex.from_product([list(fields), symbols], names=['Price', 'Symbol'])
+    return pd.DataFrame(np.hstack(list(fields.values())), index=index, columns=columns)
+
+
+def per_symbol_indicators(prices: pd.DataFrame) -> pd.DataFrame:
+    """Previous per-symbol implementation (xs per symbol, Python OBV loop)."""
+    indicators = {}
+
+    for symbol in prices.columns.get_level_values(1).unique():
+        symbol_data = prices.xs(symbol, level=1, axis=1)
+        close = symbol_data['Close']
+        values = {}
+
+        values['SMA_20'] = close.rolling(20).mean()
+        values['SMA_50'] = close.rolling(50).mean()
+        values['EMA_12'] = close.ewm(span=12).mean()
+        values['EMA_26'] = close.ewm(span=26).mean()
+
+        delta = close.diff()
+        gain = (delta.where(delta > 0, 0)).rolling(14).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
+        values['RSI'] = 100 - (100 / (1 + gain / loss))
+
+        values['MACD'] = values['EMA_12'] - values['EMA_26']
+        values['MACD_Signal'] = values['MACD'].ewm(span=9).mean()
+        values['MACD_Histogram'] = values['MACD'] - values['MACD_Signal']
+
+        bb_middle = close.rolling(20).mean()
+        bb_std_dev = close.rolling(20).std()
+        values['BB_UPPER'] = bb_middle + bb_std_dev * 2
+        values['BB_LOWER'] = bb_middle - bb_std_dev * 2
+        values['BB_MIDDLE'] = bb_middle
+
+        high_low = symbol_data['High'] - symbol_data['Low']
+        high_close = np.abs(symbol_data['High'] - close.shift())
+        low_close = np.abs(symbol_data['Low'] - close.shift())
+        values['ATR'] = np.maximum(high_low, np.maximum(high_close, low_close)).rolling(14).mean()
+
+        low_min = symbol_data['Low'].rolling(14).min()
+        high_max = symbol_data['High'].rolling(14).max()
+        values['STOCH_K'] = 100 * (close - low_min) / (high_max - low_min)
+        values['STOCH_D'] = values['STOCH_K'].rolling(3).mean()
+
+        obv = [0]
+        for i in range(1, len(symbol_data)):
+            if close.iloc[i] > close.iloc[i - 1]:
+                obv.append(obv[-1] + symbol_data['Volume'].iloc[i])
+            elif close.iloc[i] < close.iloc[i - 1]:
+                obv.append(obv[-1] - symbol_data['Volume'].iloc[i])
+            else:
+                obv.append(obv[-1])
+        values['OBV'] = pd.Series(obv, index=symbol_data.index)
+
+        indicators[symbol] = values
+
+    indicator_df = pd.DataFrame()
+    for symbol, values in indicators.items():
+        for indicator, series in values.items():
+            indicator_df[(indicator, symbol)] = series
+
+    indicator_df.columns = pd.MultiIndex.from_tuples(
+        indicator_df.columns, names=['Indicator', 'Symbol']
+    )
+    return indicator_df
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--symbols', type=int, default=1000)
+    parser.add_argument('--days', type=int, default=2500)
+    parser.add_argument('--sample', type=int, default=10,
+                        help='Symbols used to time the per-symbol loop')
+    args = parser.parse_args()
+
+    prices = build_panel(args.symbols, args.days)
+    print(f"Panel: {args.symbols} symbols x {args.days} days")
+
+    started = time.perf_counter()
+    frame = IndicatorKernel.compute_frame(prices)
+    kernel_seconds = time.perf_counter() - started
+    print(f"Batched kernel:   {kernel_seconds:8.2f} s  ({frame.shape[1]} columns)")
+
+    sample = min(args.sample, args.symbols)
+    sample_symbols = list(prices.columns.get_level_values(1).unique()[:sample])
+    sample_prices = prices.loc[:, pd.IndexSlice[:, sample_symbols]]
+
+    started = time.perf_counter()
+    per_symbol_indicators(sample_prices)
+    loop_seconds = (time.perf_counter() - started) * args.symbols / sample
+    print(f"Per-symbol loop:  {loop_seconds:8.2f} s  (extrapolated from {sample} symbols)")
+    print(f"Speed-up:         {loop_seconds / kernel_seconds:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Shared builders for synthetic market data and alert rules used across test suites.
+"""
+
+import numpy as np
+import pandas as pd
+
+from app.models.alert_models import AlertCondition, AlertRule, AlertType, ComparisonOperator, NotificationChannel
+
+
+SYMBOLS = ['AAPL', 'MSFT', 'NVDA']
+
+
+def make_prices(symbols=SYMBOLS, periods=300, seed=7) -> pd.DataFrame:
+    """Build a synthetic OHLCV panel with (Price, Symbol) MultiIndex columns."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2022-01-03', periods=periods)
+    data = {}
+
+    for symbol in symbols:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, periods)))
+        data[('Open', symbol)] = close * (1 + rng.normal(0, 0.002, periods))
+        data[('High', symbol)] = close * 1.01
+        data[('Low', symbol)] = close * 0.99
+        data[('Close', symbol)] = close
+        data[('Volume', symbol)] = rng.integers(1_000_000, 5_000_000, periods).astype(float)
+
+    df = pd.DataFrame(data, index=index)
+    df.columns = pd.MultiIndex.from_tuples(df.columns, names=['Price', 'Symbol'])
+    return df
+
+
+def make_rule(rule_id, symbols=None, conditions=None, logic="AND", **fields) -> AlertRule:
+    """Build an email price alert rule; conditions default to price > 100."""
+    defaults = dict(
+        user_id=f"user-{rule_id}",
+        name=rule_id,
+        alert_type=AlertType.PRICE,
+        channels=[NotificationChannel.EMAIL],
+    )
+    return AlertRule(
+        rule_id=rule_id,
+        symbols=symbols,
+        conditions=conditions or [AlertCondition(field="price", operator=ComparisonOperator.GREATER_THAN, value=100)],
+        condition_logic=logic,
+        **{**defaults, **fields},
+    )
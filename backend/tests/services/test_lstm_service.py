@@ -0,0 +1,347 @@
+"""
+Tests for LSTMService batched inference
+"""
+
+import pytest
+import joblib
+import numpy as np
+import pandas as pd
+import tensorflow as tf
+from concurrent.futures import ThreadPoolExecutor
+from sklearn.preprocessing import MinMaxScaler
+
+from app.core.config import settings
+from app.core.training_scheduler import TrainingPendingError, TrainingScheduler, TrainingStatus
+from app.models.schemas import LSTMPrediction
+from app.services.lstm_service import LSTMService
+
+
+def make_model(lookback: int, n_features: int) -> tf.keras.Model:
+    tf.keras.utils.set_random_seed(0)
+    return tf.keras.Sequential([
+        tf.keras.layers.LSTM(8, input_shape=(lookback, n_features)),
+        tf.keras.layers.Dropout(0.3),
+        tf.keras.layers.Dense(1),
+    ])
+
+
+def sequential_rollout(model, sequence: np.ndarray, days_ahead: int) -> list:
+    """One sample, one step at a time: the previous inference loop."""
+    current = sequence[np.newaxis].astype(np.float32)
+    predictions = []
+    for _ in range(days_ahead):
+        pred = model(current, training=False).numpy()[0, 0]
+        next_row = current[0, -1].copy()
+        next_row[0] = pred
+        current = np.concatenate([current[:, 1:], next_row[np.newaxis, np.newaxis]], axis=1)
+        predictions.append(pred)
+    return predictions
+
+
+def fake_train_and_save(symbol, features, lookback, model_path, scaler_path, epochs):
+    """Stands in for the worker-process training job: saves an untrained model."""
+    make_model(lookback, features.shape[1]).save(model_path)
+    joblib.dump(MinMaxScaler().fit(features), scaler_path)
+    return {"epochs": 0}
+
+
+def make_history(rows: int, price: float, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Close': price * np.exp(np.cumsum(rng.normal(0, 0.01, rows))),
+        'Volume': rng.uniform(1e6, 5e6, rows),
+        'RSI': rng.uniform(20, 80, rows),
+    }, index=pd.date_range('2024-01-01', periods=rows, freq='B'))
+
+
+class TestBatchedInference:
+    """Test the batched rollout used for predictions and MC dropout intervals."""
+
+    def setup_method(self):
+        self.service = LSTMService()
+        self.service.lookback_days = 12
+        self.service.feature_columns = ['Close', 'Volume', 'RSI']
+
+        rng = np.random.default_rng(0)
+        self.features = np.column_stack([
+            100 + np.cumsum(rng.normal(0, 1, 60)),
+            rng.uniform(1e6, 5e6, 60),
+            rng.uniform(20, 80, 60),
+        ])
+        self.scaler = MinMaxScaler().fit(self.features)
+        self.model = make_model(12, 3)
+
+    def test_inverse_scale_matches_scaler(self):
+        scaled = np.linspace(-0.2, 1.2, 7)
+        dummy = np.zeros((7, 3))
+        dummy[:, 0] = scaled
+
+        np.testing.assert_allclose(
+            self.service._inverse_scale_close(self.scaler, scaled),
+            self.scaler.inverse_transform(dummy)[:, 0]
+        )
+
+    def test_deterministic_rollout_matches_sequential_loop(self):
+        sequence = self.scaler.transform(self.features)[-12:]
+
+        batched = self.service._rollout(self.model, sequence, 6, n_paths=3)
+
+        expected = sequential_rollout(self.model, sequence, 6)
+        np.testing.assert_allclose(batched, np.tile(expected, (3, 1)), rtol=1e-5, atol=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_confidence_intervals_from_dropout_paths(self):
+        predictions = await self.service._generate_predictions(self.model, self.scaler, self.features, 5)
+        intervals = await self.service._calculate_confidence_intervals(
+            self.model, self.scaler, self.features, predictions, 5, n_simulations=200
+        )
+
+        assert predictions.shape == (5,)
+        for level in ('80', '95'):
+            assert intervals[level]['lower'].shape == (5,)
+            assert (intervals[level]['lower'] < intervals[level]['upper']).all()
+        assert (intervals['95']['lower'] <= intervals['80']['lower']).all()
+        assert (intervals['95']['upper'] >= intervals['80']['upper']).all()
+
+    @pytest.mark.asyncio
+    async def test_model_performance_from_window_batches(self):
+        performance = await self.service._calculate_model_performance(self.model, self.scaler, self.features)
+
+        predictions = self.model.predict(self.service._create_sequences(
+            self.scaler.transform(self.features), 12
+        )[0], verbose=0).flatten()
+        expected_mae = np.mean(np.abs(
+            self.service._inverse_scale_close(self.scaler, predictions) - self.features[12:, 0]
+        ))
+        assert performance['mae'] == pytest.approx(expected_mae, rel=1e-4)
+        assert 0.0 <= performance['directional_accuracy'] <= 1.0
+
+
+class TestModelRegistryIntegration:
+    """Test that predictions reuse registered models instead of reloading them."""
+
+    def setup_method(self):
+        self.service = LSTMService()
+        self.features = np.random.default_rng(0).random((60, 3))
+        self.model = make_model(12, 3)
+        self.scaler = MinMaxScaler().fit(self.features)
+
+    @pytest.mark.asyncio
+    async def test_registered_model_is_reused(self, tmp_path):
+        self.service.model_dir = tmp_path
+        self.service.registry.register("AAPL", self.model, self.scaler)
+
+        model, scaler = await self.service._get_or_train_model("AAPL", self.features)
+
+        assert model is self.model and scaler is self.scaler
+        assert self.service.get_registry_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_older_version_is_not_trained(self, tmp_path):
+        self.service.model_dir = tmp_path
+
+        assert await self.service._get_or_train_model("AAPL", self.features, version="lstm_v1.0") == (None, None)
+        assert len(self.service.registry) == 0
+
+
+class TestBackgroundTraining:
+    """Test that cold or retraining symbols are trained off the request path."""
+
+    @pytest.fixture(autouse=True)
+    def setup_service(self, tmp_path):
+        self.service = LSTMService()
+        self.service.lookback_days = 12
+        self.service.model_dir = tmp_path
+        self.service.training_scheduler = TrainingScheduler(
+            fake_train_and_save,
+            on_complete=self.service._on_training_complete,
+            executor=ThreadPoolExecutor(max_workers=1)
+        )
+        self.features = np.random.default_rng(0).random((60, 3))
+        yield
+        self.service.training_scheduler.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cold_symbol_is_queued_not_trained_inline(self):
+        results = [await self.service._get_or_train_model("AAPL", self.features) for _ in range(3)]
+
+        assert results == [(None, None)] * 3
+        assert self.service.get_training_status("AAPL")["status"] in ("queued", "running")
+
+        job = await self.service.training_scheduler.wait("AAPL", self.service._get_model_version())
+        assert job.status == TrainingStatus.COMPLETED
+        assert self.service.get_training_status("AAPL")["status"] == "completed"
+
+        model, scaler = await self.service._get_or_train_model("AAPL", self.features)
+        assert model is not None and model.input_shape == (None, 12, 3)
+        assert self.service.registry.stats.loads == 1
+
+    @pytest.mark.asyncio
+    async def test_prediction_for_cold_symbol_reports_pending(self):
+        self.service.feature_columns = ['Close', 'Volume', 'RSI']
+        self.service.min_training_data = 60
+
+        with pytest.raises(TrainingPendingError) as pending:
+            await self.service.get_lstm_prediction("AAPL", make_history(80, 180.0, 1), days_ahead=3)
+        assert pending.value.symbol == "AAPL"
+        assert pending.value.status in (TrainingStatus.QUEUED, TrainingStatus.RUNNING)
+
+        await self.service.training_scheduler.wait("AAPL", self.service._get_model_version())
+        prediction = await self.service.get_lstm_prediction("AAPL", make_history(80, 180.0, 1), days_ahead=3)
+        assert prediction is not None and len(prediction.predictions) == 3
+
+    @pytest.mark.asyncio
+    async def test_retrain_serves_last_good_model(self):
+        current = make_model(12, 3)
+        self.service.registry.register("AAPL", current, MinMaxScaler().fit(self.features))
+
+        model, _ = await self.service._get_or_train_model("AAPL", self.features, retrain=True)
+        assert model is current
+
+        await self.service.training_scheduler.wait("AAPL", self.service._get_model_version())
+        model, _ = await self.service._get_or_train_model("AAPL", self.features)
+        assert model is not current
+
+
+class TestGlobalModel:
+    """Test batch prediction with the shared multi-symbol model."""
+
+    @pytest.fixture(autouse=True)
+    def setup_service(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "LSTM_EPOCHS", 1)
+        monkeypatch.setattr(settings, "LSTM_GLOBAL_UNIVERSE", ['AAPL', 'MSFT', 'NVDA'])
+        self.service = LSTMService()
+        self.service.lookback_days = 12
+        self.service.min_training_data = 60
+        self.service.feature_columns = ['Close', 'Volume', 'RSI']
+        self.service.model_dir = tmp_path
+        self.service.training_scheduler = TrainingScheduler(
+            fake_train_and_save,
+            on_complete=self.service._on_training_complete,
+            executor=ThreadPoolExecutor(max_workers=1)
+        )
+        self.histories = {
+            'AAPL': make_history(80, 180.0, 1),
+            'MSFT': make_history(80, 420.0, 2),
+            'SHORT': make_history(30, 50.0, 3),
+        }
+        yield
+        self.service.training_scheduler.shutdown()
+
+    async def wait_for_global(self, version: str):
+        job = await self.service.training_scheduler.wait(self.service.GLOBAL_MODEL_KEY, version)
+        assert job.status == TrainingStatus.COMPLETED
+        return job
+
+    @pytest.mark.asyncio
+    async def test_first_batch_queues_global_training_then_scores_universe(self):
+        symbols = list(self.histories)
+        pending = await self.service.batch_predict(symbols, self.histories, days_ahead=3, use_global_model=True)
+        assert {symbol: status.status for symbol, status in pending.items()} == {
+            'AAPL': 'pending', 'MSFT': 'pending', 'SHORT': 'insufficient_data'
+        }
+
+        first_version = pending['AAPL'].model_version
+        job = await self.wait_for_global(first_version)
+        assert job.result["symbols"] == 2
+
+        results = await self.service.batch_predict(symbols, self.histories, days_ahead=3, use_global_model=True)
+        assert results['SHORT'].status == 'insufficient_data'
+        for symbol in ('AAPL', 'MSFT'):
+            prediction = results[symbol]
+            assert isinstance(prediction, LSTMPrediction) and len(prediction.predictions) == 3
+            assert len(prediction.confidence_intervals['95_lower']) == 3
+            # Per-symbol scaling keeps forecasts on each symbol's own price level
+            last_close = self.histories[symbol]['Close'].iloc[-1]
+            assert 0.5 * last_close < prediction.predictions[0] < 1.5 * last_close
+
+    @pytest.mark.asyncio
+    async def test_request_symbols_do_not_retrain_within_a_window(self):
+        symbols = ['AAPL', 'MSFT']
+        pending = await self.service.batch_predict(symbols, self.histories, days_ahead=3, use_global_model=True)
+        first_version = pending['AAPL'].model_version
+        await self.wait_for_global(first_version)
+
+        self.histories['NVDA'] = make_history(80, 900.0, 4)
+        self.histories['ZZZ'] = make_history(80, 10.0, 5)
+        for batch in (['AAPL'], ['MSFT', 'NVDA', 'ZZZ']):
+            results = await self.service.batch_predict(batch, self.histories, days_ahead=3, use_global_model=True)
+            assert all(
+                isinstance(results[symbol], LSTMPrediction) for symbol in batch if symbol in symbols
+            )
+
+        # Unknown symbols are reported, never scored with an untrained embedding
+        assert results['NVDA'].status == 'not_trained_for_symbol'
+        assert results['ZZZ'].status == 'not_trained_for_symbol'
+        assert 'LSTM_GLOBAL_UNIVERSE' in results['ZZZ'].detail
+        assert list(self.service.training_scheduler.jobs) == [(self.service.GLOBAL_MODEL_KEY, first_version)]
+
+    @pytest.mark.asyncio
+    async def test_next_window_retrains_universe_and_promotes(self):
+        symbols = ['AAPL', 'MSFT']
+        pending = await self.service.batch_predict(symbols, self.histories, days_ahead=3, use_global_model=True)
+        first_version = pending['AAPL'].model_version
+        await self.wait_for_global(first_version)
+
+        # Two more weeks of data, now including NVDA
+        self.histories = {
+            'AAPL': make_history(90, 180.0, 1),
+            'MSFT': make_history(90, 420.0, 2),
+            'NVDA': make_history(90, 900.0, 4),
+        }
+        results = await self.service.batch_predict(
+            symbols + ['NVDA'], self.histories, days_ahead=3, use_global_model=True
+        )
+
+        # Known symbols keep being served by the live model meanwhile
+        assert isinstance(results['AAPL'], LSTMPrediction)
+        assert results['NVDA'].status == 'not_trained_for_symbol'
+        assert results['NVDA'].model_version == first_version
+
+        jobs = [key for key in self.service.training_scheduler.jobs if key != (self.service.GLOBAL_MODEL_KEY, first_version)]
+        assert len(jobs) == 1
+        await self.wait_for_global(jobs[0][1])
+        assert self.service.live_global_version == jobs[0][1] != first_version
+
+        results = await self.service.batch_predict(
+            symbols + ['NVDA'], self.histories, days_ahead=3, use_global_model=True
+        )
+        assert all(isinstance(results[symbol], LSTMPrediction) for symbol in symbols + ['NVDA'])
+
+    def test_only_newer_windows_of_the_universe_are_promoted(self, monkeypatch):
+        monday = pd.Timestamp('2024-06-03')
+        older = self.service._global_model_version([monday])
+        newer = self.service._global_model_version([monday + pd.Timedelta(days=7)])
+
+        assert self.service._is_newer_global_version(older)
+        self.service.live_global_version = newer
+        assert not self.service._is_newer_global_version(older)
+
+        monkeypatch.setattr(settings, "LSTM_GLOBAL_UNIVERSE", ['AAPL'])
+        other_universe = self.service._global_model_version([monday + pd.Timedelta(days=14)])
+        monkeypatch.setattr(settings, "LSTM_GLOBAL_UNIVERSE", ['AAPL', 'MSFT', 'NVDA'])
+        assert not self.service._is_newer_global_version(other_universe)
+
+    def test_global_version_tracks_universe_and_data_window(self, monkeypatch):
+        monkeypatch.setattr(settings, "LSTM_GLOBAL_RETRAIN_DAYS", 7)
+        monday = pd.Timestamp('2024-06-03')
+
+        version = self.service._global_model_version([monday])
+        assert self.service._global_model_version([monday, monday - pd.Timedelta(days=3)]) == version
+        assert self.service._global_model_version([monday + pd.Timedelta(days=7)]) != version
+
+        monkeypatch.setattr(settings, "LSTM_GLOBAL_UNIVERSE", ['MSFT', 'NVDA', 'AAPL'])
+        assert self.service._global_model_version([monday]) == version
+        monkeypatch.setattr(settings, "LSTM_GLOBAL_UNIVERSE", ['AAPL', 'MSFT'])
+        assert self.service._global_model_version([monday]) != version
+
+    @pytest.mark.asyncio
+    async def test_batched_rollout_matches_one_symbol_at_a_time(self):
+        model = make_model(12, 3)
+        rng = np.random.default_rng(0)
+        sequences = rng.random((4, 12, 3))
+
+        batched = self.service._rollout_many(model, sequences, 5, max_batch_rows=3)
+
+        for i in range(4):
+            np.testing.assert_allclose(batched[i], self.service._rollout(model, sequences[i], 5), rtol=1e-5, atol=1e-6)
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+Tests for MarketDataStreamer quote fetching and streaming indicators
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from app.core.bar_store import FakeBarProvider
+from app.core.streaming_indicators import StreamingIndicatorEngine
+from app.models.stock_schemas import StockPrice
+from app.services.market_data_streamer import MarketDataStreamer
+
+
+class FakeStockService:
+    def __init__(self, market_open: bool = True):
+        self.market_open = market_open
+        self.history_requests = []
+
+    async def get_prices(self, symbols):
+        return {
+            symbol: StockPrice(
+                symbol=symbol, current_price=101.0, previous_close=100.0, change=1.0,
+                change_percent=1.0, day_high=102.0, day_low=99.0, volume=5000
+            )
+            for symbol in symbols if symbol != "NOPE"
+        }
+
+    async def get_histories(self, symbols, period="1y", interval="1d"):
+        self.history_requests.append(list(symbols))
+        provider = FakeBarProvider(clock=lambda: pd.Timestamp("2024-06-13 18:00"))
+        start = pd.Timestamp("2023-06-13")
+        return {symbol: await provider(symbol, interval, start, None) for symbol in symbols}
+
+    def get_market_hours(self):
+        return {"is_open": self.market_open, "current_time": datetime(2024, 6, 14, 11, 0)}
+
+
+class TestStreamingIndicators:
+    """Test that streamed quotes update and publish live indicators."""
+
+    @pytest.fixture(autouse=True)
+    def setup_streamer(self):
+        self.stock_service = FakeStockService()
+        self.streamer = MarketDataStreamer(MagicMock(), stock_service=self.stock_service)
+        self.streamer.indicators = StreamingIndicatorEngine()
+
+    @pytest.mark.asyncio
+    async def test_quotes_become_forming_bar_with_indicators(self):
+        market_data = await self.streamer._fetch_current_market_data(["AAPL", "NOPE"])
+        await self.streamer._update_indicators(market_data)
+
+        assert market_data["NOPE"]["simulated"] and "indicators" not in market_data["NOPE"]
+        assert market_data["AAPL"]["indicators"]["sma_200"] is not None
+        assert self.streamer.indicators._forming["AAPL"] == (pd.Timestamp("2024-06-14"), 102.0, 99.0, 101.0, 5000.0)
+
+        # Seeding happens once per symbol
+        await self.streamer._update_indicators(await self.streamer._fetch_current_market_data(["AAPL"]))
+        assert self.stock_service.history_requests == [["AAPL"]]
+
+    @pytest.mark.asyncio
+    async def test_closed_market_does_not_add_bars(self):
+        self.stock_service.market_open = False
+        market_data = await self.streamer._fetch_current_market_data(["AAPL"])
+        await self.streamer._update_indicators(market_data)
+
+        assert self.streamer.indicators._forming["AAPL"][0] == pd.Timestamp("2024-06-13")
+        assert market_data["AAPL"]["indicators"]["rsi"] is not None
@@ -0,0 +1,117 @@
+"""
+Tests for OptionsAnalyticsService chain pricing
+"""
+
+import pytest
+import numpy as np
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+from app.core.options_pricing import BlackScholesPricer
+from app.models.options_models import (
+    ExerciseStyle, OptionContract, OptionsChain, OptionType, PricingModel
+)
+from app.services.options_service import OptionsAnalyticsService
+
+
+def make_chain(days: int, strikes, atm_iv: float = 0.3, smile=None) -> OptionsChain:
+    """Chain of European contracts; with ``smile`` the quotes are priced off that IV curve."""
+    expiry = date.today() + timedelta(days=days)
+
+    def contracts(option_type: OptionType):
+        if smile is None:
+            return [
+                OptionContract(symbol="SPY", strike=strike, expiry=expiry, option_type=option_type,
+                               exercise_style=ExerciseStyle.EUROPEAN, last=1.0)
+                for strike in strikes
+            ]
+
+        prices = BlackScholesPricer.price_batch(
+            450.0, strikes, days / 365.0, 0.05, smile(np.asarray(strikes)), option_type, 0.01
+        ).price
+        return [
+            OptionContract(symbol="SPY", strike=strike, expiry=expiry, option_type=option_type,
+                           exercise_style=ExerciseStyle.EUROPEAN, bid=price * 0.99, ask=price * 1.01)
+            for strike, price in zip(strikes, prices)
+        ]
+
+    return OptionsChain(
+        symbol="SPY", expiry_date=expiry, spot_price=450.0,
+        calls=contracts(OptionType.CALL), puts=contracts(OptionType.PUT),
+        total_call_volume=0, total_put_volume=0, put_call_ratio=0.0, atm_iv=atm_iv,
+    )
+
+
+class TestChainPricing:
+    """Test batched pricing across all chains."""
+
+    def setup_method(self):
+        self.service = OptionsAnalyticsService()
+        self.strikes = [400.0 + 5 * i for i in range(20)]
+        self.chains = [make_chain(days, self.strikes) for days in (7, 30, 60, 120, 365)]
+
+    @pytest.mark.services
+    @pytest.mark.asyncio
+    async def test_prices_every_expiry(self):
+        results = await self.service._calculate_pricing_for_chains(
+            self.chains, 450.0, 0.05, 0.01, PricingModel.BLACK_SCHOLES
+        )
+
+        assert len(results) == len(self.chains) * len(self.strikes) * 2
+        assert all(result.model_used == PricingModel.BLACK_SCHOLES for result in results)
+        assert all(result.price >= 0 for result in results)
+
+    @pytest.mark.services
+    @pytest.mark.asyncio
+    async def test_filters_by_strike_and_type(self):
+        results = await self.service._calculate_pricing_for_chains(
+            self.chains, 450.0, 0.05, 0.01, PricingModel.BLACK_SCHOLES,
+            strike_filter=450.0, type_filter=OptionType.PUT
+        )
+
+        assert len(results) == len(self.chains)
+        assert all(result.greeks.delta < 0 for result in results)
+
+
+def skewed_smile(strikes: np.ndarray) -> np.ndarray:
+    return 0.2 + 0.3 * (450.0 - strikes) / 450.0
+
+
+class TestVolatilitySurface:
+    """Test market-implied surface construction and caching."""
+
+    def setup_method(self):
+        self.service = OptionsAnalyticsService()
+        self.strikes = [350.0 + 5 * i for i in range(41)]
+        self.chains = [make_chain(days, self.strikes, smile=skewed_smile) for days in (30, 60, 90, 180, 365, 730)]
+
+    @pytest.mark.services
+    @pytest.mark.asyncio
+    async def test_surface_recovers_quoted_smile(self):
+        surface = await self.service._calculate_volatility_surface(self.chains, 450.0, 0.05, 0.01)
+
+        assert len(surface.expiries) == len(self.chains)
+        assert surface.strikes == [s for s in self.strikes if 360.0 <= s <= 540.0]
+        expected = skewed_smile(np.asarray(surface.strikes))
+        for row in surface.implied_volatilities:
+            np.testing.assert_allclose(row, expected, atol=1e-3)
+
+        for skew in surface.skew_by_expiry.values():
+            assert skew == pytest.approx(0.06, abs=1e-3)
+        for atm_iv in surface.atm_term_structure.values():
+            assert atm_iv == pytest.approx(0.2, abs=1e-3)
+
+    @pytest.mark.services
+    @pytest.mark.asyncio
+    async def test_surface_is_cached_by_spot_bucket(self):
+        self.service.data_provider.get_spot_price = AsyncMock(side_effect=[450.0, 450.5, 470.0])
+        self.service.data_provider.fetch_options_chain = AsyncMock(return_value=self.chains)
+
+        first = await self.service.get_volatility_surface("SPY")
+        second = await self.service.get_volatility_surface("SPY")
+        assert second is first
+        assert self.service.data_provider.fetch_options_chain.await_count == 1
+        self.service.data_provider.fetch_options_chain.assert_awaited_with("SPY", spot_price=450.0)
+
+        await self.service.get_volatility_surface("SPY")
+        assert self.service.data_provider.fetch_options_chain.await_count == 2
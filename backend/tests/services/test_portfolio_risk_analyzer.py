@@ -0,0 +1,122 @@
+"""
+Tests for PortfolioRiskAnalyzer Monte Carlo simulation
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from app.models.risk_models import Portfolio, Position, PositionType
+from app.services.portfolio_risk_analyzer import PortfolioRiskAnalyzer
+
+
+def make_position(symbol: str, market_value: float) -> Position:
+    return Position(
+        position_id=f"pos_{symbol}", symbol=symbol, position_type=PositionType.LONG,
+        quantity=Decimal(10), entry_price=Decimal(100), current_price=Decimal(100),
+        market_value=Decimal(str(market_value)), unrealized_pnl=Decimal(0),
+        unrealized_pnl_percent=Decimal(0), entry_date=datetime(2024, 1, 2),
+        last_updated=datetime(2024, 1, 2),
+    )
+
+
+def make_portfolio(values: dict) -> Portfolio:
+    total = Decimal(str(sum(values.values())))
+    return Portfolio(
+        portfolio_id="p1", user_id="u1", name="Test", total_capital=total,
+        cash_balance=Decimal(0), invested_capital=total, total_value=total,
+        total_pnl=Decimal(0), total_pnl_percent=Decimal(0),
+        positions=[make_position(symbol, value) for symbol, value in values.items()],
+        created_at=datetime(2024, 1, 2), updated_at=datetime(2024, 1, 2),
+    )
+
+
+def make_history(closes: np.ndarray) -> list:
+    start = datetime(2024, 1, 2)
+    return [{'date': start + timedelta(days=i), 'close': float(close)} for i, close in enumerate(closes)]
+
+
+class TestMonteCarloEngine:
+    """Test the chunked correlated Monte Carlo engine."""
+
+    def setup_method(self):
+        self.analyzer = PortfolioRiskAnalyzer(MagicMock())
+
+    def test_terminal_distribution_matches_gbm(self):
+        mu, sigma, horizon = 0.0004, 0.015, 252
+        results = self.analyzer._run_monte_carlo_paths(
+            Decimal(100_000), [1.0], [mu], [[sigma ** 2]], horizon, 200_000,
+            chunk_size=30_000, rng=np.random.default_rng(1)
+        )
+
+        drift = (mu - 0.5 * sigma ** 2) * horizon
+        assert results.percentiles[50] == pytest.approx(np.expm1(drift), abs=0.005)
+        expected_var = -np.expm1(drift - 1.6449 * sigma * np.sqrt(horizon))
+        assert results.value_at_risk[0.95] == pytest.approx(expected_var, abs=0.005)
+        assert results.conditional_value_at_risk[0.99] > results.value_at_risk[0.99] > results.value_at_risk[0.95]
+        assert results.max_loss < results.percentiles[5] < results.percentiles[95] < results.max_gain
+
+    def test_tail_of_gains_is_no_risk(self):
+        results = self.analyzer._run_monte_carlo_paths(
+            Decimal(1_000), [1.0], [0.01], [[1e-6]], 20, 5_000,
+            chunk_size=1_000, rng=np.random.default_rng(3)
+        )
+
+        assert results.percentiles[5] > 0
+        assert results.value_at_risk == {0.95: 0.0, 0.99: 0.0}
+        assert results.conditional_value_at_risk == {0.95: 0.0, 0.99: 0.0}
+        assert self.analyzer._calculate_historical_var(np.full(50, 0.01), 0.95) == 0.0
+
+    def test_sample_paths_only(self):
+        results = self.analyzer._run_monte_carlo_paths(
+            Decimal(1_000), [0.5, 0.5], [0.0, 0.0], np.eye(2) * 1e-4, 20, 5_000,
+            num_sample_paths=7, chunk_size=1_000, rng=np.random.default_rng(2)
+        )
+
+        assert results.sample_paths.shape == (7, 21)
+        np.testing.assert_allclose(results.sample_paths[:, 0], 1_000.0)
+
+    def test_correlation_reduces_diversification(self):
+        covariance = lambda rho: 1e-4 * np.array([[1.0, rho], [rho, 1.0]])
+        run = lambda rho: self.analyzer._run_monte_carlo_paths(
+            Decimal(1_000), [0.5, 0.5], [0.0, 0.0], covariance(rho), 60, 50_000,
+            rng=np.random.default_rng(3)
+        )
+
+        independent, perfectly_correlated = run(0.0), run(1.0)
+
+        # rho = 1 is singular and goes through the eigen-clipped factor
+        assert perfectly_correlated.expected_volatility == pytest.approx(0.01)
+        assert independent.expected_volatility == pytest.approx(0.01 / np.sqrt(2))
+        assert perfectly_correlated.value_at_risk[0.95] > 1.3 * independent.value_at_risk[0.95]
+
+
+class TestMonteCarloSimulation:
+    """Test the portfolio-level Monte Carlo response."""
+
+    @pytest.mark.services
+    @pytest.mark.asyncio
+    async def test_simulation_uses_position_covariance(self):
+        rng = np.random.default_rng(4)
+        shocks = rng.normal(0, 0.01, (300, 2))
+        histories = {
+            'AAPL': make_history(100 * np.cumprod(1 + shocks[:, 0])),
+            'MSFT': make_history(100 * np.cumprod(1 + 0.5 * shocks[:, 0] + shocks[:, 1])),
+        }
+        stock_service = MagicMock()
+        stock_service.get_price_history = AsyncMock(side_effect=lambda symbol, *args: histories[symbol])
+        analyzer = PortfolioRiskAnalyzer(stock_service)
+
+        simulation = await analyzer.run_monte_carlo_simulation(
+            make_portfolio({'AAPL': 6_000, 'MSFT': 4_000}), time_horizon_days=30,
+            num_simulations=20_000, num_sample_paths=10
+        )
+
+        assert simulation.num_simulations == 20_000
+        assert len(simulation.simulation_paths) == 10
+        assert len(simulation.simulation_paths[0]) == 31
+        assert simulation.percentile_5 < simulation.percentile_50 < simulation.percentile_95
+        assert simulation.cvar_95 >= simulation.var_95 > 0
+        assert 0 < simulation.probability_of_loss < 1
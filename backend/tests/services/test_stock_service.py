@@ -0,0 +1,151 @@
+"""
+Tests for StockService history served from the local bar store
+"""
+
+import asyncio
+
+import pytest
+import pandas as pd
+
+from app.core.bar_store import BarStore, FakeBarProvider
+from app.services.stock_service import StockService
+
+
+class TestHistoryFromBarStore:
+    """Test that history endpoints read through the incremental bar store."""
+
+    @pytest.fixture(autouse=True)
+    def setup_service(self, tmp_path):
+        self.provider = FakeBarProvider()
+        self.service = StockService()
+        self.service.bar_store = BarStore(tmp_path, self.provider)
+
+        async def no_cache(key, fetch_func, ttl=None):
+            return await fetch_func()
+
+        self.service.get_or_set_cache = no_cache
+
+    @pytest.mark.asyncio
+    async def test_price_history_records_match_row_serialization(self):
+        history = await self.service.get_price_history("AAPL", "6mo", "1d")
+
+        df = (await self.service.bar_store.get_bars("AAPL", "1d", "6mo")).to_frame()
+        expected = [
+            {
+                "date": index.strftime("%Y-%m-%d %H:%M:%S"),
+                "open": float(row['Open']),
+                "high": float(row['High']),
+                "low": float(row['Low']),
+                "close": float(row['Close']),
+                "volume": int(row['Volume']),
+                "adjusted_close": float(row['Close']),
+            }
+            for index, row in df.iterrows()
+        ]
+        assert history == expected
+
+    @pytest.mark.asyncio
+    async def test_indicator_requests_reuse_stored_bars(self):
+        await self.service.get_price_history("AAPL", "2y", "1d")
+        indicators = await self.service.get_technical_indicators("AAPL", "1y")
+
+        assert indicators is not None
+        assert len(self.provider.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_history_frame_is_empty_for_unknown_symbol(self):
+        async def no_bars(symbol, interval, start, end):
+            return pd.DataFrame()
+
+        self.service.bar_store.fetch = no_bars
+        assert (await self.service._get_history_frame("NOPE", "1y")).empty
+
+
+def bulk_frame(symbols, closes):
+    """Multi-ticker download layout: (ticker, field) column MultiIndex."""
+    index = pd.bdate_range(end=pd.Timestamp.now().normalize() - pd.Timedelta(days=1), periods=len(closes))
+    frames = {
+        symbol: pd.DataFrame({
+            "Open": closes, "High": [c + 1 for c in closes], "Low": [c - 1 for c in closes],
+            "Close": closes, "Volume": [1000] * len(closes),
+        }, index=index)
+        for symbol in symbols
+    }
+    return pd.concat(frames, axis=1)
+
+
+class TestBulkFetch:
+    """Test multi-symbol quotes and history served by bulk downloads."""
+
+    @pytest.fixture(autouse=True)
+    def setup_service(self, tmp_path, monkeypatch):
+        self.downloads = []
+
+        def fake_download(tickers, **kwargs):
+            self.downloads.append((list(tickers), kwargs))
+            known = [t for t in tickers if t != "NOPE"]
+            return bulk_frame(known, [100.0, 102.0, 101.0]) if known else pd.DataFrame()
+
+        monkeypatch.setattr("app.services.stock_service.yf.download", fake_download)
+        self.service = StockService()
+
+        async def no_redis_get_many(keys):
+            return {}
+
+        self.service.cache.get_many = no_redis_get_many
+
+    @pytest.mark.asyncio
+    async def test_prices_for_many_symbols_use_one_download(self):
+        prices = await self.service.get_prices(["aapl", "MSFT", "NOPE"])
+
+        assert len(self.downloads) == 1
+        assert prices["NOPE"] is None
+        aapl = prices["AAPL"]
+        assert aapl.current_price == 101.0
+        assert aapl.previous_close == 102.0
+        assert aapl.change == -1.0
+        assert aapl.day_high == 102.0
+
+    @pytest.mark.asyncio
+    async def test_instances_share_bar_store_and_bulk_downloads(self):
+        other = StockService()
+        assert other.bar_store is self.service.bar_store
+
+        await asyncio.gather(self.service.get_prices(["AAPL"]), other.get_prices(["MSFT"]))
+
+        assert len(self.downloads) == 1
+        assert sorted(self.downloads[0][0]) == ["AAPL", "MSFT"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_history_requests_share_bulk_downloads(self, tmp_path):
+        self.service.bar_store = BarStore(tmp_path, self.service._fetch_yfinance_range)
+
+        histories = await self.service.get_histories(["AAPL", "MSFT", "NVDA"], "1y", "1d")
+
+        assert len(self.downloads) == 1
+        assert sorted(self.downloads[0][0]) == ["AAPL", "MSFT", "NVDA"]
+        assert all(list(df["Close"]) == [100.0, 102.0, 101.0] for df in histories.values())
+
+    @pytest.mark.asyncio
+    async def test_invalid_symbols_are_skipped(self):
+        prices = await self.service.get_prices(["AAPL", "BRK.B", "", "MSFT"])
+
+        assert sorted(prices) == ["AAPL", "MSFT"]
+        assert sorted(self.downloads[0][0]) == ["AAPL", "MSFT"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_quotes_do_not_replace_cached_prices(self):
+        del self.service.cache.get_many  # read through the real cache
+        price_key = self.service.create_cache_key("stock_price", "AAPL")
+        quote_key = self.service.create_cache_key("stock_quote", "AAPL")
+        full = (await self.service._bulk_fetch_quotes(["AAPL"]))["AAPL"].model_copy(update={"market_cap": 3.0e12})
+        await self.service.batch_set_cached({price_key: full}, ttl=60)
+
+        try:
+            prices = await self.service.get_prices(["AAPL", "MSFT"])
+
+            assert prices["AAPL"].market_cap == 3.0e12
+            assert sorted(self.downloads[-1][0]) == ["MSFT"]
+        finally:
+            for key in (price_key, quote_key, self.service.create_cache_key("stock_quote", "MSFT")):
+                await self.service.cache.delete(key)
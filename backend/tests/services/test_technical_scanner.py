@@ -0,0 +1,92 @@
+"""
+Tests for panel technical indicator calculation
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from app.services.scanners.technical_scanner import (
+    PanelIndicatorCalculator, TechnicalIndicatorCalculator, TechnicalScanner
+)
+
+
+def make_panel(symbols, bars, seed=5):
+    """Random OHLCV panel with a flat-price row and a row that only rises."""
+    rng = np.random.default_rng(seed)
+    close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, (symbols, bars)), axis=1))
+    close[0] = 42.0
+    close[1] = np.linspace(10, 20, bars)
+    high = close * (1 + rng.uniform(0, 0.02, (symbols, bars)))
+    low = close * (1 - rng.uniform(0, 0.02, (symbols, bars)))
+    high[0] = low[0] = 42.0
+    volume = rng.integers(1_000, 900_000, (symbols, bars)).astype(float)
+    return {'high': high, 'low': low, 'close': close, 'volume': volume}
+
+
+def assert_same(actual, expected):
+    if isinstance(expected, str):
+        assert actual == expected
+    else:
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-9, nan_ok=True)
+
+
+class TestPanelIndicatorCalculator:
+    """Test that panel indicators match the per-symbol calculator."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("bars", [1, 10, 15, 16, 30, 36, 60, 260])
+    async def test_matches_per_symbol_indicators(self, bars):
+        panel = make_panel(6, bars)
+        symbols = [f"S{i}" for i in range(6)]
+        scanner = TechnicalScanner(scanner_engine=None)
+
+        results = scanner.calculate_universe_indicators(symbols, panel)
+
+        for row, symbol in enumerate(symbols):
+            expected = await scanner.calculate_comprehensive_indicators(
+                symbol, {name: values[row].tolist() for name, values in panel.items()}
+            )
+            assert set(results[symbol]) == set(expected)
+            for name, value in expected.items():
+                assert_same(results[symbol][name], value)
+
+    def test_individual_indicators_take_custom_periods(self):
+        panel = make_panel(4, 80)
+        calculator = PanelIndicatorCalculator(panel['close'], panel['high'], panel['low'], panel['volume'])
+
+        for row in range(4):
+            high, low, close = (panel[name][row].tolist() for name in ('high', 'low', 'close'))
+            assert_same(calculator.calculate_rsi(7)[row], TechnicalIndicatorCalculator.calculate_rsi(close, 7))
+            assert_same(calculator.calculate_adx(10)[row],
+                        TechnicalIndicatorCalculator.calculate_adx(high, low, close, 10))
+            assert_same(calculator.calculate_stochastic(5, 5)['d'][row],
+                        TechnicalIndicatorCalculator.calculate_stochastic(high, low, close, 5, 5)['d'])
+            assert_same(calculator.calculate_macd(5, 35, 5)['histogram'][row],
+                        TechnicalIndicatorCalculator.calculate_macd(close, 5, 35, 5)['histogram'])
+
+    def test_close_only_panel_skips_ohlc_and_volume_indicators(self):
+        indicators = PanelIndicatorCalculator(make_panel(3, 40)['close']).calculate_comprehensive_indicators()
+
+        assert 'rsi' in indicators and 'sma_20' in indicators
+        assert not {'adx', 'atr', 'williams_r', 'k', 'obv'} & set(indicators)
+
+    def test_rejects_mismatched_panels(self):
+        panel = make_panel(3, 40)
+
+        with pytest.raises(ValueError):
+            PanelIndicatorCalculator(panel['close'][0])
+        with pytest.raises(ValueError):
+            PanelIndicatorCalculator(panel['close'], high=panel['high'][:, 1:])
+
+    def test_large_universe(self):
+        panel = make_panel(5_000, 250)
+        calculator = PanelIndicatorCalculator(panel['close'], panel['high'], panel['low'], panel['volume'])
+
+        start = time.perf_counter()
+        indicators = calculator.calculate_comprehensive_indicators()
+        elapsed = time.perf_counter() - start
+
+        assert indicators['rsi'].shape == (5_000,)
+        assert elapsed < 1.0
@@ -0,0 +1,230 @@
+"""
+Tests for the WebSocket fan-out engine
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.services.websocket_fanout import FanoutEngine
+from app.services.websocket_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """WebSocket stand-in that records sent text and can block or fail."""
+
+    def __init__(self, fail=False):
+        self.sent = []
+        self.fail = fail
+        self.open = asyncio.Event()
+        self.open.set()
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        await self.open.wait()
+        if self.fail:
+            raise RuntimeError("socket closed")
+        self.sent.append(json.loads(text))
+
+    async def close(self, code=1000, reason=""):
+        self.closed_with = code
+
+    def block(self):
+        self.open.clear()
+
+    def release(self):
+        self.open.set()
+
+
+async def settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestFanoutEngine:
+    """Test serialization, queueing policies and slow consumer handling."""
+
+    @pytest.fixture(autouse=True)
+    async def engine(self):
+        self.closed = []
+        self.engine = FanoutEngine(max_queue=3, on_close=lambda cid, error: self.closed.append((cid, error)))
+        yield self.engine
+        self.engine.clear()
+
+    @pytest.mark.asyncio
+    async def test_publish_serializes_once_for_all_connections(self):
+        serialize = self.engine.serialize
+        calls = []
+        self.engine.serialize = lambda message: calls.append(message) or serialize(message)
+        sockets = {f"c{i}": FakeWebSocket() for i in range(50)}
+        for client_id, websocket in sockets.items():
+            self.engine.register(client_id, websocket)
+
+        delivered = self.engine.publish(sockets, {"type": "market_update", "price": 1})
+        await settle()
+
+        assert delivered == 50 and len(calls) == 1
+        assert all(ws.sent == [{"type": "market_update", "price": 1}] for ws in sockets.values())
+
+    @pytest.mark.asyncio
+    async def test_slow_socket_does_not_delay_others(self):
+        slow, fast = FakeWebSocket(), FakeWebSocket()
+        slow.block()
+        self.engine.register("slow", slow)
+        self.engine.register("fast", fast)
+
+        for i in range(3):
+            self.engine.publish(["slow", "fast"], {"n": i})
+            await settle()
+
+        assert [m["n"] for m in fast.sent] == [0, 1, 2]
+        assert slow.sent == []
+        assert self.engine.connections["slow"].current_lag > 0
+
+    @pytest.mark.asyncio
+    async def test_coalesce_keeps_latest_pending_update_per_key(self):
+        websocket = FakeWebSocket()
+        websocket.block()
+        connection = self.engine.register("c1", websocket)
+
+        for i in range(5):
+            self.engine.publish(["c1"], {"symbol": "AAPL", "n": i}, key=("market_update", "AAPL"))
+            self.engine.publish(["c1"], {"symbol": "MSFT", "n": i}, key=("market_update", "MSFT"))
+            await settle()
+        websocket.release()
+        await settle()
+
+        # AAPL 0 was in flight; the rest collapsed to one pending update per symbol
+        assert websocket.sent == [{"symbol": "AAPL", "n": 0}, {"symbol": "MSFT", "n": 4}, {"symbol": "AAPL", "n": 4}]
+        assert connection.coalesced == 7 and connection.dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_bounds_the_queue(self):
+        engine = self.engine = FanoutEngine(max_queue=3, policy="drop_oldest")
+        websocket = FakeWebSocket()
+        websocket.block()
+        connection = engine.register("c1", websocket)
+
+        for i in range(6):
+            engine.publish(["c1"], {"n": i}, key="same")
+            await settle()
+        assert connection.queue_depth == 3
+        websocket.release()
+        await settle()
+
+        assert [m["n"] for m in websocket.sent] == [0, 3, 4, 5]
+        assert connection.dropped == 2
+        assert engine.get_stats()["frames_dropped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_personal_messages_are_kept_over_broadcasts(self):
+        websocket = FakeWebSocket()
+        websocket.block()
+        self.engine.register("c1", websocket)
+
+        self.engine.send("c1", {"type": "welcome"})
+        await settle()
+        self.engine.send("c1", {"type": "delta", "n": 1})
+        self.engine.publish(["c1"], {"type": "update"})
+        self.engine.send("c1", {"type": "delta", "n": 2})
+        self.engine.send("c1", {"type": "delta", "n": 3})
+        websocket.release()
+        await settle()
+
+        assert [m["type"] for m in websocket.sent] == ["welcome", "delta", "delta", "delta"]
+
+    @pytest.mark.asyncio
+    async def test_undroppable_publish_serializes_once_and_is_never_coalesced(self):
+        serialize = self.engine.serialize
+        calls = []
+        self.engine.serialize = lambda message: calls.append(message) or serialize(message)
+        sockets = {"c1": FakeWebSocket(), "c2": FakeWebSocket()}
+        for client_id, websocket in sockets.items():
+            websocket.block()
+            self.engine.register(client_id, websocket)
+
+        self.engine.publish(sockets, {"type": "delta", "n": 0}, key="scan")
+        await settle()
+        for n in (1, 2):
+            self.engine.publish(sockets, {"type": "delta", "n": n}, key="scan", droppable=False)
+        self.engine.publish(sockets, {"type": "update"})
+        self.engine.publish(sockets, {"type": "delta", "n": 3}, droppable=False)
+        for websocket in sockets.values():
+            websocket.release()
+        await settle()
+
+        assert len(calls) == 5
+        for websocket in sockets.values():
+            assert [m.get("n") for m in websocket.sent] == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_consumer_too_slow_for_personal_messages_is_closed(self):
+        websocket = FakeWebSocket()
+        websocket.block()
+        self.engine.register("c1", websocket)
+
+        results = [self.engine.send("c1", {"n": i}) for i in range(5)]
+        await settle()
+
+        assert results == [True, True, True, False, False]
+        assert "c1" not in self.engine.connections
+        assert websocket.closed_with == 1013
+        assert self.closed == [("c1", None)]
+        assert self.engine.get_stats()["slow_consumers_closed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_send_failure_closes_connection(self):
+        self.engine.register("c1", FakeWebSocket(fail=True))
+
+        self.engine.send("c1", {"n": 1})
+        await settle()
+
+        assert "c1" not in self.engine.connections
+        assert [cid for cid, _ in self.closed] == ["c1"]
+        assert isinstance(self.closed[0][1], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_lag_metrics(self):
+        websocket = FakeWebSocket()
+        websocket.block()
+        self.engine.register("c1", websocket)
+        self.engine.publish(["c1"], {"n": 1})
+        await asyncio.sleep(0.02)
+
+        stats = self.engine.get_stats()
+        assert stats["most_lagging"][0]["connection_id"] == "c1"
+        assert stats["max_lag_ms"] >= 15
+
+        websocket.release()
+        await settle()
+        metrics = self.engine.get_connection_metrics("c1")
+        assert metrics["sent"] == 1 and metrics["last_lag_ms"] >= 15 and metrics["queue_depth"] == 0
+
+
+class TestConnectionManagerFanout:
+    """Test that the connection manager delivers through the fan-out engine."""
+
+    @pytest.mark.asyncio
+    async def test_symbol_broadcast_and_failed_client_cleanup(self):
+        manager = ConnectionManager()
+        good, bad = FakeWebSocket(), FakeWebSocket(fail=True)
+        await manager.connect(good, "good")
+        await manager.connect(bad, "bad")
+        await manager.subscribe_to_symbols("good", ["AAPL"])
+        await manager.subscribe_to_symbols("bad", ["AAPL"])
+
+        await manager.send_market_update("AAPL", {"price": 190.0})
+        await settle()
+
+        assert [m["type"] for m in good.sent] == ["connection_established", "market_update"]
+        assert good.sent[1]["symbol"] == "AAPL" and good.sent[1]["data"] == {"price": 190.0}
+        assert "bad" not in manager.active_connections
+        assert manager.symbol_subscribers["AAPL"] == {"good"}
+        assert manager.get_connection_stats()["fanout"]["connections"] == 1
+
+        manager.disconnect("good")
+        assert manager.fanout.connections == {}
@@ -0,0 +1,114 @@
+"""
+Unit tests for compiled alert condition plans.
+Vectorized results are checked against the scalar condition comparer.
+"""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.core.alert_plan import AlertPlan
+from app.models.alert_models import AlertCondition, ComparisonOperator
+from app.services.alert_engine import AlertConditionEvaluator
+from tests.helpers import make_rule
+
+
+def condition(field, operator, value) -> AlertCondition:
+    return AlertCondition(field=field, operator=operator, value=value)
+
+
+class TestAlertPlan:
+    """Test compiled evaluation of many rules at once."""
+
+    def setup_method(self):
+        self.compare = AlertConditionEvaluator(MagicMock())._compare_values
+
+    def test_matches_scalar_comparisons(self):
+        rng = np.random.default_rng(7)
+        operators = [
+            ComparisonOperator.EQUALS, ComparisonOperator.NOT_EQUALS,
+            ComparisonOperator.GREATER_THAN, ComparisonOperator.GREATER_THAN_OR_EQUAL,
+            ComparisonOperator.LESS_THAN, ComparisonOperator.LESS_THAN_OR_EQUAL,
+            ComparisonOperator.BETWEEN, ComparisonOperator.NOT_BETWEEN,
+            ComparisonOperator.PERCENT_CHANGE,
+        ]
+        snapshots = {"AAPL": {"price": 101.0, "rsi": 30.0, "volume": 5000}, "MSFT": {"current_price": 99.5, "rsi": 71.0}}
+
+        rules = []
+        for i in range(300):
+            op = operators[i % len(operators)]
+            field = ("price", "rsi", "volume")[i % 3]
+            if op in (ComparisonOperator.BETWEEN, ComparisonOperator.NOT_BETWEEN):
+                low = int(rng.integers(0, 120))
+                value = [Decimal(low), Decimal(low + int(rng.integers(0, 50)))]
+            else:
+                value = Decimal(str(rng.choice([30, 71, 99.5, 101, 96, 5000, 0, 150])))
+            rules.append((make_rule(f"r{i}", conditions=[condition(field, op, value)]), ["AAPL", "MSFT"]))
+
+        plan = AlertPlan(rules)
+        result = plan.evaluate(snapshots, self.compare)
+
+        expected = []
+        for symbol, snapshot in snapshots.items():
+            for rule, _ in rules:
+                c = rule.conditions[0]
+                value = snapshot.get(c.field, snapshot.get("current_price") if c.field == "price" else None)
+                if value is not None and self.compare(value, c.operator, c.value):
+                    expected.append((rule.rule_id, symbol))
+
+        assert [(m.rule.rule_id, m.symbol) for m in result.triggered] == expected
+        assert result.pairs_evaluated == 600
+
+    def test_and_or_logic_and_missing_symbols(self):
+        above = condition("price", ComparisonOperator.GREATER_THAN, Decimal(100))
+        oversold = condition("rsi", ComparisonOperator.LESS_THAN, Decimal(30))
+        plan = AlertPlan([
+            (make_rule("and", conditions=[above, oversold]), ["AAPL", "TSLA"]),
+            (make_rule("or", conditions=[above, oversold], logic="OR"), ["AAPL"]),
+        ])
+
+        result = plan.evaluate({"AAPL": {"price": 150, "rsi": 45}})
+
+        assert [m.rule.rule_id for m in result.triggered] == ["or"]
+        assert result.pairs_evaluated == 2  # TSLA had no data this tick
+
+    def test_non_numeric_conditions_use_scalar_compare(self):
+        plan = AlertPlan([
+            (make_rule("trend", conditions=[condition("trend", ComparisonOperator.EQUALS, "bullish")]), ["AAPL"]),
+            (make_rule("cross", conditions=[condition("price", ComparisonOperator.CROSSES_ABOVE, Decimal(100))]), ["AAPL"]),
+        ])
+
+        result = plan.evaluate({"AAPL": {"trend": "bullish", "price": 101}}, self.compare)
+
+        assert [m.rule.rule_id for m in result.triggered] == ["trend"]
+        assert len(plan.symbol_plan("AAPL").scalar_conditions) == 2
+
+    def test_rule_changes_recompile_only_their_symbols(self):
+        above = [condition("price", ComparisonOperator.GREATER_THAN, Decimal(100))]
+        plan = AlertPlan([
+            (make_rule("aapl", conditions=above), ["AAPL"]),
+            (make_rule("msft", conditions=above), ["MSFT"]),
+        ])
+        aapl, msft = plan.symbol_plan("AAPL"), plan.symbol_plan("MSFT")
+
+        plan.add(make_rule("aapl2", conditions=above), ["AAPL"])
+        assert plan.symbol_plan("MSFT") is msft
+        assert plan.symbol_plan("AAPL") is not aapl
+        assert [r.rule_id for r in plan.symbol_plan("AAPL").rules] == ["aapl", "aapl2"]
+
+        plan.remove("msft")
+        assert plan.symbol_plan("MSFT") is None
+        assert len(plan) == 2
+
+    def test_evaluation_only_touches_symbols_in_the_tick(self):
+        above = [condition("price", ComparisonOperator.GREATER_THAN, Decimal(100))]
+        plan = AlertPlan((make_rule(f"r{i}", conditions=above), [f"S{i}"]) for i in range(1000))
+
+        result = plan.evaluate({"S7": {"price": 150}})
+
+        assert [(m.rule.rule_id, m.symbol) for m in result.triggered] == [("r7", "S7")]
+        assert result.pairs_evaluated == 1 and result.conditions_evaluated == 1
+        assert plan.symbol_plan("S8") is not None  # compiled on demand
+        assert len(plan._compiled) == 2
@@ -0,0 +1,263 @@
+"""
+Unit tests for the portfolio backtesting engine.
+Covers vectorized signal generation, single-period backtests, columnar results and walk-forward
+optimization on synthetic data.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import date, datetime
+
+from app.core.backtesting_engine import BacktestingEngine, MarketData, SignalGenerator
+from app.models.backtester_models import (
+    BacktestConfiguration, BacktestResult, EquityCurve, Position, SignalRule, Trade,
+    TradeLog, TradingStrategy
+)
+from tests.helpers import SYMBOLS, make_prices
+
+
+def make_strategy(entry_rules=None, exit_rules=None) -> TradingStrategy:
+    return TradingStrategy(
+        name="RSI Mean Reversion",
+        entry_rules=entry_rules or [
+            SignalRule(name="Oversold", indicator="RSI", operator="lt", threshold=40)
+        ],
+        exit_rules=exit_rules or [
+            SignalRule(name="Overbought", indicator="RSI", operator="gt", threshold=60)
+        ],
+        max_positions=3,
+    )
+
+
+class TestVectorizedSignals:
+    """Test signal matrices against the per-date rule evaluation."""
+
+    def setup_method(self):
+        self.prices = make_prices()
+        self.dates = self.prices.index[30:]
+
+    @pytest.mark.parametrize("operator,threshold", [
+        ("gt", 55), ("lt", 45), ("gte", 50), ("lte", 50),
+        ("crossover", 50), ("crossunder", 50),
+    ])
+    def test_rule_matrix_matches_scalar_evaluation(self, operator, threshold):
+        """Each operator produces the same result as evaluate_rule on every date."""
+        rule = SignalRule(name="r", indicator="RSI", operator=operator, threshold=threshold)
+        generator = SignalGenerator(make_strategy(entry_rules=[rule]))
+        indicators = generator.calculate_technical_indicators(self.prices)
+
+        matrix = generator.evaluate_rule_matrix(rule, indicators, SYMBOLS, self.dates)
+
+        assert matrix.shape == (len(self.dates), len(SYMBOLS))
+        for row, current_date in enumerate(self.dates[::7]):
+            for col, symbol in enumerate(SYMBOLS):
+                expected = generator.evaluate_rule(rule, indicators, symbol, current_date.date())
+                assert matrix[row * 7, col] == expected
+
+    def test_missing_indicator_never_fires(self):
+        """Rules on indicators that were not computed produce all-zero matrices."""
+        rule = SignalRule(name="cci", indicator="CCI", operator="gt", threshold=-1000)
+        generator = SignalGenerator(make_strategy(entry_rules=[rule]))
+        indicators = generator.calculate_technical_indicators(self.prices)
+
+        matrix = generator.evaluate_rule_matrix(rule, indicators, SYMBOLS + ['TSLA'], self.dates)
+
+        assert matrix.shape == (len(self.dates), len(SYMBOLS) + 1)
+        assert not matrix.any()
+
+    def test_composite_matrices_are_weighted(self):
+        """Composite signals are the weight-normalized sum of rule matrices."""
+        entry_rules = [
+            SignalRule(name="a", indicator="RSI", operator="gte", threshold=0, weight=0.75),
+            SignalRule(name="b", indicator="CCI", operator="gt", threshold=0, weight=0.25),
+        ]
+        generator = SignalGenerator(make_strategy(entry_rules=entry_rules))
+        indicators = generator.calculate_technical_indicators(self.prices)
+
+        entry, exit_ = generator.generate_signal_matrices(indicators, SYMBOLS, self.dates)
+
+        assert list(entry.columns) == SYMBOLS
+        assert entry.index.equals(self.dates)
+        assert np.allclose(entry.to_numpy(), 0.75)
+        assert exit_.shape == entry.shape
+
+
+class TestSingleBacktest:
+    """Test the day loop driven by precomputed signal matrices."""
+
+    @pytest.mark.asyncio
+    async def test_run_backtest_trades_on_signals(self):
+        prices = make_prices()
+        config = BacktestConfiguration(
+            strategy=make_strategy(),
+            universe=SYMBOLS,
+            start_date=date(2022, 2, 1),
+            end_date=date(2023, 1, 31),
+        )
+        market_data = MarketData(
+            prices=prices,
+            indicators=pd.DataFrame(),
+            risk_free_rate=pd.Series(dtype=float),
+            benchmark=pd.Series(dtype=float),
+        )
+
+        result = await BacktestingEngine().run_backtest(config, market_data)
+
+        assert len(result.equity_curve) > 200
+        assert result.trade_log
+        assert {trade.symbol for trade in result.trade_log} <= set(SYMBOLS)
+        assert all(trade.signal_strength >= 0.5 for trade in result.trade_log)
+
+
+def make_market_data(prices=None) -> MarketData:
+    return MarketData(
+        prices=make_prices() if prices is None else prices,
+        indicators=pd.DataFrame(),
+        risk_free_rate=pd.Series(dtype=float),
+        benchmark=pd.Series(dtype=float),
+    )
+
+
+class TestColumnarResults:
+    """Test the columnar equity curve and trade log."""
+
+    def make_position(self, symbol='AAPL', price=101.0) -> Position:
+        return Position(
+            symbol=symbol, quantity=10, entry_price=100.0, current_price=price,
+            entry_date=date(2022, 1, 3), market_value=10 * price,
+            unrealized_pnl=10 * (price - 100.0), unrealized_pnl_pct=(price - 100.0) / 100.0,
+            portfolio_weight=0.1, sector='Technology',
+        )
+
+    def test_equity_curve_copies_position_state(self):
+        curve = EquityCurve()
+        position = self.make_position()
+        curve.append(date(2022, 1, 3), 10_000.0, 8_990.0, [position], leverage=0.101)
+
+        position.current_price = 150.0
+        curve.append(date(2022, 1, 4), 10_500.0, 9_000.0, [], daily_return_pct=0.05)
+
+        first, second = curve
+        assert first.date == date(2022, 1, 3)
+        assert first.positions[0].current_price == 101.0
+        assert first.positions[0].sector == 'Technology'
+        assert first.positions[0].volatility is None
+        assert second.num_positions == 0 and second.positions == []
+        assert curve[-1].daily_return_pct == 0.05
+        np.testing.assert_allclose(curve.returns, [0.05])
+
+    def test_trade_log_round_trip(self):
+        trades = [
+            Trade(trade_id=str(i), symbol=symbol, action=action, quantity=5, price=10.0,
+                  timestamp=datetime(2022, 1, 3 + i), signal_strength=0.7,
+                  portfolio_weight=0.05, pnl=pnl)
+            for i, (symbol, action, pnl) in enumerate([
+                ('AAPL', 'BUY', None), ('AAPL', 'SELL', 12.5), ('MSFT', 'SELL', -3.0),
+            ])
+        ]
+
+        log = TradeLog.from_models(trades)
+
+        assert log.to_models() == trades
+        assert list(log.symbols) == ['AAPL', 'AAPL', 'MSFT']
+        assert [t.trade_id for t in log.top_trades(5)] == ['1']
+        assert [t.trade_id for t in log.top_trades(5, winners=False)] == ['2']
+
+    @pytest.mark.asyncio
+    async def test_result_serializes_lazily_built_snapshots(self):
+        config = BacktestConfiguration(
+            strategy=make_strategy(), universe=SYMBOLS,
+            start_date=date(2022, 2, 1), end_date=date(2023, 1, 31),
+        )
+        result = await BacktestingEngine().run_backtest(config, make_market_data())
+
+        assert isinstance(result.equity_curve, EquityCurve)
+        assert isinstance(result.trade_log, TradeLog)
+
+        restored = BacktestResult.parse_raw(result.json())
+        assert len(restored.equity_curve) == len(result.equity_curve)
+        np.testing.assert_allclose(restored.equity_curve.total_values, result.equity_curve.total_values)
+        assert restored.trade_log.to_models() == result.trade_log.to_models()
+        assert result.dict()['equity_curve'][-1]['num_positions'] == result.equity_curve[-1].num_positions
+
+    def test_rolling_metrics_match_loop(self):
+        rng = np.random.default_rng(3)
+        values = 100 * np.cumprod(1 + rng.normal(0, 0.01, 80))
+        curve = EquityCurve()
+        for day, value in zip(pd.bdate_range('2022-01-03', periods=80), values):
+            curve.append(day.date(), float(value), float(value), [])
+
+        engine = BacktestingEngine()
+        returns = values[1:] / values[:-1] - 1
+        expected_vol = [np.std(returns[i - 20:i]) * np.sqrt(252) for i in range(20, len(returns))]
+        expected_sharpe = [
+            (np.mean(returns[i - 20:i]) * 252 - 0.02) / (np.std(returns[i - 20:i]) * np.sqrt(252))
+            for i in range(20, len(returns))
+        ]
+
+        np.testing.assert_allclose(engine._calculate_rolling_volatility(curve, window=20), expected_vol)
+        np.testing.assert_allclose(engine._calculate_rolling_sharpe(curve, window=20), expected_sharpe)
+        assert engine._calculate_rolling_sharpe(curve, window=100) == []
+
+
+class TestWalkForward:
+    """Test walk-forward window generation and parallel optimization."""
+
+    def make_config(self, **overrides) -> BacktestConfiguration:
+        settings = dict(
+            strategy=make_strategy(),
+            universe=SYMBOLS,
+            start_date=date(2022, 1, 3),
+            end_date=date(2023, 2, 24),
+            enable_walk_forward=True,
+            training_window_days=120,
+            test_window_days=40,
+            step_size_days=40,
+        )
+        settings.update(overrides)
+        return BacktestConfiguration(**settings)
+
+    def test_windows_roll_by_step(self):
+        prices = make_prices()
+        windows = BacktestingEngine()._generate_walk_forward_windows(self.make_config(), prices)
+
+        assert len(windows) == 4
+        for window in windows:
+            assert window.train_start < window.train_end < window.test_start <= window.test_end
+        assert windows[1].train_start == prices.index[40].date()
+
+    def test_parameter_grid_expansion_and_application(self):
+        engine = BacktestingEngine()
+        grid = engine._expand_parameter_grid({
+            'entry_rules.0.threshold': [30.0, 40.0],
+            'max_positions': [2, 3],
+        })
+
+        assert len(grid) == 4
+        strategy = engine._apply_strategy_parameters(make_strategy(), grid[-1])
+        assert strategy.entry_rules[0].threshold == 40.0
+        assert strategy.max_positions == 3
+        assert engine._expand_parameter_grid(None) == [{}]
+
+        with pytest.raises(ValueError, match="Unknown strategy parameter"):
+            engine._apply_strategy_parameters(make_strategy(), {'entry_rules.5.threshold': 1.0})
+
+    @pytest.mark.asyncio
+    async def test_walk_forward_results_per_window(self):
+        config = self.make_config(parameter_grid={'entry_rules.0.threshold': [35.0, 45.0]})
+        market_data = MarketData(
+            prices=make_prices(),
+            indicators=pd.DataFrame(),
+            risk_free_rate=pd.Series(dtype=float),
+            benchmark=pd.Series(dtype=float),
+        )
+
+        result = await BacktestingEngine(max_workers=2).run_backtest(config, market_data)
+
+        assert result.walk_forward_results
+        assert len(result.walk_forward_results) <= 4
+        for window_result in result.walk_forward_results:
+            assert window_result.optimized_parameters['entry_rules.0.threshold'] in (35.0, 45.0)
+            assert 0.0 <= window_result.stability_score <= 1.0
+            assert window_result.test_metrics.start_date >= window_result.train_end
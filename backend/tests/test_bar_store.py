@@ -0,0 +1,159 @@
+"""
+Unit tests for the incremental OHLCV bar store.
+All data comes from the offline fake provider with a controllable clock.
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.core.bar_store import BarStore, FakeBarProvider, frame_to_array, merge_bars
+
+
+class Clock:
+    def __init__(self, now: str):
+        self.now = pd.Timestamp(now)
+
+    def __call__(self) -> pd.Timestamp:
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += pd.Timedelta(**kwargs)
+
+
+class TestBarStore:
+    """Test incremental fetching, backfill and zero-copy slices."""
+
+    @pytest.fixture(autouse=True)
+    def setup_store(self, tmp_path):
+        self.clock = Clock("2024-06-14 18:00")
+        self.provider = FakeBarProvider(clock=self.clock)
+        self.store = BarStore(tmp_path, self.provider, clock=self.clock)
+
+    async def reference(self, symbol: str, period_days: int) -> pd.DataFrame:
+        """What a full download of the period would return."""
+        start = (self.clock() - pd.Timedelta(days=period_days)).normalize()
+        return await FakeBarProvider(clock=self.clock)(symbol, "1d", start, None)
+
+    @pytest.mark.asyncio
+    async def test_first_request_fetches_period_once(self):
+        bars = await self.store.get_bars("AAPL", "1d", "1y")
+        again = await self.store.get_bars("AAPL", "1d", "1y")
+
+        expected = await self.reference("AAPL", 366)
+        pd.testing.assert_frame_equal(bars.to_frame(), expected, check_freq=False)
+        assert len(again) == len(bars)
+        assert len(self.provider.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_fetches_only_new_bars(self):
+        await self.store.get_bars("AAPL", "1d", "1y")
+        last_stored = self.store._read("AAPL", "1d")[0][-1, 0]
+
+        self.clock.advance(days=3)
+        bars = await self.store.get_bars("AAPL", "1d", "1y")
+
+        _, _, start, end = self.provider.calls[-1]
+        assert start == pd.Timestamp(last_stored, unit="s") and end is None
+        pd.testing.assert_frame_equal(bars.to_frame(), await self.reference("AAPL", 366), check_freq=False)
+
+    @pytest.mark.asyncio
+    async def test_refresh_appends_in_place(self):
+        await self.store.get_bars("AAPL", "1d", "1y")
+        data_path, _ = self.store._paths("AAPL", "1d")
+        inode, rows = data_path.stat().st_ino, len(self.store._read("AAPL", "1d")[0])
+
+        self.clock.advance(days=3)
+        await self.store.get_bars("AAPL", "1d", "1y")
+
+        assert data_path.stat().st_ino == inode
+        assert len(self.store._read("AAPL", "1d")[0]) > rows
+
+    @pytest.mark.asyncio
+    async def test_revised_bars_do_not_change_earlier_slices(self):
+        earlier = await self.store.get_bars("AAPL", "1d", "1y")
+        closes = earlier.close.copy()
+
+        async def revised(symbol, interval, start, end):
+            frame = await self.provider(symbol, interval, start, end)
+            frame["Close"] += 1.0
+            return frame
+
+        self.store.fetch = revised
+        self.clock.advance(days=3)
+        bars = await self.store.get_bars("AAPL", "1d", "1y")
+
+        np.testing.assert_array_equal(earlier.close, closes)
+        assert bars.close[bars.index.get_loc(earlier.index[-1])] == closes[-1] + 1.0
+
+    @pytest.mark.asyncio
+    async def test_longer_period_backfills_older_history_only(self):
+        await self.store.get_bars("AAPL", "1d", "6mo")
+        bars = await self.store.get_bars("AAPL", "1d", "2y")
+
+        _, _, start, end = self.provider.calls[-1]
+        assert end == (self.clock() - pd.Timedelta(days=183)).normalize()
+        pd.testing.assert_frame_equal(bars.to_frame(), await self.reference("AAPL", 731), check_freq=False)
+
+        # Shorter periods are now served from the store
+        calls = len(self.provider.calls)
+        assert len(await self.store.get_bars("AAPL", "1d", "1y")) < len(bars)
+        assert len(self.provider.calls) == calls
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_fetch(self):
+        results = await asyncio.gather(*(self.store.get_bars("MSFT", "1d", "1y") for _ in range(5)))
+
+        assert len(self.provider.calls) == 1
+        assert all(len(bars) == len(results[0]) for bars in results)
+
+    @pytest.mark.asyncio
+    async def test_slices_are_views_of_the_mapped_file(self):
+        bars = await self.store.get_bars("AAPL", "1d", "1y")
+        frame = bars.to_frame()
+
+        assert isinstance(bars.values.base, np.memmap) or isinstance(bars.values, np.memmap)
+        assert np.shares_memory(frame["Close"].to_numpy(), bars.close)
+        assert bars.close.flags.c_contiguous
+        assert not bars.close.flags.writeable
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_after_max_age(self):
+        await self.store.get_bars("AAPL", "1d", "1y")
+        self.clock.advance(days=8)
+        await self.store.get_bars("AAPL", "1d", "1y")
+
+        _, _, start, _ = self.provider.calls[-1]
+        assert start == (self.clock() - pd.Timedelta(days=366)).normalize()
+
+    @pytest.mark.asyncio
+    async def test_unknown_symbol_returns_none(self):
+        async def empty(symbol, interval, start, end):
+            return pd.DataFrame()
+
+        store = BarStore(self.store.root, empty, clock=self.clock)
+        assert await store.get_bars("NOPE", "1d", "1y") is None
+
+
+class TestBarArrays:
+    """Test frame conversion and merging."""
+
+    def test_merge_replaces_overlapping_bars(self):
+        index = pd.date_range("2024-01-01", periods=5, freq="D")
+        stored = frame_to_array(pd.DataFrame({c: np.arange(5.0) for c in ("Open", "High", "Low", "Close", "Volume")}, index=index))
+        update = frame_to_array(pd.DataFrame({c: [10.0, 11.0, 12.0] for c in ("Open", "High", "Low", "Close", "Volume")},
+                                             index=pd.date_range("2024-01-05", periods=3, freq="D")))
+
+        merged = merge_bars(stored, update)
+
+        np.testing.assert_array_equal(merged[:, 4], [0, 1, 2, 3, 10, 11, 12])
+        assert merged.flags.f_contiguous
+
+    def test_timezone_dropped_to_wall_clock(self):
+        index = pd.date_range("2024-01-02", periods=2, freq="D", tz="America/New_York")
+        array = frame_to_array(pd.DataFrame({"Close": [1.0, 2.0]}, index=index))
+
+        assert pd.Timestamp(array[0, 0], unit="s") == pd.Timestamp("2024-01-02")
+        assert np.isnan(array[0, 1])  # missing Open column
@@ -0,0 +1,70 @@
+"""
+Unit tests for request coalescing into bulk fetches.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.batch_fetcher import BatchCoalescer
+
+
+class RecordingFetch:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.batches = []
+
+    async def __call__(self, keys):
+        self.batches.append(list(keys))
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return {key: key.lower() for key in keys if key != "MISSING"}
+
+
+class TestBatchCoalescer:
+    """Test merging, chunking and sharing of bulk fetches."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_bulk_fetch(self):
+        fetch = RecordingFetch()
+        coalescer = BatchCoalescer(fetch, max_batch=10, max_wait=0.01)
+
+        results = await asyncio.gather(*(coalescer.get(symbol) for symbol in ("AAPL", "MSFT", "AAPL", "NVDA")))
+
+        assert results == ["aapl", "msft", "aapl", "nvda"]
+        assert len(fetch.batches) == 1
+        assert sorted(fetch.batches[0]) == ["AAPL", "MSFT", "NVDA"]
+
+    @pytest.mark.asyncio
+    async def test_batches_are_split_at_max_batch(self):
+        fetch = RecordingFetch()
+        coalescer = BatchCoalescer(fetch, max_batch=2, max_wait=10)
+
+        results = await coalescer.get_many(["A", "B", "C", "D", "E"])
+
+        assert results == {"A": "a", "B": "b", "C": "c", "D": "d", "E": "e"}
+        assert all(len(batch) <= 2 for batch in fetch.batches)
+        assert coalescer.bulk_calls == 3
+
+    @pytest.mark.asyncio
+    async def test_in_flight_keys_are_not_fetched_again(self):
+        fetch = RecordingFetch(delay=0.05)
+        coalescer = BatchCoalescer(fetch, max_batch=10, max_wait=0)
+
+        first = asyncio.ensure_future(coalescer.get_many(["AAPL", "MSFT"]))
+        await asyncio.sleep(0.01)
+        second = await coalescer.get_many(["MSFT", "TSLA"])
+
+        assert second == {"MSFT": "msft", "TSLA": "tsla"}
+        assert await first == {"AAPL": "aapl", "MSFT": "msft"}
+        assert fetch.batches == [["AAPL", "MSFT"], ["TSLA"]]
+
+    @pytest.mark.asyncio
+    async def test_omitted_and_failed_keys_resolve_to_none(self):
+        coalescer = BatchCoalescer(RecordingFetch(), max_wait=0)
+        assert await coalescer.get_many(["AAPL", "MISSING"]) == {"AAPL": "aapl", "MISSING": None}
+
+        failing = BatchCoalescer(RecordingFetch(fail=True), max_wait=0)
+        assert await failing.get("AAPL") is None
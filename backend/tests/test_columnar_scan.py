@@ -0,0 +1,200 @@
+"""
+Tests for columnar scanner evaluation
+"""
+
+import time
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.core.columnar_scan import FILTER_NAMES, UniverseColumns, filter_masks, group_mask, scan_columns
+from app.core.scanner_engine import ScannerEngine
+from app.core.universe_snapshot import UniverseSnapshotService
+from app.models.scanner_models import (
+    AssetType, ComparisonOperator, FilterCondition, FilterGroup, FundamentalFilter, MomentumFilter,
+    PatternFilter, PriceFilter, ScannerConfig, ScannerType, TechnicalFilter, TimeFrame, VolumeFilter
+)
+
+
+def make_universe(count, seed=7, numeric_only=False):
+    """Random asset data, including missing keys, None values and malformed sections."""
+    rng = np.random.default_rng(seed)
+    sectors = ['technology', 'healthcare', 'energy', None]
+    universe = {}
+    for i in range(count):
+        price = float(rng.uniform(1, 500))
+        data = {
+            'price': price,
+            'change': float(rng.normal(0, 3)),
+            'change_percent': float(rng.normal(0, 3)),
+            'volume': int(rng.integers(0, 5_000_000)),
+            'avg_volume': int(rng.integers(0, 3_000_000)),
+            'high': price * float(rng.uniform(1, 1.1)),
+            'low': price * float(rng.uniform(0.9, 1)),
+            'indicators': {
+                'rsi': float(rng.uniform(0, 100)),
+                'macd_histogram': float(rng.normal()),
+                'adx': float(rng.uniform(0, 60)),
+                'vwap': price * float(rng.uniform(0.97, 1.03)),
+                'rate_of_change': float(rng.normal(0, 5)),
+                'relative_strength': float(rng.uniform(0, 100)),
+            },
+            'fundamentals': {
+                'market_cap': float(rng.uniform(1e8, 1e12)),
+                'pe_ratio': float(rng.uniform(-10, 60)),
+                'sector': sectors[i % len(sectors)],
+            },
+            'patterns': [
+                {'type': ['breakout', 'flag', 'wedge'][int(rng.integers(3))], 'confidence': float(rng.uniform(0, 100))}
+                for _ in range(int(rng.integers(0, 3)))
+            ],
+        }
+        if not numeric_only:
+            data['indicators']['bollinger_position'] = ['upper', 'middle', 'lower'][i % 3]
+            if i % 11 == 0:
+                del data['indicators']['rsi']
+            if i % 13 == 0:
+                data['fundamentals']['market_cap'] = None
+            if i % 17 == 0:
+                del data['high']
+            if i % 19 == 0:
+                data['indicators'] = None
+            if i % 23 == 0:
+                data['avg_volume'] = None
+        universe[f"S{i:05d}"] = data
+    return universe
+
+
+def make_config(**kwargs):
+    defaults = dict(name="test", scanner_type=ScannerType.CUSTOM, asset_types=[AssetType.STOCK])
+    defaults.update(kwargs)
+    return ScannerConfig(**defaults)
+
+
+FILTERS = {
+    'price': PriceFilter(min_price=Decimal('20'), max_price=Decimal('400'), price_change_percent=Decimal('0.5'),
+                         above_vwap=True, near_high=Decimal('8')),
+    'volume': VolumeFilter(min_volume=100_000, volume_ratio=Decimal('0.8'), dollar_volume=Decimal('1e7')),
+    'technical': TechnicalFilter(rsi_min=Decimal('30'), rsi_max=Decimal('80'), macd_signal='bullish',
+                                 adx_min=Decimal('15'), bollinger_position='upper'),
+    'fundamental': FundamentalFilter(market_cap_min=Decimal('1e9'), pe_ratio_max=Decimal('40'),
+                                     sector=['technology', 'energy']),
+    'momentum': MomentumFilter(rate_of_change=Decimal('2'), relative_strength=Decimal('40')),
+    'pattern': PatternFilter(pattern_types=['breakout', 'flag'], confidence_min=Decimal('30')),
+}
+
+
+class TestColumnarMasks:
+    """Test that filter masks agree with the row-wise filter checks."""
+
+    def setup_method(self):
+        self.engine = ScannerEngine(columnar=False)
+        self.universe = make_universe(600)
+        self.columns = UniverseColumns(self.universe)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("name", FILTER_NAMES)
+    async def test_filter_mask_matches_row_check(self, name):
+        config = make_config(**{f"{name}_filter": FILTERS[name]})
+        check = getattr(self.engine, f"_check_{name}_filter")
+
+        mask = filter_masks(self.columns, config)[name]
+
+        expected = []
+        for data in self.universe.values():
+            try:
+                expected.append(await check(data, FILTERS[name]))
+            except Exception:
+                expected.append(False)  # _passes_filters rejects rows that raise
+        assert 0 < mask.sum() < len(mask)
+        assert mask.tolist() == expected
+
+    @pytest.mark.asyncio
+    async def test_filter_group_matches_row_evaluation(self):
+        group = FilterGroup(operator="OR", conditions=[
+            FilterCondition(field="indicators.rsi", operator=ComparisonOperator.LESS_THAN, value=25),
+            FilterCondition(field="fundamentals.sector", operator=ComparisonOperator.EQUALS, value="energy"),
+        ], groups=[FilterGroup(operator="AND", conditions=[
+            FilterCondition(field="price", operator=ComparisonOperator.BETWEEN, value=[50, 100]),
+            FilterCondition(field="volume", operator=ComparisonOperator.GREATER_THAN_OR_EQUAL, value=1_000_000),
+        ])])
+
+        mask = group_mask(self.columns, group)
+
+        expected = [await self.engine._evaluate_filter_group(data, group) for data in self.universe.values()]
+        assert mask.tolist() == expected
+
+    def test_match_score_and_matched_filters_come_from_masks(self):
+        config = make_config(price_filter=FILTERS['price'], volume_filter=FILTERS['volume'], limit=1000)
+        scan = scan_columns(self.columns, config)
+
+        row = int(np.flatnonzero(scan.filter_masks['price'] & ~scan.filter_masks['volume'])[0])
+        assert scan.match_score[row] == 50.0
+        assert scan.matched_filters(row) == ['price']
+        assert set(scan.rows) == set(np.flatnonzero(scan.filter_masks['price'] & scan.filter_masks['volume']))
+
+
+class TestColumnarScanner:
+    """Test that columnar scans return the same results as row-wise scans."""
+
+    async def make_snapshot(self, universe, symbols):
+        async def fetch(symbols, time_frame):
+            return {symbol: dict(universe[symbol], symbol=symbol, asset_type=AssetType.STOCK) for symbol in symbols}
+
+        return await UniverseSnapshotService(fetch).get_snapshot(symbols, TimeFrame.DAY_1)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort_by, sort_order", [
+        (None, "desc"), ("price", "desc"), ("volume", "asc"), ("indicators.rsi", "desc"), ("name", "asc"),
+    ])
+    async def test_results_match_row_wise_scan(self, sort_by, sort_order):
+        universe = make_universe(400, numeric_only=True)
+        config = make_config(
+            universe=list(universe)[:300], price_filter=FILTERS['price'], momentum_filter=FILTERS['momentum'],
+            custom_conditions=FilterGroup(conditions=[
+                FilterCondition(field="indicators.adx", operator=ComparisonOperator.GREATER_THAN, value=10),
+            ]),
+            sort_by=sort_by, sort_order=sort_order, limit=15,
+        )
+        snapshot = await self.make_snapshot(universe, list(universe))
+
+        rows = await ScannerEngine(columnar=False)._scan_rows(snapshot.select(config.universe), config)
+        columnar = ScannerEngine()._scan_columnar(snapshot, config.universe, config)
+
+        assert columnar[1] == rows[1] > 15
+        assert [r.symbol for r in columnar[0]] == [r.symbol for r in rows[0]]
+        assert [(r.match_score, r.matched_filters) for r in columnar[0]] == \
+            [(r.match_score, r.matched_filters) for r in rows[0]]
+        assert all(r.symbol in config.universe for r in columnar[0])
+
+    @pytest.mark.asyncio
+    async def test_run_scanner_ranks_columnar_results(self):
+        universe = make_universe(200, numeric_only=True)
+        engine = ScannerEngine()
+
+        async def fetch(symbols, time_frame):
+            return {symbol: dict(universe[symbol], symbol=symbol) for symbol in symbols}
+
+        engine.snapshots.fetch_assets = fetch
+        config = make_config(universe=sorted(universe), volume_filter=FILTERS['volume'], sort_by="volume", limit=5)
+
+        response = await engine.run_scanner(config)
+
+        assert [r.rank for r in response.results] == [1, 2, 3, 4, 5]
+        volumes = [r.volume for r in response.results]
+        assert volumes == sorted(volumes, reverse=True)
+        assert response.filters_applied > 5
+
+    def test_large_universe_scan_is_fast(self):
+        columns = UniverseColumns(make_universe(10_000, numeric_only=True))
+        config = make_config(**{f"{name}_filter": f for name, f in FILTERS.items() if name != 'technical'},
+                             sort_by="price", limit=100)
+        scan_columns(columns, config)  # load columns
+
+        start = time.perf_counter()
+        scan = scan_columns(columns, config)
+        elapsed = time.perf_counter() - start
+
+        assert scan.match_count > 0
+        assert elapsed < 0.05
@@ -0,0 +1,236 @@
+"""
+Tests for incremental scans and result deltas
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.core.columnar_scan import UniverseColumns, scan_columns
+from app.core.incremental_scan import IncrementalScan, diff_rankings
+from app.core.scanner_engine import ScannerEngine
+from app.core.universe_snapshot import UniverseSnapshotService
+from app.models.scanner_models import AssetType, SavedScanner, ScannerConfig, ScannerType, TimeFrame, VolumeFilter
+from app.services.scanner_websocket_manager import ScannerWebSocketManager, ad_hoc_scanner_id
+
+
+def make_config(**kwargs):
+    defaults = dict(name="test", scanner_type=ScannerType.VOLUME, asset_types=[AssetType.STOCK],
+                    volume_filter=VolumeFilter(min_volume=1000), sort_by="volume", limit=3)
+    defaults.update(kwargs)
+    return ScannerConfig(**defaults)
+
+
+class FeedUniverse:
+    """Universe whose symbol data the test changes between snapshots."""
+
+    def __init__(self, volumes):
+        self.data = {symbol: {'price': 10.0, 'volume': volume} for symbol, volume in volumes.items()}
+        self.service = UniverseSnapshotService(self.fetch, refresh_interval=0)
+
+    async def fetch(self, symbols, time_frame):
+        return {symbol: self.data[symbol] for symbol in symbols if symbol in self.data}
+
+    def set_volume(self, symbol, volume):
+        self.data[symbol] = dict(self.data.get(symbol, {'price': 10.0}), volume=volume)
+
+    async def snapshot(self):
+        return await self.service.get_snapshot(list(self.data), TimeFrame.DAY_1)
+
+
+class TestIncrementalScan:
+    """Test incremental evaluation and deltas."""
+
+    def setup_method(self):
+        self.feed = FeedUniverse({"A": 5000, "B": 4000, "C": 3000, "D": 2000, "E": 500})
+        self.scan = IncrementalScan(make_config())
+
+    async def update(self):
+        return self.scan.update(await self.feed.snapshot(), list(self.feed.data))
+
+    @pytest.mark.asyncio
+    async def test_first_update_enters_ranked_results(self):
+        delta = await self.update()
+
+        assert [row['symbol'] for row in delta.entered] == ["A", "B", "C"]
+        assert [row['rank'] for row in delta.entered] == [1, 2, 3]
+        assert delta.evaluated == 5
+        assert self.scan.match_count == 4
+        assert self.scan.rows() == delta.entered
+
+    @pytest.mark.asyncio
+    async def test_unchanged_universe_evaluates_nothing(self):
+        await self.update()
+        delta = await self.update()
+
+        assert delta.evaluated == 0
+        assert not delta
+        assert delta.version == self.scan.version
+
+    @pytest.mark.asyncio
+    async def test_changed_symbols_produce_enter_exit_and_move(self):
+        await self.update()
+        self.feed.set_volume("D", 3500)  # D climbs past C
+        self.feed.set_volume("A", 100)  # A stops matching
+
+        delta = await self.update()
+
+        assert delta.evaluated == 2
+        assert [row['symbol'] for row in delta.entered] == ["D"]
+        assert delta.exited == ["A"]
+        assert delta.moved == [{"symbol": "B", "rank": 1, "previous_rank": 2}]
+        assert self.scan.ranking == {"B": 1, "D": 2, "C": 3}
+
+    @pytest.mark.asyncio
+    async def test_dropped_symbols_exit(self):
+        await self.update()
+
+        delta = self.scan.update(await self.feed.snapshot(), ["B", "C", "D", "E"])
+
+        assert delta.exited == ["A"]
+        assert [m['symbol'] for m in delta.moved] == ["B", "C"]
+        assert [row['symbol'] for row in delta.entered] == ["D"]
+        assert self.scan.scanned == 4
+
+    @pytest.mark.asyncio
+    async def test_ranking_matches_full_scan(self):
+        volumes = {f"S{i:03d}": (i * 7919) % 10_007 for i in range(200)}
+        feed = FeedUniverse(volumes)
+        config = make_config(limit=25)
+        scan = IncrementalScan(config)
+        scan.update(await feed.snapshot(), list(volumes))
+
+        for i in range(0, 200, 9):
+            feed.set_volume(f"S{i:03d}", (i * 104729) % 10_007)
+        snapshot = await feed.snapshot()
+        delta = scan.update(snapshot, list(volumes))
+
+        full = scan_columns(UniverseColumns(snapshot.assets), config)
+        assert delta.evaluated == 22  # S000 was set to its current volume
+        assert list(scan.ranking) == [snapshot.columns.symbols[row] for row in full.rows]
+
+
+class TestDiffRankings:
+    """Test ranking comparison."""
+
+    def test_diff_rankings(self):
+        entered, exited, moved = diff_rankings({"A": 1, "B": 2, "C": 3}, {"B": 1, "D": 2, "C": 3})
+
+        assert (entered, exited, moved) == (["D"], ["A"], ["B"])
+
+
+class RecordingConnections:
+    """Connection manager stand-in that records sent messages."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def send_personal_message(self, message, client_id):
+        self.messages.append((client_id, message))
+
+    async def send_to_clients(self, client_ids, message):
+        self.messages.extend((client_id, message) for client_id in client_ids)
+
+
+class TestScannerStreaming:
+    """Test shared scanner streams."""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_scan_and_receive_deltas(self):
+        feed = FeedUniverse({"A": 5000, "B": 4000, "C": 3000})
+        engine = ScannerEngine()
+        engine.snapshots = feed.service
+        rescans = []
+
+        async def universe(config):
+            rescans.append(config.name)
+            return list(feed.data)
+
+        engine._get_asset_universe = universe
+        connections = RecordingConnections()
+        manager = ScannerWebSocketManager(connections)
+        manager.scanner_engine = engine
+        config = make_config().dict()
+
+        for client_id in ("c1", "c2", "c3"):
+            await manager._handle_subscribe_scanner(client_id, {
+                "scanner_id": "vol", "config": config, "interval_seconds": 30
+            })
+        scanner_id = ad_hoc_scanner_id(make_config())
+        stream = manager.scanner_streams[scanner_id]
+        await asyncio.sleep(0.05)
+
+        deltas = [(client, m) for client, m in connections.messages if m["type"] == "scanner_delta"]
+        assert len(rescans) == 1
+        assert sorted(client for client, _ in deltas) == ["c1", "c2", "c3"]
+        assert [row['symbol'] for row in deltas[0][1]['entered']] == ["A", "B", "C"]
+
+        # A late subscriber starts from the current results
+        await manager._handle_subscribe_scanner("c4", {"scanner_id": scanner_id, "interval_seconds": 30})
+        confirmation = connections.messages[-1][1]
+        assert confirmation["version"] == stream.scan.version
+        assert [row['symbol'] for row in confirmation["results"]] == ["A", "B", "C"]
+
+        for client_id in ("c1", "c2", "c3", "c4"):
+            manager.cleanup_client(client_id)
+        assert scanner_id not in manager.scanner_streams
+        assert scanner_id not in manager.scanners
+        await asyncio.sleep(0)
+        assert stream.task.cancelled() or stream.task.done()
+
+    @pytest.mark.asyncio
+    async def test_ad_hoc_scanners_with_the_same_id_do_not_collide(self):
+        connections = RecordingConnections()
+        manager = ScannerWebSocketManager(connections)
+        manager._start_stream = lambda stream: None
+
+        for client_id, limit in (("c1", 3), ("c2", 5)):
+            await manager._handle_subscribe_scanner(client_id, {
+                "scanner_id": "mine", "config": make_config(limit=limit).dict(), "interval_seconds": 30
+            })
+
+        ids = [m["scanner_id"] for _, m in connections.messages if m["type"] == "scanner_subscription_confirmed"]
+        assert ids == [ad_hoc_scanner_id(make_config(limit=3)), ad_hoc_scanner_id(make_config(limit=5))]
+        assert manager.scanner_streams[ids[1]].scanner.config.limit == 5
+
+        await manager._handle_unsubscribe_scanner("c1", {"scanner_id": ids[0]})
+        assert ids[0] not in manager.scanners and ids[1] in manager.scanners
+
+    @pytest.mark.asyncio
+    async def test_saved_scanner_streams_by_id_and_follows_updates(self):
+        feed = FeedUniverse({"A": 5000, "B": 4000, "C": 3000, "D": 2000})
+        engine = ScannerEngine()
+        engine.snapshots = feed.service
+
+        async def universe(config):
+            return list(feed.data)
+
+        engine._get_asset_universe = universe
+        connections = RecordingConnections()
+        manager = ScannerWebSocketManager(connections)
+        manager.scanner_engine = engine
+
+        now = datetime.utcnow()
+        saved = SavedScanner(scanner_id="saved-1", user_id="u1", name="vol", config=make_config(),
+                             created_at=now, updated_at=now)
+        manager.register_scanner(saved)
+        await manager._handle_subscribe_scanner("c1", {"scanner_id": "saved-1", "interval_seconds": 30})
+        await asyncio.sleep(0.05)
+
+        confirmation = connections.messages[0][1]
+        assert confirmation["type"] == "scanner_subscription_confirmed"
+        assert confirmation["scanner_id"] == "saved-1"
+        stream = manager.scanner_streams["saved-1"]
+        assert stream.scan.ranking == {"A": 1, "B": 2, "C": 3}
+
+        # An update restarts the scan from the current ranking
+        manager.register_scanner(saved.copy(update={"config": make_config(limit=2)}))
+        delta = stream.scan.update(await feed.snapshot(), list(feed.data))
+        assert delta.exited == ["C"] and delta.entered == []
+
+        manager.unregister_scanner("saved-1")
+        assert "saved-1" not in manager.scanners and "saved-1" not in manager.scanner_streams
+        assert "c1" not in manager.scanner_subscriptions
+        await asyncio.sleep(0)
+        assert stream.task.cancelled() or stream.task.done()
@@ -0,0 +1,85 @@
+"""
+Unit tests for the batched technical indicator kernel.
+Validates panel results against per-symbol pandas calculations.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from app.core.indicator_kernel import IndicatorKernel, PricePanel, PANEL_INDICATORS
+from tests.helpers import SYMBOLS, make_prices
+
+
+def reference_indicators(symbol_data: pd.DataFrame) -> dict:
+    """Per-symbol pandas formulas the kernel must reproduce."""
+    close, high, low = symbol_data['Close'], symbol_data['High'], symbol_data['Low']
+
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).rolling(14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
+    macd = close.ewm(span=12).mean() - close.ewm(span=26).mean()
+    tr = np.maximum(high - low, np.maximum((high - close.shift()).abs(), (low - close.shift()).abs()))
+    low_min, high_max = low.rolling(14).min(), high.rolling(14).max()
+    stoch_k = 100 * (close - low_min) / (high_max - low_min)
+    direction = np.sign(close.diff()).fillna(0)
+
+    return {
+        'SMA_20': close.rolling(20).mean(),
+        'EMA_26': close.ewm(span=26).mean(),
+        'RSI': 100 - (100 / (1 + gain / loss)),
+        'MACD': macd,
+        'MACD_Signal': macd.ewm(span=9).mean(),
+        'BB_UPPER': close.rolling(20).mean() + 2 * close.rolling(20).std(),
+        'ATR': tr.rolling(14).mean(),
+        'STOCH_K': stoch_k,
+        'STOCH_D': stoch_k.rolling(3).mean(),
+        'OBV': (direction * symbol_data['Volume']).cumsum(),
+    }
+
+
+class TestIndicatorKernel:
+    """Test batched indicator calculations."""
+
+    def setup_method(self):
+        self.prices = make_prices(SYMBOLS + ['TSLA'])
+
+    def test_panel_matches_per_symbol_reference(self):
+        frame = IndicatorKernel.compute_frame(self.prices)
+
+        for symbol in ['AAPL', 'TSLA']:
+            expected = reference_indicators(self.prices.xs(symbol, level=1, axis=1))
+            for name, series in expected.items():
+                np.testing.assert_allclose(
+                    frame[(name, symbol)].to_numpy(), series.to_numpy(),
+                    rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=f"{name} {symbol}"
+                )
+
+    def test_frame_layout(self):
+        frame = IndicatorKernel.compute_frame(self.prices)
+
+        assert frame.index.equals(self.prices.index)
+        assert frame.columns.names == ['Indicator', 'Symbol']
+        assert frame.shape[1] == len(PANEL_INDICATORS) * 4
+        assert set(frame.columns.get_level_values(0)) == set(PANEL_INDICATORS)
+
+    def test_missing_symbol_yields_nan_columns(self):
+        frame = IndicatorKernel.compute_frame(self.prices, symbols=['AAPL', 'GOOG'])
+
+        assert frame[('RSI', 'GOOG')].isna().all()
+        assert frame[('RSI', 'AAPL')].notna().any()
+
+    def test_latest_values_are_last_row(self):
+        panel = PricePanel.from_frame(self.prices)
+        latest = IndicatorKernel.latest_values(panel)
+        frame = IndicatorKernel.compute_frame(self.prices)
+
+        assert latest['RSI'].shape == (4,)
+        np.testing.assert_allclose(latest['RSI'], frame['RSI'].iloc[-1].to_numpy())
+
+    def test_rsi_bounds(self):
+        rsi = IndicatorKernel.rsi(PricePanel.from_frame(self.prices).close)
+        valid = rsi[~np.isnan(rsi)]
+
+        assert valid.size > 0
+        assert ((valid >= 0) & (valid <= 100)).all()
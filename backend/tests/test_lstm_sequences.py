@@ -0,0 +1,103 @@
+"""
+Unit tests for sliding-window LSTM training sequences.
+Checks the strided views and batch generator against the list-based builder.
+"""
+
+import numpy as np
+import tensorflow as tf
+
+from app.core.lstm_sequences import WindowedSequence, sliding_windows
+
+
+def reference_sequences(data: np.ndarray, lookback: int):
+    """Previous list-append implementation."""
+    X, y = [], []
+    for i in range(lookback, len(data)):
+        X.append(data[i - lookback:i])
+        y.append(data[i, 0])
+    return np.array(X), np.array(y)
+
+
+def make_series(rows: int, features: int = 4, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).random((rows, features))
+
+
+class TestSlidingWindows:
+    """Test the zero-copy window view."""
+
+    def test_matches_reference_without_copying(self):
+        data = make_series(120)
+        windows, targets = sliding_windows(data, 30)
+        X, y = reference_sequences(data, 30)
+
+        np.testing.assert_array_equal(windows, X)
+        np.testing.assert_array_equal(targets, y)
+        assert np.shares_memory(windows, data)
+        assert not windows.flags.writeable
+
+    def test_short_series_has_no_windows(self):
+        windows, targets = sliding_windows(make_series(30), 30)
+
+        assert windows.shape == (0, 30, 4)
+        assert targets.shape == (0,)
+
+
+class TestWindowedSequence:
+    """Test batch generation over one or many feature matrices."""
+
+    def setup_method(self):
+        self.series = [make_series(rows, seed=rows) for rows in (80, 55, 120)]
+
+    def test_batches_cover_every_window_once(self):
+        batches = WindowedSequence(self.series, 20, batch_size=16)
+        X = np.concatenate([batches[i][0] for i in range(len(batches))])
+        y = np.concatenate([batches[i][1] for i in range(len(batches))])
+
+        references = [reference_sequences(data, 20) for data in self.series]
+        np.testing.assert_allclose(X, np.concatenate([r[0] for r in references]), rtol=1e-6)
+        np.testing.assert_allclose(y, np.concatenate([r[1] for r in references]), rtol=1e-6)
+        np.testing.assert_array_equal(batches.targets(), y)
+        assert X.dtype == np.float32
+        assert batches.num_samples == 60 + 35 + 100
+
+    def test_chronological_split_per_series(self):
+        train = WindowedSequence(self.series, 20, end_fraction=0.8)
+        val = WindowedSequence(self.series, 20, start_fraction=0.8)
+
+        assert train.num_samples + val.num_samples == 195
+        for series_id, count in enumerate([60, 35, 100]):
+            train_offsets = train.offsets[train.series_ids == series_id]
+            val_offsets = val.offsets[val.series_ids == series_id]
+            assert train_offsets.max() < val_offsets.min()
+            assert len(train_offsets) == int(count * 0.8)
+
+    def test_symbol_ids_served_with_each_window(self):
+        batches = WindowedSequence(self.series, 20, batch_size=64, shuffle=True, seed=0, symbol_ids=[7, 8, 9])
+        inputs, y = batches[0]
+
+        assert set(inputs) == {"sequence", "symbol_id"}
+        expected_ids = np.array([7, 8, 9])[batches.served_series_ids()[:64]]
+        np.testing.assert_array_equal(inputs["symbol_id"], expected_ids)
+        np.testing.assert_array_equal(y, batches.targets()[:64])
+
+    def test_shuffle_reorders_each_epoch(self):
+        batches = WindowedSequence(self.series, 20, batch_size=300, shuffle=True, seed=1)
+        first = batches[0][1].copy()
+        batches.on_epoch_end()
+        second = batches[0][1]
+
+        assert not np.array_equal(first, second)
+        np.testing.assert_array_equal(np.sort(first), np.sort(second))
+
+    def test_feeds_model_fit(self):
+        tf.keras.utils.set_random_seed(0)
+        model = tf.keras.Sequential([tf.keras.layers.LSTM(4, input_shape=(20, 4)), tf.keras.layers.Dense(1)])
+        model.compile(optimizer='adam', loss='mse')
+
+        history = model.fit(
+            WindowedSequence(self.series, 20, batch_size=32, shuffle=True, end_fraction=0.8),
+            validation_data=WindowedSequence(self.series, 20, batch_size=32, start_fraction=0.8),
+            epochs=2, verbose=0
+        )
+
+        assert len(history.history['val_loss']) == 2
@@ -0,0 +1,144 @@
+"""
+Unit tests for the in-memory model registry.
+Uses stand-in models and loaders so no Keras files are involved.
+"""
+
+import asyncio
+import json
+import time
+
+import numpy as np
+import pytest
+from sklearn.preprocessing import MinMaxScaler
+
+from app.core.model_registry import MODEL_OVERHEAD_BYTES, ModelRegistry, estimate_model_bytes
+
+
+class FakeModel:
+    def __init__(self, params: int = 1000):
+        self.params = params
+
+    def count_params(self) -> int:
+        return self.params
+
+
+class FakeLoader:
+    """Records load calls; optionally slow so concurrent loads overlap."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = []
+
+    def __call__(self, path: str):
+        time.sleep(self.delay)
+        self.calls.append(path)
+        return FakeModel()
+
+
+def save_model_files(registry: ModelRegistry, symbol: str, version: str = None):
+    registry.model_path(symbol, version).write_text("model")
+    registry.scaler_path(symbol, version).write_text("scaler")
+
+
+class TestModelRegistry:
+    """Test LRU/memory eviction, counters and warm start."""
+
+    @pytest.fixture(autouse=True)
+    def setup_registry(self, tmp_path):
+        self.model_dir = tmp_path
+        self.load_model = FakeLoader()
+        self.registry = self.make_registry()
+
+    def make_registry(self, **kwargs) -> ModelRegistry:
+        return ModelRegistry(self.model_dir, self.load_model, lambda path: {"path": path},
+                             default_version="v2", **kwargs)
+
+    def test_lru_eviction_by_count(self):
+        registry = self.make_registry(max_models=2)
+        registry.register("AAPL", FakeModel(), None)
+        registry.register("MSFT", FakeModel(), None)
+        registry.get("AAPL")
+        registry.register("NVDA", FakeModel(), None)
+
+        assert ("AAPL", "v2") in registry and ("NVDA", "v2") in registry
+        assert ("MSFT", "v2") not in registry
+        assert registry.stats.evictions == 1
+
+    def test_eviction_by_memory_budget(self):
+        model_mb = (MODEL_OVERHEAD_BYTES + 250_000 * 4) / (1024 * 1024)
+        registry = self.make_registry(memory_budget_mb=model_mb * 2.5)
+        for symbol in ("AAPL", "MSFT", "NVDA", "TSLA"):
+            registry.register(symbol, FakeModel(250_000), None)
+
+        assert len(registry) == 2
+        assert registry.memory_bytes <= registry.memory_budget_bytes
+        assert registry.describe()["entries"] == ["NVDA@v2", "TSLA@v2"]
+
+    def test_estimate_includes_scaler_arrays(self):
+        scaler = MinMaxScaler().fit(np.random.default_rng(0).random((50, 10)))
+        scaler_bytes = sum(v.nbytes for v in vars(scaler).values() if isinstance(v, np.ndarray))
+
+        assert scaler_bytes > 0
+        assert estimate_model_bytes(FakeModel(100), scaler) == MODEL_OVERHEAD_BYTES + 400 + scaler_bytes
+
+    @pytest.mark.asyncio
+    async def test_acquire_loads_once_then_hits(self):
+        save_model_files(self.registry, "AAPL")
+
+        first = await self.registry.acquire("AAPL")
+        second = await self.registry.acquire("AAPL")
+        missing = await self.registry.acquire("MSFT")
+
+        assert first is second and missing is None
+        assert self.load_model.calls == [str(self.registry.model_path("AAPL"))]
+        stats = self.registry.describe()
+        assert (stats["hits"], stats["misses"], stats["loads"]) == (1, 2, 1)
+        assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+    @pytest.mark.asyncio
+    async def test_versioned_and_legacy_paths(self):
+        save_model_files(self.registry, "AAPL", "v1")
+        (self.model_dir / "MSFT_lstm_model.keras").write_text("model")
+        (self.model_dir / "MSFT_scaler.joblib").write_text("scaler")
+
+        assert (await self.registry.acquire("AAPL", "v1")).version == "v1"
+        assert await self.registry.acquire("AAPL") is None
+        assert (await self.registry.acquire("MSFT")).scaler["path"].endswith("MSFT_scaler.joblib")
+        assert await self.registry.acquire("MSFT", "v1") is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self):
+        self.load_model.delay = 0.05
+        save_model_files(self.registry, "AAPL")
+
+        entries = await asyncio.gather(*(self.registry.acquire("AAPL") for _ in range(5)))
+
+        assert len(self.load_model.calls) == 1
+        assert all(entry is entries[0] for entry in entries)
+
+    @pytest.mark.asyncio
+    async def test_load_failure_counted(self):
+        save_model_files(self.registry, "AAPL")
+        registry = ModelRegistry(self.model_dir, self.load_model, lambda path: 1 / 0, default_version="v2")
+
+        assert await registry.acquire("AAPL") is None
+        assert registry.stats.load_failures == 1
+        assert len(registry) == 0
+
+    @pytest.mark.asyncio
+    async def test_warm_start_from_persisted_counts(self):
+        for symbol in ("AAPL", "MSFT", "NVDA"):
+            save_model_files(self.registry, symbol)
+        for symbol, count in (("AAPL", 3), ("MSFT", 1), ("NVDA", 5), ("TSLA", 4)):
+            for _ in range(count):
+                await self.registry.acquire(symbol)
+        self.registry.save_request_counts()
+
+        assert json.loads((self.model_dir / ModelRegistry.REQUEST_COUNTS_FILE).read_text())["NVDA"] == 5
+
+        restarted = self.make_registry()
+        loaded = await restarted.warm_start(3)
+
+        # TSLA is popular but has no saved model
+        assert loaded == ["NVDA", "AAPL"]
+        assert restarted.describe()["entries"] == ["NVDA@v2", "AAPL@v2"]
@@ -175,6 +175,48 @@ class TestBlackScholesPricer:
             f"Put boundary condition failed: {put_price_expiry:.4f} vs {put_intrinsic:.4f}"
 
 
+class TestBatchPricing:
+    """Test array-in/array-out pricing over whole chains"""
+
+    def test_black_scholes_batch_matches_scalar(self):
+        """Every entry matches the scalar price and Greeks"""
+        strikes = np.array([80.0, 100.0, 120.0, 90.0, 110.0])
+        expiries = np.array([0.1, 0.25, 0.5, 1.0, 0.0])
+        types = [OptionType.CALL, OptionType.PUT, OptionType.CALL, OptionType.PUT, OptionType.CALL]
+
+        result = BlackScholesPricer.price_batch(100, strikes, expiries, 0.05, 0.25, types, 0.01)
+
+        for i, (K, T, option_type) in enumerate(zip(strikes, expiries, types)):
+            pricer = BlackScholesPricer.call_price if option_type == OptionType.CALL else BlackScholesPricer.put_price
+            assert result.price[i] == pytest.approx(pricer(100, K, T, 0.05, 0.25, 0.01))
+
+            expected = BlackScholesPricer.calculate_greeks(100, K, T, 0.05, 0.25, option_type, 0.01)
+            greeks = result.greeks(i)
+            for name in ("delta", "gamma", "theta", "vega", "rho", "vanna", "vomma"):
+                assert getattr(greeks, name) == pytest.approx(getattr(expected, name) or 0.0, abs=1e-12)
+
+    def test_price_chain_routes_like_price_option(self):
+        """Chain pricing agrees with per-contract pricing for both models"""
+        engine = OptionsPricingEngine()
+        strikes = [95.0, 100.0, 105.0, 100.0]
+        expiries = [0.25, 0.25, 0.5, 0.5]
+        types = [OptionType.CALL, OptionType.PUT, OptionType.PUT, OptionType.CALL]
+        styles = [ExerciseStyle.EUROPEAN, ExerciseStyle.AMERICAN, ExerciseStyle.EUROPEAN, ExerciseStyle.AMERICAN]
+
+        results = engine.price_chain(100, strikes, expiries, 0.05, 0.2, types, styles, 0.01)
+
+        assert len(results) == 4
+        for result, K, T, option_type, style in zip(results, strikes, expiries, types, styles):
+            expected = engine.price_option(OptionPricingInput(
+                spot_price=100, strike_price=K, time_to_expiry=T, risk_free_rate=0.05,
+                volatility=0.2, dividend_yield=0.01, option_type=option_type, exercise_style=style
+            ))
+            assert result.model_used == expected.model_used
+            assert result.price == pytest.approx(expected.price, rel=1e-9)
+            assert result.greeks.delta == pytest.approx(expected.greeks.delta, rel=1e-9)
+            assert result.intrinsic_value == pytest.approx(expected.intrinsic_value)
+
+
 class TestBinomialPricer:
     """Test Binomial pricing model accuracy"""
 
@@ -225,6 +267,74 @@ class TestBinomialPricer:
             f"No early exercise premium: {american_put:.4f} vs {european_put:.4f}"
 
 
+    @staticmethod
+    def reference_price(S, K, T, r, sigma, option_type, american, steps, q=0.0):
+        """Node-by-node CRR induction used as the batch pricer's reference"""
+        dt = T / steps
+        u = np.exp(sigma * np.sqrt(dt))
+        d = 1 / u
+        p = (np.exp((r - q) * dt) - d) / (u - d)
+        sign = 1 if option_type == OptionType.CALL else -1
+
+        values = [max(sign * (S * u ** i * d ** (steps - i) - K), 0) for i in range(steps + 1)]
+        for j in range(steps - 1, -1, -1):
+            for i in range(j + 1):
+                values[i] = np.exp(-r * dt) * (p * values[i + 1] + (1 - p) * values[i])
+                if american:
+                    values[i] = max(values[i], sign * (S * u ** i * d ** (j - i) - K))
+        return values[0]
+
+    def test_batch_matches_node_by_node_induction(self):
+        """A chain of American strikes and expiries priced in one call matches per-contract trees"""
+        strikes = np.array([80.0, 95.0, 100.0, 105.0, 120.0] * 2)
+        expiries = np.repeat([0.1, 0.5], 5)
+        types = [OptionType.PUT, OptionType.CALL] * 5
+
+        result = BinomialPricer.price_batch(
+            100, strikes, expiries, 0.05, 0.3, types, ExerciseStyle.AMERICAN, steps=50, q=0.02
+        )
+
+        for i, (K, T, option_type) in enumerate(zip(strikes, expiries, types)):
+            expected = self.reference_price(100, K, T, 0.05, 0.3, option_type, True, 50, 0.02)
+            assert result.price[i] == pytest.approx(expected, rel=1e-10, abs=1e-12)
+
+    @pytest.mark.parametrize("option_type", [OptionType.CALL, OptionType.PUT])
+    def test_lattice_greeks_match_black_scholes(self, option_type):
+        """European lattice Greeks converge to the closed-form values"""
+        S, K, T, r, sigma, q = 100, 105, 0.25, 0.05, 0.2, 0.01
+        _, greeks = BinomialPricer.price_option(
+            S, K, T, r, sigma, option_type, ExerciseStyle.EUROPEAN, 400, q
+        )
+        expected = BlackScholesPricer.calculate_greeks(S, K, T, r, sigma, option_type, q)
+
+        assert greeks.delta == pytest.approx(expected.delta, abs=0.005)
+        assert greeks.gamma == pytest.approx(expected.gamma, abs=0.001)
+        assert greeks.theta == pytest.approx(expected.theta, abs=0.001)
+        assert greeks.vega == pytest.approx(expected.vega, abs=0.01)
+        assert greeks.rho == pytest.approx(expected.rho, abs=0.01)
+
+    def test_expired_contracts_use_intrinsic_value(self):
+        """Contracts at or past expiry are worth their intrinsic value"""
+        result = BinomialPricer.price_batch(
+            100, [90.0, 110.0], [0.0, 0.25], 0.05, 0.2, OptionType.CALL, ExerciseStyle.AMERICAN
+        )
+
+        assert result.price[0] == 10.0
+        assert result.delta[0] == 1.0
+        assert result.gamma[0] == 0.0
+        assert result.price[1] > 0
+
+    def test_american_call_without_dividends_equals_european(self):
+        """Early exercise of a call is never optimal without dividends"""
+        american = BinomialPricer.price_batch(100, [90, 100, 110], 0.5, 0.05, 0.25,
+                                              OptionType.CALL, ExerciseStyle.AMERICAN)
+        european = BinomialPricer.price_batch(100, [90, 100, 110], 0.5, 0.05, 0.25,
+                                              OptionType.CALL, ExerciseStyle.EUROPEAN)
+
+        np.testing.assert_allclose(american.price, european.price)
+        np.testing.assert_allclose(american.delta, european.delta)
+
+
 class TestImpliedVolatilitySolver:
     """Test implied volatility calculation accuracy"""
 
@@ -291,6 +401,36 @@ class TestImpliedVolatilitySolver:
             assert abs(results[i] - results[0]) < 0.001, \
                 f"Method consistency failed: {results[i]:.6f} vs {results[0]:.6f}"
 
+    def test_solve_batch_roundtrip(self):
+        """Batch solver recovers the volatilities used to price a chain"""
+        rng = np.random.default_rng(5)
+        strikes = rng.uniform(80, 120, 500)
+        times = rng.uniform(0.25, 2.0, 500)
+        sigmas = rng.uniform(0.15, 0.9, 500)
+        types = [OptionType.CALL if k >= 100 else OptionType.PUT for k in strikes]
+
+        prices = BlackScholesPricer.price_batch(100, strikes, times, 0.05, sigmas, types, 0.01).price
+        result = ImpliedVolatilitySolver.solve_batch(prices, 100, strikes, times, 0.05, types, 0.01)
+
+        assert result.converged.all()
+        np.testing.assert_allclose(result.implied_volatility, sigmas, atol=1e-5)
+
+    def test_solve_batch_rejects_arbitrage_prices(self):
+        """Prices outside the no-arbitrage bounds or at expiry yield NaN"""
+        result = ImpliedVolatilitySolver.solve_batch(
+            [0.0, 150.0, 5.0], 100, 100, [0.5, 0.5, 0.0], 0.05, OptionType.CALL
+        )
+
+        assert np.isnan(result.implied_volatility).all()
+        assert not result.converged.any()
+
+    def test_solve_batch_flags_bracket_collapse_at_bound(self):
+        """A price needing more than MAX_VOLATILITY is not reported as converged"""
+        result = ImpliedVolatilitySolver.solve_batch([99.9], 100, 100, 0.5, 0.0, OptionType.CALL)
+
+        assert np.isnan(result.implied_volatility).all()
+        assert not result.converged.any()
+
 
 class TestOptionsPricingEngine:
     """Test the main pricing engine integration"""
@@ -0,0 +1,58 @@
+"""
+Unit tests for the inverted alert rule index.
+"""
+
+import pytest
+
+from app.core.rule_index import RuleIndex
+from app.models.alert_models import AlertType
+from tests.helpers import make_rule
+
+
+class TestRuleIndex:
+    """Test index maintenance and lookups."""
+
+    def setup_method(self):
+        self.index = RuleIndex()
+        self.index.add(make_rule("aapl", symbols=["AAPL"]))
+        self.index.add(make_rule("tech", symbols=["AAPL", "msft"], alert_type=AlertType.TECHNICAL))
+        self.index.add(make_rule("tsla", symbol="TSLA"))
+        self.index.add(make_rule("market", alert_type=AlertType.NEWS))
+        self.index.add(make_rule("book", portfolio_id="p1", alert_type=AlertType.PORTFOLIO))
+
+    def ids(self, rules):
+        return [rule.rule_id for rule in rules]
+
+    def test_symbol_lookup(self):
+        assert self.ids(self.index.for_symbol("AAPL")) == ["aapl", "tech"]
+        assert self.ids(self.index.for_symbol("msft")) == ["tech"]
+        assert self.ids(self.index.for_symbol("TSLA")) == ["tsla"]
+        assert self.index.for_symbol("NVDA") == []
+        assert set(self.index.for_symbols(["AAPL", "NVDA", "TSLA"])) == {"AAPL", "TSLA"}
+
+    def test_event_lookup_includes_unscoped_rules(self):
+        assert self.ids(self.index.for_event("price_change", ["MSFT"])) == ["tech", "market", "book"]
+        assert self.ids(self.index.for_event("technical", ["AAPL", "TSLA"])) == ["tech"]
+        assert self.ids(self.index.for_event("news")) == ["market"]
+
+    def test_portfolio_lookup(self):
+        assert self.ids(self.index.for_portfolio("p1")) == ["book"]
+        assert self.index.for_portfolio("p2") == []
+
+    def test_update_moves_rule_and_keeps_order(self):
+        self.index.add(make_rule("aapl", symbols=["NVDA", "AAPL"]))
+
+        assert self.ids(self.index.for_symbol("AAPL")) == ["aapl", "tech"]
+        assert self.ids(self.index.for_symbol("NVDA")) == ["aapl"]
+
+        self.index.add(make_rule("aapl", symbols=["NVDA"]))
+        assert self.ids(self.index.for_symbol("AAPL")) == ["tech"]
+
+    def test_remove_drops_empty_keys(self):
+        self.index.remove("tsla")
+        self.index.remove("book")
+
+        assert "TSLA" not in self.index.by_symbol
+        assert "p1" not in self.index.by_portfolio
+        assert self.index.remove("missing") is None
+        assert len(self.index) == 3
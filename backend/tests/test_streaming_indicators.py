@@ -0,0 +1,139 @@
+"""
+Unit tests for incremental streaming indicators.
+Values are checked bar by bar against full-history TA-Lib calculations.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import talib
+
+from app.core.streaming_indicators import STREAMING_INDICATORS, StreamingIndicatorEngine, SymbolIndicators
+
+
+def make_bars(periods=300, seed=5) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 50 * np.exp(np.cumsum(rng.normal(0, 0.015, periods)))
+    return pd.DataFrame({
+        'High': close * (1 + rng.uniform(0, 0.02, periods)),
+        'Low': close * (1 - rng.uniform(0, 0.02, periods)),
+        'Close': close,
+        'Volume': rng.integers(100_000, 900_000, periods).astype(float),
+    }, index=pd.bdate_range('2023-01-02', periods=periods))
+
+
+def talib_reference(df: pd.DataFrame) -> dict:
+    high, low, close, volume = (df[c].to_numpy() for c in ('High', 'Low', 'Close', 'Volume'))
+    ref = {
+        'sma_20': talib.SMA(close, 20), 'sma_50': talib.SMA(close, 50), 'sma_200': talib.SMA(close, 200),
+        'ema_12': talib.EMA(close, 12), 'ema_20': talib.EMA(close, 20), 'ema_26': talib.EMA(close, 26),
+        'rsi': talib.RSI(close, 14),
+        'atr': talib.ATR(high, low, close, 14),
+        'adx': talib.ADX(high, low, close, 14),
+        'adx_plus_di': talib.PLUS_DI(high, low, close, 14),
+        'adx_minus_di': talib.MINUS_DI(high, low, close, 14),
+        'obv': talib.OBV(close, volume),
+    }
+    ref['macd'], ref['macd_signal'], ref['macd_hist'] = talib.MACD(close, 12, 26, 9)
+    ref['bb_upper'], ref['bb_middle'], ref['bb_lower'] = talib.BBANDS(close, 20, 2, 2, 0)
+    ref['stoch_k'], ref['stoch_d'] = talib.STOCH(high, low, close, 14, 3, 0, 3, 0)
+    return ref
+
+
+def as_array(values: dict) -> np.ndarray:
+    return np.array([np.nan if values[name] is None else values[name] for name in STREAMING_INDICATORS])
+
+
+class TestSymbolIndicators:
+    """Test incremental updates against full-history TA-Lib values."""
+
+    def setup_method(self):
+        self.df = make_bars()
+        self.ref = talib_reference(self.df)
+
+    def test_every_bar_matches_talib(self):
+        state = SymbolIndicators()
+        rows = self.df[['High', 'Low', 'Close', 'Volume']].to_numpy()
+        results = [state.update(*row) for row in rows]
+
+        for name in STREAMING_INDICATORS:
+            values = np.array([r[name] for r in results])
+            np.testing.assert_allclose(values, self.ref[name], rtol=1e-9, atol=1e-8, err_msg=name)
+
+    def test_uncommitted_bar_leaves_state_unchanged(self):
+        state = SymbolIndicators()
+        rows = self.df[['High', 'Low', 'Close', 'Volume']].to_numpy()
+        for row in rows[:-1]:
+            state.update(*row)
+
+        preview = state.update(*(rows[-1] * 1.1), commit=False)
+        again = state.update(*(rows[-1] * 1.1), commit=False)
+        committed = state.update(*rows[-1])
+
+        assert preview == again
+        for name in STREAMING_INDICATORS:
+            assert committed[name] == pytest.approx(self.ref[name][-1], rel=1e-9), name
+
+
+class TestStreamingIndicatorEngine:
+    """Test forming-bar handling across bar boundaries."""
+
+    def setup_method(self):
+        self.df = make_bars(periods=260)
+        self.engine = StreamingIndicatorEngine()
+
+    def test_seeded_state_matches_full_history(self):
+        self.engine.seed('AAPL', self.df)
+        expected = talib_reference(self.df)
+
+        latest = as_array(self.engine.latest('AAPL'))
+        np.testing.assert_allclose(latest, [expected[name][-1] for name in STREAMING_INDICATORS], rtol=1e-9)
+
+    def test_forming_bar_is_replaced_until_next_bar(self):
+        history, today = self.df.iloc[:-1], self.df.index[-1]
+        self.engine.seed('AAPL', history)
+        last = self.df.iloc[-1]
+
+        # Intraday quotes replace the forming bar rather than adding bars
+        self.engine.update_bar('AAPL', today, last['High'] * 0.99, last['Low'], last['Close'] * 0.98, 1000)
+        self.engine.update_bar('AAPL', today, last['High'], last['Low'], last['Close'], last['Volume'])
+        expected = talib_reference(self.df)
+        np.testing.assert_allclose(as_array(self.engine.latest('AAPL')),
+                                   [expected[name][-1] for name in STREAMING_INDICATORS], rtol=1e-9)
+
+        # The next bar commits it
+        next_day = today + pd.offsets.BDay()
+        self.engine.update_bar('AAPL', next_day, last['High'], last['Low'], last['Close'], 5000)
+        extended = pd.concat([self.df, pd.DataFrame(
+            {'High': [last['High']], 'Low': [last['Low']], 'Close': [last['Close']], 'Volume': [5000.0]},
+            index=[next_day])])
+        expected = talib_reference(extended)
+        np.testing.assert_allclose(as_array(self.engine.latest('AAPL')),
+                                   [expected[name][-1] for name in STREAMING_INDICATORS], rtol=1e-9)
+
+    def test_ticks_fold_into_forming_bar(self):
+        self.engine.seed('AAPL', self.df.iloc[:-1])
+        today = self.df.index[-1]
+
+        for price, size in ((100.0, 10), (104.0, 5), (98.0, 7), (101.0, 3)):
+            self.engine.on_tick('AAPL', today, price, size)
+
+        _, high, low, close, volume = self.engine._forming['AAPL']
+        assert (high, low, close, volume) == (104.0, 98.0, 101.0, 25.0)
+
+    def test_stale_update_is_ignored(self):
+        self.engine.seed('AAPL', self.df)
+        before = self.engine.latest('AAPL')
+
+        self.engine.update_bar('AAPL', self.df.index[-5], 1.0, 1.0, 1.0, 1.0)
+
+        assert self.engine.latest('AAPL') == before
+
+    def test_warmup_values_are_none(self):
+        self.engine.seed('NEW', self.df.iloc[:30])
+        latest = self.engine.latest('NEW')
+
+        assert latest['sma_20'] is not None
+        assert latest['sma_200'] is None and latest['macd'] is None
+        assert self.engine.latest('UNKNOWN') == {}
+        assert np.isnan(self.engine.latest_array(['NEW', 'UNKNOWN'])[1]).all()
@@ -0,0 +1,169 @@
+"""
+Unit tests for the background training scheduler.
+Thread executors stand in for the process pool except where the pool itself is tested.
+"""
+
+import asyncio
+import operator
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.training_scheduler import TrainingScheduler, TrainingStatus
+
+
+class SlowTrainer:
+    """Records calls and the peak number of concurrent jobs."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, symbol: str, value: int = 0):
+        with self._lock:
+            self.calls.append(symbol)
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        if value < 0:
+            raise ValueError("negative")
+        return {"symbol": symbol, "value": value}
+
+
+class TestTrainingScheduler:
+    """Test deduplication, bounded concurrency and job status."""
+
+    def setup_method(self):
+        self.trainer = SlowTrainer()
+        self.completed = []
+
+    def make_scheduler(self, max_workers: int = 2) -> TrainingScheduler:
+        async def on_complete(job):
+            self.completed.append(job.symbol)
+
+        return TrainingScheduler(
+            self.trainer, max_workers=max_workers, on_complete=on_complete,
+            executor=ThreadPoolExecutor(max_workers=8)
+        )
+
+    @pytest.mark.asyncio
+    async def test_duplicate_submissions_share_one_job(self):
+        scheduler = self.make_scheduler()
+
+        jobs = [scheduler.submit("AAPL", "v1", 1) for _ in range(3)]
+        assert all(job is jobs[0] for job in jobs)
+        assert scheduler.is_pending("AAPL", "v1")
+
+        job = await scheduler.wait("AAPL", "v1")
+        assert job.status == TrainingStatus.COMPLETED
+        assert job.result == {"symbol": "AAPL", "value": 1}
+        assert self.trainer.calls == ["AAPL"] and self.completed == ["AAPL"]
+
+        # A finished job does not block the next retrain
+        assert scheduler.submit("AAPL", "v1", 2) is not job
+        assert (await scheduler.wait("AAPL", "v1")).result["value"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_workers(self):
+        scheduler = self.make_scheduler(max_workers=2)
+        symbols = ["AAPL", "MSFT", "NVDA", "TSLA", "AMZN"]
+
+        jobs = [scheduler.submit(symbol, "v1") for symbol in symbols]
+        await asyncio.sleep(0.01)
+        statuses = [job.status for job in jobs]
+
+        assert statuses.count(TrainingStatus.RUNNING) == 2
+        assert statuses.count(TrainingStatus.QUEUED) == 3
+
+        await asyncio.gather(*(job.task for job in jobs))
+        assert self.trainer.peak == 2
+        assert sorted(self.completed) == sorted(symbols)
+        assert scheduler.describe()["completed"] == 5
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_without_waiting(self):
+        self.trainer.delay = 0.5
+        scheduler = self.make_scheduler()
+
+        started = time.perf_counter()
+        job = scheduler.submit("AAPL", "v1")
+        assert time.perf_counter() - started < 0.05
+        assert job.active
+
+        await scheduler.wait("AAPL", "v1")
+
+    @pytest.mark.asyncio
+    async def test_failed_job_reports_error(self):
+        scheduler = self.make_scheduler()
+
+        scheduler.submit("AAPL", "v1", -1)
+        job = await scheduler.wait("AAPL", "v1")
+
+        assert job.status == TrainingStatus.FAILED
+        assert job.error == "negative"
+        assert job.to_dict()["status"] == "failed"
+        assert self.completed == []
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout_does_not_cancel_job(self):
+        self.trainer.delay = 0.2
+        scheduler = self.make_scheduler()
+        scheduler.submit("AAPL", "v1")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await scheduler.wait("AAPL", "v1", timeout=0.01)
+
+        job = await scheduler.wait("AAPL", "v1")
+        assert job.status == TrainingStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_superseded_finished_jobs_are_evicted(self):
+        scheduler = self.make_scheduler()
+
+        await scheduler.submit("AAPL", "v1").task
+        scheduler.submit("MSFT", "v1")
+        v2 = scheduler.submit("AAPL", "v2")
+        assert scheduler.get_job("AAPL", "v1") is None
+        assert scheduler.get_job("MSFT", "v1") is not None
+
+        # A job still running when superseded is dropped once it finishes
+        v3 = scheduler.submit("AAPL", "v3")
+        assert scheduler.get_job("AAPL", "v2") is v2
+        job = await scheduler.wait("AAPL", "v2")
+        assert job.status == TrainingStatus.COMPLETED
+        assert scheduler.get_job("AAPL", "v2") is None
+
+        await v3.task
+        assert scheduler.get_job("AAPL", "v3") is v3
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_are_capped(self):
+        self.trainer.delay = 0
+        scheduler = self.make_scheduler()
+        scheduler.max_finished_jobs = 3
+        symbols = ["AAPL", "MSFT", "NVDA", "TSLA", "AMZN"]
+
+        for symbol in symbols:
+            await scheduler.submit(symbol, "v1").task
+
+        assert [symbol for symbol, _ in scheduler.jobs] == symbols[-3:]
+
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_process(self):
+        # Default spawned process pool; train_func must be picklable
+        scheduler = TrainingScheduler(operator.concat, max_workers=1)
+        try:
+            scheduler.submit("AAPL", "v1", "_trained")
+            job = await scheduler.wait("AAPL", "v1", timeout=60)
+        finally:
+            scheduler.shutdown()
+
+        assert job.status == TrainingStatus.COMPLETED
+        assert job.result == "AAPL_trained"
@@ -0,0 +1,124 @@
+"""
+Tests for shared universe snapshots
+"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from app.core.scanner_engine import ScannerEngine
+from app.core.universe_snapshot import UniverseSnapshotService
+from app.models.scanner_models import (
+    AssetType, PriceFilter, ScannerConfig, ScannerType, TechnicalFilter, TimeFrame, VolumeFilter
+)
+
+
+class FakeProvider:
+    """Asset data provider that counts per-symbol fetches."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_asset_data(self, symbol, time_frame):
+        self.calls.append(symbol)
+        await asyncio.sleep(0)
+        n = int(symbol[1:])
+        return {
+            'price': 10.0 + n, 'volume': 1000 * n, 'change_percent': float(n % 7 - 3),
+            'indicators': {'rsi': float(n % 100), 'adx': float(n % 50), 'macd_histogram': float(n % 5 - 2)},
+        }
+
+
+class TestUniverseSnapshotService:
+    """Test snapshot refresh, extension and sharing."""
+
+    def setup_method(self):
+        self.fetches = []
+
+        async def fetch(symbols, time_frame):
+            self.fetches.append(list(symbols))
+            await asyncio.sleep(0)
+            return {symbol: {'price': 1.0} for symbol in symbols if symbol != "NOPE"}
+
+        self.service = UniverseSnapshotService(fetch, refresh_interval=60)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_fetch(self):
+        snapshots = await asyncio.gather(*(
+            self.service.get_snapshot(["AAPL", "MSFT"], TimeFrame.DAY_1) for _ in range(12)
+        ))
+
+        assert self.fetches == [["AAPL", "MSFT"]]
+        assert len({snapshot.version for snapshot in snapshots}) == 1
+
+    @pytest.mark.asyncio
+    async def test_new_symbols_extend_snapshot_without_refetching(self):
+        first = await self.service.get_snapshot(["AAPL", "NOPE"], TimeFrame.DAY_1)
+        second = await self.service.get_snapshot(["AAPL", "NOPE", "MSFT"], TimeFrame.DAY_1)
+
+        assert self.fetches == [["AAPL", "NOPE"], ["MSFT"]]
+        assert second.version > first.version
+        assert second.refreshed_at == first.refreshed_at
+        assert set(second.assets) == {"AAPL", "MSFT"}
+        assert set(first.assets) == {"AAPL"}
+
+    @pytest.mark.asyncio
+    async def test_snapshots_are_immutable(self):
+        snapshot = await self.service.get_snapshot(["AAPL"], TimeFrame.DAY_1)
+
+        with pytest.raises(TypeError):
+            snapshot.assets["MSFT"] = {}
+        with pytest.raises(AttributeError):
+            snapshot.version = 99
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_refetches_recently_requested_symbols(self):
+        await self.service.get_snapshot(["AAPL", "MSFT"], TimeFrame.DAY_1)
+        await self.service.get_snapshot(["MSFT"], TimeFrame.DAY_1)
+
+        self.service.refresh_interval = 0
+        await self.service.get_snapshot(["NVDA"], TimeFrame.DAY_1)
+        await self.service.get_snapshot(["NVDA"], TimeFrame.DAY_1)
+
+        # AAPL and MSFT were requested before the first refresh; only NVDA since
+        assert self.fetches[1:] == [["AAPL", "MSFT", "NVDA"], ["NVDA"]]
+        assert self.service.refreshes == 3
+
+    @pytest.mark.asyncio
+    async def test_time_frames_have_separate_snapshots(self):
+        daily = await self.service.get_snapshot(["AAPL"], TimeFrame.DAY_1)
+        hourly = await self.service.get_snapshot(["AAPL"], TimeFrame.HOUR_1)
+
+        assert len(self.fetches) == 2
+        assert daily.time_frame == TimeFrame.DAY_1 and hourly.time_frame == TimeFrame.HOUR_1
+
+
+class TestScannerEngineSnapshots:
+    """Test that scanner runs read shared snapshots."""
+
+    @pytest.mark.asyncio
+    async def test_preset_scanners_fetch_universe_once(self):
+        provider = FakeProvider()
+        engine = ScannerEngine()
+        engine.register_data_provider(AssetType.STOCK, provider)
+        universe = [f"S{i:03d}" for i in range(100)]
+
+        configs = [
+            ScannerConfig(name=f"scanner {i}", scanner_type=ScannerType.TECHNICAL, asset_types=[AssetType.STOCK],
+                          universe=universe, limit=10 + i, **filters)
+            for i, filters in enumerate([
+                {'technical_filter': TechnicalFilter(rsi_max=Decimal(30 + i))} for i in range(4)
+            ] + [
+                {'volume_filter': VolumeFilter(min_volume=1000 * i)} for i in range(1, 5)
+            ] + [
+                {'price_filter': PriceFilter(min_price=Decimal(20 + i))} for i in range(4)
+            ])
+        ]
+        responses = await asyncio.gather(*(engine.run_scanner(config) for config in configs))
+
+        assert sorted(provider.calls) == universe
+        assert engine.snapshots.refreshes == 1
+        assert all(response.total_scanned == 100 for response in responses)
+        assert len(responses[0].results) == 10
+        assert all(int(r.symbol[1:]) <= 30 for r in responses[0].results)
@@ -13,8 +13,13 @@ from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime, timedelta
 import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
+import joblib
 from pathlib import Path
+from sklearn.preprocessing import MinMaxScaler
 
+from app.core.lstm_training import fit_lstm_model, train_and_save
+from app.core.training_scheduler import TrainingScheduler, TrainingStatus
 from app.services.lstm_service import LSTMService, RateLimit
 from app.models.schemas import LSTMPrediction, ModelPerformance
 from app.core.config import settings
@@ -184,7 +189,7 @@ class TestLSTMServiceValidation:
         # Create very small dataset
         small_features = np.random.rand(30, 22)  # Less than lookback_days
 
-        model, scaler = await lstm_service._train_model("TEST", small_features)
+        model, scaler, _ = fit_lstm_model(small_features, lstm_service.lookback_days, epochs=1, verbose=0)
 
         # Should return None due to insufficient data
         assert model is None
@@ -245,23 +250,19 @@ class TestLSTMServiceValidation:
     @pytest_asyncio.async_test
     async def test_model_saving_and_loading(self, lstm_service):
         """UT-LSTM-05.1: Test model persistence"""
-        # Create and save a simple model
-        input_shape = (90, 22)
+        # Save a simple model and scaler where the registry looks for them
+        input_shape = (None, 90, 22)
         model = lstm_service._build_lstm_model(input_shape)
+        scaler = MinMaxScaler().fit(np.random.rand(10, 22))
 
-        model_path = lstm_service.model_dir / "test_model.keras"
-
-        # Test saving
-        await lstm_service._save_model(model, model_path)
-        assert model_path.exists()
+        model.save(lstm_service.registry.model_path("TEST"))
+        joblib.dump(scaler, lstm_service.registry.scaler_path("TEST"))
+        assert lstm_service.registry.has_saved_model("TEST")
 
-        # Test loading
-        loaded_model = await lstm_service._load_model(model_path)
-        assert loaded_model is not None
-        assert loaded_model.input_shape == model.input_shape
-
-        # Cleanup
-        os.remove(model_path)
+        # Test loading through the registry
+        entry = await lstm_service.registry.acquire("TEST")
+        assert entry is not None
+        assert entry.model.input_shape == model.input_shape
 
     @pytest_asyncio.async_test
     async def test_model_compatibility_validation(self, lstm_service):
@@ -337,7 +338,7 @@ class TestLSTMServiceValidation:
     @pytest_asyncio.async_test
     async def test_full_prediction_pipeline_mock(self, lstm_service, valid_historical_data):
         """IT-LSTM-01.1: Test complete prediction pipeline with mocks"""
-        with patch.object(lstm_service, '_train_model') as mock_train:
+        with patch.object(lstm_service, '_get_or_train_model') as mock_train:
             # Mock successful training
             mock_model = Mock()
             mock_model.predict.return_value = np.array([[0.6]])
@@ -391,17 +392,39 @@ class TestLSTMServiceValidation:
                 assert results[symbol] is not None
 
     # REQ-STOCK-02.8: Error Handling Tests
-    @pytest_asyncio.async_test
-    async def test_tensorflow_error_handling(self, lstm_service, valid_historical_data):
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("failure", ["build", "fit"])
+    async def test_tensorflow_error_handling(self, lstm_service, failure):
         """ET-LSTM-01.1: Test TensorFlow/Keras error handling"""
-        with patch('tensorflow.keras.models.Sequential') as mock_sequential:
-            mock_sequential.side_effect = Exception("TensorFlow error")
+        failing_model = MagicMock()
+        failing_model.fit.side_effect = Exception("TensorFlow error")
+        sequential = (
+            {"side_effect": Exception("TensorFlow error")} if failure == "build"
+            else {"return_value": failing_model}
+        )
+        features = np.random.rand(300, 22)
 
-            # Should handle TensorFlow errors gracefully
-            model, scaler = await lstm_service._train_model("TEST", np.random.rand(300, 22))
+        with patch('app.core.lstm_training.Sequential', **sequential):
+            # Fitting raises instead of returning a half-built model
+            with pytest.raises(Exception, match="TensorFlow error"):
+                fit_lstm_model(features, lstm_service.lookback_days, epochs=1, verbose=0)
 
-            assert model is None
-            assert scaler is None
+            # A training job fails cleanly: no model is saved or loaded
+            on_complete = AsyncMock()
+            scheduler = TrainingScheduler(
+                train_and_save, on_complete=on_complete, executor=ThreadPoolExecutor(max_workers=1)
+            )
+            model_path = lstm_service.registry.model_path("TEST")
+            scaler_path = lstm_service.registry.scaler_path("TEST")
+            scheduler.submit("TEST", "v1", features, lstm_service.lookback_days,
+                             str(model_path), str(scaler_path), 1)
+            job = await scheduler.wait("TEST", "v1")
+            scheduler.shutdown()
+
+        assert job.status == TrainingStatus.FAILED
+        assert job.error == "TensorFlow error"
+        on_complete.assert_not_awaited()
+        assert not model_path.exists() and not scaler_path.exists()
 
     @pytest_asyncio.async_test
     async def test_memory_management_large_dataset(self, lstm_service):
@@ -435,7 +458,7 @@ class TestLSTMServiceValidation:
         """PT-LSTM-01.1: Test prediction generation performance"""
         start_time = datetime.utcnow()
 
-        with patch.object(lstm_service, '_train_model') as mock_train:
+        with patch.object(lstm_service, '_get_or_train_model') as mock_train:
             # Mock quick training
             mock_model = Mock()
             mock_model.predict.return_value = np.array([[0.6]])
@@ -460,7 +483,7 @@ class TestLSTMServiceValidation:
         """PT-LSTM-01.2: Test concurrent prediction handling"""
         import asyncio
 
-        with patch.object(lstm_service, '_train_model') as mock_train:
+        with patch.object(lstm_service, '_get_or_train_model') as mock_train:
             mock_model = Mock()
             mock_model.predict.return_value = np.array([[0.6]])
             mock_scaler = Mock()